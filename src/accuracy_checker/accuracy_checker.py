@@ -44,6 +44,11 @@ def cli_argument_parser():
         type=str,
         help='Delimiter to use in the resulting file',
         default=';')
+    parser.add_argument(
+        '--result_store',
+        type=str,
+        help='Path to SQLite result store, results are added to it alongside the resulting file',
+        default=None)
     parser.add_argument(
         '-d', '--definitions',
         help='Path to the global datasets configuration file',
@@ -114,11 +119,12 @@ if __name__ == '__main__':
 
     log.info(f'Create result table with name: {args.result_file}')
 
-    output_handler = OutputHandler(args.result_file, args.csv_delimiter)
+    output_handler = OutputHandler(args.result_file, args.csv_delimiter, args.result_store)
     output_handler.create_table()
 
     log.info(f'Start {len(test_list)} accuracy tests\n')
 
     return_code = accuracy_check(args.executor_type, test_list, output_handler, log)
+    output_handler.close()
     log.info('Accuracy tests completed' if not return_code else 'Accuracy tests failed')
     sys.exit(return_code)
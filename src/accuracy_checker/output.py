@@ -3,10 +3,11 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
 from csv_wrapper import CsvReport  # noqa: E402
+from result_store import ResultStore  # noqa: E402
 
 
 class OutputHandler:
-    def __init__(self, table_name, csv_delimiter):
+    def __init__(self, table_name, csv_delimiter, result_store=None):
         self.__table_name = table_name
 
         self._column_names = {
@@ -24,9 +25,16 @@ class OutputHandler:
         }
 
         self._report = CsvReport(self.__table_name, self._column_names.values(), output_delimiter=csv_delimiter)
+        self._result_store = ResultStore(result_store) if result_store else None
 
     def create_table(self):
         self._report.write_headers()
+        if self._result_store is not None:
+            self._result_store.create_table('accuracy_checker', list(self._column_names.values()))
+
+    def close(self):
+        if self._result_store is not None:
+            self._result_store.close()
 
     def add_results(self, test, process, executor):
         results = process.get_result_parameters()
@@ -37,3 +45,5 @@ class OutputHandler:
 
             row_dict = {column_name: result_dict[key] for key, column_name in self._column_names.items()}
             self._report.append_row(row_dict)
+            if self._result_store is not None:
+                self._result_store.add_row('accuracy_checker', row_dict)
@@ -15,14 +15,7 @@ def process_config(config, log):
     status = 0
     for idx, curr_test in enumerate(tests):
         try:
-            model = test_parser.parse_model(curr_test)
-            dataset = test_parser.parse_dataset(curr_test)
-            indep_parameters = test_parser.parse_independent_parameters(curr_test)
-            framework = indep_parameters.inference_framework
-            dep_parameters = test_parser.parse_dependent_parameters(curr_test, framework)
-
-            test_list.append(FrameworkWrapperRegistry()[framework].create_test(model, dataset,
-                                                                               indep_parameters, dep_parameters))
+            test_list.append(parse_test(test_parser, curr_test))
         except ValueError as valerr:
             log.warning(f'Test {idx + 1} not added to test list: {valerr}')
             status = 1
@@ -30,6 +23,19 @@ def process_config(config, log):
     return test_list, status
 
 
+def parse_test(test_parser, curr_test):
+    """
+    Create test from the Test element of the configuration file
+    """
+    model = test_parser.parse_model(curr_test)
+    dataset = test_parser.parse_dataset(curr_test)
+    indep_parameters = test_parser.parse_independent_parameters(curr_test)
+    framework = indep_parameters.inference_framework
+    dep_parameters = test_parser.parse_dependent_parameters(curr_test, framework)
+
+    return FrameworkWrapperRegistry()[framework].create_test(model, dataset, indep_parameters, dep_parameters)
+
+
 class TestConfigParser:
     def __init__(self, log):
         self._log = log
@@ -93,6 +99,14 @@ class TestConfigParser:
         raw_output = True
         if raw_output_element:
             raw_output = raw_output_element[0].firstChild.data.strip() == 'True'
+        save_raw_timings_element = indep_parameters_tag.getElementsByTagName('SaveRawTimings')
+        save_raw_timings = False
+        if save_raw_timings_element and save_raw_timings_element[0].firstChild:
+            save_raw_timings = save_raw_timings_element[0].firstChild.data.strip() == 'True'
+        collect_rusage_element = indep_parameters_tag.getElementsByTagName('CollectRusage')
+        collect_rusage = False
+        if collect_rusage_element and collect_rusage_element[0].firstChild:
+            collect_rusage = collect_rusage_element[0].firstChild.data.strip() == 'True'
         if timeout_overhead_element:
             timeout_overhead = int(timeout_overhead_element[0].firstChild.data)
         else:
@@ -103,11 +117,74 @@ class TestConfigParser:
         if links_tag and links_tag[0].firstChild:
             custom_models_links = links_tag[0].firstChild.data.strip()
 
+        max_input_images_element = indep_parameters_tag.getElementsByTagName('MaxInputImages')
+        max_input_images = None
+        if max_input_images_element and max_input_images_element[0].firstChild:
+            max_input_images = max_input_images_element[0].firstChild.data.strip()
+
+        warmup_parameters = {}
+        for tag_name, parameter_name in [('WarmupIterations', 'warmup_iters'), ('WarmupTime', 'warmup_time'),
+                                         ('SteadyStateCV', 'steady_state_cv'),
+                                         ('SteadyStateMaxTime', 'steady_state_max_time')]:
+            warmup_element = indep_parameters_tag.getElementsByTagName(tag_name)
+            warmup_parameters[parameter_name] = None
+            if warmup_element and warmup_element[0].firstChild:
+                warmup_parameters[parameter_name] = warmup_element[0].firstChild.data.strip()
+
+        load_parameters = {}
+        for tag_name, parameter_name in [('ArrivalRate', 'arrival_rate'),
+                                         ('ArrivalDistribution', 'arrival_distribution'),
+                                         ('ArrivalTrace', 'arrival_trace'), ('LoadWorkers', 'load_workers'),
+                                         ('LatencySLA', 'latency_sla'), ('SLAPercentile', 'sla_percentile')]:
+            load_element = indep_parameters_tag.getElementsByTagName(tag_name)
+            load_parameters[parameter_name] = None
+            if load_element and load_element[0].firstChild:
+                load_parameters[parameter_name] = load_element[0].firstChild.data.strip()
+
+        instances_element = indep_parameters_tag.getElementsByTagName('Instances')
+        instances = None
+        if instances_element and instances_element[0].firstChild:
+            instances = instances_element[0].firstChild.data.strip()
+        instances_pinning_element = indep_parameters_tag.getElementsByTagName('InstancesPinning')
+        instances_pinning = None
+        if instances_pinning_element and instances_pinning_element[0].firstChild:
+            instances_pinning = instances_pinning_element[0].firstChild.data.strip()
+
+        memory_sampling_interval_element = indep_parameters_tag.getElementsByTagName('MemorySamplingInterval')
+        memory_sampling_interval = None
+        if memory_sampling_interval_element and memory_sampling_interval_element[0].firstChild:
+            memory_sampling_interval = memory_sampling_interval_element[0].firstChild.data.strip()
+        stall_timeout_element = indep_parameters_tag.getElementsByTagName('StallTimeout')
+        stall_timeout = None
+        if stall_timeout_element and stall_timeout_element[0].firstChild:
+            stall_timeout = stall_timeout_element[0].firstChild.data.strip()
+        load_stall_timeout_element = indep_parameters_tag.getElementsByTagName('LoadStallTimeout')
+        load_stall_timeout = None
+        if load_stall_timeout_element and load_stall_timeout_element[0].firstChild:
+            load_stall_timeout = load_stall_timeout_element[0].firstChild.data.strip()
+        trace_allocations_element = indep_parameters_tag.getElementsByTagName('TraceAllocations')
+        trace_allocations = False
+        if trace_allocations_element and trace_allocations_element[0].firstChild:
+            trace_allocations = trace_allocations_element[0].firstChild.data.strip() == 'True'
+
         num_gpu_devices_element = indep_parameters_tag.getElementsByTagName('GPUDevicesNumber')
         num_gpu_devices = None
         if num_gpu_devices_element and num_gpu_devices_element[0].firstChild:
             num_gpu_devices = int(num_gpu_devices_element[0].firstChild.data.strip())
 
+        compiled_model_cache_element = indep_parameters_tag.getElementsByTagName('CompiledModelCache')
+        compiled_model_cache = None
+        if compiled_model_cache_element and compiled_model_cache_element[0].firstChild:
+            compiled_model_cache = compiled_model_cache_element[0].firstChild.data.strip()
+            if compiled_model_cache == 'False':
+                compiled_model_cache = None
+        input_cache_element = indep_parameters_tag.getElementsByTagName('InputCache')
+        input_cache = None
+        if input_cache_element and input_cache_element[0].firstChild:
+            input_cache = input_cache_element[0].firstChild.data.strip()
+            if input_cache == 'False':
+                input_cache = None
+
         self._log.info(f'Framework independent parameters:\n\t'
                        f'Inference framework - {inference_framework}\n\t'
                        f'Batch size - {batch_size}\n\t'
@@ -116,8 +193,29 @@ class TestConfigParser:
                        f'Number of iterations - {iteration_count}\n\t'
                        f'Time limit of test execution - {test_time_limit}\n\t'
                        f'Timeout overhead - {timeout_overhead}\n\t'
+                       f'Stall timeout - {stall_timeout}\n\t'
+                       f'Load stall timeout - {load_stall_timeout}\n\t'
                        f'Custom models links - {custom_models_links}\n\t'
-                       f'Raw output - {raw_output}')
+                       f'Raw output - {raw_output}\n\t'
+                       f'Save raw timings - {save_raw_timings}\n\t'
+                       f'Max input images - {max_input_images}\n\t'
+                       f'Input cache - {input_cache}\n\t'
+                       f'Warm-up iterations - {warmup_parameters["warmup_iters"]}\n\t'
+                       f'Warm-up time - {warmup_parameters["warmup_time"]}\n\t'
+                       f'Steady state CV - {warmup_parameters["steady_state_cv"]}\n\t'
+                       f'Steady state max time - {warmup_parameters["steady_state_max_time"]}\n\t'
+                       f'Collect rusage - {collect_rusage}\n\t'
+                       f'Compiled model cache - {compiled_model_cache}\n\t'
+                       f'Arrival rate - {load_parameters["arrival_rate"]}\n\t'
+                       f'Arrival distribution - {load_parameters["arrival_distribution"]}\n\t'
+                       f'Arrival trace - {load_parameters["arrival_trace"]}\n\t'
+                       f'Load workers - {load_parameters["load_workers"]}\n\t'
+                       f'Latency SLA - {load_parameters["latency_sla"]}\n\t'
+                       f'SLA percentile - {load_parameters["sla_percentile"]}\n\t'
+                       f'Instances - {instances}\n\t'
+                       f'Instances pinning - {instances_pinning}\n\t'
+                       f'Memory sampling interval - {memory_sampling_interval}\n\t'
+                       f'Trace allocations - {trace_allocations}')
 
         return FrameworkIndependentParameters(
             inference_framework=inference_framework,
@@ -127,8 +225,21 @@ class TestConfigParser:
             iterarion_count=iteration_count,
             test_time_limit=test_time_limit,
             timeout_overhead=timeout_overhead,
+            stall_timeout=stall_timeout,
+            load_stall_timeout=load_stall_timeout,
             custom_models_links=custom_models_links,
             raw_output=raw_output,
+            save_raw_timings=save_raw_timings,
+            collect_rusage=collect_rusage,
+            max_input_images=max_input_images,
+            input_cache=input_cache,
+            compiled_model_cache=compiled_model_cache,
+            instances=instances,
+            instances_pinning=instances_pinning,
+            memory_sampling_interval=memory_sampling_interval,
+            trace_allocations=trace_allocations,
+            **warmup_parameters,
+            **load_parameters,
         )
 
     def parse_dependent_parameters(self, curr_test, framework):
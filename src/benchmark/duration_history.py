@@ -0,0 +1,107 @@
+import json
+import os
+import threading
+from datetime import timedelta
+from pathlib import Path
+from statistics import mean, median
+
+# durations of the last runs of the test used for the prediction
+MAX_DURATIONS_NUM = 5
+# predicted timeouts are not shorter than this time in seconds, durations of short tests vary more
+MIN_PREDICTED_TIMEOUT = 60
+TEST_ORDERS = ('config', 'longest_first', 'shortest_first')
+
+
+class DurationHistory:
+    """Durations of successful tests in seconds by test identity (Test ID column of the resulting file),
+    stored in JSON file between runs
+    """
+
+    def __init__(self, path):
+        """DurationHistory constructor
+
+        :param path: Path to JSON file with the history, it is created if it does not exist
+        """
+        self._path = Path(path)
+        self._durations = json.loads(self._path.read_text()) if self._path.is_file() else {}
+        # durations of concurrent tests are added from their threads
+        self._lock = threading.Lock()
+
+    def predict(self, test):
+        """Median of the last durations of the test, None if the test has not been run"""
+        durations = self._durations.get(test.get_identity())
+        return median(durations) if durations else None
+
+    def add(self, test, duration):
+        with self._lock:
+            durations = self._durations.setdefault(test.get_identity(), [])
+            durations.append(round(duration, 3))
+            del durations[:-MAX_DURATIONS_NUM]
+            temporary_path = self._path.with_name(f'{self._path.name}.tmp')
+            temporary_path.write_text(json.dumps(self._durations, indent=4, sort_keys=True))
+            os.replace(temporary_path, self._path)
+
+    def order_tests(self, test_list, order):
+        """Order tests by predicted durations, tests without history are considered the longest ones
+
+        :param order: 'config' keeps the configuration file order, 'longest_first' or 'shortest_first'
+        """
+        if order == 'longest_first':
+            return sorted(test_list, key=lambda test: -(self.predict(test) or float('inf')))
+        if order == 'shortest_first':
+            return sorted(test_list, key=lambda test: self.predict(test) or float('inf'))
+        return list(test_list)
+
+
+class RunProgress:
+    """Progress of the run: timeouts of tests predicted from the duration history and ETA logged
+    after every finished test
+    """
+
+    def __init__(self, test_list, log, history=None, timeout_factor=None, parallel=1):
+        """RunProgress constructor
+
+        :param history: DurationHistory, durations of successful tests are added to it
+        :param timeout_factor: Timeout of the test is its predicted duration multiplied by the factor,
+                               None keeps timeouts set by time limits of tests
+        :param parallel: Number of tests executed concurrently
+        """
+        self._log = log
+        self._history = history
+        self._timeout_factor = timeout_factor
+        self._parallel = parallel
+        self._tests_num = len(test_list)
+        self._remaining_predictions = [history.predict(test) if history else None for test in test_list]
+        self._durations = []
+        self._lock = threading.Lock()
+
+    def get_timeout(self, test):
+        """Timeout of the test in seconds predicted from its history, None if it is not predicted"""
+        predicted_duration = self._history.predict(test) if self._history else None
+        if not self._timeout_factor or predicted_duration is None:
+            return None
+        return max(self._timeout_factor * predicted_duration, MIN_PREDICTED_TIMEOUT)
+
+    def get_eta(self):
+        """Predicted time in seconds to finish the remaining tests, None if no test duration is known"""
+        known_durations = [duration for duration in self._remaining_predictions if duration is not None]
+        average_duration = mean(self._durations or known_durations) if self._durations or known_durations else None
+        if average_duration is None and len(known_durations) < len(self._remaining_predictions):
+            return None
+        remaining_time = sum(average_duration if duration is None else duration
+                             for duration in self._remaining_predictions)
+        return remaining_time / self._parallel
+
+    def finish_test(self, test, duration, succeeded):
+        with self._lock:
+            predicted_duration = self._history.predict(test) if self._history else None
+            if predicted_duration in self._remaining_predictions:
+                self._remaining_predictions.remove(predicted_duration)
+            if succeeded and self._history is not None:
+                self._history.add(test, duration)
+            self._durations.append(duration)
+            message = f'Finished {len(self._durations)} of {self._tests_num} tests, the last in {duration:.1f} s'
+            eta = self.get_eta() if self._remaining_predictions else None
+            if eta is not None:
+                message += f', ETA {timedelta(seconds=round(eta))}'
+            self._log.info(message)
@@ -1,7 +1,10 @@
 import abc
+import json
 import os
 import sys
 import tarfile
+import tempfile
+import threading
 from io import BytesIO
 from pathlib import Path
 
@@ -14,6 +17,12 @@ class Executor(metaclass=abc.ABCMeta):
     def __init__(self, log):
         self.log = log
         self.target_framework = None
+        # machine description is the same for all tests of one target, it is collected once per target
+        self._infrastructure = {}
+        self._fingerprints = {}
+        self._infrastructure_lock = threading.Lock()
+        self.resident_worker_jobs = 0
+        self._resident_workers = {}
 
     @staticmethod
     def get_executor(executor_type, log):
@@ -30,14 +39,69 @@ class Executor(metaclass=abc.ABCMeta):
     def get_path_to_inference_folder(self):
         pass
 
-    @abc.abstractmethod
     def get_infrastructure(self):
+        return self._get_cached(self._infrastructure, self._get_infrastructure)
+
+    def get_fingerprint(self):
+        """Structured machine description (dict) from node_info.get_system_fingerprint, None if unavailable"""
+        return self._get_cached(self._fingerprints, self._get_fingerprint)
+
+    def _get_cached(self, cache, getter):
+        with self._infrastructure_lock:
+            if self.target_framework not in cache:
+                cache[self.target_framework] = getter()
+            return cache[self.target_framework]
+
+    @abc.abstractmethod
+    def _get_infrastructure(self):
         pass
 
     @abc.abstractmethod
-    def execute_process(self, command_line, timeout):
+    def _get_fingerprint(self):
         pass
 
+    @abc.abstractmethod
+    def execute_process(self, command_line, timeout, cpu_set=None, memory_sampler=None, stall_monitor=None):
+        pass
+
+    def set_resident_worker_jobs(self, max_jobs):
+        """
+        Run python launchers in resident workers keeping frameworks imported, one worker per target framework
+        :param max_jobs: number of tests after which the worker is restarted, 0 disables resident workers
+        """
+        self.resident_worker_jobs = max_jobs
+
+    def get_resident_worker_command_line(self, command_line):
+        """
+        Command line of the resident worker client running the launcher of the command line. Command line is returned
+        unchanged if resident workers are disabled or it is not a python launcher from the inference folder
+        """
+        if not self.resident_worker_jobs:
+            return command_line
+        python, script, arguments = (command_line.split(' ', 2) + ['', ''])[:3]
+        inference_folder = Path(self.get_path_to_inference_folder())
+        if not script.endswith('.py') or Path(script).parent != inference_folder:
+            return command_line
+        socket_name = f'dl-benchmark-{os.getpid()}-{id(self)}-{self.target_framework}.sock'
+        socket_path = f'{self._get_resident_worker_folder()}/{socket_name}'
+        self._resident_workers[socket_path] = python, self.target_framework
+        worker_script = inference_folder / 'inference_worker.py'
+        return (f'{python} {worker_script.as_posix()} --socket {socket_path} --max_jobs {self.resident_worker_jobs}'
+                f' {script} {arguments}').strip()
+
+    def stop_resident_workers(self):
+        inference_folder = Path(self.get_path_to_inference_folder())
+        for socket_path, (python, target_framework) in self._resident_workers.items():
+            self.log.info(f'Stopping resident worker {socket_path}')
+            self.target_framework = target_framework
+            self.execute_process(f'{python} {(inference_folder / "inference_worker.py").as_posix()} '
+                                 f'--socket {socket_path} --stop', None)
+        self._resident_workers = {}
+
+    @staticmethod
+    def _get_resident_worker_folder():
+        return Path(tempfile.gettempdir()).as_posix()
+
     @abc.abstractmethod
     def get_path_to_logs_folder(self):
         pass
@@ -60,11 +124,21 @@ class HostExecutor(Executor):
     def get_path_to_inference_folder(self):
         return str(Path(__file__).resolve().parents[1].joinpath('inference'))
 
-    def get_infrastructure(self):
+    def set_resident_worker_jobs(self, max_jobs):
+        if max_jobs and sys.platform == 'win32':
+            # inference_worker.py serves jobs through UNIX sockets
+            self.log.warning('Resident workers are not supported on Windows, every test starts a new process')
+            max_jobs = 0
+        super().set_resident_worker_jobs(max_jobs)
+
+    @staticmethod
+    def _import_node_info():
         sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('node_info')))
         import node_info as info  # noqa: E402
+        return info
 
-        hardware = info.get_system_characteristics()
+    def _get_infrastructure(self):
+        hardware = self._import_node_info().get_system_characteristics()
         hardware_info = ''
         for key in hardware:
             hardware_info += f'{key}: {hardware[key]}, '
@@ -72,8 +146,12 @@ class HostExecutor(Executor):
 
         return hardware_info
 
-    def execute_process(self, command_line, timeout):
-        cmd_handler = CMDHandler(command_line, self.log, self.environment)
+    def _get_fingerprint(self):
+        return self._import_node_info().get_system_fingerprint()
+
+    def execute_process(self, command_line, timeout, cpu_set=None, memory_sampler=None, stall_monitor=None):
+        cmd_handler = CMDHandler(command_line, self.log, self.environment, cpu_set=cpu_set,
+                                 memory_sampler=memory_sampler, stall_monitor=stall_monitor)
         cmd_handler.run(timeout)
         return cmd_handler.return_code, cmd_handler.output
 
@@ -96,15 +174,25 @@ class DockerExecutor(Executor):
     def get_path_to_inference_folder(self):
         return '/tmp/dl-benchmark/src/inference'
 
-    def get_infrastructure(self):
-        hardware_command = 'python3 /tmp/dl-benchmark/src/node_info/node_info.py'
+    @staticmethod
+    def _get_resident_worker_folder():
+        return '/tmp'
+
+    def _run_node_info(self, arguments=''):
+        hardware_command = f'python3 /tmp/dl-benchmark/src/node_info/node_info.py {arguments}'.strip()
         command_line = f'bash -c "source /root/.bashrc && {hardware_command}"'
         docker_handler = DockerHandler(command_line, self.log, self.client,
                                        self.container_dict[self.target_framework].id, False)
         docker_handler.run()
         if docker_handler.return_code != 0:
+            return None
+        return docker_handler.output
+
+    def _get_infrastructure(self):
+        output = self._run_node_info()
+        if output is None:
             return 'None'
-        hardware = [line.strip().split(': ') for line in docker_handler.output[:]]
+        hardware = [line.strip().split(': ') for line in output]
         hardware = [pair for pair in hardware if len(pair) == 2]
         hardware_info = ''
         for line in hardware:
@@ -113,7 +201,22 @@ class DockerExecutor(Executor):
 
         return hardware_info
 
-    def execute_process(self, command_line, _):
+    def _get_fingerprint(self):
+        output = self._run_node_info('--fingerprint')
+        if not output:
+            return None
+        try:
+            return json.loads(output[-1])
+        except ValueError:
+            self.log.warning(f'Failed to parse machine fingerprint of {self.target_framework} container')
+            return None
+
+    def execute_process(self, command_line, _, cpu_set=None, memory_sampler=None, stall_monitor=None):
+        # memory of the process tree inside the container is not sampled, launchers report their own RSS,
+        # heartbeat files of launchers are not visible outside of the container
+        if cpu_set:
+            cpu_list = ','.join(str(cpu) for cpu in cpu_set)
+            command_line = f'taskset -c {cpu_list} {command_line}'
         docker_handler = DockerHandler(command_line, self.log, self.client,
                                        self.container_dict[self.target_framework].id)
         docker_handler.run()
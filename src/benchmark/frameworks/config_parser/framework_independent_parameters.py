@@ -3,7 +3,13 @@ from .framework_parameters_parser import FrameworkParameters
 
 class FrameworkIndependentParameters(FrameworkParameters):
     def __init__(self, inference_framework, batch_size, device, iterarion_count, test_time_limit,
-                 timeout_overhead, custom_models_links=None, raw_output=True, num_gpu_devices=None):
+                 timeout_overhead, custom_models_links=None, raw_output=True, num_gpu_devices=None,
+                 save_raw_timings=False, max_input_images=None, warmup_iters=None, warmup_time=None,
+                 steady_state_cv=None, steady_state_max_time=None, compiled_model_cache=None, arrival_rate=None,
+                 arrival_distribution=None, arrival_trace=None, load_workers=None, latency_sla=None,
+                 sla_percentile=None, instances=None, instances_pinning=None, memory_sampling_interval=None,
+                 trace_allocations=False, stall_timeout=None, load_stall_timeout=None, input_cache=None,
+                 collect_rusage=False):
         self.inference_framework = None
         self.batch_size = None
         self.device = None
@@ -12,6 +18,27 @@ class FrameworkIndependentParameters(FrameworkParameters):
         self.test_time_limit = None
         self.custom_models_links = custom_models_links
         self.raw_output = raw_output
+        self.save_raw_timings = save_raw_timings
+        self.max_input_images = None
+        self.input_cache = input_cache
+        self.warmup_iters = None
+        self.warmup_time = None
+        self.steady_state_cv = None
+        self.steady_state_max_time = None
+        self.collect_rusage = collect_rusage
+        self.compiled_model_cache = compiled_model_cache
+        self.arrival_rate = None
+        self.arrival_distribution = None
+        self.arrival_trace = arrival_trace
+        self.load_workers = None
+        self.latency_sla = None
+        self.sla_percentile = None
+        self.instances = None
+        self.instances_pinning = None
+        self.memory_sampling_interval = None
+        self.trace_allocations = trace_allocations
+        self.stall_timeout = None
+        self.load_stall_timeout = None
         if self._parameter_is_not_none(inference_framework):
             self.inference_framework = inference_framework
         else:
@@ -38,6 +65,91 @@ class FrameworkIndependentParameters(FrameworkParameters):
             raise ValueError('Test time limit is required parameter. '
                              'Test time limit can only `take values: float greater than zero.')
 
+        if self._parameter_is_not_none(max_input_images):
+            if self._int_value_is_correct(max_input_images):
+                self.max_input_images = int(max_input_images)
+            else:
+                raise ValueError('Max input images can only take values: integer greater than zero.')
+
+        if self._parameter_is_not_none(warmup_iters):
+            if self._int_value_is_correct(warmup_iters):
+                self.warmup_iters = int(warmup_iters)
+            else:
+                raise ValueError('Warm-up iterations can only take values: integer greater than zero.')
+        if self._parameter_is_not_none(warmup_time):
+            if self._float_value_is_correct(warmup_time):
+                self.warmup_time = float(warmup_time)
+            else:
+                raise ValueError('Warm-up time can only take values: float greater than zero.')
+        if self._parameter_is_not_none(steady_state_cv):
+            if self._float_value_is_correct(steady_state_cv):
+                self.steady_state_cv = float(steady_state_cv)
+            else:
+                raise ValueError('Steady state CV can only take values: float greater than zero.')
+        if self._parameter_is_not_none(steady_state_max_time):
+            if self._float_value_is_correct(steady_state_max_time):
+                self.steady_state_max_time = float(steady_state_max_time)
+            else:
+                raise ValueError('Steady state max time can only take values: float greater than zero.')
+
+        if self._parameter_is_not_none(arrival_rate):
+            if self._float_value_is_correct(arrival_rate):
+                self.arrival_rate = float(arrival_rate)
+            else:
+                raise ValueError('Arrival rate can only take values: float greater than zero.')
+        if self._parameter_is_not_none(arrival_distribution):
+            if arrival_distribution in ['poisson', 'uniform']:
+                self.arrival_distribution = arrival_distribution
+            else:
+                raise ValueError('Arrival distribution can only take values: poisson, uniform.')
+        if self._parameter_is_not_none(load_workers):
+            if self._int_value_is_correct(load_workers):
+                self.load_workers = int(load_workers)
+            else:
+                raise ValueError('Load workers can only take values: integer greater than zero.')
+        if self._parameter_is_not_none(latency_sla):
+            if self._float_value_is_correct(latency_sla):
+                self.latency_sla = float(latency_sla)
+            else:
+                raise ValueError('Latency SLA can only take values: float greater than zero.')
+        if self._parameter_is_not_none(sla_percentile):
+            if self._float_value_is_correct(sla_percentile) and 0 < float(sla_percentile) <= 100:
+                self.sla_percentile = float(sla_percentile)
+            else:
+                raise ValueError('SLA percentile can only take values: float greater than zero and not greater '
+                                 'than 100.')
+        if self.latency_sla is not None and self.arrival_rate is None and self.arrival_trace is None:
+            raise ValueError('Latency SLA requires arrival rate or arrival trace.')
+
+        if self._parameter_is_not_none(instances):
+            if self._int_value_is_correct(instances) and int(instances) > 0:
+                self.instances = int(instances)
+            else:
+                raise ValueError('Instances can only take values: integer greater than zero.')
+        if self._parameter_is_not_none(instances_pinning):
+            if instances_pinning in ['none', 'cpu_sets', 'numa']:
+                self.instances_pinning = instances_pinning
+            else:
+                raise ValueError('Instances pinning can only take values: none, cpu_sets, numa.')
+
+        if self._parameter_is_not_none(memory_sampling_interval):
+            if self._float_value_is_correct(memory_sampling_interval):
+                # zero interval disables sampling
+                self.memory_sampling_interval = float(memory_sampling_interval) or None
+            else:
+                raise ValueError('Memory sampling interval can only take values: float not less than zero.')
+
+        if self._parameter_is_not_none(stall_timeout):
+            if self._float_value_is_correct(stall_timeout):
+                self.stall_timeout = float(stall_timeout)
+            else:
+                raise ValueError('Stall timeout can only take values: float greater than zero.')
+        if self._parameter_is_not_none(load_stall_timeout):
+            if self._float_value_is_correct(load_stall_timeout):
+                self.load_stall_timeout = float(load_stall_timeout)
+            else:
+                raise ValueError('Load stall timeout can only take values: float greater than zero.')
+
         if self._parameter_is_not_none(timeout_overhead):
             self.timeout_overhead = int(timeout_overhead)
         else:
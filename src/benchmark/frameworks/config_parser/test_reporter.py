@@ -1,10 +1,22 @@
 import abc
+import hashlib
+import json
 import logging as log
 
 from collections import OrderedDict
 
+TEST_ID_LENGTH = 12
+
 
 class Test(metaclass=abc.ABCMeta):
+    # framework independent parameters changing measurements of the test, parameters of the benchmark itself
+    # (timeouts, logs, caches of input data) are excluded
+    MEASUREMENT_PARAMETERS = ('iteration', 'test_time_limit', 'num_gpu_devices', 'max_input_images', 'warmup_iters',
+                              'warmup_time', 'steady_state_cv', 'steady_state_max_time', 'compiled_model_cache',
+                              'arrival_rate', 'arrival_distribution', 'arrival_trace', 'load_workers', 'latency_sla',
+                              'sla_percentile', 'instances', 'instances_pinning', 'trace_allocations',
+                              'collect_rusage')
+
     def __init__(self, model, dataset, indep_parameters, dep_parameters):
         self.model = model
         self.dataset = dataset
@@ -33,6 +45,30 @@ class Test(metaclass=abc.ABCMeta):
 
         return report_res
 
+    def get_identity(self):
+        """
+        Stable identity of the test in configuration files: model, dataset, framework, device, batch size,
+        framework independent parameters changing measurements and framework dependent parameters, resumed runs
+        skip tests by identity
+        """
+        identity = {
+            'model': self.model.name,
+            'precision': self.model.precision,
+            'source_framework': self.model.source_framework,
+            'dataset': self.dataset.name if self.dataset else None,
+            'inference_framework': self.indep_parameters.inference_framework,
+            'device': self.indep_parameters.device,
+            'batch_size': self.indep_parameters.batch_size,
+            'dep_parameters': vars(self.dep_parameters),
+        }
+        # unset parameters are skipped, so new optional parameters do not change identities of existing tests
+        for name in self.MEASUREMENT_PARAMETERS:
+            value = getattr(self.indep_parameters, name, None)
+            if value is not None and value is not False:
+                identity[name] = value
+        identity_json = json.dumps(identity, sort_keys=True, default=str)
+        return hashlib.sha256(identity_json.encode('utf-8')).hexdigest()[:TEST_ID_LENGTH]
+
     @staticmethod
     def _get_optional_parameters_string(parameters_dict):
         parameter_strings = []
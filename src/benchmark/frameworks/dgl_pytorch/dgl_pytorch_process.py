@@ -58,6 +58,7 @@ class DGLPyTorchProcess(ProcessHandler):
             common_params = DGLPyTorchProcess._add_argument_to_cmd_line(
                 common_params, '--num_intra_threads', num_intra_threads)
 
+        common_params = self._add_measurement_arguments(common_params)
         command_line = f'{python} {path_to_pytorch_script} {common_params}'
 
         return command_line
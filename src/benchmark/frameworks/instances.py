@@ -0,0 +1,100 @@
+import copy
+import itertools
+import os
+from pathlib import Path
+from statistics import mean, median
+
+NUMA_SYSFS_PATH = Path('/sys/devices/system/node')
+# launchers wait for each other at the start of measurements until this number of instances arrive in the directory
+START_BARRIER_ENV = 'DLI_START_BARRIER'
+START_BARRIER_PARTIES_ENV = 'DLI_START_BARRIER_PARTIES'
+LATENCY_PERCENTILES = ('latency_p50', 'latency_p90', 'latency_p95', 'latency_p99', 'latency_p99_9')
+
+
+def parse_cpu_list(cpu_list):
+    """Convert CPU list of sysfs to the list of CPU ids, ex. '0-2,5' -> [0, 1, 2, 5]"""
+    cpus = []
+    for cpu_range in cpu_list.strip().split(','):
+        if not cpu_range:
+            continue
+        first, _, last = cpu_range.partition('-')
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def get_numa_cpu_sets():
+    if not NUMA_SYSFS_PATH.exists():
+        return []
+    nodes = sorted(NUMA_SYSFS_PATH.glob('node[0-9]*'), key=lambda node: int(node.name[4:]))
+    return [parse_cpu_list((node / 'cpulist').read_text()) for node in nodes]
+
+
+def split_cpu_set(cpus, parts):
+    """Split CPUs into contiguous disjoint sets of equal size, remaining CPUs are not used"""
+    cpus = sorted(cpus)
+    size = len(cpus) // parts
+    if size == 0:
+        raise ValueError(f'{len(cpus)} CPUs can not be split between {parts} instances')
+    return [cpus[i * size:(i + 1) * size] for i in range(parts)]
+
+
+def get_instance_cpu_sets(instances, pinning, cpu_set=None):
+    """
+    CPU sets of test instances
+    :param pinning: none, cpu_sets (disjoint sets of equal size) or numa (NUMA nodes assigned round-robin)
+    :param cpu_set: CPUs of the whole test, all available CPUs if None
+    :return: list of CPU sets, None for instances without pinning
+    """
+    if pinning in (None, 'none'):
+        return [cpu_set] * instances
+    if cpu_set is None:
+        cpu_set = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else list(range(os.cpu_count()))
+    if pinning == 'cpu_sets':
+        return split_cpu_set(cpu_set, instances)
+    if pinning == 'numa':
+        nodes = [sorted(set(node) & set(cpu_set)) for node in get_numa_cpu_sets()]
+        nodes = [node for node in nodes if node]
+        if not nodes:
+            raise ValueError('NUMA nodes are not available for pinning of test instances')
+        return list(itertools.islice(itertools.cycle(nodes), instances))
+    raise ValueError(f'Unknown pinning of test instances {pinning}')
+
+
+def aggregate_instance_reports(reports, reference_report=None):
+    """
+    Aggregate JSON reports of concurrent instances of one test: throughput is summed, latency is the median
+    of instance medians, latency percentiles and maximum are the worst of instances
+    :param reference_report: report of a single instance run alone, used for the scaling efficiency
+    """
+    aggregated = copy.deepcopy(reports[0])
+    instance_results = [report['execution_results'] for report in reports]
+    results = aggregated['execution_results']
+
+    throughputs = [float(result['throughput']) for result in instance_results]
+    results['throughput'] = round(sum(throughputs), 3)
+    if all(result.get('batch_throughput') for result in instance_results):
+        results['batch_throughput'] = round(sum(float(result['batch_throughput']) for result in instance_results), 3)
+    results['iterations_num'] = sum(int(result.get('iterations_num') or 0) for result in instance_results)
+    results['latency_avg'] = round(mean(float(result['latency_avg']) for result in instance_results), 5)
+    for name in ('latency_max', *LATENCY_PERCENTILES):
+        values = [float(result[name]) for result in instance_results if result.get(name) is not None]
+        results[name] = max(values) if values else None
+    results['latency_min'] = min((float(result['latency_min']) for result in instance_results
+                                  if result.get('latency_min') is not None), default=None)
+    # histograms of instances have different buckets, the median latency is a summary of the spread
+    results['latency_histogram'] = None
+
+    latencies = [float(result['latency_median']) for result in instance_results if result.get('latency_median')]
+    results['latency_median'] = round(median(latencies), 5) if latencies else None
+    results['instances_num'] = len(reports)
+    results['instance_throughputs'] = throughputs
+    results['instance_latencies'] = latencies
+    # relative difference between the slowest and the fastest instances
+    results['instance_latency_spread'] = (round((max(latencies) - min(latencies)) / min(latencies), 5)
+                                          if latencies and min(latencies) > 0 else None)
+    results['scaling_efficiency'] = None
+    if reference_report is not None:
+        reference_throughput = float(reference_report['execution_results']['throughput'])
+        if reference_throughput > 0:
+            results['scaling_efficiency'] = round(sum(throughputs) / (len(reports) * reference_throughput), 5)
+    return aggregated
@@ -79,6 +79,8 @@ class MXNetProcess(ProcessHandler):
         common_params = MXNetProcess._add_argument_to_cmd_line(
             common_params, '--raw_output', 'true')
 
+        common_params = self._add_input_data_arguments(common_params)
+
         quantization = self._test.dep_parameters.quantization
         if quantization == 'True':
             common_params = MXNetProcess._add_flag_to_cmd_line(
@@ -101,6 +103,7 @@ class SyncMXNetProcess(MXNetProcess):
         time_limit = self._test.indep_parameters.test_time_limit
         common_params = super()._fill_command_line()
         common_params += f' --time {time_limit}'
+        common_params = self._add_measurement_arguments(common_params)
         command_line = f'{python} {path_to_sync_script} {common_params}'
 
         return command_line
@@ -65,6 +65,8 @@ class NcnnProcess(ProcessHandler):
             common_params = NcnnProcess._add_argument_to_cmd_line(
                 common_params, '--raw_output', 'true')
 
+        common_params = self._add_input_data_arguments(common_params)
+        common_params = self._add_measurement_arguments(common_params)
         command_line = f'{python} {path_to_ncnn_script} {common_params}'
 
         return command_line
@@ -78,6 +78,10 @@ class ONNXRuntimePythonProcess(ProcessHandler):
         if raw_output:
             common_params = self._add_argument_to_cmd_line(common_params, '--raw_output', 'true')
 
+        common_params = self._add_input_data_arguments(common_params)
+        common_params = self._add_measurement_arguments(common_params)
+        common_params = self._add_load_generator_arguments(common_params)
+        common_params = self._add_compiled_model_cache_argument(common_params)
         command_line = f'{python} {path_to_onnx_script} {common_params}'
 
         return command_line
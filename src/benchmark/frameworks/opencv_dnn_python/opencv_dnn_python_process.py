@@ -71,6 +71,8 @@ class OpenCVDNNPythonProcess(ProcessHandler):
         common_params = self._add_optional_argument_to_cmd_line(common_params, '--layout', layout)
 
         common_params = self._add_argument_to_cmd_line(common_params, '--raw_output', 'true')
+        common_params = self._add_input_data_arguments(common_params)
+        common_params = self._add_measurement_arguments(common_params)
         command_line = f'{python} {path_to_opencv_script} {common_params}'
 
         return command_line
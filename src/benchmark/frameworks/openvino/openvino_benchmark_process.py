@@ -5,11 +5,32 @@ from .openvino_process import OpenVINOProcess
 
 
 class OpenVINOBenchmarkProcess(OpenVINOProcess):
+    # statistics report of benchmark_app saved with -json_stats to the report folder
+    JSON_STATS_FILE_NAME = 'benchmark_report.json'
+
     def __init__(self, test, executor, log, perf_hint='', api_mode=''):
         super().__init__(test, executor, log)
         self._perf_hint = perf_hint
         self._api_mode = api_mode
 
+    @property
+    def report_folder(self):
+        # the name of the statistics report is fixed, concurrent and previous tests save it to their own folders
+        report_folder_name = f'{self.benchmark_app_name}_{self._test.model.name}_{self.timestamp}'
+        return Path(self._executor.get_path_to_logs_folder()) / report_folder_name
+
+    @property
+    def report_path(self):
+        return self.report_folder / self.JSON_STATS_FILE_NAME
+
+    @property
+    def json_stats_arguments(self):
+        return f'-report_type "no_counters" -json_stats -report_folder {self.report_folder.absolute()}'
+
+    def execute(self):
+        self.report_folder.mkdir(parents=True, exist_ok=True)
+        super().execute()
+
     @staticmethod
     def _add_perf_hint_for_cmd_line(command_line, perf_hint):
         hint = perf_hint.lower()
@@ -48,6 +69,11 @@ class OpenVINOBenchmarkProcess(OpenVINOProcess):
                     'num_tokens': None, 'audio_len_avg': None, 'audio_sampling_rate': None,
                     'latency_per_second': None}
 
+        report = self._get_json_stats()
+        if report is not None:
+            return self._get_performance_metrics_from_json_stats(report)
+
+        # benchmark_app without the statistics report, metrics are parsed from its output
         # calculate average time of single pass metric to align output with custom launchers
         duration = self._get_benchmark_app_metric('Duration')
         iter_count = self._get_benchmark_app_metric('Count')
@@ -56,21 +82,40 @@ class OpenVINOBenchmarkProcess(OpenVINOProcess):
         fps = self._get_benchmark_app_metric('Throughput')
         latency = round(self._get_benchmark_app_metric('Median') / 1000, 5)
 
-        num_tokens = 'N/A'
-        audio_len_avg = 'N/A'
-        audio_sampling_rate = 'N/A'
-        latency_per_second = 'N/A'
+        metrics = {
+            'average_time': average_time_of_single_pass,
+            'fps': fps,
+            'batch_fps': 0.0,
+            'num_tokens': 'N/A',
+            'audio_len_avg': 'N/A',
+            'audio_sampling_rate': 'N/A',
+            'latency_per_second': 'N/A',
+        }
+        return self._add_latency_metrics(metrics, latency)
+
+    def _get_performance_metrics_from_json_stats(self, report):
+        # calculate average time of single pass metric to align output with custom launchers
+        MILLISECONDS_IN_SECOND = 1000
+        duration = float(report['execution_results']['execution_time'])
+        iter_count = float(report['execution_results']['iterations_num'])
+        average_time_of_single_pass = (round(duration / MILLISECONDS_IN_SECOND / iter_count, 5)
+                                       if None not in (duration, iter_count) else None)
+
+        fps = round(float(report['execution_results']['throughput']), 3)
+        latency = round(float(report['execution_results']['latency_median']) / MILLISECONDS_IN_SECOND, 5)
 
         metrics = {
             'average_time': average_time_of_single_pass,
             'fps': fps,
             'batch_fps': 0.0,
-            'num_tokens': num_tokens,
-            'audio_len_avg': audio_len_avg,
-            'audio_sampling_rate': audio_sampling_rate,
-            'latency_per_second': latency_per_second,
+            'num_tokens': report['execution_results'].get('num_tokens', 'N/A'),
+            'audio_len_avg': report['execution_results'].get('num_tokens', 'N/A'),
+            'audio_sampling_rate': report['execution_results'].get('audio_sampling_rate', 'N/A'),
+            'latency_per_second': report['execution_results'].get('latency_per_second', 'N/A'),
         }
+        return self._add_latency_metrics(metrics, latency)
 
+    def _add_latency_metrics(self, metrics, latency):
         if self._test.dep_parameters.use_latency_per_token:
             metrics.update({'latency_per_token': latency,
                             'latency': 'N/A'})
@@ -80,14 +125,31 @@ class OpenVINOBenchmarkProcess(OpenVINOProcess):
 
         return metrics
 
+    def _get_json_stats(self):
+        """
+        gets statistics report of benchmark app
+        :return: report content or None if benchmark app has not saved it
+        """
+        try:
+            report = self.get_json_report_content()
+        except (OSError, ValueError):
+            return None
+        return report if 'execution_results' in report else None
+
+    def _get_json_stats_parameter(self, key):
+        report = self._get_json_stats()
+        if report is None:
+            return None
+        return report.get('configuration_setup', {}).get(key)
+
     def _get_benchmark_app_metric(self, metric_name):
         """
         gets metric value from benchmark app full output
         :param metric_name: metric name, ex 'Throughput'
         :return: float value or None if pattern not found
         """
+        regex = re.compile(f'.*{metric_name}:\\s+(?P<metric>\\d*\\.\\d+|\\d+).*')
         for line in self._output:
-            regex = re.compile(f'.*{metric_name}:\\s+(?P<metric>\\d*\\.\\d+|\\d+).*')
             res = regex.match(line)
             if res:
                 try:
@@ -96,6 +158,9 @@ class OpenVINOBenchmarkProcess(OpenVINOProcess):
                     return None
 
     def _get_model_batch_size(self):
+        batch_size = self._get_json_stats_parameter('batch_size')
+        if batch_size:
+            return batch_size
         regex = re.compile(r'\s*Model\sbatch\ssize:\s(\d+)')
         for line in self._output:
             if 'Model batch size' in line:
@@ -165,7 +230,7 @@ class OpenVINOBenchmarkPythonProcess(OpenVINOBenchmarkProcess):
         frontend = self._test.dep_parameters.frontend
         time = int(self._test.indep_parameters.test_time_limit)
 
-        arguments = f'-m {model_xml} -d {device} -niter {iteration} -t {time}'
+        arguments = f'-m {model_xml} -d {device} -niter {iteration} -t {time} {self.json_stats_arguments}'
 
         arguments = self._add_optional_argument_to_cmd_line(arguments, '-i', dataset)
 
@@ -186,6 +251,9 @@ class OpenVINOBenchmarkPythonProcess(OpenVINOBenchmarkProcess):
 
     def extract_inference_param(self, key):
         if key == 'nireq':
+            nireq = self._get_json_stats_parameter('nireq')
+            if nireq:
+                return nireq
             regex = re.compile(r'\s*(\d+)\s*inference\s+requests')
             for line in self._output:
                 if 'Measuring performance' in line:
@@ -214,10 +282,6 @@ class OpenVINOBenchmarkCppProcess(OpenVINOBenchmarkProcess):
         if not self._benchmark_path.is_file():
             raise invalid_path_exception
 
-    @property
-    def report_path(self):
-        return Path(self._executor.get_path_to_logs_folder()) / 'benchmark_report.json'
-
     @staticmethod
     def create_process(test, executor, log, cpp_benchmarks_dir='', **kwargs):
         return OpenVINOBenchmarkCppProcess(test, executor, log, cpp_benchmarks_dir)
@@ -231,8 +295,7 @@ class OpenVINOBenchmarkCppProcess(OpenVINOBenchmarkProcess):
         frontend = self._test.dep_parameters.frontend
         time = int(self._test.indep_parameters.test_time_limit)
 
-        arguments = (f'-m {model_xml} -d {device} -niter {iteration} -t {time} '
-                     f'-report_type "no_counters" -json_stats -report_folder {self.report_path.parent.absolute()}')
+        arguments = f'-m {model_xml} -d {device} -niter {iteration} -t {time} {self.json_stats_arguments}'
 
         arguments = self._add_optional_argument_to_cmd_line(arguments, '-i', dataset)
 
@@ -250,51 +313,9 @@ class OpenVINOBenchmarkCppProcess(OpenVINOBenchmarkProcess):
 
         return command_line
 
-    def get_performance_metrics(self):
-        if self._status != 0 or len(self._output) == 0:
-            return {'average_time': None, 'fps': None, 'latency': None, 'batch_fps': None, 'latency_per_token': None,
-                    'num_tokens': None, 'audio_len_avg': None, 'audio_sampling_rate': None,
-                    'latency_per_second': None}
-
-        report = self.get_json_report_content()
-
-        # calculate average time of single pass metric to align output with custom launchers
-        MILLISECONDS_IN_SECOND = 1000
-        duration = float(report['execution_results']['execution_time'])
-        iter_count = float(report['execution_results']['iterations_num'])
-        average_time_of_single_pass = (round(duration / MILLISECONDS_IN_SECOND / iter_count, 5)
-                                       if None not in (duration, iter_count) else None)
-
-        fps = round(float(report['execution_results']['throughput']), 3)
-        latency = round(float(report['execution_results']['latency_median']) / MILLISECONDS_IN_SECOND, 5)
-
-        num_tokens = report['execution_results'].get('num_tokens', 'N/A')
-        audio_len_avg = report['execution_results'].get('num_tokens', 'N/A')
-        audio_sampling_rate = report['execution_results'].get('audio_sampling_rate', 'N/A')
-        latency_per_second = report['execution_results'].get('latency_per_second', 'N/A')
-
-        metrics = {
-            'average_time': average_time_of_single_pass,
-            'fps': fps,
-            'batch_fps': 0.0,
-            'num_tokens': num_tokens,
-            'audio_len_avg': audio_len_avg,
-            'audio_sampling_rate': audio_sampling_rate,
-            'latency_per_second': latency_per_second,
-        }
-
-        if self._test.dep_parameters.use_latency_per_token:
-            metrics.update({'latency_per_token': latency,
-                            'latency': 'N/A'})
-        else:
-            metrics.update({'latency_per_token': 'N/A',
-                            'latency': latency})
-
-        return metrics
-
     def extract_inference_param(self, key):
         if key == 'nireq':
-            return self.get_json_report_content()['configuration_setup']['nireq']
+            return self._get_json_stats_parameter('nireq')
         elif key == 'batch_size':
             return self._get_model_batch_size()
         return super().extract_inference_param(key)
@@ -39,6 +39,8 @@ class OpenVINOPythonAPIProcess(OpenVINOProcess):
         if raw_output:
             command_line = OpenVINOPythonAPIProcess._add_argument_to_cmd_line(command_line, '--raw_output', 'true')
 
+        command_line = self._add_input_data_arguments(command_line)
+
         return command_line
 
 
@@ -55,8 +57,13 @@ class AsyncOpenVINOProcess(OpenVINOPythonAPIProcess):
     def _fill_command_line(self):
         path_to_async_script = Path.joinpath(self.inference_script_root, 'inference_openvino_async_mode.py')
         python = ProcessHandler.get_cmd_python_version()
+        time_limit = self._test.indep_parameters.test_time_limit
 
         common_params = super()._fill_command_line()
+        common_params += f' --time {time_limit}'
+        common_params = self._add_optional_argument_to_cmd_line(common_params, '--raw_timings_path',
+                                                                self.raw_timings_path)
+        common_params = self._add_compiled_model_cache_argument(common_params)
         command_line = f'{python} {path_to_async_script} {common_params}'
 
         nstreams = self._test.dep_parameters.nstreams
@@ -87,6 +94,9 @@ class SyncOpenVINOProcess(OpenVINOPythonAPIProcess):
 
         common_params = super()._fill_command_line()
         common_params += f' --time {time_limit}'
+        common_params = self._add_measurement_arguments(common_params)
+        common_params = self._add_load_generator_arguments(common_params)
+        common_params = self._add_compiled_model_cache_argument(common_params)
         command_line = f'{python} {path_to_sync_script} {common_params}'
 
         return command_line
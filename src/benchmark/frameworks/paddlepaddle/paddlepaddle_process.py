@@ -59,6 +59,8 @@ class PaddlePaddleProcess(ProcessHandler):
 
         common_params = self._add_argument_to_cmd_line(common_params, '--raw_output', 'true')
 
+        common_params = self._add_input_data_arguments(common_params)
+        common_params = self._add_measurement_arguments(common_params)
         command_line = f'{python} {path_to_paddlepaddle_script} {common_params}'
 
         nthreads = self._test.dep_parameters.nthreads
@@ -2,18 +2,53 @@ import abc
 import json
 import os
 import platform
+import shutil
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
+from .instances import START_BARRIER_ENV, START_BARRIER_PARTIES_ENV, aggregate_instance_reports, get_instance_cpu_sets
+
+sys.path.append(str(Path(__file__).resolve().parents[2].joinpath('utils')))
+from heartbeat_monitor import HeartbeatMonitor  # noqa: E402, PLC0411
+from memory_sampler import ProcessTreeMemorySampler  # noqa: E402, PLC0411
+
+# launchers trace Python allocations of measured iterations if this environment variable is set
+TRACE_ALLOCATIONS_ENV = 'DLI_TRACE_ALLOCATIONS'
+# launchers write heartbeats to the file set in this environment variable
+HEARTBEAT_PATH_ENV = 'DLI_HEARTBEAT_PATH'
+BYTES_IN_MEGABYTE = 1024 ** 2
+
 
 class ProcessHandler(metaclass=abc.ABCMeta):
+    LATENCY_PERCENTILES = ('latency_p50', 'latency_p90', 'latency_p95', 'latency_p99', 'latency_p99_9')
+    WARMUP_PARAMETERS = ('warmup_iters', 'warmup_time', 'steady_state_cv', 'steady_state_max_time')
+    # launchers limit the steady-state warm-up by this time if the test does not set it
+    DEFAULT_STEADY_STATE_MAX_TIME = 60
+    LOAD_GENERATOR_PARAMETERS = ('arrival_rate', 'arrival_distribution', 'arrival_trace', 'load_workers',
+                                 'latency_sla', 'sla_percentile')
+    # launchers run the open-loop inference at most this number of times searching the maximal rate under SLA
+    MAX_RATE_SEARCH_RUNS = 12
+    # memory footprint reported by launchers in JSON report and its metric names
+    LAUNCHER_MEMORY_METRICS = {'rss_after_import_mb': 'rss_after_import', 'load_rss_delta_mb': 'load_rss_delta',
+                               'rss_after_warmup_mb': 'rss_after_warmup', 'peak_rss_mb': 'peak_rss',
+                               'allocated_per_iteration': 'allocated_per_iteration'}
+
     def __init__(self, test, executor, log):
         self.__log = log
         self._test = test
         self._executor = executor
         self._output = None
         self._status = None
-        self.timestamp = datetime.now().strftime('%d.%m.%y_%H-%M-%S')
+        self._cpu_set = None
+        self._timeout = None
+        # name of the instance of multi-instance test whose command line is filled, None for the whole test
+        self._instance_name = None
+        self._aggregated_report = None
+        self._memory_samplers = []
+        # microseconds keep report names unique for concurrently started tests of the same model
+        self.timestamp = datetime.now().strftime('%d.%m.%y_%H-%M-%S-%f')
         self.inference_script_root = Path(self._executor.get_path_to_inference_folder())
 
     @property
@@ -29,10 +64,53 @@ class ProcessHandler(metaclass=abc.ABCMeta):
 
     @property
     def report_path(self):
-        report_name = f'{self.benchmark_app_name}_{self._test.model.name}_{self.timestamp}.json'
+        instance_suffix = f'_{self._instance_name}' if self._instance_name else ''
+        report_name = f'{self.benchmark_app_name}_{self._test.model.name}_{self.timestamp}{instance_suffix}.json'
         report_path = Path(self._executor.get_path_to_logs_folder()) / report_name
         return report_path
 
+    @property
+    def input_cache_dir(self):
+        input_cache = getattr(self._test.indep_parameters, 'input_cache', None)
+        if not input_cache:
+            return None
+        if input_cache == 'True':
+            # shared by all tests of the run, so tests on the same data skip decoding and preprocessing
+            return Path(self._executor.get_path_to_logs_folder()) / 'input_cache'
+        return input_cache
+
+    @property
+    def compiled_model_cache_dir(self):
+        compiled_model_cache = getattr(self._test.indep_parameters, 'compiled_model_cache', None)
+        if not compiled_model_cache:
+            return None
+        if compiled_model_cache == 'True':
+            # shared by all tests of the run, launchers key entries by model, framework version and options
+            return Path(self._executor.get_path_to_logs_folder()) / 'compiled_model_cache'
+        return compiled_model_cache
+
+    @property
+    def raw_timings_path(self):
+        if not getattr(self._test.indep_parameters, 'save_raw_timings', False):
+            return None
+        return self.report_path.with_suffix('.npy')
+
+    @property
+    def warmup_time_limit(self):
+        indep_parameters = self._test.indep_parameters
+        time_limit = getattr(indep_parameters, 'warmup_time', None) or 0
+        if getattr(indep_parameters, 'steady_state_cv', None):
+            time_limit += (getattr(indep_parameters, 'steady_state_max_time', None)
+                           or self.DEFAULT_STEADY_STATE_MAX_TIME)
+        return time_limit
+
+    @property
+    def measurement_time_limit(self):
+        time_limit = self._test.indep_parameters.test_time_limit
+        if time_limit and getattr(self._test.indep_parameters, 'latency_sla', None):
+            return time_limit * self.MAX_RATE_SEARCH_RUNS
+        return time_limit
+
     @staticmethod
     def get_cmd_python_version():
         cmd_python_version = ''
@@ -45,49 +123,216 @@ class ProcessHandler(metaclass=abc.ABCMeta):
         return cmd_python_version
 
     def get_model_shape(self):
-        input_shape = []
-        for line in self._output:
-            if 'Shape for input layer' in line:
-                input_shape.append(line.split(':')[-1].strip())
+        input_shape = self.__get_reported_input_shapes()
+        if input_shape is None:
+            # launchers without input shapes in JSON report print them
+            input_shape = [line.split(':')[-1].strip() for line in self._output if 'Shape for input layer' in line]
 
         return ', '.join(input_shape) if len(input_shape) > 0 else 'Undefined'
 
+    def __get_reported_input_shapes(self):
+        if self._status != 0:
+            return None
+        try:
+            report = self.get_json_report_content() or {}
+        except (OSError, ValueError, TypeError):
+            return None
+        input_shapes = (report.get('configurations_setup') or {}).get('input_shapes')
+        return list(input_shapes.values()) if input_shapes else None
+
+    @property
+    def instances(self):
+        return getattr(self._test.indep_parameters, 'instances', None) or 1
+
     def execute(self):
-        command_line = self._fill_command_line()
-        if command_line == '':
-            errmsg = 'Command line is empty, nothing to execute'
-            self.__log.error(errmsg)
-            raise AssertionError(errmsg)
+        command_line = self.__get_command_line()
         self.__log.info(f'Start inference test on model: {self._test.model.name}')
-        self.__log.info(f'Command line is: {command_line}')
         self._executor.set_target_framework(self._test.indep_parameters.inference_framework)
-
-        # add timeout overhead because time_limit in bechmark app applies for inference stage only
-        # set None n case of test_time_limit is unset for backward compatibility
-        configured_time_limit = self._test.indep_parameters.test_time_limit
-        configured_timeout_overhead = self._test.indep_parameters.timeout_overhead
-        timeout = configured_time_limit + configured_timeout_overhead if configured_time_limit else None
-        self._status, self._output = self._executor.execute_process(command_line, timeout)
-
-        if type(self._output) is not list:
-            self._output = self._output.decode('utf-8').split('\n')[:-1]
+        if self.instances > 1:
+            self._status, self._output = self.__execute_instances()
+        else:
+            worker_command_line = self._executor.get_resident_worker_command_line(command_line)
+            # the resident worker runs the launcher outside of the process tree of the command line
+            in_process_tree = worker_command_line == command_line
+            command_line = self.__add_allocation_tracing_env(worker_command_line)
+            heartbeat_path = self.report_path.with_suffix('.heartbeat') if in_process_tree else None
+            command_line = self.__add_heartbeat_env(command_line, heartbeat_path)
+            self.__log.info(f'Command line is: {command_line}')
+            self._status, self._output = self.__execute_command_line(command_line, self._cpu_set, in_process_tree,
+                                                                     heartbeat_path)
 
         if self._status == 0:
             self.__log.info(f'End inference test on model : {self._test.model.name}')
+            if self.raw_timings_path and self.instances == 1:
+                self._executor.copy_log_file(self.raw_timings_path)
         else:
             self.__log.warning(f'Inference test on model: {self._test.model.name} was ended with error. '
                                f'Process logs: {self._output}')
             self.__print_error()
             self.__save_failed_test_log()
 
+    def __get_command_line(self, instance_name=None):
+        self._instance_name = instance_name
+        try:
+            command_line = self._fill_command_line()
+        finally:
+            self._instance_name = None
+        if command_line == '':
+            errmsg = 'Command line is empty, nothing to execute'
+            self.__log.error(errmsg)
+            raise AssertionError(errmsg)
+        return command_line
+
+    def __get_instance_report_path(self, instance_name):
+        self._instance_name = instance_name
+        try:
+            return self.report_path
+        finally:
+            self._instance_name = None
+
+    def __add_allocation_tracing_env(self, command_line):
+        if not getattr(self._test.indep_parameters, 'trace_allocations', False):
+            return command_line
+        return self._add_env_to_cmd_line(command_line, TRACE_ALLOCATIONS_ENV, 1)
+
+    def __is_stall_detected(self):
+        indep_parameters = self._test.indep_parameters
+        return bool(getattr(indep_parameters, 'stall_timeout', None)
+                    or getattr(indep_parameters, 'load_stall_timeout', None))
+
+    def __add_heartbeat_env(self, command_line, heartbeat_path):
+        if heartbeat_path is None or not self.__is_stall_detected():
+            return command_line
+        return self._add_env_to_cmd_line(command_line, HEARTBEAT_PATH_ENV, heartbeat_path)
+
+    def __get_stall_monitor(self, heartbeat_path):
+        if heartbeat_path is None or not self.__is_stall_detected():
+            return None
+        return HeartbeatMonitor(heartbeat_path, getattr(self._test.indep_parameters, 'stall_timeout', None),
+                                getattr(self._test.indep_parameters, 'load_stall_timeout', None))
+
+    def __get_memory_sampler(self):
+        interval = getattr(self._test.indep_parameters, 'memory_sampling_interval', None)
+        if not interval:
+            return None
+        memory_sampler = ProcessTreeMemorySampler(interval)
+        self._memory_samplers.append(memory_sampler)
+        return memory_sampler
+
+    def __execute_command_line(self, command_line, cpu_set, sample_memory=True, heartbeat_path=None):
+        # add timeout overhead because time_limit in bechmark app applies for inference stage only
+        # set None n case of test_time_limit is unset for backward compatibility
+        configured_time_limit = self.measurement_time_limit
+        configured_timeout_overhead = self._test.indep_parameters.timeout_overhead
+        # warm-up is not limited by the test time limit
+        timeout = (configured_time_limit + configured_timeout_overhead + self.warmup_time_limit
+                   if configured_time_limit else None)
+        if self._timeout is not None:
+            # the predicted timeout prolongs the configured one, the history of a slow machine must not kill tests
+            # within their configured time limits
+            timeout = max(timeout, self._timeout) if timeout is not None else self._timeout
+        memory_sampler = self.__get_memory_sampler() if sample_memory else None
+        stall_monitor = self.__get_stall_monitor(heartbeat_path)
+        status, output = self._executor.execute_process(command_line, timeout, cpu_set=cpu_set,
+                                                        memory_sampler=memory_sampler, stall_monitor=stall_monitor)
+        if stall_monitor is not None:
+            stall_monitor.remove_heartbeat()
+
+        if type(output) is not list:
+            output = output.decode('utf-8').split('\n')[:-1]
+        return status, output
+
+    def __execute_instances(self):
+        """
+        Run the test alone as the reference for the scaling efficiency, then run its instances concurrently.
+        Launchers of instances start measurements together, JSON reports of instances are aggregated
+        """
+        instances = self.instances
+        instance_names = [f'instance{index}' for index in range(instances)]
+        if len({self.__get_instance_report_path(name) for name in ['reference', *instance_names]}) <= instances:
+            raise ValueError(f'Multi-instance mode is not supported by {self.benchmark_app_name}')
+        pinning = getattr(self._test.indep_parameters, 'instances_pinning', None)
+        cpu_sets = get_instance_cpu_sets(instances, pinning, self._cpu_set)
+
+        command_line = self.__get_command_line('reference')
+        heartbeat_path = self.__get_instance_report_path('reference').with_suffix('.heartbeat')
+        command_line = self.__add_heartbeat_env(command_line, heartbeat_path)
+        self.__log.info(f'Reference command line is: {command_line}')
+        status, output = self.__execute_command_line(command_line, cpu_sets[0], sample_memory=False,
+                                                     heartbeat_path=heartbeat_path)
+        if status != 0:
+            return status, output
+        reference_report = json.loads(self._executor.get_file_content(self.__get_instance_report_path('reference')))
+
+        barrier_folder = Path(self._executor.get_path_to_logs_folder()) / f'start_barrier_{self.timestamp}'
+        command_lines = []
+        heartbeat_paths = []
+        for name in instance_names:
+            command_line = self.__get_command_line(name)
+            command_line = self._add_env_to_cmd_line(command_line, START_BARRIER_ENV, barrier_folder)
+            command_line = self._add_env_to_cmd_line(command_line, START_BARRIER_PARTIES_ENV, instances)
+            command_line = self.__add_allocation_tracing_env(command_line)
+            heartbeat_paths.append(self.__get_instance_report_path(name).with_suffix('.heartbeat'))
+            command_line = self.__add_heartbeat_env(command_line, heartbeat_paths[-1])
+            self.__log.info(f'Command line of {name} is: {command_line}')
+            command_lines.append(command_line)
+
+        results = [None] * instances
+
+        def run_instance(index):
+            results[index] = self.__execute_command_line(command_lines[index], cpu_sets[index],
+                                                         heartbeat_path=heartbeat_paths[index])
+
+        threads = [threading.Thread(target=run_instance, args=(index,)) for index in range(instances)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        shutil.rmtree(barrier_folder, ignore_errors=True)
+
+        output = [line for _, instance_output in results for line in instance_output]
+        status = next((status for status, _ in results if status != 0), 0)
+        if status == 0:
+            reports = [json.loads(self._executor.get_file_content(self.__get_instance_report_path(name)))
+                       for name in instance_names]
+            self._aggregated_report = aggregate_instance_reports(reports, reference_report)
+        return status, output
+
     def get_status(self):
         return self._status
 
+    def set_cpu_set(self, cpu_set):
+        """
+        Pin launcher process to the list of CPU ids, None means no pinning
+        """
+        self._cpu_set = cpu_set
+
+    def set_timeout(self, timeout):
+        """
+        Timeout of the test in seconds predicted from durations of its previous runs, it is used if it is longer
+        than the timeout of the test time limit and the timeout overhead, None means the configured timeout
+        """
+        self._timeout = timeout
+
     @abc.abstractmethod
     def get_performance_metrics(self):
         pass
 
+    def get_memory_metrics(self):
+        """
+        Peak RSS and USS of the launcher process tree in megabytes sampled by the benchmark, peaks of concurrent
+        instances are summed
+        """
+        metrics = {'peak_tree_rss': None, 'peak_tree_uss': None}
+        for name, attribute in (('peak_tree_rss', 'peak_rss'), ('peak_tree_uss', 'peak_uss')):
+            peaks = [getattr(sampler, attribute) for sampler in self._memory_samplers]
+            if peaks and all(peak is not None for peak in peaks):
+                metrics[name] = round(sum(peaks) / BYTES_IN_MEGABYTE, 3)
+        return metrics
+
     def get_json_report_content(self):
+        if self._aggregated_report is not None:
+            return self._aggregated_report
         if self.report_path:
             return json.loads(self._executor.get_file_content(self.report_path))
 
@@ -107,7 +352,11 @@ class ProcessHandler(metaclass=abc.ABCMeta):
         if self._status != 0 or len(self._output) == 0:
             return {'average_time': None, 'fps': None, 'latency': None, 'batch_fps': None, 'latency_per_token': None,
                     'num_tokens': None, 'audio_len_avg': None, 'audio_sampling_rate': None,
-                    'latency_per_second': None}
+                    'latency_per_second': None, 'warmup_time': None, 'warmup_iterations_num': None,
+                    'load_time': None, 'compile_time': None, 'cold_start': None, 'max_rate_under_sla': None,
+                    'instances': None, 'instance_latency_spread': None, 'scaling_efficiency': None,
+                    'cpu_time_per_iteration': None, 'context_switches_per_iteration': None,
+                    **dict.fromkeys(self.LATENCY_PERCENTILES), **dict.fromkeys(self.LAUNCHER_MEMORY_METRICS.values())}
 
         report = self.get_json_report_content()
 
@@ -121,13 +370,46 @@ class ProcessHandler(metaclass=abc.ABCMeta):
         audio_len_avg = self.get_reported_optional_value(report, 'audio_len_avg')
         latency_per_second = self.get_reported_optional_value(report, 'latency_per_second')
         audio_sampling_rate = self.get_reported_optional_value(report, 'audio_sampling_rate')
+        latency_percentiles = {name: self.get_reported_optional_value(report, name, round_precision=5)
+                               for name in self.LATENCY_PERCENTILES}
+        warmup_time = self.get_reported_optional_value(report, 'warmup_time', round_precision=5)
+        warmup_iterations_num = self.get_reported_optional_value(report, 'warmup_iterations_num', value_type=int,
+                                                                 to_round=False)
+        load_time = self.get_reported_optional_value(report, 'read_network_time', round_precision=5)
+        compile_time = self.get_reported_optional_value(report, 'compile_time', round_precision=5)
+        # time from the start of the launcher process to the first inference result, always in seconds
+        cold_start_time = (report.get('startup') or {}).get('cold_start_time')
+        cold_start = round(float(cold_start_time), 5) if cold_start_time else 'N/A'
+        max_rate_under_sla = self.get_reported_optional_value(report, 'max_rate_under_sla')
+        instances = self.get_reported_optional_value(report, 'instances_num', value_type=int, to_round=False)
+        instance_latency_spread = self.get_reported_optional_value(report, 'instance_latency_spread',
+                                                                   round_precision=5)
+        scaling_efficiency = self.get_reported_optional_value(report, 'scaling_efficiency', round_precision=5)
+        memory_metrics = {name: self.get_reported_optional_value(report, report_name)
+                          for report_name, name in self.LAUNCHER_MEMORY_METRICS.items()}
+        # CPU time is measured by launchers in seconds in any latency units
+        cpu_time_per_iteration = self.get_reported_optional_value(report, 'cpu_time_per_iteration',
+                                                                  round_precision=6)
+        context_switches_per_iteration = self.get_reported_optional_value(report, 'context_switches_per_iteration')
 
         if self.launcher_latency_units == 'milliseconds':
             latency = round(latency / MILLISECONDS_IN_SECOND, 5)
             average_time_of_single_pass = round(average_time_of_single_pass / MILLISECONDS_IN_SECOND, 5)
+            latency_percentiles = {name: round(value / MILLISECONDS_IN_SECOND, 5) if value != 'N/A' else value
+                                   for name, value in latency_percentiles.items()}
+            warmup_time, load_time, compile_time = (
+                round(value / MILLISECONDS_IN_SECOND, 5) if value != 'N/A' else value
+                for value in (warmup_time, load_time, compile_time))
         metrics = {'average_time': average_time_of_single_pass, 'fps': fps, 'latency': latency, 'batch_fps': batch_fps,
                    'latency_per_token': latency_per_token, 'num_tokens': num_tokens, 'audio_len_avg': audio_len_avg,
-                   'latency_per_second': latency_per_second, 'audio_sampling_rate': audio_sampling_rate}
+                   'latency_per_second': latency_per_second, 'audio_sampling_rate': audio_sampling_rate,
+                   'warmup_time': warmup_time, 'warmup_iterations_num': warmup_iterations_num,
+                   'load_time': load_time, 'compile_time': compile_time, 'cold_start': cold_start,
+                   'max_rate_under_sla': max_rate_under_sla,
+                   'instances': instances, 'instance_latency_spread': instance_latency_spread,
+                   'scaling_efficiency': scaling_efficiency, 'cpu_time_per_iteration': cpu_time_per_iteration,
+                   'context_switches_per_iteration': context_switches_per_iteration, **latency_percentiles,
+                   **memory_metrics}
         return metrics
 
     @abc.abstractmethod
@@ -164,6 +446,31 @@ class ProcessHandler(metaclass=abc.ABCMeta):
         command_line = f'{self._benchmark_path} {arguments}'
         return command_line
 
+    def _add_input_data_arguments(self, command_line):
+        max_input_images = getattr(self._test.indep_parameters, 'max_input_images', None)
+        command_line = self._add_optional_argument_to_cmd_line(command_line, '--max_input_images', max_input_images)
+        return self._add_optional_argument_to_cmd_line(command_line, '--input_cache_dir', self.input_cache_dir)
+
+    def _add_measurement_arguments(self, command_line):
+        command_line = self._add_optional_argument_to_cmd_line(command_line, '--raw_timings_path',
+                                                               self.raw_timings_path)
+        for parameter in self.WARMUP_PARAMETERS:
+            value = getattr(self._test.indep_parameters, parameter, None)
+            command_line = self._add_optional_argument_to_cmd_line(command_line, f'--{parameter}', value)
+        if getattr(self._test.indep_parameters, 'collect_rusage', False):
+            command_line = self._add_flag_to_cmd_line(command_line, '--collect_rusage')
+        return command_line
+
+    def _add_load_generator_arguments(self, command_line):
+        for parameter in self.LOAD_GENERATOR_PARAMETERS:
+            value = getattr(self._test.indep_parameters, parameter, None)
+            command_line = self._add_optional_argument_to_cmd_line(command_line, f'--{parameter}', value)
+        return command_line
+
+    def _add_compiled_model_cache_argument(self, command_line):
+        return self._add_optional_argument_to_cmd_line(command_line, '--compiled_model_cache_dir',
+                                                       self.compiled_model_cache_dir)
+
     @staticmethod
     def _add_argument_to_cmd_line(command_line, argument, value):
         return f'{command_line} {argument} {value}'
@@ -120,6 +120,9 @@ class PyTorchProcess(ProcessHandler):
             common_params = PyTorchProcess._add_argument_to_cmd_line(
                 common_params, '--num_intra_threads', num_intra_threads)
 
+        common_params = self._add_input_data_arguments(common_params)
+        common_params = self._add_measurement_arguments(common_params)
+        common_params = self._add_compiled_model_cache_argument(common_params)
         command_line = f'{python} {path_to_pytorch_script} {common_params}'
 
         return command_line
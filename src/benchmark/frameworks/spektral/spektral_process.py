@@ -40,6 +40,7 @@ class SpektralProcess(ProcessHandler):
             common_params = self._add_argument_to_cmd_line(common_params, '--raw_output', 'true')
         common_params = self._add_flag_to_cmd_line(common_params, '--restrisct_gpu_usage')
 
+        common_params = self._add_measurement_arguments(common_params)
         command_line = f'{python} {path_to_spektral_script} {common_params}'
 
         return command_line
@@ -72,6 +72,8 @@ class TensorFlowProcess(ProcessHandler):
         if use_xla:
             common_params = self._add_optional_argument_to_cmd_line(common_params, '--use_xla', 'true')
 
+        common_params = self._add_input_data_arguments(common_params)
+        common_params = self._add_measurement_arguments(common_params)
         command_line = f'{python} {path_to_tensorflow_script} {common_params}'
 
         nthreads = self._test.dep_parameters.nthreads
@@ -86,6 +86,10 @@ class TVMProcess(ProcessHandler):
         common_params = TVMProcess._add_optional_argument_to_cmd_line(
             common_params, '--target', target)
 
+        common_params = self._add_measurement_arguments(common_params)
+        common_params = self._add_compiled_model_cache_argument(common_params)
+        common_params = self._add_input_data_arguments(common_params)
+
         return f'{common_params}'
 
 
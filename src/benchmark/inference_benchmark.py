@@ -1,11 +1,15 @@
 import argparse
 import sys
+from collections import Counter
 from pathlib import Path
+from time import perf_counter
 
 from config_processor import process_config
+from duration_history import TEST_ORDERS, DurationHistory, RunProgress
 from executors import Executor
 from frameworks.framework_wrapper_registry import FrameworkWrapperRegistry
 from output import OutputHandler
+from scheduler import ParallelTestScheduler
 
 sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
 from logger_conf import configure_logger, exception_hook  # noqa: E402
@@ -32,6 +36,11 @@ def cli_argument_parser():
                         type=str,
                         help='Delimiter to use in the resulting file',
                         default=';')
+    parser.add_argument('--result_store',
+                        type=str,
+                        help='Path to SQLite result store, results and JSON reports of tests are added to it '
+                             'alongside the resulting file',
+                        default=None)
     parser.add_argument('--executor_type',
                         type=str,
                         choices=['host_machine', 'docker_container'],
@@ -47,18 +56,119 @@ def cli_argument_parser():
                         help='Path to the folder with pre-built OpenVINO C++ Benchmark App',
                         default=None,
                         required=False)
+    parser.add_argument('--parallel',
+                        metavar='N',
+                        type=int,
+                        help='Number of tests to execute concurrently. Tests without thread count '
+                             'in the configuration file occupy the whole machine and run exclusively',
+                        default=1)
+    parser.add_argument('--cpu_sets',
+                        type=str,
+                        choices=['none', 'auto'],
+                        help='CPU sets isolation for concurrent tests: none, auto (pin each test '
+                             'to a disjoint CPU set sized from its thread count)',
+                        default='none')
+    parser.add_argument('--resident_worker_jobs',
+                        metavar='N',
+                        type=int,
+                        help='Run python launchers in resident workers keeping the framework imported between '
+                             'tests, a worker is restarted after N tests. 0 starts a new process for every test',
+                        default=0)
+    parser.add_argument('--resume',
+                        action='store_true',
+                        help='Continue the resulting file of the interrupted run: tests with results in it '
+                             'are skipped, results of the other tests are appended')
+    parser.add_argument('--rerun_failed',
+                        action='store_true',
+                        help='Run failed tests of the resumed resulting file again, their rows are replaced')
+    parser.add_argument('--duration_history',
+                        type=str,
+                        help='Path to JSON file with durations of previous runs of tests, durations of '
+                             'successful tests are added to it',
+                        default=None)
+    parser.add_argument('--test_order',
+                        type=str,
+                        choices=TEST_ORDERS,
+                        help='Order of tests: config (configuration file order), longest_first or '
+                             'shortest_first by durations of previous runs, new tests are the longest',
+                        default='config')
+    parser.add_argument('--timeout_factor',
+                        type=float,
+                        help='Timeout of a test with the duration history is its predicted duration multiplied '
+                             'by the factor if it is longer than the time limit and the timeout overhead',
+                        default=None)
 
     args = parser.parse_args()
 
     if not Path(args.config_path).is_file():
         raise ValueError('Wrong path to configuration file!')
+    if args.parallel < 1:
+        raise ValueError('Number of concurrent tests must be greater than zero!')
+    if args.resident_worker_jobs < 0:
+        raise ValueError('Number of tests per resident worker must not be negative!')
+    if args.rerun_failed and not args.resume:
+        raise ValueError('Failed tests can be run again only with --resume!')
+    if (args.test_order != 'config' or args.timeout_factor) and not args.duration_history:
+        raise ValueError('Tests can be ordered and timed out by durations only with --duration_history!')
+    if args.timeout_factor is not None and args.timeout_factor <= 1:
+        raise ValueError('Timeout factor must be greater than one!')
 
     return args
 
 
+def skip_finished_tests(test_list, finished_tests, log):
+    """
+    Remove tests with results in the resumed table, the test repeated in the configuration is skipped
+    as many times as it has results
+    :param finished_tests: Counter of identities of tests with results
+    """
+    finished_tests = Counter(finished_tests)
+    remaining_tests = []
+    for test in test_list:
+        test_id = test.get_identity()
+        if finished_tests[test_id] > 0:
+            finished_tests[test_id] -= 1
+        else:
+            remaining_tests.append(test)
+    log.info(f'Skip {len(test_list) - len(remaining_tests)} tests with results in the resulting file')
+    return remaining_tests
+
+
+def run_test(test, process_executor, log, cpp_benchmarks_dir=None, openvino_cpp_benchmark_dir=None,
+             cpu_set=None, timeout=None):
+    status = Status.EXIT_SUCCESS
+    framework_name = test.indep_parameters.inference_framework
+    benchmarks_path = cpp_benchmarks_dir
+    if 'openvino' in framework_name.lower():
+        benchmarks_path = openvino_cpp_benchmark_dir
+
+    try:
+        log.info(f'Creating separate process for the test {framework_name}')
+        test_process = FrameworkWrapperRegistry()[framework_name].create_process(
+            test, process_executor, log, cpp_benchmarks_dir=benchmarks_path)
+        test_process.set_cpu_set(cpu_set)
+        test_process.set_timeout(timeout)
+
+        log.info('Executing process')
+        test_process.execute()
+
+        test_status = test_process.get_status()
+        if test_status != Status.EXIT_SUCCESS.value:
+            status = Status.INFERENCE_FAILURE
+            log.error(f'Test finished with non-zero code: {test_status}')
+    except Exception as ex:
+        status = Status.INFERENCE_EXCEPTION
+        log.error(f'Inference failed with exception: {ex}', exc_info=True)
+        test_process = None
+
+    return status, test_process
+
+
 def inference_benchmark(executor_type, test_list, output_handler, log,
-                        cpp_benchmarks_dir=None, openvino_cpp_benchmark_dir=None):
+                        cpp_benchmarks_dir=None, openvino_cpp_benchmark_dir=None,
+                        parallel=1, cpu_sets='none', resident_worker_jobs=0, progress=None):
     status = Status.EXIT_SUCCESS
+    progress = progress or RunProgress(test_list, log, parallel=parallel)
 
     try:
         process_executor = Executor.get_executor(executor_type, log)
@@ -66,32 +176,59 @@ def inference_benchmark(executor_type, test_list, output_handler, log,
         log.error(ex, exc_info=True)
         return Status.EXECUTOR_NOT_FOUND
 
+    if parallel > 1:
+        return parallel_inference_benchmark(executor_type, test_list, output_handler, log, cpp_benchmarks_dir,
+                                            openvino_cpp_benchmark_dir, parallel, cpu_sets, resident_worker_jobs,
+                                            progress)
+
+    process_executor.set_resident_worker_jobs(resident_worker_jobs)
     for test in test_list:
-        framework_name = test.indep_parameters.inference_framework
-        benchmarks_path = cpp_benchmarks_dir
-        if 'openvino' in framework_name.lower():
-            benchmarks_path = openvino_cpp_benchmark_dir
+        start_time = perf_counter()
+        test_status, test_process = run_test(test, process_executor, log,
+                                             cpp_benchmarks_dir, openvino_cpp_benchmark_dir,
+                                             timeout=progress.get_timeout(test))
+        if test_status != Status.EXIT_SUCCESS:
+            status = test_status
 
-        try:
-            log.info(f'Creating separate process for the test {framework_name}')
-            test_process = FrameworkWrapperRegistry()[framework_name].create_process(
-                test, process_executor, log, cpp_benchmarks_dir=benchmarks_path)
+        log.info('Saving test result in file')
+        output_handler.add_row_to_table(process_executor, test, test_process)
+        progress.finish_test(test, perf_counter() - start_time, test_status == Status.EXIT_SUCCESS)
+    process_executor.stop_resident_workers()
 
-            log.info('Executing process')
-            test_process.execute()
+    return status
 
-            test_status = test_process.get_status()
-            if test_status != Status.EXIT_SUCCESS.value:
-                status = Status.INFERENCE_FAILURE
-                log.error(f'Test finished with non-zero code: {test_status}')
-        except Exception as ex:
-            status = Status.INFERENCE_EXCEPTION
-            log.error(f'Inference failed with exception: {ex}', exc_info=True)
-            test_process = None
 
-        log.info('Saving test result in file')
-        output_handler.add_row_to_table(process_executor, test, test_process)
+def parallel_inference_benchmark(executor_type, test_list, output_handler, log, cpp_benchmarks_dir,
+                                 openvino_cpp_benchmark_dir, parallel, cpu_sets, resident_worker_jobs=0,
+                                 progress=None):
+    # each worker owns its executor because executor keeps target framework of the current test
+    executors = [Executor.get_executor(executor_type, log) for _ in range(parallel)]
+    for process_executor in executors:
+        process_executor.set_resident_worker_jobs(resident_worker_jobs)
+    scheduler = ParallelTestScheduler(executors, log, pin_cpu_sets=(cpu_sets == 'auto'))
+    log.info(f'Executing up to {parallel} tests concurrently, CPU sets isolation: {cpu_sets}')
+    progress = progress or RunProgress(test_list, log, parallel=parallel)
+
+    def run_scheduled_test(idx, test, process_executor, cpu_set):
+        start_time = perf_counter()
+        try:
+            test_status, test_process = run_test(test, process_executor, log, cpp_benchmarks_dir,
+                                                 openvino_cpp_benchmark_dir, cpu_set, progress.get_timeout(test))
+            log.info(f'Saving result of test {idx + 1} in file')
+            output_handler.add_row_to_table(process_executor, test, test_process, row_index=idx)
+        except Exception as ex:
+            log.error(f'Failed to save result of test {idx + 1}: {ex}', exc_info=True)
+            output_handler.skip_row(idx)
+            test_status = Status.INFERENCE_EXCEPTION
+        progress.finish_test(test, perf_counter() - start_time, test_status == Status.EXIT_SUCCESS)
+        return test_status
 
+    status = Status.EXIT_SUCCESS
+    for test_status in scheduler.run(test_list, run_scheduled_test):
+        if test_status != Status.EXIT_SUCCESS:
+            status = test_status
+    for process_executor in executors:
+        process_executor.stop_resident_workers()
     return status
 
 
@@ -104,16 +241,30 @@ if __name__ == '__main__':
     test_list, test_creation_status = process_config(args.config_path, log)
     log.info('All tests are added to test list' if not test_creation_status else 'Not all tests are added to test list')
 
-    log.info(f'Create result table with name: {args.result_file}')
+    output_handler = OutputHandler(args.result_file, args.csv_delimiter, args.result_store)
+    if args.resume:
+        log.info(f'Resume result table with name: {args.result_file}')
+        finished_tests = output_handler.resume_table(args.rerun_failed)
+        test_list = skip_finished_tests(test_list, finished_tests, log)
+    else:
+        log.info(f'Create result table with name: {args.result_file}')
+        output_handler.create_table()
 
-    output_handler = OutputHandler(args.result_file, args.csv_delimiter)
-    output_handler.create_table()
+    duration_history = DurationHistory(args.duration_history) if args.duration_history else None
+    if duration_history is not None:
+        test_list = duration_history.order_tests(test_list, args.test_order)
+    progress = RunProgress(test_list, log, duration_history, args.timeout_factor, args.parallel)
 
     log.info(f'Start {len(test_list)} inference tests')
 
     inference_status = inference_benchmark(args.executor_type, test_list,
                                            output_handler, log,
                                            args.cpp_benchmarks_dir,
-                                           args.openvino_cpp_benchmark_dir)
+                                           args.openvino_cpp_benchmark_dir,
+                                           args.parallel,
+                                           args.cpu_sets,
+                                           args.resident_worker_jobs,
+                                           progress)
+    output_handler.close()
     log.info('Inference tests completed' if not inference_status.value else 'Inference tests failed')
     sys.exit(inference_status.value or test_creation_status)
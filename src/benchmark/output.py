@@ -1,13 +1,29 @@
+import hashlib
+import json
 import sys
+import threading
+from collections import Counter
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
 from csv_wrapper import CsvReport  # noqa: E402
 from constants import Status  # noqa: E402
+from result_store import ResultStore  # noqa: E402
+
+FINGERPRINT_HASH_LENGTH = 12
+
+
+def get_fingerprint_hash(fingerprint):
+    fingerprint_json = json.dumps(fingerprint, sort_keys=True)
+    return hashlib.sha256(fingerprint_json.encode('utf-8')).hexdigest()[:FINGERPRINT_HASH_LENGTH]
 
 
 class OutputHandler:
-    def __init__(self, table_name, csv_delimiter):
+    def __init__(self, table_name, csv_delimiter, result_store=None):
+        """
+        :param result_store: path to SQLite result store, rows and JSON reports of tests are added to it
+                             alongside the CSV table
+        """
         self.__table_name = table_name
 
         self._column_names = {
@@ -33,9 +49,43 @@ class OutputHandler:
             'audio_sampling_rate': 'Audio sampling rate (Hz)',
             'latency_per_second': 'Latency per second',
             'error_type': 'Error type',
+            # new columns are appended, converters of older versions read the columns above by position
+            'fingerprint': 'Infrastructure fingerprint',
+            'latency_p50': 'Latency p50',
+            'latency_p90': 'Latency p90',
+            'latency_p95': 'Latency p95',
+            'latency_p99': 'Latency p99',
+            'latency_p99_9': 'Latency p99.9',
+            'max_rate_under_sla': 'Max rate under SLA (req/s)',
+            'instances': 'Instances',
+            'instance_latency_spread': 'Instance latency spread',
+            'scaling_efficiency': 'Scaling efficiency',
+            'rss_after_import': 'RSS after import (MB)',
+            'load_rss_delta': 'Model load RSS delta (MB)',
+            'rss_after_warmup': 'RSS after warm-up (MB)',
+            'peak_rss': 'Peak RSS (MB)',
+            'peak_tree_rss': 'Peak tree RSS (MB)',
+            'peak_tree_uss': 'Peak tree USS (MB)',
+            'allocated_per_iteration': 'Allocated per iteration (B)',
+            'warmup_time': 'Warm-up time (s)',
+            'warmup_iterations_num': 'Warm-up iterations',
+            'load_time': 'Load time (s)',
+            'compile_time': 'Compile time (s)',
+            'cold_start': 'Cold start (s)',
+            'raw_timings': 'Raw timings',
+            'test_id': 'Test ID',
+            'cpu_time_per_iteration': 'CPU time per iteration (s)',
+            'context_switches_per_iteration': 'Context switches per iteration',
         }
 
         self._report = CsvReport(self.__table_name, self._column_names.values(), output_delimiter=csv_delimiter)
+        self._lock = threading.Lock()
+        self._pending_rows = {}
+        self._next_row_index = 0
+        # full machine fingerprints are stored next to the table, rows refer to them by hash
+        self._fingerprints_path = Path(table_name).with_suffix('.fingerprints.json')
+        self._fingerprints = {}
+        self._result_store = ResultStore(result_store) if result_store else None
 
     @staticmethod
     def __create_table_row(executor, test, process):
@@ -48,19 +98,107 @@ class OutputHandler:
             report['status'] = 'Success' if status_code == 0 else 'Failed'
             reported_metrics = process.get_performance_metrics()
             report.update(reported_metrics)
+            report.update(process.get_memory_metrics())
             report['error_type'] = process_status.name if status_code else 'NO_ERROR'
+            # per-iteration times are used by compare_results to test differences between runs
+            raw_timings_path = process.raw_timings_path if status_code == 0 else None
+            report['raw_timings'] = raw_timings_path if raw_timings_path and raw_timings_path.is_file() else None
         else:
             report['input_shape'] = 'Undefined'
             report['status'] = 'Failed'
             report['average_time'], report['fps'], report['latency'], report['num_tokens'] = None, None, None, None
             report['error_type'] = Status.INFERENCE_EXCEPTION.name
+        report['test_id'] = test.get_identity()
         report['hardware'] = executor.get_infrastructure()
+        report['fingerprint'] = executor.get_fingerprint()
         return report
 
+    @staticmethod
+    def __get_json_report(process):
+        if process is None or process.get_status() != 0:
+            return None
+        try:
+            return json.dumps(process.get_json_report_content())
+        except (OSError, ValueError, TypeError):
+            # launchers without JSON reports
+            return None
+
     def create_table(self):
         self._report.write_headers()
+        if self._result_store is not None:
+            self._result_store.create_table('benchmark', list(self._column_names.values()))
+
+    def resume_table(self, rerun_failed=False):
+        """
+        Continue the table of the interrupted run, it is created if it does not exist. The table is rewritten
+        with the current columns without the incomplete last row
+        :param rerun_failed: remove rows of failed tests to run them again
+        :return: Counter of identities of tests with results in the table
+        """
+        table_path = Path(self.__table_name)
+        if not table_path.is_file() or table_path.stat().st_size == 0:
+            self.create_table()
+            return Counter()
+        rows = self._report.read()
+        test_id_column = self._column_names['test_id']
+        if rows and test_id_column not in rows[0]:
+            raise ValueError(f'Table {self.__table_name} has no {test_id_column} column, it can not be resumed')
+        # the run has been interrupted while writing the last row
+        if rows and None in rows[-1].values():
+            rows.pop()
+        if rerun_failed:
+            rows = [row for row in rows if row[self._column_names['status']] == 'Success']
+        self._report.rewrite(rows)
+        if self._fingerprints_path.is_file():
+            self._fingerprints = json.loads(self._fingerprints_path.read_text())
+        if self._result_store is not None:
+            self._result_store.create_table('benchmark', list(self._column_names.values()))
+        return Counter(row[test_id_column] for row in rows if row[test_id_column])
 
-    def add_row_to_table(self, executor, test, process):
+    def close(self):
+        if self._result_store is not None:
+            self._result_store.close()
+
+    def add_row_to_table(self, executor, test, process, row_index=None):
+        """
+        Append test result to the table. Safe for concurrent writers: rows added with
+        row_index are written strictly in index order, a row waits until all previous rows are added.
+        """
         report_row = self.__create_table_row(executor, test, process)
-        row_dict = {column_name: report_row[key] for key, column_name in self._column_names.items()}
+        json_report = self.__get_json_report(process) if self._result_store is not None else None
+        with self._lock:
+            report_row['fingerprint'] = self.__add_fingerprint(report_row.get('fingerprint'))
+            row_dict = {column_name: report_row.get(key) for key, column_name in self._column_names.items()}
+            if row_index is None:
+                self.__write_row(row_dict, json_report)
+            else:
+                self._pending_rows[row_index] = (row_dict, json_report)
+                self.__flush_pending_rows()
+
+    def __write_row(self, row_dict, json_report):
         self._report.append_row(row_dict)
+        if self._result_store is not None:
+            self._result_store.add_row('benchmark', row_dict, json_report)
+
+    def __add_fingerprint(self, fingerprint):
+        if fingerprint is None:
+            return None
+        fingerprint_hash = get_fingerprint_hash(fingerprint)
+        if fingerprint_hash not in self._fingerprints:
+            self._fingerprints[fingerprint_hash] = fingerprint
+            with open(self._fingerprints_path, 'w') as fingerprints_file:
+                json.dump(self._fingerprints, fingerprints_file, indent=4, sort_keys=True)
+        return fingerprint_hash
+
+    def skip_row(self, row_index):
+        """Mark row as finished without result to let the next rows to be written"""
+        with self._lock:
+            self._pending_rows[row_index] = None
+            self.__flush_pending_rows()
+
+    def __flush_pending_rows(self):
+        while self._next_row_index in self._pending_rows:
+            row = self._pending_rows.pop(self._next_row_index)
+            if row is not None:
+                self.__write_row(*row)
+            self._next_row_index += 1
@@ -0,0 +1,109 @@
+import os
+import queue
+import threading
+
+THREAD_COUNT_PARAMETERS = ('nthreads', 'thread_count', 'num_threads', 'num_intra_threads')
+
+
+def get_available_cpus():
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def get_required_cpu_count(test):
+    """
+    Number of CPUs the test asks for in its framework dependent parameters.
+    :return: integer or None when the test does not limit threads, i.e. wants the whole machine
+    """
+    # instances of multi-instance test run concurrently, each with the thread count of the test
+    instances = getattr(getattr(test, 'indep_parameters', None), 'instances', None) or 1
+    for parameter in THREAD_COUNT_PARAMETERS:
+        value = getattr(test.dep_parameters, parameter, None)
+        if value is not None and str(value).strip().isdigit() and int(value) > 0:
+            return int(value) * instances
+    return None
+
+
+def format_cpu_set(cpu_set):
+    """Convert list of CPU ids to the taskset list format, ex. [0, 1, 2, 5] -> '0-2,5'"""
+    ranges = []
+    for cpu in sorted(cpu_set):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ','.join(str(first) if first == last else f'{first}-{last}' for first, last in ranges)
+
+
+class CpuSetAllocator:
+    def __init__(self, cpus=None):
+        self._cpus = sorted(cpus) if cpus is not None else get_available_cpus()
+        self._free_cpus = list(self._cpus)
+        self._condition = threading.Condition()
+
+    @property
+    def cpu_count(self):
+        return len(self._cpus)
+
+    def acquire(self, cpu_count=None):
+        """
+        Block until the requested number of CPUs is free and reserve them.
+        :param cpu_count: number of CPUs, None or value greater than number of CPUs reserves the whole machine
+        :return: sorted list of reserved CPU ids
+        """
+        requested = self.cpu_count if cpu_count is None else min(cpu_count, self.cpu_count)
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._free_cpus) >= requested)
+            cpu_set = self._free_cpus[:requested]
+            del self._free_cpus[:requested]
+        return cpu_set
+
+    def release(self, cpu_set):
+        with self._condition:
+            self._free_cpus = sorted(self._free_cpus + list(cpu_set))
+            self._condition.notify_all()
+
+
+class ParallelTestScheduler:
+    """Runs independent tests concurrently on disjoint CPU sets.
+    Tests are started in configuration order: the next test waits until a worker
+    and enough CPUs are free, tests without thread limits occupy all CPUs and run exclusively.
+    """
+
+    def __init__(self, executors, log, pin_cpu_sets=False, allocator=None):
+        self._log = log
+        self._pin_cpu_sets = pin_cpu_sets
+        self._allocator = allocator or CpuSetAllocator()
+        self._executors = queue.Queue()
+        for executor in executors:
+            self._executors.put(executor)
+
+    def run(self, test_list, run_test):
+        """
+        :param test_list: list of tests in configuration order
+        :param run_test: callable run_test(idx, test, executor, cpu_set) returning test status
+        :return: list of test statuses in configuration order
+        """
+        statuses = [None] * len(test_list)
+        workers = []
+        for idx, test in enumerate(test_list):
+            cpu_set = self._allocator.acquire(get_required_cpu_count(test))
+            executor = self._executors.get()
+            self._log.info(f'Scheduling test {idx + 1}/{len(test_list)} on CPUs {format_cpu_set(cpu_set)}')
+
+            worker = threading.Thread(target=self._run_worker,
+                                      args=(statuses, idx, test, executor, cpu_set, run_test))
+            worker.start()
+            workers.append(worker)
+
+        for worker in workers:
+            worker.join()
+        return statuses
+
+    def _run_worker(self, statuses, idx, test, executor, cpu_set, run_test):
+        try:
+            statuses[idx] = run_test(idx, test, executor, cpu_set if self._pin_cpu_sets else None)
+        finally:
+            self._executors.put(executor)
+            self._allocator.release(cpu_set)
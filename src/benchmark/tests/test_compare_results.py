@@ -0,0 +1,56 @@
+import sys
+from argparse import Namespace
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'compare_results'))
+from compare_results import (IMPROVEMENT, NO_CHANGE, REGRESSION, REMOVED, compare_result_sets,  # noqa: E402
+                             mann_whitney_u, read_result_set, write_csv_report)
+
+COMPARE_ARGS = Namespace(threshold=5.0, alpha=0.05, bootstrap_iterations=200, confidence=0.95, seed=0)
+
+
+def write_table(path, rows):
+    header = ['Status', 'Topology name', 'Inference Framework', 'Precision', 'Batch size', 'Mode', 'Parameters',
+              'Latency', 'Raw timings']
+    lines = [';'.join(f'"{value}"' for value in row) for row in [header, *rows]]
+    path.write_text('\n'.join(lines) + '\n')
+
+
+def test_mann_whitney_u():
+    cliffs_delta, p_value = mann_whitney_u(np.arange(1.0, 11.0), np.arange(11.0, 21.0))
+    assert cliffs_delta == 1.0
+    assert p_value < 0.001
+    cliffs_delta, p_value = mann_whitney_u(np.ones(10), np.ones(10))
+    assert (cliffs_delta, p_value) == (0.0, 1.0)
+
+
+def test_compare_result_sets(tmp_path):
+    rng = np.random.default_rng(1)
+    timings = {name: rng.normal(mean, 0.001, 200) for name, mean in
+               [('base_a', 0.1), ('cand_a', 0.11), ('base_b', 0.1), ('cand_b', 0.1)]}
+    for name, samples in timings.items():
+        np.save(tmp_path / f'{name}.npy', samples)
+    test_a = ['a', 'OpenVINO DLDT', 'FP32', '1', 'Sync', 'Device: CPU']
+    test_b = ['b', 'OpenVINO DLDT', 'FP32', '1', 'Sync', 'Device: CPU']
+    test_c = ['c', 'OpenVINO DLDT', 'FP32', '1', 'Sync', 'Device: CPU']
+    write_table(tmp_path / 'baseline.csv', [['Success', *test_a, '0.1', 'base_a.npy'],
+                                            ['Success', *test_b, '0.1', 'base_b.npy'],
+                                            ['Success', *test_c, '0.2', '']])
+    write_table(tmp_path / 'candidate.csv', [['Success', *test_b, '0.1', 'cand_b.npy'],
+                                             ['Success', *test_a, '0.11', 'cand_a.npy']])
+
+    rows = compare_result_sets(read_result_set([tmp_path / 'baseline.csv']),
+                               read_result_set([tmp_path / 'candidate.csv']), COMPARE_ARGS)
+
+    verdicts = [(row['Topology name'], row['Verdict']) for row in rows]
+    assert verdicts == [('a', REGRESSION), ('b', NO_CHANGE), ('c', REMOVED)]
+    assert rows[0]['Change CI low (%)'] > 5
+    assert rows[0]['Candidate samples'] == 200
+
+    improvement = compare_result_sets(read_result_set([tmp_path / 'candidate.csv']),
+                                      read_result_set([tmp_path / 'baseline.csv']), COMPARE_ARGS)[-2]
+    assert (improvement['Topology name'], improvement['Verdict']) == ('a', IMPROVEMENT)
+    write_csv_report(rows, tmp_path / 'report.csv')
+    assert len((tmp_path / 'report.csv').read_text().splitlines()) == 4
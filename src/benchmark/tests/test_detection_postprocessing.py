@@ -0,0 +1,193 @@
+import logging as log
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'inference'))
+from detection_postprocessing import (non_max_suppression, soft_non_max_suppression, xywh_to_xyxy,  # noqa: E402
+                                      yolo_non_max_suppression)
+
+log.basicConfig(
+    format='[ %(levelname)s ] %(message)s',
+    level=log.INFO,
+    stream=sys.stdout,
+)
+
+
+def legacy_yolo_nms(predictions, score_threshold, nms_threshold):
+    predictions.sort(key=lambda prediction: prediction[0], reverse=True)
+    valid_detections = []
+    while len(predictions) > 0:
+        max_detection = predictions[0]
+        if max_detection[0] < score_threshold:
+            break
+        valid_detections.append(max_detection)
+        predictions.remove(max_detection)
+        remove_detections = []
+        for detection in predictions:
+            if detection[0] < score_threshold:
+                remove_detections.append(detection)
+                continue
+            if not (max_detection[1] == detection[1]):
+                continue
+            current_rect_area = detection[2][2] * detection[2][3]
+            max_rect_area = max_detection[2][2] * max_detection[2][3]
+            intersection_area = float(
+                (min(detection[2][0] + detection[2][2], max_detection[2][0] + max_detection[2][2])
+                 - max(detection[2][0], max_detection[2][0]))
+                * (min(detection[2][1] + detection[2][3], max_detection[2][1] + max_detection[2][3])
+                   - max(detection[2][1], max_detection[2][1])),
+            )
+            overlap = intersection_area / (current_rect_area + max_rect_area - intersection_area)
+            if overlap > nms_threshold:
+                remove_detections.append(detection)
+        for detection in remove_detections:
+            predictions.remove(detection)
+    return valid_detections
+
+
+def legacy_ssd_nms(detections, det_threshold):
+    detections.sort(key=lambda detection: detection[0], reverse=True)
+    valid_detections = []
+    for _ in range(len(detections)):
+        max_detection = max(detections, key=lambda detection: detection[0])
+        if max_detection[0] < det_threshold:
+            break
+        valid_detections.append(max_detection)
+        max_detection[0] = 0
+        for detection in detections:
+            if detection[0] < det_threshold:
+                continue
+            current_rect_area = ((detection[1][2] - detection[1][0]) * (detection[1][3] - detection[1][1]))
+            max_rect_area = ((max_detection[1][2] - max_detection[1][0])
+                             * (max_detection[1][3] - max_detection[1][1]))
+            intersection_area = 0
+            if not (detection[1][0] >= max_detection[1][2]
+                    or detection[1][1] >= max_detection[1][3]
+                    or max_detection[1][0] >= detection[1][2]
+                    or max_detection[1][1] >= detection[1][3]):
+                intersection_area = ((min(detection[1][2], max_detection[1][2])
+                                      - max(detection[1][0], max_detection[1][0]))
+                                     * (min(detection[1][3], max_detection[1][3])
+                                        - max(detection[1][1], max_detection[1][1])))
+            overlap = intersection_area / (current_rect_area + max_rect_area - intersection_area)
+            detection[0] *= np.exp(-overlap * overlap / 0.6)
+    return valid_detections
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_yolo_nms_matches_legacy(seed):
+    rng = np.random.default_rng(seed)
+    count = 300
+    # every box crosses x = 50, the legacy overlap is exact only for boxes intersecting along one of the axes
+    x = rng.uniform(0, 50, count)
+    boxes = np.stack([x, rng.uniform(0, 100, count), rng.uniform(50, 80, count) - x + 1, rng.uniform(5, 40, count)],
+                     axis=1)
+    scores = rng.uniform(0, 1, count)
+    class_ids = rng.integers(0, 3, count)
+    predictions = [[scores[i], class_ids[i], boxes[i].tolist()] for i in range(count)]
+
+    expected = legacy_yolo_nms(predictions, 0.3, 0.4)
+    keep = non_max_suppression(xywh_to_xyxy(boxes), scores, 0.4, 0.3, class_ids)
+
+    assert [prediction[0] for prediction in expected] == scores[keep].tolist()
+    assert [prediction[1] for prediction in expected] == class_ids[keep].tolist()
+
+
+def test_nms_keeps_disjoint_boxes():
+    boxes = [[0, 0, 10, 10], [20, 20, 30, 30], [1, 1, 11, 11]]
+    assert non_max_suppression(boxes, [0.9, 0.8, 0.7], 0.4).tolist() == [0, 1]
+    assert non_max_suppression(boxes, [0.9, 0.8, 0.7], 0.4, class_ids=[0, 0, 1]).tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_ssd_soft_nms_matches_legacy(seed):
+    rng = np.random.default_rng(seed)
+    count = 200
+    top_left = rng.integers(0, 300, (count, 2))
+    boxes = np.concatenate([top_left, top_left + rng.integers(1, 100, (count, 2))], axis=1)
+    # repeated scores check that ties are resolved in the same order
+    scores = np.round(rng.uniform(0, 1, count), 2)
+    detections = [[scores[i], boxes[i].tolist(), 0., i] for i in range(count)]
+
+    expected = legacy_ssd_nms([detection[:] for detection in detections], 0.4)
+    detections.sort(key=lambda detection: detection[0], reverse=True)
+    keep = soft_non_max_suppression([detection[1] for detection in detections],
+                                    [detection[0] for detection in detections], 0.4)
+
+    assert [detection[3] for detection in expected] == [detections[i][3] for i in keep]
+
+
+def test_yolo_v7_nms():
+    prediction = np.zeros((1, 4, 7))
+    prediction[0, :, :4] = [[50, 50, 20, 20], [51, 50, 20, 20], [52, 50, 20, 20], [150, 150, 20, 20]]
+    prediction[0, :, 4] = [0.9, 0.95, 0.9, 0.1]
+    prediction[0, :, 5:] = [[1, 0], [1, 0], [0, 1], [1, 0]]
+
+    detections, = yolo_non_max_suppression(prediction)
+
+    np.testing.assert_allclose(detections, [[41, 40, 61, 60, 0.95, 0], [42, 40, 62, 60, 0.9, 1]])
+
+
+def legacy_yolo_v2_cell(adapter, cx, cy, dx, dy, detection, anchor_box_number, image_height, image_weight, anchors):
+    tx, ty, tw, th, to = detection[0:5]
+    bbox_center_x = (float(cx) + adapter._sigmoid(tx)) * (float(image_weight) / dx)
+    bbox_center_y = (float(cy) + adapter._sigmoid(ty)) * (float(image_height) / dy)
+    prior_width, prior_height = anchors[anchor_box_number]
+    bbox_width = (np.exp(tw) * prior_width) * (float(image_weight) / dx)
+    bbox_height = (np.exp(th) * prior_height) * (float(image_height) / dy)
+    scores = detection[5:]
+    class_id = np.argmax(scores)
+    if adapter._sigmoid(to) * scores[class_id] > adapter._threshold:
+        return [[scores[class_id], class_id, [bbox_center_x - bbox_width / 2, bbox_center_y - bbox_height / 2,
+                                              bbox_width, bbox_height]]]
+    return []
+
+
+def legacy_yolo_v3_cell(adapter, cx, cy, dx, dy, detection, anchor_box_number, image_height, image_weight, anchors):
+    activate = adapter._sigmoid if adapter.__class__.__name__ == 'YoloV3TFIO' else (lambda x: x)
+    tx, ty, tw, th = detection[0:4]
+    prior_width, prior_height = anchors[anchor_box_number]
+    bbox_center_x = (float(cx) + activate(tx)) * (float(image_height) / dx)
+    bbox_center_y = (float(cy) + activate(ty)) * (float(image_weight) / dy)
+    bbox_width = np.exp(tw) * prior_width
+    bbox_height = np.exp(th) * prior_height
+    predictions = []
+    for class_id in range(80):
+        confidence = activate(detection[5 + class_id])
+        if confidence >= adapter._threshold:
+            predictions.append([confidence, class_id, [bbox_center_x - bbox_width / 2,
+                                                       bbox_center_y - bbox_height / 2, bbox_width, bbox_height]])
+    return predictions
+
+
+@pytest.mark.parametrize('adapter_name', ['YoloV2CocoIO', 'YoloV3IO', 'YoloV3TFIO'])
+def test_yolo_decoding_matches_legacy(adapter_name):
+    pytest.importorskip('cv2')
+    import io_adapter
+
+    adapter = object.__new__(getattr(io_adapter, adapter_name))
+    adapter._threshold = 0.5
+    legacy_cell = legacy_yolo_v2_cell if adapter_name == 'YoloV2CocoIO' else legacy_yolo_v3_cell
+    rng = np.random.default_rng(0)
+    h, w = 416, 608
+    for data_shape, anchors in zip(adapter._get_shapes(), adapter._get_anchors()):
+        dx, dy = data_shape[-2:]
+        cells = rng.normal(0, 1.5, data_shape).astype(np.float32)
+        expected = []
+        for cx in range(dy):
+            for cy in range(dx):
+                for anchor_box_number, detection in enumerate(cells[:, :, cy, cx]):
+                    if detection[4] >= adapter._threshold:
+                        expected += legacy_cell(adapter, cx, cy, dx, dy, detection, anchor_box_number, h, w, anchors)
+
+        detections, cx, cy, anchor_box_number = adapter._get_cell_detections(cells)
+        priors = np.asarray(anchors, dtype=np.float64)[anchor_box_number]
+        scores, class_ids, boxes = adapter._get_predictions(detections, cx, cy, dx, dy, priors, h, w)
+
+        assert len(expected) > 0
+        np.testing.assert_allclose(scores, [prediction[0] for prediction in expected], rtol=1e-6)
+        assert class_ids.tolist() == [prediction[1] for prediction in expected]
+        np.testing.assert_allclose(boxes, [prediction[2] for prediction in expected], rtol=1e-4, atol=1e-3)
@@ -0,0 +1,29 @@
+import logging as log
+
+from src.benchmark.duration_history import MIN_PREDICTED_TIMEOUT, DurationHistory, RunProgress
+from src.benchmark.tests.test_processes import DotDict
+
+
+def make_test(test_id):
+    return DotDict({'get_identity': lambda: test_id})
+
+
+def test_history_orders_tests_and_predicts_timeouts(tmp_path):
+    history_path = tmp_path / 'durations.json'
+    history = DurationHistory(history_path)
+    short_test, long_test, new_test = make_test('short'), make_test('long'), make_test('new')
+    for duration in (10, 12, 500):
+        history.add(short_test, duration)
+    history.add(long_test, 100)
+
+    history = DurationHistory(history_path)
+    assert history.predict(short_test) == 12 and history.predict(new_test) is None
+    assert history.order_tests([short_test, long_test, new_test], 'longest_first') == [new_test, long_test, short_test]
+    assert history.order_tests([new_test, long_test, short_test], 'shortest_first') == [short_test, long_test, new_test]
+
+    progress = RunProgress([short_test, long_test], log, history, timeout_factor=3)
+    assert progress.get_timeout(short_test) == MIN_PREDICTED_TIMEOUT
+    assert progress.get_timeout(long_test) == 300 and progress.get_timeout(new_test) is None
+    assert progress.get_eta() == 112
+    progress.finish_test(short_test, 20, succeeded=False)
+    assert progress.get_eta() == 100 and history.predict(short_test) == 12
@@ -1,11 +1,19 @@
 import logging as log
 import re
+import shutil
+import subprocess
 import sys
+import time
+from pathlib import Path
 
 import pytest
 
 from src.benchmark.executors import Executor, HostExecutor, DockerExecutor
+import cmd_handler  # noqa: PLC0411
 from src.benchmark.frameworks.known_frameworks import KnownFrameworks
+from src.utils.constants import Status
+from src.utils.heartbeat_monitor import HeartbeatMonitor
+from src.utils.memory_sampler import ProcessTreeMemorySampler, get_start_time
 
 log.basicConfig(
     format='[ %(levelname)s ] %(message)s',
@@ -113,6 +121,22 @@ def test_infrastructure(executor_instance, mocker):
         assert ex.get_infrastructure() == 'test: test'
 
 
+def test_infrastructure_is_collected_once(mocker):
+    ex = get_host_executor(mocker)
+    get_infrastructure = mocker.patch.object(HostExecutor, '_get_infrastructure', return_value='CPU: test')
+    get_fingerprint = mocker.patch.object(HostExecutor, '_get_fingerprint', return_value={'cpu_model': 'test'})
+    for _ in range(3):
+        assert ex.get_infrastructure() == 'CPU: test'
+        assert ex.get_fingerprint() == {'cpu_model': 'test'}
+    assert get_infrastructure.call_count == 1
+    assert get_fingerprint.call_count == 1
+
+
+def test_host_fingerprint(mocker):
+    fingerprint = get_host_executor(mocker).get_fingerprint()
+    assert {'cpu_model', 'threads', 'caches', 'kernel', 'frameworks'} <= set(fingerprint)
+
+
 @pytest.mark.parametrize('executor_instance', [get_host_executor, get_docker_executor])
 def test_execute_process(executor_instance, mocker):
     ex = executor_instance(mocker)
@@ -129,3 +153,89 @@ def test_execute_process_timeout(executor_instance, mocker, caplog):
     if isinstance(ex, HostExecutor):
         ex.execute_process(command_line='sleep 5', timeout=0.01)
         assert re.match(r'.*Timeout .* is reached, terminating.*', caplog.text)
+
+
+@pytest.mark.skipif(shutil.which('taskset') is None or not Path('/proc/self/status').exists(),
+                    reason='taskset is unavailable')
+def test_execute_process_pinned(mocker):
+    _, output = get_host_executor(mocker).execute_process('grep Cpus_allowed_list /proc/self/status', 10,
+                                                          cpu_set=[0])
+    assert output[-1].split() == ['Cpus_allowed_list:', '0']
+
+
+@pytest.mark.skipif(not ProcessTreeMemorySampler.is_supported(), reason='/proc is unavailable')
+def test_only_processes_alive_after_grace_period_are_killed(mocker, tmp_path):
+    mocker.patch.object(cmd_handler, 'KILL_GRACE_PERIOD', 0.5)
+    send_signal = mocker.spy(cmd_handler.CMDHandler, '_send_signal')
+    pid_path = tmp_path / 'child.pid'
+    # the parent exits on SIGTERM, its child ignores SIGTERM
+    child_code = ('import os, signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); '
+                  f'open(r"{pid_path}", "w").write(str(os.getpid())); time.sleep(60)')
+    script = tmp_path / 'parent.py'
+    script.write_text(f'import subprocess, sys, time\nsubprocess.Popen([sys.executable, "-c", {child_code!r}])\n'
+                      'time.sleep(60)\n')
+    get_host_executor(mocker).execute_process(f'{sys.executable} {script}', 3)
+
+    child_pid = int(pid_path.read_text())
+    killed_pids = [call.args[0] for call in send_signal.call_args_list if call.args[1] == cmd_handler.signal.SIGKILL]
+    assert killed_pids == [[child_pid]]
+    # SIGKILL is delivered asynchronously
+    for _ in range(100):
+        if get_start_time(child_pid) is None:
+            break
+        time.sleep(0.01)
+    assert get_start_time(child_pid) is None
+
+
+def test_execute_process_stall(mocker, tmp_path, caplog):
+    heartbeat_path = tmp_path / 'test.heartbeat'
+    code = f"import time; open(r'{heartbeat_path}', 'w').write('inference 3'); time.sleep(60)"
+    stall_monitor = HeartbeatMonitor(heartbeat_path, stall_timeout=1, load_stall_timeout=None)
+    status, _ = get_host_executor(mocker).execute_process(f'{sys.executable} -c "{code}"', 120,
+                                                          stall_monitor=stall_monitor)
+    assert status == Status.PROCESS_STALLED.value
+    assert 'in phase inference after 3 iterations' in caplog.text
+
+
+def test_resident_worker_command_line(mocker):
+    ex = get_host_executor(mocker)
+    ex.set_target_framework(KnownFrameworks.pytorch)
+    inference_folder = Path(ex.get_path_to_inference_folder())
+    command_line = f'python3 {inference_folder / "inference_pytorch.py"} -m model.pt -ni 10'
+    assert ex.get_resident_worker_command_line(command_line) == command_line
+
+    ex.set_resident_worker_jobs(5)
+    worker_command_line = ex.get_resident_worker_command_line(command_line)
+    assert re.fullmatch(rf'python3 {inference_folder / "inference_worker.py"} --socket \S+PyTorch\.sock --max_jobs 5 '
+                        rf'{inference_folder / "inference_pytorch.py"} -m model\.pt -ni 10', worker_command_line)
+    assert ex.get_resident_worker_command_line('benchmark_app -m model.xml') == 'benchmark_app -m model.xml'
+
+
+def test_resident_workers_are_disabled_on_windows(mocker):
+    ex = get_host_executor(mocker)
+    ex.set_target_framework(KnownFrameworks.pytorch)
+    mocker.patch('sys.platform', 'win32')
+    ex.set_resident_worker_jobs(5)
+    command_line = f'python3 {Path(ex.get_path_to_inference_folder()) / "inference_pytorch.py"} -m model.pt'
+    assert ex.get_resident_worker_command_line(command_line) == command_line
+
+
+def test_resident_worker_runs_jobs_in_one_process(tmp_path):
+    script = tmp_path / 'launcher.py'
+    script.write_text('import os\nimport sys\n\n\ndef main():\n'
+                      '    print(os.getpid(), *sys.argv[1:])\n    return int(sys.argv[1])\n')
+    worker = Path(__file__).resolve().parents[2] / 'inference' / 'inference_worker.py'
+    socket_path = tmp_path / 'worker.sock'
+
+    def run_job(return_code):
+        process = subprocess.run([sys.executable, str(worker), '--socket', str(socket_path), '--max_jobs', '2',
+                                  str(script), str(return_code)], stdout=subprocess.PIPE, cwd=tmp_path, timeout=60)
+        pid, code = process.stdout.decode().split()[-2:]
+        assert process.returncode == return_code == int(code)
+        return pid
+
+    try:
+        pids = [run_job(0), run_job(3), run_job(0)]
+    finally:
+        subprocess.run([sys.executable, str(worker), '--socket', str(socket_path), '--stop'], cwd=tmp_path, timeout=60)
+    assert pids[0] == pids[1] != pids[2]
@@ -0,0 +1,23 @@
+from src.benchmark.frameworks.openvino.openvino_test import OpenVINOTest
+from src.benchmark.tests.test_processes import DotDict
+
+
+def make_test(**indep_parameters):
+    indep_parameters = DotDict({'inference_framework': 'OpenVINO DLDT', 'device': 'CPU', 'batch_size': 1,
+                                'iteration': 10, 'test_time_limit': 60, 'timeout_overhead': 300,
+                                **indep_parameters})
+    model = DotDict({'name': 'resnet-50', 'precision': 'FP32', 'source_framework': 'pytorch'})
+    return OpenVINOTest(model, None, indep_parameters, DotDict({'mode': 'sync'}))
+
+
+def test_identity_depends_on_measurement_parameters():
+    identity = make_test().get_identity()
+
+    assert make_test().get_identity() == identity
+    for parameters in [{'iteration': 100}, {'test_time_limit': 120}, {'warmup_iters': 5}, {'instances': 2},
+                       {'arrival_rate': 100.0, 'latency_sla': 0.01}, {'compiled_model_cache': 'True'}]:
+        assert make_test(**parameters).get_identity() != identity
+    # parameters of the benchmark itself and unset optional parameters do not change measurements
+    for parameters in [{'timeout_overhead': 600}, {'raw_output': False}, {'input_cache': 'True'},
+                       {'warmup_iters': None}, {'trace_allocations': False}]:
+        assert make_test(**parameters).get_identity() == identity
@@ -0,0 +1,143 @@
+import itertools
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip('cv2')
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'inference'))
+import cv2  # noqa: E402
+from io_adapter import FeedForwardIO  # noqa: E402
+
+from src.benchmark.tests.test_processes import DotDict  # noqa: E402
+
+
+class ChwTransformer:
+    @staticmethod
+    def get_shape_in_chw_order(shape, input_name):
+        return shape[1:]
+
+
+def make_io(batch_size, samples, **args):
+    io = FeedForwardIO(DotDict({'batch_size': batch_size, **args}), None, ChwTransformer())
+    for key, value in samples.items():
+        io._input_samples[key] = value
+        io._transformed_input[key] = itertools.cycle(value)
+    return io
+
+
+@pytest.mark.parametrize('batch_size', [1, 3, 4])
+def test_cached_batches_equal_stacked_batches(batch_size):
+    samples = {'data': np.arange(5 * 2 * 3, dtype=np.float32).reshape(5, 2, 3),
+               'mask': np.arange(3, dtype=np.int64).reshape(3, 1)}
+    cached_io = make_io(batch_size, samples)
+    stacked_io = make_io(batch_size, samples)
+    stacked_io.BATCH_CACHE_MAX_BYTES = 0
+
+    # batches of both inputs repeat after lcm(5, 3) = 15 samples, the cache wraps around several times
+    for _ in range(3 * 15):
+        cached_batch = cached_io.get_slice_input()
+        stacked_batch = stacked_io.get_slice_input()
+        for key in samples:
+            np.testing.assert_array_equal(cached_batch[key], stacked_batch[key])
+            assert not cached_batch[key].flags.writeable
+            assert cached_batch[key].ctypes.data % cached_io.BATCH_CACHE_ALIGNMENT == 0
+    assert len(cached_io._batch_cache) == 15 // np.gcd(15, batch_size)
+    assert not stacked_io._batch_cache
+
+
+def test_binder_is_called_once_for_every_distinct_batch():
+    bound = []
+
+    def binder(input_name, batch):
+        bound.append((input_name, batch))
+        return f'{input_name}_{len(bound)}'
+
+    io = make_io(2, {'data': np.arange(3, dtype=np.float32).reshape(3, 1)})
+    io.set_input_binder(binder)
+    batches = [io.get_slice_input()['data'] for _ in range(7)]
+
+    assert batches == ['data_1', 'data_2', 'data_3'] * 2 + ['data_1']
+    assert [batch.ravel().tolist() for _, batch in bound] == [[0, 1], [2, 0], [1, 2]]
+
+
+def test_ort_binder_shares_memory_with_cached_batch():
+    onnx_rt = pytest.importorskip('onnxruntime')
+    from inference_onnx_runtime import bind_ort_value
+
+    io = make_io(2, {'data': np.arange(4, dtype=np.float32).reshape(4, 1)})
+    io.set_input_binder(bind_ort_value)
+    ort_value = io.get_slice_input()['data']
+
+    assert isinstance(ort_value, onnx_rt.OrtValue)
+    np.testing.assert_array_equal(ort_value.numpy(), [[0], [1]])
+
+
+def write_images(image_dir, images_num):
+    image_dir.mkdir()
+    for idx in range(images_num):
+        cv2.imwrite(str(image_dir / f'{idx:02d}.png'), np.full((4, 5, 3), idx * 10, dtype=np.uint8))
+    return sorted(str(path) for path in image_dir.iterdir())
+
+
+def test_images_are_decoded_in_order_without_disk_cache(tmp_path):
+    files = write_images(tmp_path / 'images', 7)
+    io = make_io(1, {})
+    io.DECODE_PREFETCH_SIZE = 2
+    images, shapes = io._IOAdapter__convert_images([1, 3, 4, 5], files, np.float32, 'data', use_cache=False)
+
+    assert not isinstance(images, np.memmap) and io._input_cache_dir is None
+    np.testing.assert_array_equal(images, np.stack([cv2.imread(filename) for filename in files]))
+    assert shapes == [[4, 5]] * 7
+
+
+def test_image_directory_is_sorted_and_sampled_with_fixed_seed(tmp_path):
+    files = write_images(tmp_path / 'images', 10)
+    input_ = [str(tmp_path / 'images')]
+
+    assert make_io(1, {})._IOAdapter__create_list_images(input_) == files
+    sampled_files = make_io(1, {}, max_input_images=4)._IOAdapter__create_list_images(input_)
+    assert len(sampled_files) == 4 and sampled_files == sorted(sampled_files) and set(sampled_files) < set(files)
+    assert make_io(1, {}, max_input_images=4)._IOAdapter__create_list_images(input_) == sampled_files
+
+
+def test_input_cache_is_keyed_reused_and_evicted(tmp_path, mocker):
+    files = write_images(tmp_path / 'images', 3)
+    cache_dir = tmp_path / 'cache'
+    io = make_io(1, {}, input_cache_dir=str(cache_dir))
+    images, _ = io._IOAdapter__convert_images([1, 3, 4, 5], files, np.float32, 'data', use_cache=True)
+
+    # the same files, shape and type are mapped from the cache without decoding
+    mocker.patch.object(FeedForwardIO, '_IOAdapter__read_data', side_effect=AssertionError)
+    cached_images, _ = make_io(1, {}, input_cache_dir=str(cache_dir))._IOAdapter__convert_images(
+        [1, 3, 4, 5], files, np.float32, 'data', use_cache=True)
+    assert isinstance(cached_images, np.memmap)
+    np.testing.assert_array_equal(cached_images, images)
+
+    get_cache_key = FeedForwardIO._IOAdapter__get_cache_key
+    cache_key = get_cache_key(files, [1, 3, 4, 5])
+    assert cache_key == get_cache_key(files, [1, 3, 4, 5])
+    assert cache_key != get_cache_key(files, [1, 3, 4, 6]) and cache_key != get_cache_key(files[:2], [1, 3, 4, 5])
+    os.utime(files[0], ns=(0, 0))
+    assert cache_key != get_cache_key(files, [1, 3, 4, 5])
+
+    # the least recently used entry and temporary files of crashed launchers are removed
+    decoded_entry = next(cache_dir.glob('decoded_*.npy'))
+    old_entry = cache_dir / 'old.npy'
+    np.save(old_entry, np.zeros(64, dtype=np.uint8))
+    os.utime(old_entry, (1, 1))
+    stale_tmp_file = cache_dir / 'decoded_crashed.999999999.tmp'
+    stale_tmp_file.write_bytes(b'')
+    os.utime(stale_tmp_file, (1, 1))
+    io.INPUT_CACHE_MAX_BYTES = decoded_entry.stat().st_size
+    io._IOAdapter__evict_input_cache(keep=decoded_entry)
+    assert list(cache_dir.iterdir()) == [decoded_entry]
+
+
+def test_liveness_of_launchers_is_not_probed_with_signals_on_windows(mocker):
+    kill = mocker.patch('os.kill')
+    mocker.patch('sys.platform', 'win32')
+    assert not FeedForwardIO._IOAdapter__is_process_alive(os.getpid())
+    kill.assert_not_called()
@@ -0,0 +1,49 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'inference'))
+from inference_tools.load_generator import (find_max_arrival_rate, get_arrival_times,  # noqa: E402
+                                            open_loop_inference)
+
+
+def test_poisson_arrivals_have_target_rate():
+    arrival_times = get_arrival_times(20000, arrival_rate=500, distribution='poisson')
+
+    assert arrival_times[0] == 0
+    assert np.all(np.diff(arrival_times) >= 0)
+    assert abs(len(arrival_times) / arrival_times[-1] - 500) < 25
+
+
+def test_trace_arrivals_are_scaled_to_rate():
+    arrival_times = get_arrival_times(5, arrival_rate=10, distribution='trace', trace=[1.0, 3.0])
+
+    np.testing.assert_allclose(arrival_times, [0, 0.15, 0.2, 0.35, 0.4])
+
+
+def test_open_loop_latency_includes_queueing():
+    def inference_iteration(service_time):
+        time.sleep(service_time)
+        return service_time
+
+    arrival_times = get_arrival_times(10, arrival_rate=200, distribution='uniform')
+    results = open_loop_inference(arrival_times, [(0.01,)], quiet=True)(inference_iteration)()
+
+    assert results['service_time_infer'] == [0.01] * 10
+    # requests arrive twice as fast as they are served, so the last one waits for the previous ones
+    assert max(results['time_infer']) > 0.05
+    assert results['duration'] >= 0.1
+
+
+def test_max_rate_search_converges_to_sla():
+    def run_at_rate(rate):
+        # latency grows with the rate, SLA of 10 ms is met up to 100 requests per second
+        return {'time_infer': [rate / 10000] * 10}
+
+    max_rate, results = find_max_arrival_rate(run_at_rate, 30, latency_sla=0.01, max_runs=20)
+
+    assert 95 <= max_rate <= 100
+    assert results['time_infer'][0] <= 0.01
+    assert find_max_arrival_rate(lambda rate: {'time_infer': [1.0]}, 30, latency_sla=0.01, max_runs=3)[0] is None
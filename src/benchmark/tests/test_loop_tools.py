@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'inference'))
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, get_warmup_results,  # noqa: E402
+                                        loop_inference, resource, set_loop_parameters, set_warmup_parameters)
+from postprocessing_data import calculate_performance_metrics_sync_mode  # noqa: E402
+
+
+def make_inference(times):
+    times = iter(times)
+
+    def inference_iteration():
+        return next(times)
+
+    return inference_iteration
+
+
+def test_loop_excludes_warmup_iterations(capsys):
+    results = loop_inference(3, 0, warmup_iters=2, quiet=True)(make_inference([5.0, 4.0, 0.1, 0.2, 0.3]))()
+
+    assert results['warmup_time_infer'] == [5.0, 4.0] == get_warmup_results()['warmup_time_infer']
+    assert results['time_infer'] == [0.1, 0.2, 0.3]
+    assert capsys.readouterr().out == ''
+
+
+def test_loop_stops_by_test_duration():
+    results = loop_inference(1, 1, quiet=True, collect_rusage=True)(make_inference([0.3] * 10))()
+
+    assert results['time_infer'] == [0.3] * 4
+    assert len(results['cpu_time']) in [0, 4]
+
+
+def test_loop_warms_up_until_steady_state():
+    set_warmup_parameters(warmup_iters=2, steady_state_cv=0.01, steady_state_max_time=100)
+    try:
+        times = [1.0, 0.5] + [0.2, 0.3] * 5 + [0.1] * 13
+        results = loop_inference(3, 0, quiet=True)(make_inference(times))()
+    finally:
+        set_warmup_parameters()
+
+    assert results['warmup_time_infer'] == times[:22]
+    assert results['time_infer'] == [0.1] * 3
+    assert get_warmup_results()['steady_state_reached'] is True
+
+
+def test_loop_parameters_are_used_by_default(capsys):
+    set_loop_parameters(quiet=True, collect_rusage=True)
+    try:
+        results = loop_inference(3, 0, warmup_iters=0)(make_inference([0.1, 0.2, 0.3]))()
+    finally:
+        set_loop_parameters()
+
+    assert capsys.readouterr().out == ''
+    loop_results = get_loop_results()
+    assert loop_results['cpu_time'] == results['cpu_time']
+    assert loop_results['context_switches'] == results['context_switches']
+    assert len(results['cpu_time']) == (3 if resource is not None else 0)
+
+    metrics = calculate_performance_metrics_sync_mode(1, results['time_infer'], cpu_time=[0.2, 0.4],
+                                                      context_switches=[1, 4])
+    assert (metrics['cpu_time_per_iteration'], metrics['context_switches_per_iteration']) == (0.3, 2.5)
+    metrics = calculate_performance_metrics_sync_mode(1, results['time_infer'], **get_loop_results())
+    assert metrics['warmup_iterations_num'] == 0
+
+
+def test_get_exec_time():
+    res, exec_time = get_exec_time()(lambda value: value)(42)
+
+    assert res == 42
+    assert 0 < exec_time < 1
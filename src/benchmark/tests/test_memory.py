@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'inference'))
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'utils'))
+from inference_tools import memory_tools  # noqa: E402
+from memory_sampler import ProcessTreeMemorySampler, get_start_time  # noqa: E402
+
+BYTES_IN_MEGABYTE = 1024 ** 2
+
+pytestmark = pytest.mark.skipif(not ProcessTreeMemorySampler.is_supported(), reason='/proc is unavailable')
+
+
+def test_sampler_covers_child_processes():
+    # the child allocates 64 MB, the parent shell only waits for it
+    code = 'import time; data = bytearray(64 * 1024 ** 2); time.sleep(1)'
+    process = subprocess.Popen(f'{sys.executable} -c "{code}"; true', shell=True)
+    sampler = ProcessTreeMemorySampler(interval=0.05)
+    sampler.start(process.pid)
+    process.wait()
+    sampler.stop()
+
+    assert sampler.peak_rss > 64 * BYTES_IN_MEGABYTE
+    assert sampler.peak_uss is None or sampler.peak_uss > 64 * BYTES_IN_MEGABYTE
+
+
+def test_start_time_identifies_process():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    start_time = get_start_time(process.pid)
+    process.wait()
+
+    assert isinstance(start_time, int) and start_time >= get_start_time('self')
+    assert get_start_time(process.pid) != start_time
+
+
+def test_launcher_memory_stages_are_reported(monkeypatch):
+    monkeypatch.setenv(memory_tools.TRACE_ALLOCATIONS_ENV, '1')
+    memory_tools.reset_memory_results()
+    memory_tools.record_memory('import')
+    data = bytearray(32 * BYTES_IN_MEGABYTE)
+    data[::4096] = b'x' * len(data[::4096])
+    memory_tools.record_memory('model_load')
+    memory_tools.record_memory('import')
+
+    assert memory_tools.start_allocation_tracing()
+    retained = [bytearray(1000) for _ in range(10)]
+    memory_tools.stop_allocation_tracing(len(retained))
+    results = memory_tools.get_memory_results()
+
+    assert results['load_rss_delta_mb'] >= 30
+    assert results['peak_rss_mb'] >= results['rss_after_load_mb']
+    assert results['rss_after_warmup_mb'] is None
+    assert results['allocated_per_iteration'] >= 1000
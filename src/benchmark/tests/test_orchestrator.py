@@ -0,0 +1,107 @@
+import asyncio
+import logging as log
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'remote_control'))
+import orchestrator  # noqa: E402
+from orchestrator import RemoteOrchestrator  # noqa: E402
+
+STATUS_PERIOD = 1000
+
+
+class FakeExecutor:
+    """Results of attempts are returned in order: bool, exception to raise or time in seconds to hang"""
+
+    def __init__(self, connection_results=(True,), launch_results=(True,), wait_time=0):
+        self.connection_results = list(connection_results)
+        self.launch_results = list(launch_results)
+        self.wait_time = wait_time
+        self.connection_calls = 0
+        self.launch_calls = 0
+
+    @staticmethod
+    def _get_result(results):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        if isinstance(result, float):
+            time.sleep(result)
+            return True
+        return result
+
+    def try_connection(self, ip, login, password):
+        self.connection_calls += 1
+        return self._get_result(self.connection_results)
+
+    def try_python(self, command_line):
+        self.launch_calls += 1
+        return self._get_result(self.launch_results)
+
+    def wait_all(self):
+        time.sleep(self.wait_time)
+
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    monkeypatch.setattr(orchestrator, 'INITIAL_BACKOFF', 0.01)
+    monkeypatch.setattr(orchestrator, 'MAX_BACKOFF', 0.02)
+    delays = []
+    sleep = asyncio.sleep
+
+    async def record_sleep(delay, *args, **kwargs):
+        if delay != STATUS_PERIOD:
+            delays.append(delay)
+        return await sleep(delay, *args, **kwargs)
+
+    monkeypatch.setattr(orchestrator.asyncio, 'sleep', record_sleep)
+    return delays
+
+
+def run_orchestrator(executors, **kwargs):
+    machines = [SimpleNamespace(ip=ip, login='login', password='password') for ip in executors]
+    remote_orchestrator = RemoteOrchestrator(machines, log.getLogger(), lambda machine: executors[machine.ip],
+                                             lambda machine: 'ftp_client.py', status_period=STATUS_PERIOD, **kwargs)
+    failed_hosts = asyncio.run(remote_orchestrator.run())
+    return failed_hosts, remote_orchestrator._statuses
+
+
+def test_failed_attempts_are_retried_with_backoff(backoffs):
+    executor = FakeExecutor(connection_results=[False, ConnectionError('refused'), False, True],
+                            launch_results=[False, True])
+    failed_hosts, statuses = run_orchestrator({'host': executor}, attempts=4)
+
+    assert failed_hosts == [] and statuses['host'].state == 'done'
+    assert (executor.connection_calls, executor.launch_calls) == (4, 2)
+    assert backoffs == [0.01, 0.02, 0.02, 0.01]
+
+
+def test_host_fails_after_all_attempts(backoffs):
+    executor = FakeExecutor(connection_results=[False] * 3)
+    failed_hosts, statuses = run_orchestrator({'host': executor}, attempts=3)
+
+    assert failed_hosts == ['host'] and executor.launch_calls == 0
+    assert statuses['host'].message == 'connecting failed after 3 attempts (process is not created)'
+
+
+def test_timed_out_connection_is_retried_and_launch_is_not(backoffs):
+    executor = FakeExecutor(connection_results=[1.0, True], launch_results=[1.0, True])
+    failed_hosts, statuses = run_orchestrator({'host': executor}, attempt_timeout=0.1)
+
+    assert failed_hosts == ['host']
+    assert (executor.connection_calls, executor.launch_calls) == (2, 1)
+    assert 'not repeated' in statuses['host'].message
+
+
+def test_host_timeout_fails_only_hung_host(backoffs):
+    executors = {'hung': FakeExecutor(wait_time=5), 'host': FakeExecutor()}
+    start_time = time.monotonic()
+    failed_hosts, statuses = run_orchestrator(executors, host_timeout=0.3)
+
+    assert time.monotonic() - start_time < 5
+    assert failed_hosts == ['hung'] and statuses['host'].state == 'done'
+    assert statuses['hung'].message == 'timed out after 0.3 s'
@@ -1,5 +1,7 @@
+import json
 import logging as log
 import sys
+from pathlib import Path
 
 import pytest
 
@@ -104,7 +106,8 @@ def test_framework_wrapper(inference_framework, complex_test, mocker):
                           inference_framework[1])
 
 
-def test_get_openvino_benchmark_app_metrics(mocker):
+def test_get_openvino_benchmark_app_metrics(mocker, tmp_path):
+    mocker.patch('src.benchmark.executors.HostExecutor.get_path_to_logs_folder', return_value=tmp_path)
     mocker.patch(
         'src.benchmark.frameworks.openvino.openvino_benchmark_process.OpenVINOBenchmarkPythonProcess.'
         '_fill_command_line',
@@ -123,3 +126,142 @@ def test_get_openvino_benchmark_app_metrics(mocker):
                                                  'audio_len_avg': 'N/A',
                                                  'audio_sampling_rate': 'N/A',
                                                  'latency_per_second': 'N/A'}
+
+
+def test_openvino_benchmark_app_reports_are_saved_to_test_folders(mocker, tmp_path):
+    mocker.patch('src.benchmark.executors.HostExecutor.get_path_to_logs_folder', return_value=tmp_path)
+    processes = [OpenVINOBenchmarkPythonProcess(TEST_BASIC_LINE, get_host_executor(mocker), log) for _ in range(2)]
+    processes[0].timestamp, processes[1].timestamp = '01.01.24_00-00-00-000001', '01.01.24_00-00-00-000002'
+
+    report_folders = [process.report_folder for process in processes]
+    assert report_folders[0] != report_folders[1]
+    for process, report_folder in zip(processes, report_folders):
+        assert report_folder.parent == tmp_path and process.report_path.parent == report_folder
+        assert process.json_stats_arguments.endswith(f'-report_folder {report_folder.absolute()}')
+
+
+def test_results_are_read_from_reports_instead_of_output(mocker):
+    json_stats = {'configuration_setup': {'nireq': '4'},
+                  'execution_results': {'execution_time': 1000.0, 'iterations_num': 100, 'throughput': 100.0,
+                                        'latency_median': 40.0}}
+    mocker.patch('src.benchmark.frameworks.processes.ProcessHandler.get_json_report_content', return_value=json_stats)
+    process = OpenVINOBenchmarkPythonProcess(TEST_BASIC_LINE, get_host_executor(mocker), log)
+    process._status, process._output = 0, ['[ INFO ] Throughput: 1.00 FPS']
+    metrics = process.get_performance_metrics()
+    assert (metrics['fps'], metrics['latency'], metrics['average_time']) == (100.0, 0.04, 0.01)
+    assert process.extract_inference_param('nireq') == '4'
+
+    report = {'configurations_setup': {'input_shapes': {'data': '[1, 3, 224, 224]', 'info': '[1, 3]'}}}
+    mocker.patch('src.benchmark.frameworks.processes.ProcessHandler.get_json_report_content', return_value=report)
+    process = SyncOpenVINOProcess(TEST_BASIC_LINE, get_host_executor(mocker), log)
+    process._status, process._output = 0, ['Shape for input layer data: [1, 3, 1, 1]']
+    assert process.get_model_shape() == '[1, 3, 224, 224], [1, 3]'
+
+
+def test_get_latency_percentiles_from_json_report(mocker):
+    report = {'execution_results': {'throughput': 100.0, 'latency_median': 10.0, 'latency_avg': 12.0,
+                                    'latency_p50': 10.0, 'latency_p90': 15.0, 'latency_p95': 17.5,
+                                    'latency_p99': 25.0, 'latency_p99_9': None}}
+    mocker.patch('src.benchmark.frameworks.processes.ProcessHandler.get_json_report_content', return_value=report)
+    mocker.patch.object(SyncOpenVINOProcess, 'launcher_latency_units', 'milliseconds')
+    process = SyncOpenVINOProcess(TEST_BASIC_LINE, get_host_executor(mocker), log)
+    process._status, process._output = 0, ['output']
+    metrics = process.get_performance_metrics_from_json_report()
+    assert [metrics[name] for name in ProcessHandler.LATENCY_PERCENTILES] == [0.01, 0.015, 0.0175, 0.025, 'N/A']
+
+
+def test_warmup_arguments_and_time_limit(mocker):
+    test = DotDict({'indep_parameters': DotDict({'inference_framework': 'inference_framework', 'warmup_iters': 5,
+                                                 'warmup_time': 2.0, 'steady_state_cv': 0.05}),
+                    'dep_parameters': DotDict({'mode': 'mode'}),
+                    'model': DotDict({'model': 'model'})})
+    process = SyncOpenVINOProcess(test, get_host_executor(mocker), log)
+    command_line = process._add_measurement_arguments('launcher')
+    assert command_line == 'launcher --warmup_iters 5 --warmup_time 2.0 --steady_state_cv 0.05'
+    assert process.warmup_time_limit == 2.0 + ProcessHandler.DEFAULT_STEADY_STATE_MAX_TIME
+
+
+def test_rusage_argument_and_metrics(mocker):
+    test = DotDict({'indep_parameters': DotDict({'inference_framework': 'inference_framework',
+                                                 'collect_rusage': True}),
+                    'dep_parameters': DotDict({'mode': 'mode'}),
+                    'model': DotDict({'model': 'model'})})
+    report = {'execution_results': {'throughput': 100.0, 'latency_avg': 12.0, 'cpu_time_per_iteration': 0.0234567,
+                                    'context_switches_per_iteration': 3.5}}
+    mocker.patch('src.benchmark.frameworks.processes.ProcessHandler.get_json_report_content', return_value=report)
+    mocker.patch.object(SyncOpenVINOProcess, 'launcher_latency_units', 'milliseconds')
+    process = SyncOpenVINOProcess(test, get_host_executor(mocker), log)
+    assert process._add_measurement_arguments('launcher') == 'launcher --collect_rusage'
+    process._status, process._output = 0, ['output']
+    metrics = process.get_performance_metrics_from_json_report()
+    assert (metrics['cpu_time_per_iteration'], metrics['context_switches_per_iteration']) == (0.023457, 3.5)
+
+
+@pytest.mark.parametrize(('test_time_limit', 'predicted_timeout', 'timeout'),
+                         [(60, None, 360), (60, 100, 360), (60, 1000, 1000), (0, 100, 100), (0, None, None)])
+def test_predicted_timeout_does_not_shorten_configured_timeout(test_time_limit, predicted_timeout, timeout, mocker):
+    test = DotDict({'indep_parameters': DotDict({'inference_framework': 'inference_framework',
+                                                 'test_time_limit': test_time_limit, 'timeout_overhead': 300}),
+                    'dep_parameters': DotDict({'mode': 'mode'}),
+                    'model': DotDict({'model': 'model'})})
+    execute_process = mocker.patch('src.benchmark.executors.HostExecutor.execute_process', return_value=(0, []))
+    process = SyncOpenVINOProcess(test, get_host_executor(mocker), log)
+    process.set_timeout(predicted_timeout)
+    process._ProcessHandler__execute_command_line('launcher', None)
+    assert execute_process.call_args.args[1] == timeout
+
+
+def test_async_openvino_time_limit(mocker):
+    test = DotDict({'indep_parameters': DotDict({'inference_framework': 'inference_framework', 'batch_size': 1,
+                                                 'device': 'CPU', 'iteration': 10, 'test_time_limit': 60}),
+                    'dep_parameters': DotDict({'mode': 'mode', 'async_request': 4}),
+                    'model': DotDict({'model': 'model.xml', 'weight': 'model.bin'})})
+    process = AsyncOpenVINOProcess(test, get_host_executor(mocker), log)
+    command_line = process._fill_command_line()
+    assert ' -ni 10 ' in command_line
+    assert command_line.endswith(' --time 60 --requests 4')
+
+
+def test_compiled_model_cache_argument_and_compile_time(mocker):
+    test = DotDict({'indep_parameters': DotDict({'inference_framework': 'inference_framework',
+                                                 'compiled_model_cache': 'True'}),
+                    'dep_parameters': DotDict({'mode': 'mode'}),
+                    'model': DotDict({'model': 'model'})})
+    report = {'execution_results': {'throughput': 100.0, 'latency_avg': 12.0, 'read_network_time': 250.0,
+                                    'compile_time': 1500.0}}
+    mocker.patch('src.benchmark.frameworks.processes.ProcessHandler.get_json_report_content', return_value=report)
+    mocker.patch.object(SyncOpenVINOProcess, 'launcher_latency_units', 'milliseconds')
+    process = SyncOpenVINOProcess(test, get_host_executor(mocker), log)
+    command_line = process._add_compiled_model_cache_argument('launcher')
+    assert command_line == f'launcher --compiled_model_cache_dir {process.compiled_model_cache_dir}'
+    assert process.compiled_model_cache_dir.name == 'compiled_model_cache'
+    process._status, process._output = 0, ['output']
+    metrics = process.get_performance_metrics_from_json_report()
+    assert (metrics['load_time'], metrics['compile_time']) == (0.25, 1.5)
+
+
+def test_multi_instance_reports_are_aggregated(mocker):
+    test = DotDict({'indep_parameters': DotDict({'inference_framework': 'inference_framework', 'batch_size': 1,
+                                                 'device': 'CPU', 'iteration': 10, 'test_time_limit': 60,
+                                                 'timeout_overhead': 10, 'instances': 2,
+                                                 'instances_pinning': 'cpu_sets'}),
+                    'dep_parameters': DotDict({'mode': 'mode'}),
+                    'model': DotDict({'model': 'model.xml', 'weight': 'model.bin', 'name': 'model'})})
+    reports = {'reference': {'throughput': 100.0, 'latency_median': 0.01, 'latency_avg': 0.01},
+               'instance0': {'throughput': 90.0, 'latency_median': 0.011, 'latency_avg': 0.011},
+               'instance1': {'throughput': 70.0, 'latency_median': 0.0143, 'latency_avg': 0.0143}}
+    execute_process = mocker.patch('src.benchmark.executors.HostExecutor.execute_process',
+                                   return_value=(0, ['output']))
+    mocker.patch('src.benchmark.executors.HostExecutor.get_file_content',
+                 side_effect=lambda path: json.dumps({'execution_results': reports[Path(path).stem.split('_')[-1]]}))
+    mocker.patch('src.benchmark.frameworks.instances.os.sched_getaffinity', return_value={0, 1, 2, 3}, create=True)
+    process = SyncOpenVINOProcess(test, get_host_executor(mocker), log)
+    process.execute()
+
+    command_lines = [call.args[0] for call in execute_process.call_args_list]
+    assert 'DLI_START_BARRIER' not in command_lines[0]
+    assert all('DLI_START_BARRIER_PARTIES=2 ' in command_line for command_line in command_lines[1:])
+    assert [call.kwargs['cpu_set'] for call in execute_process.call_args_list] == [[0, 1], [0, 1], [2, 3]]
+    metrics = process.get_performance_metrics()
+    assert (metrics['fps'], metrics['instances'], metrics['scaling_efficiency']) == (160.0, 2, 0.8)
+    assert metrics['instance_latency_spread'] == 0.3
@@ -0,0 +1,119 @@
+import logging as log
+import sys
+import threading
+import time
+
+import pytest
+
+from src.benchmark.output import OutputHandler
+from src.utils.result_store import ResultStore
+from src.benchmark.scheduler import CpuSetAllocator, ParallelTestScheduler, format_cpu_set, get_required_cpu_count
+from src.benchmark.tests.test_processes import DotDict
+
+log.basicConfig(
+    format='[ %(levelname)s ] %(message)s',
+    level=log.INFO,
+    stream=sys.stdout,
+)
+
+
+def make_test(**dep_parameters):
+    return DotDict({'dep_parameters': DotDict(dep_parameters)})
+
+
+@pytest.mark.parametrize('cpu_set', [[[0], '0'], [[0, 1, 2, 5], '0-2,5'], [[7, 3, 4, 9, 10], '3-4,7,9-10']])
+def test_format_cpu_set(cpu_set):
+    assert format_cpu_set(cpu_set[0]) == cpu_set[1]
+
+
+@pytest.mark.parametrize('test_params', [[{'nthreads': '4'}, 4], [{'thread_count': '2'}, 2],
+                                         [{'num_threads': '8', 'num_inter_threads': '2'}, 8],
+                                         [{'num_intra_threads': None}, None], [{}, None]])
+def test_required_cpu_count(test_params):
+    assert get_required_cpu_count(make_test(**test_params[0])) == test_params[1]
+
+
+def test_allocator_gives_disjoint_cpu_sets():
+    allocator = CpuSetAllocator(range(8))
+    first = allocator.acquire(3)
+    second = allocator.acquire(5)
+    assert not set(first) & set(second)
+    allocator.release(first)
+    assert allocator.acquire(3) == [0, 1, 2]
+
+
+def test_scheduler_runs_unlimited_test_exclusively():
+    allocator = CpuSetAllocator(range(4))
+    scheduler = ParallelTestScheduler(['executor_1', 'executor_2'], log, pin_cpu_sets=True, allocator=allocator)
+    tests = [make_test(nthreads='2'), make_test(nthreads='2'), make_test(), make_test(nthreads='2')]
+    running = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def run_test(idx, test, executor, cpu_set):
+        with lock:
+            overlaps.append((idx, list(running)))
+            running.append(idx)
+        time.sleep(0.05)
+        with lock:
+            running.remove(idx)
+        return cpu_set
+
+    statuses = scheduler.run(tests, run_test)
+
+    assert [len(cpu_set) for cpu_set in statuses] == [2, 2, 4, 2]
+    assert dict(overlaps)[2] == []
+    assert 2 not in dict(overlaps)[3]
+
+
+def test_output_rows_are_written_in_config_order(tmp_path, mocker):
+    table = tmp_path / 'result.csv'
+    handler = OutputHandler(str(table), ';')
+    handler.create_table()
+    mocker.patch.object(OutputHandler, '_OutputHandler__create_table_row',
+                        side_effect=lambda executor, test, process: dict.fromkeys(handler._column_names, test))
+
+    handler.add_row_to_table(None, 'second', None, row_index=1)
+    handler.skip_row(2)
+    handler.add_row_to_table(None, 'fourth', None, row_index=3)
+    assert len(table.read_text().splitlines()) == 1
+    handler.add_row_to_table(None, 'first', None, row_index=0)
+
+    rows = [line.split(';')[0] for line in table.read_text().splitlines()[1:]]
+    assert rows == ['"first"', '"second"', '"fourth"']
+
+
+def test_output_rows_are_added_to_result_store(tmp_path, mocker):
+    store_path = tmp_path / 'results.sqlite'
+    handler = OutputHandler(str(tmp_path / 'result.csv'), ';', str(store_path))
+    handler.create_table()
+    mocker.patch.object(OutputHandler, '_OutputHandler__create_table_row',
+                        side_effect=lambda executor, test, process: {'status': 'Success', 'model': test})
+
+    handler.add_row_to_table(None, 'second', None, row_index=1)
+    handler.add_row_to_table(None, 'first', None, row_index=0)
+    handler.close()
+
+    store = ResultStore(store_path)
+    columns, rows = store.read_table('benchmark', {'Topology name': 'second'})
+    assert columns == list(handler._column_names.values())
+    assert rows[0][columns.index('Status')] == 'Success'
+    assert [row[columns.index('Topology name')] for row in store.read_table('benchmark')[1]] == ['first', 'second']
+    store.close()
+
+
+def test_resumed_table_keeps_finished_tests(tmp_path, mocker):
+    table = tmp_path / 'result.csv'
+    handler = OutputHandler(str(table), ';')
+    handler.create_table()
+    mocker.patch.object(OutputHandler, '_OutputHandler__create_table_row',
+                        side_effect=lambda executor, test, process: {'test_id': test[0], 'status': test[1]})
+    for test in [('a', 'Success'), ('b', 'Failed'), ('a', 'Success')]:
+        handler.add_row_to_table(None, test, None)
+    # the run is interrupted while writing the row
+    with open(table, 'a') as table_file:
+        table_file.write('"Success";"Classif')
+
+    assert OutputHandler(str(table), ';').resume_table() == {'a': 2, 'b': 1}
+    assert OutputHandler(str(table), ';').resume_table(rerun_failed=True) == {'a': 2}
+    assert len(table.read_text().splitlines()) == 3
@@ -0,0 +1,32 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'inference'))
+from inference_tools import startup_tools  # noqa: E402
+
+
+@pytest.mark.skipif(startup_tools.get_process_start_time() is None, reason='/proc is unavailable')
+def test_cold_start_is_counted_from_process_start():
+    process_start_time = startup_tools.get_process_start_time()
+    assert 0 <= time.time() - process_start_time < 3600
+
+    startup_tools.reset_startup_results()
+    startup_tools.record_import()
+    startup_tools.record_first_inference(0.5)
+    startup_tools.record_first_inference(0.1)
+    results = startup_tools.get_startup_results(read_time=1.0)
+
+    assert results['first_inference_time'] == 0.5
+    assert results['read_time'] == 1.0 and results['compile_time'] is None
+    assert results['cold_start_time'] >= results['import_time'] > 0
+
+
+def test_job_start_time_overrides_process_start(monkeypatch):
+    monkeypatch.setattr(startup_tools, '_start_time', {'time': time.time() - 2})
+    startup_tools.reset_startup_results()
+    startup_tools.record_import()
+
+    assert 2 <= startup_tools.get_startup_results()['import_time'] < 3
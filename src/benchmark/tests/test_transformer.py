@@ -0,0 +1,274 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip('cv2')
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'inference'))
+from transformer import (LAYER_LAYOUT_TO_IMAGE, IntelCaffeTransformer, NcnnTransformer,  # noqa: E402
+                         OpenVINOTransformer, TensorFlowLiteTransformer, TensorFlowTransformer, Transformer,
+                         TVMTransformer)
+
+MEAN = [123.675, 116.28, 103.53]
+INPUT_SCALE = [58.395, 57.12, 57.375]
+CHANNEL_SWAP = [2, 1, 0]
+
+
+# per-image transformers before batched preprocessing, channel swap was a no-op in all of them
+class LegacyTransformer:
+    @staticmethod
+    def _transform(image):
+        return image
+
+    def transform_images(self, images, shape, element_type, *args):
+        dataset_size = images.shape[0]
+        new_shape = [dataset_size] + shape[1:]
+        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
+        for i in range(dataset_size):
+            transformed_images[i] = self._transform(images[i])
+        return transformed_images
+
+
+class LegacyOpenVINOTransformer(LegacyTransformer):
+    def _transform(self, image, shape):
+        if self.__is_nhwc(shape):
+            return image
+        return image.transpose(2, 0, 1)
+
+    def __is_nhwc(self, shape):
+        return (len(shape) in [3, 4]) and (shape[len(shape) - 1] in [1, 3])
+
+    def transform_images(self, images, shape, element_type, *args):
+        dataset_size = images.shape[0]
+        new_shape = [dataset_size, shape[1], shape[2], shape[3]]
+        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
+        image_index = 0
+        for i in range(dataset_size):
+            image_index %= images.shape[0]
+            transformed_images[i] = self._transform(images[image_index], shape)
+            image_index += 1
+        return transformed_images
+
+
+class LegacyIntelCaffeTransformer(LegacyTransformer):
+    def __init__(self, converting):
+        self._converting = converting
+
+    def __set_channel_swap(self, image):
+        if 'channel_swap' in self._converting:
+            image = image[self._converting['channel_swap'], :, :]
+
+    def __set_mean(self, image):
+        if 'mean' in self._converting:
+            image[:, :, 0] -= self._converting['mean'][0]
+            image[:, :, 1] -= self._converting['mean'][1]
+            image[:, :, 2] -= self._converting['mean'][2]
+
+    def __set_input_scale(self, image):
+        if 'input_scale' in self._converting:
+            image[:, :, 0] /= self._converting['input_scale'][0]
+            image[:, :, 1] /= self._converting['input_scale'][1]
+            image[:, :, 2] /= self._converting['input_scale'][2]
+
+    def _transform(self, image):
+        transformed_image = np.copy(image).astype(np.float32)
+        transformed_image = transformed_image.transpose(2, 0, 1)
+        self.__set_channel_swap(transformed_image)
+        self.__set_mean(transformed_image)
+        self.__set_input_scale(transformed_image)
+        return transformed_image
+
+    def transform_images(self, images, shape, element_type, *args):
+        dataset_size = images.shape[0]
+        new_shape = [dataset_size] + list(shape[1:])
+        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
+        for i in range(dataset_size):
+            transformed_images[i] = self._transform(images[i])
+        return transformed_images
+
+
+class LegacyTensorFlowTransformer(LegacyTransformer):
+    def __init__(self, converting: dict):
+        self._converting = converting
+
+    def __set_channel_swap(self, image):
+        if 'channel_swap' in self._converting:
+            image = image[:, :, self._converting['channel_swap']]
+
+    def __set_mean(self, image):
+        if 'mean' in self._converting:
+            image[:, :, 0] -= self._converting['mean'][0]
+            image[:, :, 1] -= self._converting['mean'][1]
+            image[:, :, 2] -= self._converting['mean'][2]
+
+    def __set_input_scale(self, image):
+        if 'input_scale' in self._converting:
+            image[:, :, 0] /= self._converting['input_scale'][0]
+            image[:, :, 1] /= self._converting['input_scale'][1]
+            image[:, :, 2] /= self._converting['input_scale'][2]
+
+    def _transform(self, image):
+        transformed_image = np.copy(image).astype(np.float64)
+        self.__set_channel_swap(transformed_image)
+        self.__set_mean(transformed_image)
+        self.__set_input_scale(transformed_image)
+        return transformed_image
+
+
+class LegacyTensorFlowLiteTransformer(LegacyTensorFlowTransformer):
+    def __set_channel_swap(self, image, input_name):
+        channel_swap = self._converting[input_name]['channel_swap']
+        if channel_swap is not None:
+            image = image[:, :, :, channel_swap]
+
+    def __set_mean(self, image, input_name):
+        mean = self._converting[input_name]['mean']
+        if mean is not None:
+            image -= mean
+
+    def __set_input_scale(self, image, input_name):
+        input_scale = self._converting[input_name]['input_scale']
+        if input_scale is not None:
+            image /= input_scale
+
+    def __set_layout_order(self, image, input_name):
+        layout = self._converting[input_name]['layout']
+        if layout is not None:
+            layout = LAYER_LAYOUT_TO_IMAGE[layout]
+            image = image.transpose(layout)
+        return image
+
+    def _transform(self, image, input_name):
+        transformed_image = np.copy(image).astype(np.float64)
+        self.__set_channel_swap(transformed_image, input_name)
+        self.__set_mean(transformed_image, input_name)
+        self.__set_input_scale(transformed_image, input_name)
+        transformed_image = self.__set_layout_order(transformed_image, input_name)
+        return transformed_image
+
+    def transform_images(self, images, shape, element_type, input_name):
+        transformed_images = self._transform(images, input_name)
+        return transformed_images.astype(element_type)
+
+
+class LegacyTVMTransformer(LegacyTransformer):
+    def __init__(self, converting):
+        self._converting = converting
+
+    def __set_channel_swap(self, image, input_name):
+        channel_swap = self._converting['channel_swap']
+        if channel_swap is not None:
+            image = image[:, :, :, channel_swap]
+
+    def __set_norm(self, image, input_name):
+        image /= [np.float32(255), np.float32(255), np.float32(255)]
+
+    def __set_mean(self, image, input_name):
+        mean = self._converting['mean']
+        if mean is not None:
+            image -= mean
+
+    def __set_input_scale(self, image, input_name):
+        input_scale = self._converting['std']
+        if input_scale is not None:
+            image /= input_scale
+
+    def __set_layout_order(self, image, input_name):
+        layout = self._converting['layout']
+        if layout is not None:
+            layout = LAYER_LAYOUT_TO_IMAGE[layout]
+            image = image.transpose(layout)
+        return image
+
+    def _transform(self, image, input_name):
+        transformed_image = np.copy(image).astype(np.float64)
+        self.__set_channel_swap(transformed_image, input_name)
+        if self._converting['norm']:
+            self.__set_norm(transformed_image, input_name)
+        self.__set_mean(transformed_image, input_name)
+        self.__set_input_scale(transformed_image, input_name)
+        transformed_image = self.__set_layout_order(transformed_image, input_name)
+        return transformed_image
+
+    def transform_images(self, images, shape, element_type, input_name):
+        transformed_images = self._transform(images, input_name)
+        return transformed_images.astype(element_type)
+
+
+class LegacyNcnnTransformer(LegacyTransformer):
+    def _transform(self, image, shape):
+        return image
+
+    def transform_images(self, images, shape, element_type, *args):
+        dataset_size = images.shape[0]
+        new_shape = [dataset_size, shape[1], shape[2], shape[3]]
+        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
+        for i in range(dataset_size):
+            transformed_images[i] = self._transform(images[i], shape)
+        return transformed_images
+
+
+def get_tflite_converting(channel_swap):
+    return {'data': {'channel_swap': channel_swap, 'mean': MEAN, 'input_scale': INPUT_SCALE, 'layout': 'NCHW'}}
+
+
+def get_tvm_converting(channel_swap):
+    return {'channel_swap': channel_swap, 'mean': [0.485, 0.456, 0.406], 'std': [0.229, 0.224, 0.225],
+            'norm': True, 'layout': 'NCHW'}
+
+
+TRANSFORMERS = {
+    'base': (Transformer, LegacyTransformer, None, [4, 6, 5, 3]),
+    'openvino_nchw': (OpenVINOTransformer, LegacyOpenVINOTransformer, None, [4, 3, 6, 5]),
+    'openvino_nhwc': (OpenVINOTransformer, LegacyOpenVINOTransformer, None, [4, 6, 5, 3]),
+    'ncnn': (NcnnTransformer, LegacyNcnnTransformer, None, [4, 6, 5, 3]),
+    'caffe': (IntelCaffeTransformer, LegacyIntelCaffeTransformer, lambda channel_swap: {}, [4, 3, 6, 5]),
+    'tensorflow': (TensorFlowTransformer, LegacyTensorFlowTransformer,
+                   lambda channel_swap: {'mean': MEAN, 'input_scale': INPUT_SCALE}, [4, 6, 5, 3]),
+    'tensorflow_lite': (TensorFlowLiteTransformer, LegacyTensorFlowLiteTransformer, get_tflite_converting,
+                        [4, 3, 6, 5]),
+    'tvm': (TVMTransformer, LegacyTVMTransformer, get_tvm_converting, [4, 3, 6, 5]),
+}
+
+
+def transform(transformer_class, get_converting, images, shape, channel_swap=None):
+    transformer = transformer_class(get_converting(channel_swap)) if get_converting else transformer_class()
+    return transformer.transform_images(images, shape, np.float32, 'data')
+
+
+def get_images():
+    return np.random.default_rng(0).integers(0, 256, size=(4, 6, 5, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize('name', TRANSFORMERS)
+def test_batched_transform_matches_legacy(name):
+    transformer_class, legacy_class, get_converting, shape = TRANSFORMERS[name]
+    images = get_images()
+
+    expected = transform(legacy_class, get_converting, images, shape)
+    result = transform(transformer_class, get_converting, images, shape)
+    assert result.dtype == np.float32 and result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-4)
+
+
+@pytest.mark.parametrize('name', ['tensorflow_lite', 'tvm'])
+def test_channel_swap_is_applied_to_source_images(name):
+    # the legacy transformers assigned the swapped image to a local variable and fed the source channel order
+    transformer_class, legacy_class, get_converting, shape = TRANSFORMERS[name]
+    images = get_images()
+
+    expected = transform(legacy_class, get_converting, images[..., CHANNEL_SWAP], shape, CHANNEL_SWAP)
+    result = transform(transformer_class, get_converting, images, shape, CHANNEL_SWAP)
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-4)
+
+
+def test_caffe_and_tensorflow_normalize_swapped_channels():
+    images = get_images()
+    expected = (images[..., CHANNEL_SWAP] - np.array(MEAN)) / np.array(INPUT_SCALE)
+    converting = {'channel_swap': CHANNEL_SWAP, 'mean': MEAN, 'input_scale': INPUT_SCALE}
+
+    tensorflow_result = TensorFlowTransformer(converting).transform_images(images, [4, 6, 5, 3], np.float32)
+    caffe_result = IntelCaffeTransformer(converting).transform_images(images, [4, 3, 6, 5], np.float32)
+    np.testing.assert_allclose(tensorflow_result, expected, rtol=1e-5, atol=1e-4)
+    np.testing.assert_allclose(caffe_result, expected.transpose(0, 3, 1, 2), rtol=1e-5, atol=1e-4)
@@ -0,0 +1,59 @@
+import importlib
+import sys
+from pathlib import Path
+from xml.dom import minidom
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+TEST_XML = ('<Tests><Test><FrameworkIndependent><IterationCount>1000</IterationCount><BatchSize>1</BatchSize>'
+            '</FrameworkIndependent><FrameworkDependent><ThreadCount></ThreadCount></FrameworkDependent>'
+            '</Test></Tests>')
+
+
+@pytest.fixture
+def tuner_module(monkeypatch, tmp_path):
+    # tuner and inference_benchmark configure the logger at import time, it creates a log file in the working directory
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module('tuner')
+
+
+def synthetic_run(calls):
+    def run_configuration(configuration, short):
+        calls.append((configuration, short))
+        threads, batch = int(configuration['ThreadCount']), int(configuration['BatchSize'])
+        # latency is the lowest at 4 threads and batch 1, throughput grows with batch
+        latency = (abs(threads - 4) + 1) * batch * 0.01
+        return latency, batch / latency
+
+    return run_configuration
+
+
+def test_tuner_finds_optimal_configurations(tuner_module):
+    calls = []
+    search_space = {'ThreadCount': ['1', '2', '3', '4', '5', '6', '7', '8'], 'BatchSize': ['1', '2', '4']}
+    tuner = tuner_module.ConfigurationTuner(search_space, synthetic_run(calls), coarse_points=3, margin=0.1)
+    latency_optimal, throughput_optimal = tuner.search()
+
+    assert tuner.get_configuration(latency_optimal) == {'ThreadCount': '4', 'BatchSize': '1'}
+    assert tuner.get_configuration(throughput_optimal)['ThreadCount'] == '4'
+    assert len(tuner.short_results) < 8 * 3
+    assert all(configuration_indexes in tuner.short_results for configuration_indexes in tuner.full_results)
+
+
+def test_pareto_frontier_excludes_dominated_configurations(tuner_module):
+    results = {'1': (1.0, 10.0), '2': (2.0, 20.0), '3': (3.0, 15.0), '4': (1.5, 10.0)}
+    tuner = tuner_module.ConfigurationTuner({'ThreadCount': list(results)},
+                                            lambda configuration, short: results[configuration['ThreadCount']],
+                                            margin=10)
+    tuner.evaluate([(index,) for index in range(len(results))])
+    assert [tuner.get_configuration(indexes)['ThreadCount'] for indexes in tuner.get_pareto_frontier()] == ['1', '2']
+
+
+def test_short_run_overrides_iterations(tuner_module):
+    test_element = minidom.parseString(TEST_XML).getElementsByTagName('Test')[0]
+    element = tuner_module.create_test_element(test_element, {'ThreadCount': '4'}, {'IterationCount': 20})
+    assert element.getElementsByTagName('ThreadCount')[0].firstChild.data == '4'
+    assert element.getElementsByTagName('IterationCount')[0].firstChild.data == '20'
+    assert test_element.getElementsByTagName('IterationCount')[0].firstChild.data == '1000'
@@ -0,0 +1,354 @@
+"""
+Configuration tuner searching framework parameters of one test for the lowest latency and the highest throughput.
+
+Search space is a JSON file with XML tag names of the test and lists of their values, ex.
+{"ThreadCount": [1, 2, 4, 8], "StreamCount": [1, 2, 4], "BatchSize": [1, 2, 4]}. Configurations of the coarse grid
+are screened by short runs, promising ones are measured by full runs, then the best configurations are refined
+by hill climbing over neighboring values. Result is a benchmark configuration file with the latency-optimal,
+throughput-optimal and Pareto-optimal tests.
+"""
+import argparse
+import itertools
+import json
+import sys
+from pathlib import Path
+from xml.dom import minidom
+
+from config_processor import TestConfigParser, parse_test
+from executors import Executor
+from inference_benchmark import run_test
+from output import OutputHandler
+
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
+from logger_conf import configure_logger, exception_hook  # noqa: E402
+from constants import Status  # noqa: E402
+
+log = configure_logger()
+
+LATENCY = 'latency'
+THROUGHPUT = 'throughput'
+
+
+def cli_argument_parser():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-c', '--config',
+                        type=str,
+                        dest='config_path',
+                        help='Path to configuration file with the test to tune',
+                        required=True)
+    parser.add_argument('--test_index',
+                        type=int,
+                        help='Number of the test in configuration file starting from 1',
+                        default=1)
+    parser.add_argument('-s', '--search_space',
+                        type=str,
+                        help='Path to JSON file with tag names of the test and lists of their values',
+                        required=True)
+    parser.add_argument('-r', '--result_config',
+                        type=str,
+                        help='Full name of the resulting configuration file with optimal tests',
+                        required=True)
+    parser.add_argument('--result',
+                        type=str,
+                        dest='result_file',
+                        help='Full name of the resulting csv file with results of full runs',
+                        default=None)
+    parser.add_argument('--csv_delimiter',
+                        metavar='CHARACTER',
+                        type=str,
+                        help='Delimiter to use in the resulting file',
+                        default=';')
+    parser.add_argument('--executor_type',
+                        type=str,
+                        choices=['host_machine', 'docker_container'],
+                        help='Environment to execute test: host_machine, docker_container',
+                        default='host_machine')
+    parser.add_argument('-b', '--cpp_benchmarks_dir',
+                        type=str,
+                        help='Path to the folder with pre-built C++ benchmark apps',
+                        default=None)
+    parser.add_argument('--openvino_cpp_benchmark_dir',
+                        type=str,
+                        help='Path to the folder with pre-built OpenVINO C++ Benchmark App',
+                        default=None)
+    parser.add_argument('--resident_worker_jobs',
+                        metavar='N',
+                        type=int,
+                        help='Run python launchers in resident workers, a worker is restarted after N tests',
+                        default=0)
+    parser.add_argument('--coarse_points',
+                        metavar='N',
+                        type=int,
+                        help='Number of values of every parameter in the coarse grid',
+                        default=3)
+    parser.add_argument('--margin',
+                        type=float,
+                        help='Relative margin to the best short run result, configurations outside it '
+                             'are not measured by full runs',
+                        default=0.1)
+    parser.add_argument('--short_iterations',
+                        metavar='N',
+                        type=int,
+                        help='Number of iterations of short screening runs',
+                        default=20)
+    parser.add_argument('--short_time_limit',
+                        metavar='SECONDS',
+                        type=int,
+                        help='Time limit of short screening runs',
+                        default=5)
+
+    args = parser.parse_args()
+
+    if not Path(args.config_path).is_file():
+        raise ValueError('Wrong path to configuration file!')
+    if not Path(args.search_space).is_file():
+        raise ValueError('Wrong path to search space file!')
+    if args.coarse_points < 1:
+        raise ValueError('Number of coarse grid points must be greater than zero!')
+    if args.margin < 0:
+        raise ValueError('Margin must not be negative!')
+
+    return args
+
+
+def read_search_space(path):
+    with open(path) as search_space_file:
+        search_space = json.load(search_space_file)
+    if not isinstance(search_space, dict) or not search_space:
+        raise ValueError('Search space must be a non-empty JSON object')
+    for tag, values in search_space.items():
+        if not isinstance(values, list) or not values:
+            raise ValueError(f'Values of {tag} must be a non-empty list')
+    return {tag: [str(value) for value in values] for tag, values in search_space.items()}
+
+
+def dominates(first, second):
+    """Result (latency, fps) is not worse than the other one in both metrics and better in one of them"""
+    return first[0] <= second[0] and first[1] >= second[1] and first != second
+
+
+class ConfigurationTuner:
+    """
+    Adaptive search over the search space. Configurations are addressed by tuples of value indexes,
+    so the neighbors of configuration are the adjacent values of its parameters.
+    """
+
+    def __init__(self, search_space, run_configuration, coarse_points=3, margin=0.1):
+        """ConfigurationTuner constructor
+
+        :param search_space: Dict with parameter name and list of its values, values are ordered
+        :param run_configuration: Function of configuration dict and short run flag returning
+                                  (latency, fps) or None if the run failed
+        :param coarse_points: Number of values of every parameter in the coarse grid
+        :param margin: Relative margin to the best short run result for the full run
+        """
+        self.parameters = list(search_space)
+        self.values = [search_space[parameter] for parameter in self.parameters]
+        self._run_configuration = run_configuration
+        self._coarse_points = coarse_points
+        self._margin = margin
+        self.short_results = {}
+        self.full_results = {}
+
+    def get_configuration(self, indexes):
+        return {parameter: values[index] for parameter, values, index in zip(self.parameters, self.values, indexes)}
+
+    def get_coarse_grid(self):
+        axes = []
+        for values in self.values:
+            points = min(self._coarse_points, len(values))
+            if points == 1:
+                axes.append([(len(values) - 1) // 2])
+            else:
+                axes.append(sorted({round(i * (len(values) - 1) / (points - 1)) for i in range(points)}))
+        return list(itertools.product(*axes))
+
+    def _is_promising(self, result):
+        # short runs are noisy, so everything close to the best screened result is measured by the full run
+        screened = [value for value in self.short_results.values() if value is not None]
+        best_latency = min(latency for latency, _ in screened)
+        best_fps = max(fps for _, fps in screened)
+        return result[0] <= best_latency * (1 + self._margin) or result[1] >= best_fps * (1 - self._margin)
+
+    def evaluate(self, indexes_list):
+        """Screen configurations by short runs and measure promising ones by full runs"""
+        indexes_list = [indexes for indexes in indexes_list if indexes not in self.short_results]
+        for indexes in indexes_list:
+            log.info(f'Short run of configuration {self.get_configuration(indexes)}')
+            self.short_results[indexes] = self._run_configuration(self.get_configuration(indexes), True)
+        for indexes in indexes_list:
+            result = self.short_results[indexes]
+            if result is None or indexes in self.full_results or not self._is_promising(result):
+                continue
+            log.info(f'Full run of configuration {self.get_configuration(indexes)}')
+            self.full_results[indexes] = self._run_configuration(self.get_configuration(indexes), False)
+
+    def get_best(self, objective):
+        results = [(indexes, result) for indexes, result in self.full_results.items() if result is not None]
+        if not results:
+            return None
+        if objective == LATENCY:
+            return min(results, key=lambda item: item[1][0])[0]
+        return max(results, key=lambda item: item[1][1])[0]
+
+    def get_neighbors(self, indexes):
+        neighbors = []
+        for dimension, values in enumerate(self.values):
+            for step in (-1, 1):
+                index = indexes[dimension] + step
+                if 0 <= index < len(values):
+                    neighbors.append(indexes[:dimension] + (index,) + indexes[dimension + 1:])
+        return neighbors
+
+    def refine(self, objective):
+        """Move to the best neighbor while it improves the objective"""
+        best = self.get_best(objective)
+        while best is not None:
+            self.evaluate(self.get_neighbors(best))
+            new_best = self.get_best(objective)
+            if new_best == best:
+                break
+            best = new_best
+        return best
+
+    def search(self):
+        """
+        :return: indexes of the latency-optimal and throughput-optimal configurations, None if all runs failed
+        """
+        self.evaluate(self.get_coarse_grid())
+        return self.refine(LATENCY), self.refine(THROUGHPUT)
+
+    def get_pareto_frontier(self):
+        """
+        :return: list of indexes of configurations not dominated by others, sorted by latency
+        """
+        results = {indexes: result for indexes, result in self.full_results.items() if result is not None}
+        frontier = [indexes for indexes, result in results.items()
+                    if not any(dominates(other, result) for other in results.values())]
+        return sorted(frontier, key=lambda indexes: results[indexes])
+
+
+def set_tag_value(test_element, tag, value):
+    elements = test_element.getElementsByTagName(tag)
+    if not elements:
+        raise ValueError(f'Tag {tag} not found in the test')
+    element = elements[0]
+    while element.firstChild:
+        element.removeChild(element.firstChild)
+    element.appendChild(element.ownerDocument.createTextNode(str(value)))
+
+
+def create_test_element(test_element, configuration, short_parameters=None):
+    """
+    Copy of the Test element with tag values of configuration, short_parameters override
+    tag values of the short run
+    """
+    element = test_element.cloneNode(deep=True)
+    for tag, value in {**configuration, **(short_parameters or {})}.items():
+        set_tag_value(element, tag, value)
+    return element
+
+
+def get_configuration_runner(test_element, process_executor, output_handler, short_parameters,
+                             cpp_benchmarks_dir=None, openvino_cpp_benchmark_dir=None):
+    test_parser = TestConfigParser(log)
+
+    def run_configuration(configuration, short):
+        element = create_test_element(test_element, configuration, short_parameters if short else None)
+        try:
+            test = parse_test(test_parser, element)
+        except ValueError as ex:
+            log.warning(f'Configuration {configuration} is skipped: {ex}')
+            return None
+        status, process = run_test(test, process_executor, log, cpp_benchmarks_dir, openvino_cpp_benchmark_dir)
+        if not short and output_handler is not None:
+            output_handler.add_row_to_table(process_executor, test, process)
+        if status != Status.EXIT_SUCCESS or process is None:
+            return None
+        metrics = process.get_performance_metrics()
+        latency = metrics.get('latency') or metrics.get('average_time')
+        fps = metrics.get('fps')
+        if not latency or not fps:
+            return None
+        return float(latency), float(fps)
+
+    return run_configuration
+
+
+def write_result_config(config_path, result_path, tests):
+    """
+    Write configuration file with tests instead of the tests of the original file
+
+    :param tests: List of Test elements and lists of comment lines preceding them
+    """
+    document = minidom.parse(config_path)
+    root = document.documentElement
+    for test_element in root.getElementsByTagName('Test'):
+        root.removeChild(test_element)
+    for test_element, comments in tests:
+        for comment in comments:
+            root.appendChild(document.createComment(f' {comment} '))
+        root.appendChild(test_element)
+    Path(result_path).write_bytes(document.toxml(encoding='utf-8'))
+
+
+def get_result_tests(tuner, test_element, latency_optimal, throughput_optimal):
+    tests = []
+    frontier = tuner.get_pareto_frontier()
+    for indexes in dict.fromkeys([latency_optimal, throughput_optimal, *frontier]):
+        roles = [role for role, optimal in [('Latency-optimal', latency_optimal),
+                                            ('Throughput-optimal', throughput_optimal)] if optimal == indexes]
+        roles.append('Pareto-optimal' if indexes in frontier else 'Dominated')
+        latency, fps = tuner.full_results[indexes]
+        comments = [f'{", ".join(roles)}: latency {latency:.6f} s, FPS {fps:.3f}']
+        tests.append((create_test_element(test_element, tuner.get_configuration(indexes)), comments))
+    return tests
+
+
+def main():
+    args = cli_argument_parser()
+    search_space = read_search_space(args.search_space)
+
+    test_elements = TestConfigParser(log).get_tests_list(args.config_path)
+    if not 1 <= args.test_index <= len(test_elements):
+        raise ValueError(f'Test {args.test_index} not found in configuration file')
+    test_element = test_elements[args.test_index - 1]
+    for tag in search_space:
+        if not test_element.getElementsByTagName(tag):
+            raise ValueError(f'Tag {tag} not found in test {args.test_index}')
+
+    process_executor = Executor.get_executor(args.executor_type, log)
+    process_executor.set_resident_worker_jobs(args.resident_worker_jobs)
+    output_handler = None
+    if args.result_file:
+        output_handler = OutputHandler(args.result_file, args.csv_delimiter)
+        output_handler.create_table()
+
+    short_parameters = {'IterationCount': args.short_iterations, 'TestTimeLimit': args.short_time_limit}
+    run_configuration = get_configuration_runner(test_element, process_executor, output_handler, short_parameters,
+                                                 args.cpp_benchmarks_dir, args.openvino_cpp_benchmark_dir)
+    tuner = ConfigurationTuner(search_space, run_configuration, args.coarse_points, args.margin)
+    try:
+        latency_optimal, throughput_optimal = tuner.search()
+    finally:
+        process_executor.stop_resident_workers()
+        if output_handler is not None:
+            output_handler.close()
+
+    if latency_optimal is None:
+        log.error('All configurations failed')
+        return Status.INFERENCE_FAILURE.value
+
+    log.info(f'Latency-optimal configuration: {tuner.get_configuration(latency_optimal)}')
+    log.info(f'Throughput-optimal configuration: {tuner.get_configuration(throughput_optimal)}')
+    log.info(f'{len(tuner.short_results)} configurations screened, {len(tuner.full_results)} measured')
+    write_result_config(args.config_path, args.result_config,
+                        get_result_tests(tuner, test_element, latency_optimal, throughput_optimal))
+    log.info(f'Optimal tests are saved to {args.result_config}')
+    return Status.EXIT_SUCCESS.value
+
+
+if __name__ == '__main__':
+    sys.excepthook = exception_hook
+    sys.exit(main() or 0)
@@ -0,0 +1,300 @@
+import argparse
+import html
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
+from csv_wrapper import CsvReport  # noqa: E402
+
+# tests of two runs are joined on these columns of the benchmark tables, device is a part of parameters
+KEY_COLUMNS = ('Topology name', 'Inference Framework', 'Precision', 'Batch size', 'Mode', 'Parameters')
+RAW_TIMINGS_COLUMN = 'Raw timings'
+# latency of tests without raw timings, the first reported column is used
+SUMMARY_COLUMNS = ('Latency', 'Average time of single pass (s)')
+STATUS_COLUMN = 'Status'
+
+REGRESSION = 'Regression'
+IMPROVEMENT = 'Improvement'
+NO_CHANGE = 'No change'
+FAILED = 'Failed'
+ADDED = 'Added'
+REMOVED = 'Removed'
+
+OUTPUT_COLUMNS = ('Verdict', *KEY_COLUMNS, 'Baseline latency (s)', 'Candidate latency (s)', 'Change (%)',
+                  'Change CI low (%)', 'Change CI high (%)', 'p-value', "Cliff's delta", 'Baseline samples',
+                  'Candidate samples')
+
+
+def cli_argument_parser():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-b', '--baseline',
+                        type=str,
+                        help='Paths to the baseline inference tables in csv format.',
+                        nargs='+',
+                        required=True)
+    parser.add_argument('-c', '--candidate',
+                        type=str,
+                        help='Paths to the candidate inference tables in csv format.',
+                        nargs='+',
+                        required=True)
+    parser.add_argument('-r', '--result_table',
+                        type=str,
+                        help='Full name of the resulting csv file.',
+                        required=True)
+    parser.add_argument('--html',
+                        type=str,
+                        help='Full name of the resulting html file.',
+                        default=None)
+    parser.add_argument('--baseline_timings_dir',
+                        type=str,
+                        help='Directory with raw timings (.npy) of the baseline tests, files are found by name. '
+                             'Paths from the tables are used by default.',
+                        default=None)
+    parser.add_argument('--candidate_timings_dir',
+                        type=str,
+                        help='Directory with raw timings (.npy) of the candidate tests.',
+                        default=None)
+    parser.add_argument('-t', '--threshold',
+                        type=float,
+                        help='Minimal change of the median latency in percents reported as regression '
+                             'or improvement. Regressions above the threshold make exit code non-zero.',
+                        default=5.0)
+    parser.add_argument('--alpha',
+                        type=float,
+                        help='Significance level of the Mann-Whitney U test.',
+                        default=0.05)
+    parser.add_argument('--bootstrap_iterations',
+                        type=int,
+                        help='Number of bootstrap resamples for the confidence interval of the change.',
+                        default=1000)
+    parser.add_argument('--confidence',
+                        type=float,
+                        help='Confidence level of the change interval.',
+                        default=0.95)
+    parser.add_argument('--seed',
+                        type=int,
+                        help='Seed of the bootstrap random generator.',
+                        default=0)
+
+    args = parser.parse_args()
+    if args.threshold < 0:
+        raise ValueError('Threshold must not be negative!')
+    if not 0 < args.alpha < 1 or not 0 < args.confidence < 1:
+        raise ValueError('Significance and confidence levels must be between 0 and 1!')
+
+    return args
+
+
+def get_float(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 and math.isfinite(value) else None
+
+
+def load_raw_timings(value, table_path, timings_dir):
+    if not value:
+        return None
+    path = Path(value)
+    if timings_dir is not None:
+        path = Path(timings_dir) / path.name
+    elif not path.is_absolute():
+        path = Path(table_path).parent / path
+    if not path.is_file():
+        return None
+    timings = np.load(path).astype(np.float64).ravel()
+    timings = timings[np.isfinite(timings)]
+    return timings if timings.size else None
+
+
+def read_result_set(tables, timings_dir=None):
+    """
+    Read tests of one run, rows with the same key columns (repeated tests) are merged
+    :return: dict with key columns values and dict of test samples, summary latencies and failure flag
+    """
+    tests = {}
+    for table in tables:
+        if not Path(table).is_file():
+            raise ValueError(f'Wrong path to the table {table}!')
+        for row in CsvReport(table).read():
+            key = tuple(row.get(column, '') for column in KEY_COLUMNS)
+            test = tests.setdefault(key, {'samples': [], 'summary': [], 'failed': False})
+            if row.get(STATUS_COLUMN) != 'Success':
+                test['failed'] = True
+                continue
+            samples = load_raw_timings(row.get(RAW_TIMINGS_COLUMN), table, timings_dir)
+            if samples is not None:
+                test['samples'].append(samples)
+            summary = next((get_float(row.get(column)) for column in SUMMARY_COLUMNS
+                            if get_float(row.get(column)) is not None), None)
+            if summary is not None:
+                test['summary'].append(summary)
+    for test in tests.values():
+        test['samples'] = np.concatenate(test['samples']) if test['samples'] else None
+        test['failed'] = test['failed'] and test['samples'] is None and not test['summary']
+    return tests
+
+
+def get_ranks(values):
+    """Ranks starting from 1, tied values get the average rank"""
+    order = np.argsort(values, kind='mergesort')
+    _, first_indexes, counts = np.unique(values[order], return_index=True, return_counts=True)
+    ranks = np.empty(len(values))
+    ranks[order] = np.repeat(first_indexes + (counts + 1) / 2, counts)
+    return ranks
+
+
+def mann_whitney_u(baseline, candidate):
+    """
+    Two-sided Mann-Whitney U test with the normal approximation, tie and continuity corrections
+    :return: Cliff's delta (positive if candidate times are greater) and p-value
+    """
+    n1, n2 = len(baseline), len(candidate)
+    values = np.concatenate([baseline, candidate])
+    u_statistic = get_ranks(values)[n1:].sum() - n2 * (n2 + 1) / 2
+    cliffs_delta = 2 * u_statistic / (n1 * n2) - 1
+
+    n = n1 + n2
+    _, counts = np.unique(values, return_counts=True)
+    tie_correction = (counts ** 3 - counts).sum() / (n * (n - 1)) if n > 1 else 0
+    variance = n1 * n2 / 12 * (n + 1 - tie_correction)
+    if variance <= 0:
+        return cliffs_delta, 1.0
+    z = max(abs(u_statistic - n1 * n2 / 2) - 0.5, 0) / math.sqrt(variance)
+    return cliffs_delta, min(math.erfc(z / math.sqrt(2)), 1.0)
+
+
+def bootstrap_change(baseline, candidate, iterations, confidence, rng):
+    """Percentile bootstrap interval of the relative change of the median"""
+    changes = np.empty(iterations)
+    for i in range(iterations):
+        baseline_median = np.median(rng.choice(baseline, len(baseline)))
+        candidate_median = np.median(rng.choice(candidate, len(candidate)))
+        changes[i] = candidate_median / baseline_median - 1
+    tail = (1 - confidence) / 2
+    return np.quantile(changes, tail), np.quantile(changes, 1 - tail)
+
+
+def get_verdict(change, threshold, significant):
+    if significant and change > threshold:
+        return REGRESSION
+    if significant and change < -threshold:
+        return IMPROVEMENT
+    return NO_CHANGE
+
+
+def compare_tests(baseline, candidate, args, rng):
+    result = dict.fromkeys(OUTPUT_COLUMNS[len(KEY_COLUMNS) + 1:], 'N/A')
+    if baseline['failed'] or candidate['failed']:
+        result['Verdict'] = FAILED
+        return result
+
+    threshold = args.threshold / 100
+    if baseline['samples'] is not None and candidate['samples'] is not None:
+        baseline_samples, candidate_samples = baseline['samples'], candidate['samples']
+        baseline_latency, candidate_latency = np.median(baseline_samples), np.median(candidate_samples)
+        change = candidate_latency / baseline_latency - 1
+        cliffs_delta, p_value = mann_whitney_u(baseline_samples, candidate_samples)
+        ci_low, ci_high = bootstrap_change(baseline_samples, candidate_samples, args.bootstrap_iterations,
+                                           args.confidence, rng)
+        result.update({
+            'Change CI low (%)': round(ci_low * 100, 3),
+            'Change CI high (%)': round(ci_high * 100, 3),
+            'p-value': round(p_value, 6),
+            "Cliff's delta": round(cliffs_delta, 3),
+            'Baseline samples': len(baseline_samples),
+            'Candidate samples': len(candidate_samples),
+        })
+        result['Verdict'] = get_verdict(change, threshold, p_value < args.alpha)
+    elif baseline['summary'] and candidate['summary']:
+        # significance is unknown without raw timings, the change is compared with the threshold only
+        baseline_latency, candidate_latency = np.median(baseline['summary']), np.median(candidate['summary'])
+        change = candidate_latency / baseline_latency - 1
+        result['Verdict'] = get_verdict(change, threshold, True)
+    else:
+        result['Verdict'] = NO_CHANGE
+        return result
+
+    result.update({
+        'Baseline latency (s)': round(float(baseline_latency), 6),
+        'Candidate latency (s)': round(float(candidate_latency), 6),
+        'Change (%)': round(float(change) * 100, 3),
+    })
+    return result
+
+
+def compare_result_sets(baseline_tests, candidate_tests, args):
+    """
+    :return: rows of the report ranked by the change, from the largest regression to the largest improvement,
+             tests without change follow
+    """
+    rng = np.random.default_rng(args.seed)
+    rows = []
+    for key in list(baseline_tests) + [key for key in candidate_tests if key not in baseline_tests]:
+        if key not in candidate_tests:
+            row = dict.fromkeys(OUTPUT_COLUMNS, 'N/A')
+            row['Verdict'] = REMOVED
+        elif key not in baseline_tests:
+            row = dict.fromkeys(OUTPUT_COLUMNS, 'N/A')
+            row['Verdict'] = ADDED
+        else:
+            row = compare_tests(baseline_tests[key], candidate_tests[key], args, rng)
+        row.update(zip(KEY_COLUMNS, key))
+        rows.append(row)
+
+    def rank(row):
+        change = row['Change (%)']
+        return (change == 'N/A', -change if change != 'N/A' else 0)
+
+    return sorted(rows, key=rank)
+
+
+def write_csv_report(rows, path):
+    report = CsvReport(path, OUTPUT_COLUMNS)
+    report.write_headers()
+    for row in rows:
+        report.append_row({column: row[column] for column in OUTPUT_COLUMNS})
+
+
+def write_html_report(rows, path):
+    path_to_styles = Path(__file__).resolve().parents[1].joinpath('csv2html', 'styles.html')
+    table_html = [path_to_styles.read_text()]
+    table_html.append('\n<table align="center" border="1" cellspacing="0" cellpadding="4" class="main">\n<tr>')
+    table_html.extend(f'<th>{html.escape(column)}</th>' for column in OUTPUT_COLUMNS)
+    table_html.append('</tr>\n')
+    colors = {REGRESSION: '#F08080', IMPROVEMENT: '#90EE90', FAILED: '#FFFF00'}
+    for row in rows:
+        color = colors.get(row['Verdict'])
+        table_html.append(f'<tr bgcolor="{color}">' if color else '<tr>')
+        table_html.extend(f'<td align="left">{html.escape(str(row[column]))}</td>' for column in OUTPUT_COLUMNS)
+        table_html.append('</tr>\n')
+    table_html.append('</table>\n')
+    Path(path).write_text(''.join(table_html))
+
+
+def main():
+    args = cli_argument_parser()
+
+    baseline_tests = read_result_set(args.baseline, args.baseline_timings_dir)
+    candidate_tests = read_result_set(args.candidate, args.candidate_timings_dir)
+    rows = compare_result_sets(baseline_tests, candidate_tests, args)
+
+    write_csv_report(rows, args.result_table)
+    if args.html:
+        write_html_report(rows, args.html)
+
+    regressions = [row for row in rows if row['Verdict'] == REGRESSION]
+    improvements = [row for row in rows if row['Verdict'] == IMPROVEMENT]
+    print(f'{len(rows)} tests compared: {len(regressions)} regressions, {len(improvements)} improvements')
+    for row in regressions:
+        print(f'Regression {row["Change (%)"]}%: {", ".join(row[column] for column in KEY_COLUMNS)}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main() or 0)
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from table_creator import HTMLTable
 
 
@@ -13,11 +15,28 @@ MODE_POSITION_IN_TABLE = 9
 PARAMS_POSITION_IN_TABLE = 10
 INFR_POSITION_IN_TABLE = 11
 FPS_POSITION_IN_TABLE = 14
+COLD_START_COLUMN = 'Cold start (s)'
 
 
 class HTMLBenchmarkTable(HTMLTable):
     def __init__(self, _table_csv, _file):
         super().__init__(_table_csv, _file)
+        # columns added after FPS in newer tables shift its position
+        header = self._table_csv[0] if self._table_csv else []
+        self._fps_position = header.index('FPS') if 'FPS' in header else FPS_POSITION_IN_TABLE
+        # cold start is shown under FPS if the table contains it
+        self._cold_start_position = header.index(COLD_START_COLUMN) if COLD_START_COLUMN in header else None
+        self.__index_tests()
+
+    def __index_tests(self):
+        # tests are looked up for every cell of the resulting table, lookups by key replace scans of all rows
+        self._tests_index = defaultdict(list)
+        self._infr_params = defaultdict(set)
+        for row in self._table_csv[1:]:
+            key = (row[MODEL_POSITION_IN_TABLE], row[INFR_POSITION_IN_TABLE], row[BATCH_POSITION_IN_TABLE],
+                   row[WEIGHT_POSITION_IN_TABLE], row[MODE_POSITION_IN_TABLE], row[INFERENCE_POSITION_IN_TABLE])
+            self._tests_index[key].append(row)
+            self._infr_params[row[INFR_POSITION_IN_TABLE]].add(row[PARAMS_POSITION_IN_TABLE])
 
     @staticmethod
     def get_supported_mode(plugin):
@@ -57,11 +76,7 @@ class HTMLBenchmarkTable(HTMLTable):
                 sorted(models_dict[model]['batch'], key=lambda val: int(val))
 
     def __find_plugin_in_infr(self, plugin, target_infr):
-        for row_index in range(1, len(self._table_csv)):
-            if plugin in self._table_csv[row_index][PARAMS_POSITION_IN_TABLE] and \
-                    target_infr == self._table_csv[row_index][INFR_POSITION_IN_TABLE]:
-                return True
-        return False
+        return any(plugin in params for params in self._infr_params[target_infr])
 
     def _get_column_dict(self):
         infr_dict = {}
@@ -83,20 +98,25 @@ class HTMLBenchmarkTable(HTMLTable):
         return infr_dict
 
     def __find_test_in_table(self, curr_infr, plugin, model_name, framework, batch, weight, mode):
-        for row_index in range(1, len(self._table_csv)):
-            if (self._table_csv[row_index][MODEL_POSITION_IN_TABLE] == model_name
-                    and self._table_csv[row_index][INFR_POSITION_IN_TABLE] == curr_infr
-                    and plugin in self._table_csv[row_index][PARAMS_POSITION_IN_TABLE]
-                    and self._table_csv[row_index][BATCH_POSITION_IN_TABLE] == batch
-                    and self._table_csv[row_index][WEIGHT_POSITION_IN_TABLE] == weight
-                    and self._table_csv[row_index][MODE_POSITION_IN_TABLE] == mode
-                    and self._table_csv[row_index][INFERENCE_POSITION_IN_TABLE] == framework):
-                if self._table_csv[row_index][STATUS_POSITION_IN_TABLE] == 'Failed':
+        for row in self._tests_index.get((model_name, curr_infr, batch, weight, mode, framework), []):
+            if plugin in row[PARAMS_POSITION_IN_TABLE]:
+                if row[STATUS_POSITION_IN_TABLE] == 'Failed':
                     return '-'
                 else:
-                    return self._table_csv[row_index][FPS_POSITION_IN_TABLE]
+                    return self.__get_test_result(row)
         return 'N/A'
 
+    def __get_test_result(self, row):
+        fps = row[self._fps_position]
+        if self._cold_start_position is None:
+            return fps
+        cold_start = row[self._cold_start_position]
+        try:
+            float(cold_start)
+        except ValueError:
+            return fps
+        return f'{fps}<br><span class="cold_start">cold start {cold_start} s</span>'
+
     def _added_all_test(self, models_dict):
         for infr in self._column_dict:
             for framework in self._column_dict[infr]:
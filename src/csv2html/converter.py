@@ -5,15 +5,21 @@ from pathlib import Path
 from accuracy_checker_table_creator import HTMLAccuracyCheckerTable
 from benchmark_table_creator import HTMLBenchmarkTable
 
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
+from result_store import ResultStore  # noqa: E402
+
 
 def cli_argument_parser():
     parser = argparse.ArgumentParser()
 
-    parser.add_argument('-t', '--tables',
+    tables = parser.add_mutually_exclusive_group(required=True)
+    tables.add_argument('-t', '--tables',
                         type=str,
                         help='Paths to the inference tables in csv format.',
-                        nargs='+',
-                        required=True)
+                        nargs='+')
+    tables.add_argument('-s', '--result_store',
+                        type=str,
+                        help='Path to the SQLite result store to read the inference results from.')
     parser.add_argument('-r', '--result_table',
                         type=str,
                         help='Full name of the resulting file',
@@ -45,6 +51,17 @@ def open_csv_table(path_table_csv):
     return table_csv
 
 
+def read_result_store(path_result_store, table_kind):
+    if not Path(path_result_store).is_file():
+        raise ValueError('Wrong path the result store!')
+    store = ResultStore(path_result_store)
+    try:
+        columns, rows = store.read_table(table_kind)
+    finally:
+        store.close()
+    return [columns, *rows]
+
+
 def split_table(table_csv):
     for row_index in range(len(table_csv)):
         table_csv[row_index] = [field.strip('"') for field in table_csv[row_index].split(';')]
@@ -70,8 +87,11 @@ def convert_csv_table_to_html(table_csv, table_type):
 def main():
     args = cli_argument_parser()
 
-    table_csv = open_csv_table(args.tables)
-    split_table(table_csv)
+    if args.result_store:
+        table_csv = read_result_store(args.result_store, args.table_kind)
+    else:
+        table_csv = open_csv_table(args.tables)
+        split_table(table_csv)
     table_html = convert_csv_table_to_html(table_csv, args.table_kind)
     if table_html is None:
         return 1
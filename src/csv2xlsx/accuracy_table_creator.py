@@ -3,17 +3,16 @@ from collections import defaultdict
 
 from table_creator import XlsxTable
 
-import pandas
 import xlsxwriter
 from iteration_utilities import deepflatten
 
 
 class XlsxAccuracyTable(XlsxTable):
-    def __init__(self, paths_table_csv, path_table_xlsx):
+    def __init__(self, paths_table_csv, path_table_xlsx, result_store=None):
         logging.info('START: __init__(). Input: {0}, {1}'.format(
             paths_table_csv, path_table_xlsx))
 
-        super().__init__(paths_table_csv, path_table_xlsx, 'Accuracy')
+        super().__init__(paths_table_csv, path_table_xlsx, 'Accuracy', result_store)
 
         logging.info('FINISH: __init__()')
 
@@ -71,11 +70,7 @@ class XlsxAccuracyTable(XlsxTable):
     def read_csv_table(self):
         logging.info('START: read_csv_table()')
 
-        self._data = pandas.DataFrame()
-        for path_table_csv in self._paths_table_csv:
-            new_table = pandas.read_csv(path_table_csv, sep=';',
-                                        encoding='latin-1')  # for title
-            self._data = pandas.concat([self._data, new_table])
+        self._data = self._read_tables('accuracy_checker')
         self._data.reset_index(drop=True, inplace=True)
         self._data_dictionary = self._data.to_dict()  # for table rows
         self._init_table_keys()
@@ -256,21 +251,6 @@ class XlsxAccuracyTable(XlsxTable):
 
         logging.info('FINISH: create_table_header()')
 
-    def _find_row_records(self, task_type, topology_name, train_framework,
-                          dataset, accuracy_type, experiments,
-                          processed_records_keys):
-        records_group = []
-        for key, value in experiments.items():
-            if (key not in processed_records_keys
-                    and value[self._KEY_TASK_TYPE] == task_type
-                    and value[self._KEY_TOPOLOGY_NAME] == topology_name
-                    and value[self._KEY_TRAIN_FRAMEWORK] == train_framework
-                    and value[self._KEY_DATASET] == dataset
-                    and value[self._KEY_ACCURACY_TYPE] == accuracy_type):
-                records_group.append(value)
-                processed_records_keys.append(key)
-        return records_group
-
     def _create_row_record(self, records_group):
         return self._create_row_record_by_key(records_group, self._KEY_ACCURACY)
 
@@ -290,20 +270,12 @@ class XlsxAccuracyTable(XlsxTable):
         # transpose 2d dictionary
         experiments = self._data.to_dict('index')
 
-        processed_records_keys = []
         self._table_records = defaultdict(list)
-        for key, value in experiments.items():
-            if key in processed_records_keys:
-                continue
-            records_group = self._find_row_records(value[self._KEY_TASK_TYPE],
-                                                   value[self._KEY_TOPOLOGY_NAME],
-                                                   value[self._KEY_TRAIN_FRAMEWORK],
-                                                   value[self._KEY_DATASET],
-                                                   value[self._KEY_ACCURACY_TYPE],
-                                                   experiments,
-                                                   processed_records_keys)
-            if (len(records_group) == 0):
-                continue
+        records_groups = self._group_records(experiments, (self._KEY_TASK_TYPE, self._KEY_TOPOLOGY_NAME,
+                                                           self._KEY_TRAIN_FRAMEWORK, self._KEY_DATASET,
+                                                           self._KEY_ACCURACY_TYPE))
+        for records_group in records_groups.values():
+            value = records_group[0]
             accuracy_record = self._create_row_record(records_group)
             record = {self._KEY_TASK_TYPE: value[self._KEY_TASK_TYPE],
                       self._KEY_TOPOLOGY_NAME: value[self._KEY_TOPOLOGY_NAME],
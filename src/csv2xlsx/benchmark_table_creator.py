@@ -8,13 +8,16 @@ import pandas
 import xlsxwriter
 from iteration_utilities import deepflatten
 
+COLD_START_COLUMN = 'Cold start (s)'
+COLD_START_SHEET = 'Cold start'
+
 
 class XlsxBenchmarkTable(XlsxTable):
-    def __init__(self, paths_table_csv, path_table_xlsx):
+    def __init__(self, paths_table_csv, path_table_xlsx, result_store=None):
         logging.info('START: __init__(). Input: {0}, {1}'.format(
             paths_table_csv, path_table_xlsx))
 
-        super().__init__(paths_table_csv, path_table_xlsx, 'Performance')
+        super().__init__(paths_table_csv, path_table_xlsx, 'Performance', result_store)
 
         logging.info('FINISH: __init__()')
 
@@ -22,7 +25,9 @@ class XlsxBenchmarkTable(XlsxTable):
         logging.info('START: _init_xlsx_parameters()')
 
         self._book = xlsxwriter.Workbook(self._path_table_xlsx)
-        self._sheet = self._book.add_worksheet(self._sheet_name)
+        # sheets share the layout, every sheet shows one metric of tests
+        self._sheets = {self._book.add_worksheet(name): key for name, key in self._sheet_metrics.items()}
+        self._sheet = next(iter(self._sheets))
 
         # For the title
         self._cell_format = self._book.add_format(
@@ -66,20 +71,20 @@ class XlsxBenchmarkTable(XlsxTable):
         self._KEY_EXECUTION_MODE = keys[9]
         self._KEY_PARAMETERS = keys[10]
         self._KEY_INFRASTRUCTURE = keys[11]
-        self._KEY_AVGTIME = keys[12]
-        self._KEY_LATENCY = keys[13]
-        self._KEY_FPS = keys[14]
+        # metrics are found by name, columns added to newer tables shift their positions
+        self._KEY_AVGTIME = next((key for key in keys if key.startswith('Average time')), keys[12])
+        self._KEY_LATENCY = 'Latency' if 'Latency' in keys else keys[13]
+        self._KEY_FPS = 'FPS' if 'FPS' in keys else keys[14]
+        self._sheet_metrics = {self._sheet_name: self._KEY_FPS}
+        if COLD_START_COLUMN in keys:
+            self._sheet_metrics[COLD_START_SHEET] = COLD_START_COLUMN
 
         logging.info(f'FINISH: _init_table_keys(). {keys}')
 
     def read_csv_table(self):
         logging.info('START: read_csv_table()')
 
-        self._data = pandas.DataFrame()
-        for path_table_csv in self._paths_table_csv:
-            new_table = pandas.read_csv(path_table_csv, sep=';',
-                                        encoding='latin-1')  # for title
-            self._data = pandas.concat([self._data, new_table])
+        self._data = self._read_tables('benchmark')
         self._data.reset_index(drop=True, inplace=True)
         self._data_dictionary = self._data.to_dict()  # for table rows
         self._init_table_keys()
@@ -363,6 +368,21 @@ class XlsxBenchmarkTable(XlsxTable):
 
         self._init_xlsx_parameters()
 
+        self._add_new_line(self._data_dictionary[self._KEY_BLOB_SIZE])
+        self._get_infrastructure()
+        self._get_inference_frameworks()
+        self._get_devices()
+        self._get_precisions()
+        self._get_execution_modes()
+        self._get_execution_parameters()
+
+        for sheet in self._sheets:
+            self._sheet = sheet
+            self._write_sheet_header()
+
+        logging.info('FINISH: create_table_header()')
+
+    def _write_sheet_header(self):
         # Freeze title panes
         self._sheet.freeze_panes(6, 5)
 
@@ -379,25 +399,15 @@ class XlsxBenchmarkTable(XlsxTable):
         self._sheet.set_column(2, 2, col_width)
         self._sheet.merge_range('C1:C6', self._KEY_TRAIN_FRAMEWORK, self._cell_format_title1)
 
-        self._add_new_line(self._data_dictionary[self._KEY_BLOB_SIZE])
         col_width = XlsxTable._get_column_width(
             self._data_dictionary[self._KEY_BLOB_SIZE], self._cell_format)
         self._sheet.set_column(3, 3, col_width)
         self._sheet.merge_range('D1:D6', self._KEY_BLOB_SIZE, self._cell_format_title1)
         self._sheet.merge_range('E1:E6', self._KEY_BATCH_SIZE, self._cell_format_title1)
 
-        self._get_infrastructure()
-        self._get_inference_frameworks()
-        self._get_devices()
-        self._get_precisions()
-        self._get_execution_modes()
-        self._get_execution_parameters()
-
         # Write horizontal title (cells corresponding infrastructure)
         self._fill_horizontal_title()
 
-        logging.info('FINISH: create_table_header()')
-
     def _find_column_idx(self, value):
         idx1 = self._find_infrastructure_idx(value[self._KEY_INFRASTRUCTURE],
                                              self._infrastructure)
@@ -416,23 +426,8 @@ class XlsxBenchmarkTable(XlsxTable):
                                          self._execution_parameters[idx1][idx2][idx3][idx4][idx5])
         return self._col_indeces[idx1][idx2][idx3][idx4][idx5][idx6]
 
-    def _find_row_records(self, task_type, topology_name, train_framework,
-                          blob_size, batch_size, experiments,
-                          processed_records_keys):
-        records_group = []
-        for key, value in experiments.items():
-            if (key not in processed_records_keys
-                    and value[self._KEY_TASK_TYPE] == task_type
-                    and value[self._KEY_TOPOLOGY_NAME] == topology_name
-                    and value[self._KEY_TRAIN_FRAMEWORK] == train_framework
-                    and value[self._KEY_BLOB_SIZE] == blob_size
-                    and value[self._KEY_BATCH_SIZE] == batch_size):
-                records_group.append(value)
-                processed_records_keys.append(key)
-        return records_group
-
-    def _create_row_record(self, records_group):
-        return self._create_row_record_by_key(records_group, self._KEY_FPS)
+    def _create_row_record(self, records_group, key):
+        return self._create_row_record_by_key(records_group, key)
 
     def _remove_unused_metrics(self, data):
         # remove unused keys from DataFrame
@@ -448,27 +443,19 @@ class XlsxBenchmarkTable(XlsxTable):
         # transpose 2d dictionary
         experiments = self._data.to_dict('index')
 
-        processed_records_keys = []
         self._table_records = defaultdict(list)
-        for key, value in experiments.items():
-            if key in processed_records_keys:
-                continue
-            records_group = self._find_row_records(value[self._KEY_TASK_TYPE],
-                                                   value[self._KEY_TOPOLOGY_NAME],
-                                                   value[self._KEY_TRAIN_FRAMEWORK],
-                                                   value[self._KEY_BLOB_SIZE],
-                                                   value[self._KEY_BATCH_SIZE],
-                                                   experiments,
-                                                   processed_records_keys)
-            if (len(records_group) == 0):
-                continue
-            fps_record = self._create_row_record(records_group)
+        records_groups = self._group_records(experiments, (self._KEY_TASK_TYPE, self._KEY_TOPOLOGY_NAME,
+                                                           self._KEY_TRAIN_FRAMEWORK, self._KEY_BLOB_SIZE,
+                                                           self._KEY_BATCH_SIZE))
+        for records_group in records_groups.values():
+            value = records_group[0]
             record = {self._KEY_TASK_TYPE: value[self._KEY_TASK_TYPE],
                       self._KEY_TOPOLOGY_NAME: value[self._KEY_TOPOLOGY_NAME],
                       self._KEY_TRAIN_FRAMEWORK: value[self._KEY_TRAIN_FRAMEWORK],
                       self._KEY_BLOB_SIZE: value[self._KEY_BLOB_SIZE],
-                      self._KEY_BATCH_SIZE: value[self._KEY_BATCH_SIZE],
-                      self._KEY_FPS: fps_record}
+                      self._KEY_BATCH_SIZE: value[self._KEY_BATCH_SIZE]}
+            for key in self._sheet_metrics.values():
+                record[key] = self._create_row_record(records_group, key)
             self._table_records[value[self._KEY_TASK_TYPE]].append(record)
 
         logging.info('FINISH: create_table_rows()')
@@ -488,6 +475,13 @@ class XlsxBenchmarkTable(XlsxTable):
     def write_test_results(self):
         logging.info('START: write_test_results()')
 
+        for sheet, key in self._sheets.items():
+            self._sheet = sheet
+            self._write_sheet_results(key)
+
+        logging.info('FINISH: write_test_results()')
+
+    def _write_sheet_results(self, metric_key):
         row_idx = 6
         for task_type, task_records in self._table_records.items():  # loop by tasks
             if len(task_records) <= 0:
@@ -526,9 +520,13 @@ class XlsxBenchmarkTable(XlsxTable):
                                       self._cell_format_title2)
                     self._sheet.write(row_idx, 4, topology_record[self._KEY_BATCH_SIZE],
                                       self._cell_format_title2)
-                    for key, value in topology_record[self._KEY_FPS].items():
+                    for key, value in topology_record[metric_key].items():
                         formatting = self._cell_format_fps
-                        if value == 'None' or pandas.isnull(value):
+                        if (value == 'None' or pandas.isnull(value)) and metric_key != self._KEY_FPS:
+                            # tests without the optional metric, ex. launchers without startup report
+                            value = 'N/A'
+                            formatting = self._cell_format_undefined_fps
+                        elif value == 'None' or pandas.isnull(value):
                             value = 'NaN'
                             formatting = self._cell_format_nan_fps
                         elif value == 'Undefined':
@@ -545,11 +543,16 @@ class XlsxBenchmarkTable(XlsxTable):
 
         self._full_num_rows = row_idx
 
-        logging.info('FINISH: write_test_results()')
-
     def beautify_table(self):
         logging.info('START: beautify_table()')
 
+        for sheet in self._sheets:
+            self._sheet = sheet
+            self._beautify_sheet()
+
+        logging.info('FINISH: beautify_table()')
+
+    def _beautify_sheet(self):
         rel_col_idx = 5  # task type, topology, framework, blob sizes, batch size
         rel_row_idx = 0
         num_header_rows = 6  # infrastructure, framework, device, precision, mode, parameters
@@ -566,8 +569,6 @@ class XlsxBenchmarkTable(XlsxTable):
                                    self._full_num_rows - num_header_rows, num_cols)
             rel_col_idx += num_cols
 
-        logging.info('FINISH: beautify_table()')
-
     def close_table(self):
         logging.info('START: close_table()')
 
@@ -12,11 +12,15 @@ def cli_argument_parser():
 
     parser = argparse.ArgumentParser()
 
-    parser.add_argument('-t', '--tables',
+    tables = parser.add_mutually_exclusive_group(required=True)
+    tables.add_argument('-t', '--tables',
                         type=str,
                         help='Paths to the inference tables in csv format.',
-                        nargs='+',
-                        required=True)
+                        nargs='+')
+
+    tables.add_argument('-s', '--result_store',
+                        type=str,
+                        help='Path to the SQLite result store to read the inference results from.')
 
     parser.add_argument('-r', '--result_table',
                         type=str,
@@ -31,18 +35,20 @@ def cli_argument_parser():
     paths_table_csv = parser.parse_args().tables
     path_table_xlsx = parser.parse_args().result_table
     table_kind = parser.parse_args().table_kind
+    result_store = parser.parse_args().result_store
 
-    logging.info(f'FINISH: build_parser(). Output: {paths_table_csv}, {path_table_xlsx}, {table_kind}')
-    return paths_table_csv, path_table_xlsx, table_kind
+    logging.info(f'FINISH: build_parser(). Output: {paths_table_csv}, {path_table_xlsx}, {table_kind}, '
+                 f'{result_store}')
+    return paths_table_csv, path_table_xlsx, table_kind, result_store
 
 
-def convert_csv_table_to_xlsx(paths_table_csv, path_table_xlsx, table_type):
+def convert_csv_table_to_xlsx(paths_table_csv, path_table_xlsx, table_type, result_store=None):
     logging.info('START: convert_csv_table_to_xlsx()')
 
     if table_type == 'benchmark':
-        table_xlsx = XlsxBenchmarkTable(paths_table_csv, path_table_xlsx)
+        table_xlsx = XlsxBenchmarkTable(paths_table_csv, path_table_xlsx, result_store)
     elif table_type == 'accuracy_checker':
-        table_xlsx = XlsxAccuracyTable(paths_table_csv, path_table_xlsx)
+        table_xlsx = XlsxAccuracyTable(paths_table_csv, path_table_xlsx, result_store)
     else:
         raise ValueError(f'Incorrect value of the table type {table_type}')
 
@@ -62,10 +68,10 @@ def main():
                         format='%(asctime)s %(levelname)s: %(message)s',
                         level=logging.INFO)
 
-    paths_table_csv, path_table_xlsx, table_type = cli_argument_parser()
+    paths_table_csv, path_table_xlsx, table_type, result_store = cli_argument_parser()
 
     try:
-        convert_csv_table_to_xlsx(paths_table_csv, path_table_xlsx, table_type)
+        convert_csv_table_to_xlsx(paths_table_csv, path_table_xlsx, table_type, result_store)
     except ValueError as ex:
         logging.error(f'{ex}')
         return 1
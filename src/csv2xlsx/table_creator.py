@@ -1,17 +1,26 @@
 import abc
+import io
 import logging
+import sys
 import tkinter
 import tkinter.font
+from collections import defaultdict
+from pathlib import Path
 
+import pandas
 from iteration_utilities import deepflatten
 
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
+from result_store import ResultStore  # noqa: E402
+
 
 class XlsxTable(metaclass=abc.ABCMeta):
-    def __init__(self, paths_table_csv, path_table_xlsx, sheet_name):
+    def __init__(self, paths_table_csv, path_table_xlsx, sheet_name, result_store=None):
         logging.info('START: __init__(). Input: {0}, {1}'.format(
             paths_table_csv, path_table_xlsx))
 
         self._paths_table_csv = paths_table_csv
+        self._result_store = result_store
         self._path_table_xlsx = path_table_xlsx
         self._sheet_name = sheet_name
 
@@ -41,6 +50,33 @@ class XlsxTable(metaclass=abc.ABCMeta):
         root.destroy()
         return max_cell_width
 
+    def _read_tables(self, table_kind):
+        if self._result_store is None:
+            data = pandas.DataFrame()
+            for path_table_csv in self._paths_table_csv:
+                new_table = pandas.read_csv(path_table_csv, sep=';',
+                                            encoding='latin-1')  # for title
+                data = pandas.concat([data, new_table])
+            return data
+
+        # the store keeps values as in CSV tables, so they are parsed the same way
+        store = ResultStore(self._result_store)
+        table_csv = io.StringIO()
+        try:
+            store.write_csv(table_kind, table_csv)
+        finally:
+            store.close()
+        table_csv.seek(0)
+        return pandas.read_csv(table_csv, sep=';')
+
+    @staticmethod
+    def _group_records(experiments, keys):
+        # one pass over experiments instead of the scan of all experiments for every table row
+        records_groups = defaultdict(list)
+        for value in experiments.values():
+            records_groups[tuple(value[key] for key in keys)].append(value)
+        return records_groups
+
     def _get_infrastructure(self):
         logging.info('START: _get_infrastructure()')
 
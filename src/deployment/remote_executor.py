@@ -22,6 +22,20 @@ class RemoteExecutor:
             except Exception:
                 time.sleep(self.my_wait_counter)
 
+    def try_connection(self, machine_ip, login, password):
+        """Single connection attempt, exceptions of the remote helper are raised to the caller"""
+        self.my_machine_ip = machine_ip
+        self.my_active_connection = self.my_remote_helper.connect(machine_ip, login, password)
+        return True
+
+    def try_python(self, command):
+        """Single attempt to start the python command, returns False if the process is not created"""
+        new_process = self.my_remote_helper.execute_python(self.my_active_connection, command)
+        if new_process is None:
+            return False
+        self.my_process_list.append(new_process)
+        return True
+
     def execute_command(self, command, executor=None):
         if executor is None:
             executor = self.my_remote_helper.execute
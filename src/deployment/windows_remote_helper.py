@@ -24,7 +24,7 @@ class WindowsRemoteHepler(RemoteHelper):
         watcher = None
         if result == 0:
             self.my_log.info(f'Process started successfully {process_id}')
-            con.watch_for(
+            watcher = con.watch_for(
                 notification_type='Deletion',
                 wmi_class='Win32_Process',
                 ProcessId=process_id,
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+
+class CompiledModelCache:
+    """
+    Directory with compiled models shared by tests and runs. Every framework has its own subdirectory,
+    entries are evicted in the least recently used order when the directory grows beyond max_bytes.
+    """
+    DEFAULT_MAX_BYTES = 20 * 2 ** 30
+    HASH_CHUNK_SIZE = 2 ** 20
+
+    def __init__(self, cache_dir, framework, max_bytes=DEFAULT_MAX_BYTES):
+        self.framework_dir = Path(cache_dir) / framework
+        self.framework_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def get_cache(cls, cache_dir, framework):
+        return cls(cache_dir, framework) if cache_dir else None
+
+    @classmethod
+    def get_file_hash(cls, path):
+        file_hash = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(cls.HASH_CHUNK_SIZE), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def get_key(self, model_paths, **options):
+        """
+        :param model_paths: model files, their content is hashed. Directories and missing paths
+                            (ex. model names of model zoos) are keyed by the path
+        :param options: framework version, device, precision, shapes and other compilation settings
+        """
+        model_hashes = []
+        for path in model_paths:
+            if path is not None and Path(path).is_file():
+                model_hashes.append(self.get_file_hash(path))
+            else:
+                model_hashes.append(str(path))
+        key = json.dumps({'models': model_hashes, 'options': options}, sort_keys=True, default=str)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def get_entry(self, key):
+        """
+        Directory of the cache entry, it is created if it does not exist
+        """
+        entry = self.framework_dir / key
+        entry.mkdir(exist_ok=True)
+        return entry
+
+    def touch(self, path):
+        # modification time is used as the last access time for LRU eviction
+        os.utime(path)
+
+    def evict(self, keep=None):
+        entries = []
+        for entry in self.framework_dir.iterdir():
+            try:
+                entries.append((entry.stat().st_mtime, self._get_size(entry), entry))
+            except FileNotFoundError:
+                continue
+        cache_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if cache_size <= self.max_bytes:
+                break
+            if keep is not None and entry == Path(keep):
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                try:
+                    entry.unlink()
+                except FileNotFoundError:
+                    pass
+            cache_size -= size
+
+    @staticmethod
+    def _get_size(path):
+        if not path.is_dir():
+            return path.stat().st_size
+        size = 0
+        for file in path.rglob('*'):
+            try:
+                if file.is_file():
+                    size += file.stat().st_size
+            except FileNotFoundError:
+                continue
+        return size
@@ -0,0 +1,108 @@
+import numpy as np
+
+
+def xywh_to_xyxy(boxes):
+    """
+    Convert boxes from [x_min, y_min, width, height] to [x_min, y_min, x_max, y_max] format
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    return np.concatenate([boxes[:, :2], boxes[:, :2] + boxes[:, 2:]], axis=1)
+
+
+def center_xywh_to_xyxy(boxes):
+    """
+    Convert boxes from [x_center, y_center, width, height] to [x_min, y_min, x_max, y_max] format
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    return np.concatenate([boxes[:, :2] - boxes[:, 2:] / 2, boxes[:, :2] + boxes[:, 2:] / 2], axis=1)
+
+
+def box_iou(boxes_a, boxes_b):
+    """
+    Intersection over union of every pair of boxes in [x_min, y_min, x_max, y_max] format
+    :return: matrix of shape (len(boxes_a), len(boxes_b)), boxes with empty union have zero IoU
+    """
+    boxes_a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    boxes_b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def non_max_suppression(boxes, scores, iou_threshold, score_threshold=None, class_ids=None):
+    """
+    Greedy non-maximum suppression, boxes of different classes do not suppress each other.
+    :param boxes: boxes in [x_min, y_min, x_max, y_max] format
+    :param score_threshold: boxes with smaller scores are dropped before suppression
+    :param class_ids: class of every box, all boxes belong to one class if None
+    :return: indices of kept boxes ordered by descending score, equal scores keep the input order
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    scores = np.asarray(scores, dtype=np.float64).reshape(-1)
+    class_ids = np.zeros(len(scores), dtype=int) if class_ids is None else np.asarray(class_ids).reshape(-1)
+    order = np.argsort(-scores, kind='stable')
+    if score_threshold is not None:
+        order = order[scores[order] >= score_threshold]
+
+    keep = []
+    order_classes = class_ids[order]
+    for class_id in np.unique(order_classes):
+        # candidates are compared with the current best box only, so memory stays linear in their number
+        candidates = order[order_classes == class_id]
+        while len(candidates) > 0:
+            best = candidates[0]
+            keep.append(best)
+            overlap = box_iou(boxes[best], boxes[candidates[1:]])[0]
+            candidates = candidates[1:][overlap <= iou_threshold]
+
+    rank = np.empty(len(scores), dtype=int)
+    rank[order] = np.arange(len(order))
+    keep = np.asarray(keep, dtype=int)
+    return keep[np.argsort(rank[keep])]
+
+
+def soft_non_max_suppression(boxes, scores, score_threshold, sigma=0.6):
+    """
+    Class-agnostic Gaussian soft non-maximum suppression: instead of removing boxes overlapping the selected one
+    their scores decay as exp(-iou^2 / sigma).
+    :param boxes: boxes in [x_min, y_min, x_max, y_max] format
+    :return: indices of selected boxes in the selection order, equal scores are selected in the input order
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    scores = np.array(scores, dtype=np.float64).reshape(-1)
+    keep = []
+    for _ in range(len(scores)):
+        best = int(np.argmax(scores))
+        if scores[best] < score_threshold:
+            break
+        keep.append(best)
+        scores[best] = 0
+        active = np.flatnonzero(scores >= score_threshold)
+        overlap = box_iou(boxes[best], boxes[active])[0]
+        scores[active] *= np.exp(-overlap * overlap / sigma)
+    return keep
+
+
+def yolo_non_max_suppression(prediction, conf_threshold=0.25, iou_threshold=0.45, max_detections=300):
+    """
+    Non-maximum suppression of raw YOLO predictions
+    :param prediction: array of shape (batch, boxes, 5 + classes) with [x_center, y_center, width, height,
+                       objectness, class scores...] rows
+    :return: list of arrays of shape (detections, 6) with [x_min, y_min, x_max, y_max, score, class] rows
+             for every image of the batch
+    """
+    output = []
+    for image_prediction in np.asarray(prediction, dtype=np.float64):
+        image_prediction = image_prediction[image_prediction[:, 4] > conf_threshold]
+        class_scores = image_prediction[:, 5:] * image_prediction[:, 4:5]
+        class_ids = np.argmax(class_scores, axis=1)
+        scores = class_scores[np.arange(len(class_scores)), class_ids]
+        detections = np.concatenate([center_xywh_to_xyxy(image_prediction[:, :4]), scores[:, None],
+                                     class_ids[:, None]], axis=1)[scores > conf_threshold]
+        keep = non_max_suppression(detections[:, :4], detections[:, 4], iou_threshold, class_ids=detections[:, 5])
+        output.append(detections[keep[:max_detections]])
+    return output
@@ -3,11 +3,14 @@ import json
 import sys
 import traceback
 from pathlib import Path
-from time import time
+from time import perf_counter
 
 import caffe
 
 import postprocessing_data as pp
+from inference_tools.argument_tools import add_input_data_arguments, add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import IntelCaffeIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -38,6 +41,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-b', '--batch_size',
                         help='Size of the processed pack',
                         default=1,
@@ -106,6 +110,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'caffe_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
 
     args = parser.parse_args()
 
@@ -158,22 +163,28 @@ def inference_caffe(net, number_iter, get_slice):
     if number_iter == 1:
         slice_input = get_slice()
         load_images_to_network(net, slice_input)
-        t0 = time()
+        t0 = perf_counter()
         result = net.forward()
-        t1 = time()
+        t1 = perf_counter()
         time_infer.append(t1 - t0)
     else:
-        for _ in range(number_iter):
-            slice_input = get_slice()
-            load_images_to_network(net, slice_input)
-            t0 = time()
-            net.forward()
-            t1 = time()
-            time_infer.append(t1 - t0)
+        loop_results = loop_inference(number_iter, 0)(inference_iteration)(net, get_slice)
+        time_infer = loop_results['time_infer']
 
     return result, time_infer
 
 
+def inference_iteration(net, get_slice):
+    load_images_to_network(net, get_slice())
+    _, exec_time = infer_slice(net)
+    return exec_time
+
+
+@get_exec_time()
+def infer_slice(net):
+    net.forward()
+
+
 def create_dict_for_transformer(args):
     dictionary = {
         'channel_swap': args.channel_swap,
@@ -185,6 +196,8 @@ def create_dict_for_transformer(args):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='Caffe', version=caffe.__version__)
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -202,12 +215,14 @@ def main():
         log.info('The device has been assigned: {0}'.format(args.device))
         log.info('Loading network files:\n\t {0}\n\t {1}'.format(
             args.model_prototxt, args.model_caffemodel))
-        net = load_network(args.model_prototxt, args.model_caffemodel)
+        net, read_network_time = get_exec_time()(load_network)(args.model_prototxt, args.model_caffemodel)
         net = network_input_reshape(net, args.batch_size)
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
 
         input_shapes = get_input_shape(model_wrapper, net)
         for layer in input_shapes:
             log.info('Shape for input layer {0}: {1}'.format(layer, input_shapes[layer]))
+        report_writer.update_input_shapes(input_shapes)
 
         log.info('Prepare input data')
         if args.input:
@@ -219,8 +234,12 @@ def main():
         log.info(f'Starting inference ({args.number_iter} iterations)')
         result, inference_time = inference_caffe(net, args.number_iter, io.get_slice_input)
 
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
         log.info('Computing performance metrics')
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                      **get_loop_results())
         report_writer.update_execution_results(**inference_result)
 
         log.info(f'Write report to {args.report_path}')
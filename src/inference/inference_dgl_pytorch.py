@@ -4,7 +4,7 @@ import json
 import sys
 import traceback
 from pathlib import Path
-from time import time
+from time import perf_counter
 import importlib.util
 
 import torch
@@ -12,7 +12,9 @@ import dgl
 
 import postprocessing_data as pp
 from reporter.report_writer import ReportWriter
-from inference_tools.loop_tools import loop_inference
+from inference_tools.argument_tools import add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from pytorch_auxiliary import get_device_to_infer, infer_slice, set_thread_num
 from io_model_wrapper import DGLPyTorchWrapper
 from io_graphs_adapter.graph_adapter import IOGraphAdapter
@@ -83,6 +85,7 @@ def cli_argument_parser():
                         default=Path(__file__).parent / 'dgl_pytorch_inference_report.json',
                         dest='report_path',
                         help='Path to json benchmark report path, default: ./dgl_pytorch_inference_report.json')
+    add_measurement_arguments(parser)
     parser.add_argument('--num_inter_threads',
                         help='Number of threads used for parallelism between independent operations',
                         default=None,
@@ -118,14 +121,15 @@ def inference_dgl_pytorch(model, num_iterations, input_graph, device, test_durat
         predictions = None
         time_infer = []
         if num_iterations == 1:
-            t0 = time()
+            t0 = perf_counter()
             predictions = model(input_graph, features).argmax(dim=1)
-            t1 = time()
+            t1 = perf_counter()
             time_infer.append(t1 - t0)
         else:
             # several decorator calls in order to use variables as decorator parameters
             inputs = [input_graph, features]
-            time_infer = loop_inference(num_iterations, test_duration)(inference_iteration)(device, inputs, model)
+            loop_results = loop_inference(num_iterations, test_duration)(inference_iteration)(device, inputs, model)
+            time_infer = loop_results['time_infer']
     return predictions, time_infer
 
 
@@ -189,13 +193,18 @@ def write_cmd_options_to_report(report_writer, args):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     write_cmd_options_to_report(report_writer, args)
 
     try:
-        model = load_model_from_file(args.model, args.module_path, args.model_name)
+        model, read_network_time = get_exec_time()(load_model_from_file)(
+            args.model, args.module_path, args.model_name)
         device = get_device_to_infer(args.device)
-        compiled_model = compile_model(model, device)
+        compiled_model, compile_time = get_exec_time()(compile_model)(model, device)
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5),
+                                               compile_time=round(compile_time, 5))
 
         model_wrapper = DGLPyTorchWrapper(compiled_model)
         io = IOGraphAdapter.get_io_adapter(args, model_wrapper)
@@ -209,8 +218,12 @@ def main():
         result, inference_time = inference_dgl_pytorch(compiled_model, args.number_iter,
                                                        input_data, device, args.time)
 
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time['time_infer'])
         log.info('Computing performance metrics')
-        inference_result = pp.calculate_performance_metrics_sync_mode(1, inference_time['time_infer'])
+        inference_result = pp.calculate_performance_metrics_sync_mode(1, inference_time['time_infer'],
+                                                                      **get_loop_results())
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
         report_writer.write_report(args.report_path)
@@ -3,11 +3,14 @@ import json
 import sys
 import traceback
 from pathlib import Path
-from time import time
+from time import perf_counter
 
 import mxnet
 
 import postprocessing_data as pp
+from inference_tools.argument_tools import add_input_data_arguments
+from inference_tools.loop_tools import get_exec_time
+from inference_tools.memory_tools import record_memory
 from io_adapter import IOAdapter
 from io_model_wrapper import MXNetIOModelWrapper
 from mxnet_auxiliary import (load_network_gluon, load_network_gluon_model_zoo,
@@ -50,6 +53,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-in', '--input_name',
                         help='Input name.',
                         default='data',
@@ -211,19 +215,19 @@ def inference_mxnet(net, num_iterations, get_slice, input_name):
     slice_input = None
     if num_iterations == 1:
         mxnet.nd.waitall()
-        inference_time = time()
+        inference_time = perf_counter()
         slice_input = get_slice()
         predictions = net(slice_input[input_name])
         mxnet.nd.waitall()
-        inference_time = time() - inference_time
+        inference_time = perf_counter() - inference_time
     else:
         mxnet.nd.waitall()
-        inference_time = time()
+        inference_time = perf_counter()
         for _ in range(num_iterations):
             slice_input = get_slice()
             net(slice_input[input_name]).softmax()
         mxnet.nd.waitall()
-        inference_time = time() - inference_time
+        inference_time = perf_counter() - inference_time
 
     return predictions, inference_time
 
@@ -248,13 +252,14 @@ def main():
         if ((args.model_name is not None)
                 and (args.model_json is None)
                 and (args.model_params is None)):
-            net = load_network_gluon_model_zoo(args.model_name, args.hybrid, context,
-                                               args.save_model, args.path_save_model)
+            net, read_network_time = get_exec_time()(load_network_gluon_model_zoo)(
+                args.model_name, args.hybrid, context, args.save_model, args.path_save_model)
         elif (args.model_json is not None) and (args.model_params is not None):
-            net = load_network_gluon(args.model_json, args.model_params, context,
-                                     args.input_name)
+            net, read_network_time = get_exec_time()(load_network_gluon)(
+                args.model_json, args.model_params, context, args.input_name)
         else:
             raise ValueError('Incorrect arguments.')
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
 
         if (args.quantization):
             quant_wrapper.quant_gluon_model(net, context)
@@ -264,6 +269,7 @@ def main():
             quant_wrapper.save_model_as_symbol_block()
 
         log.info(f'Shape for input layer {args.input_name}: {args.input_shape}')
+        report_writer.update_input_shapes({args.input_name: args.input_shape})
 
         if args.input:
             log.info(f'Preparing input data: {args.input}')
@@ -278,6 +284,7 @@ def main():
             model_wrapper._input_shape = [transformed_shape]
             io.fill_unset_inputs(net, log, custom_shapes)
 
+        record_memory('model_load')
         log.info(f'Starting inference ({args.number_iter} iterations) on {args.device}')
         result, inference_time = inference_mxnet(net, args.number_iter,
                                                  io.get_slice_input_mxnet, args.input_name)
@@ -286,7 +293,7 @@ def main():
         inference_result = pp.calculate_performance_metrics_async_mode(inference_time,
                                                                        args.batch_size,
                                                                        args.number_iter)
-        report_writer.update_execution_results(**inference_result, iterations_num=args.number_iter)
+        report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
         report_writer.write_report(args.report_path)
 
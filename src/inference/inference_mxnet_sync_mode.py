@@ -3,12 +3,14 @@ import json
 import sys
 import traceback
 from pathlib import Path
-from time import time
+from time import perf_counter
 
 import mxnet
 
 import postprocessing_data as pp
-from inference_tools.loop_tools import loop_inference, get_exec_time
+from inference_tools.argument_tools import add_input_data_arguments, add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import MXNetIOModelWrapper
 from mxnet_auxiliary import (load_network_gluon, load_network_gluon_model_zoo,
@@ -51,6 +53,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-in', '--input_name',
                         help='Input name.',
                         default='data',
@@ -150,6 +153,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'mxnet_sync_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
     parser.add_argument('--time', required=False, default=0, type=int,
                         dest='time',
                         help='Optional. Time in seconds to execute topology.')
@@ -214,11 +218,11 @@ def inference_mxnet(net, num_iterations, get_slice, input_name, test_duration):
     time_infer = []
     if num_iterations == 1:
         mxnet.nd.waitall()
-        t0 = time()
+        t0 = perf_counter()
         slice_input = get_slice()
         predictions = net(slice_input[input_name])
         mxnet.nd.waitall()
-        t1 = time()
+        t1 = perf_counter()
         time_infer.append(t1 - t0)
     else:
         loop_results = loop_inference(num_iterations, test_duration)(inference_iteration)(get_slice, input_name, net)
@@ -242,6 +246,8 @@ def infer_slice(input_name, net, slice_input):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='MXNet', version=mxnet.__version__)
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -260,13 +266,14 @@ def main():
         if ((args.model_name is not None)
                 and (args.model_json is None)
                 and (args.model_params is None)):
-            net = load_network_gluon_model_zoo(args.model_name, args.hybrid, context,
-                                               args.save_model, args.path_save_model)
+            net, read_network_time = get_exec_time()(load_network_gluon_model_zoo)(
+                args.model_name, args.hybrid, context, args.save_model, args.path_save_model)
         elif (args.model_json is not None) and (args.model_params is not None):
-            net = load_network_gluon(args.model_json, args.model_params, context,
-                                     args.input_name)
+            net, read_network_time = get_exec_time()(load_network_gluon)(
+                args.model_json, args.model_params, context, args.input_name)
         else:
             raise ValueError('Incorrect arguments.')
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
 
         if (args.quantization):
             quant_wrapper.quant_gluon_model(net, context)
@@ -276,6 +283,7 @@ def main():
             quant_wrapper.save_model_as_symbol_block()
 
         log.info(f'Shape for input layer {args.input_name}: {args.input_shape}')
+        report_writer.update_input_shapes({args.input_name: args.input_shape})
 
         if args.input:
             log.info(f'Preparing input data: {args.input}')
@@ -294,8 +302,12 @@ def main():
         result, inference_time = inference_mxnet(net, args.number_iter,
                                                  io.get_slice_input_mxnet, args.input_name, args.time)
 
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
         log.info('Computing performance metrics')
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                      **get_loop_results())
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
         report_writer.write_report(args.report_path)
@@ -4,7 +4,9 @@ import traceback
 from pathlib import Path
 
 import postprocessing_data as pp
-from inference_tools.loop_tools import loop_inference, get_exec_time
+from inference_tools.argument_tools import add_input_data_arguments, add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import NcnnIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -27,6 +29,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-m', '--model',
                         help='Model name.',
                         choices=['squeezenet', 'shufflenetv2', 'faster_rcnn', 'rfcn',
@@ -108,6 +111,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'ncnn_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
     args = parser.parse_args()
 
     return args
@@ -150,6 +154,8 @@ def infer_slice(input_name, batch_size, net, slice_input):
 def main():
     try:
         args = cli_argument_parser()
+        set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+        set_loop_parameters(args.quiet, args.collect_rusage)
         model_wrapper = NcnnIOModelWrapper(args)
         data_transformer = NcnnTransformer()
         io = IOAdapter.get_io_adapter(args, model_wrapper, data_transformer)
@@ -163,12 +169,17 @@ def main():
         validate_task(args.model, args.task)
 
         io.prepare_input(args.model, args.input)
-        net = load_model(args)
+        net, read_network_time = get_exec_time()(load_model)(args)
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
 
         result, inference_time = inference_ncnn(net, args.number_iter, args.input_name,
                                                 args.input_shape[0], io.get_slice_input, args.time)
 
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
+        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                      **get_loop_results())
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
         report_writer.write_report(args.report_path)
@@ -1,10 +1,11 @@
 import argparse
 import json
+import os
 import sys
 import traceback
 
 from pathlib import Path
-from time import time
+from time import perf_counter
 
 import numpy as np
 import onnxruntime as onnx_rt
@@ -12,7 +13,12 @@ import onnxruntime as onnx_rt
 import postprocessing_data as pp
 import preprocessing_data as prep
 
-from inference_tools.loop_tools import loop_inference, get_exec_time
+from compiled_model_cache import CompiledModelCache
+from inference_tools.argument_tools import (add_compiled_model_cache_argument, add_input_data_arguments,
+                                            add_load_generator_arguments, add_measurement_arguments)
+from inference_tools.load_generator import read_arrival_trace, run_open_loop_inference, synchronized
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, get_warmup_results, loop_inference,
+                                        set_loop_parameters, set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import ONNXIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -63,6 +69,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-d', '--device',
                         help='Specify the target device to infer on (CPU by default)',
                         default='CPU',
@@ -164,6 +171,9 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'ort_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
+    add_compiled_model_cache_argument(parser)
+    add_load_generator_arguments(parser)
     parser.add_argument('--time', required=False, default=0, type=int,
                         dest='time',
                         help='Optional. Time in seconds to execute topology.')
@@ -185,6 +195,35 @@ def set_session_options(number_threads, execution_mode, num_inter_threads):
     return sess_options
 
 
+def use_optimized_model_cache(model, compiled_model_cache, execution_providers, device, precision, session_options):
+    """
+    Load the model optimized by the previous session with the same settings or save the optimized model
+    of the created session to the cache
+    :return: path to the model to create session from, path where the session saves the optimized model
+             (None if the model is loaded from the cache)
+    """
+    key = compiled_model_cache.get_key([model], framework_version=onnx_rt.__version__, providers=execution_providers,
+                                       device=device, precision=precision,
+                                       optimization_level=str(session_options.graph_optimization_level))
+    entry = compiled_model_cache.get_entry(key)
+    optimized_model = entry / 'model.onnx'
+    if optimized_model.is_file():
+        log.info(f'Loading optimized model from cache: {optimized_model}')
+        compiled_model_cache.touch(entry)
+        session_options.graph_optimization_level = onnx_rt.GraphOptimizationLevel.ORT_DISABLE_ALL
+        return str(optimized_model), None
+    # concurrent tests may optimize the same model, the complete file is renamed to the cache entry
+    session_options.optimized_model_filepath = str(entry / f'model.{os.getpid()}.onnx')
+    return model, session_options.optimized_model_filepath
+
+
+def save_optimized_model(compiled_model_cache, optimized_model_path):
+    optimized_model_path = Path(optimized_model_path)
+    if optimized_model_path.is_file():
+        os.replace(optimized_model_path, optimized_model_path.parent / 'model.onnx')
+    compiled_model_cache.evict(keep=optimized_model_path.parent)
+
+
 def create_inference_session(model, task_type, execution_providers, device, precision, session_options):
     log.info(f'Setting device to {device}')
     log.info(f'Setting execution providers to {execution_providers}')
@@ -215,6 +254,17 @@ def create_inference_session(model, task_type, execution_providers, device, prec
         return session
 
 
+def bind_ort_value(input_name, data):
+    # OrtValue shares memory with the cached batch, so input data is not copied on every run
+    return onnx_rt.OrtValue.ortvalue_from_numpy(data)
+
+
+def run_session(session, output_names, slice_input):
+    if slice_input and all(isinstance(value, onnx_rt.OrtValue) for value in slice_input.values()):
+        return [output.numpy() for output in session.run_with_ort_values(output_names, slice_input)]
+    return session.run(output_names, slice_input)
+
+
 def inference_onnx_runtime(session_or_pipeline, task_type, model_name, output_names, number_iter,
                            get_slice, test_duration, device):
     result = None
@@ -239,7 +289,7 @@ def inference_onnx_runtime(session_or_pipeline, task_type, model_name, output_na
         if task_type not in ['batch-text-generation']:
             slice_input = get_slice()
 
-        t0 = time()
+        t0 = perf_counter()
 
         if task_type in ['text-to-image']:
             result = session_or_pipeline(slice_input)
@@ -258,9 +308,9 @@ def inference_onnx_runtime(session_or_pipeline, task_type, model_name, output_na
 
             result = (tokens, label_indices)
         else:
-            result = session_or_pipeline.run(output_names, slice_input)
+            result = run_session(session_or_pipeline, output_names, slice_input)
 
-        t1 = time()
+        t1 = perf_counter()
         time_infer.append(t1 - t0)
     else:
         loop_results = loop_inference(number_iter, test_duration)(inference_iteration)(get_slice, model_name,
@@ -272,6 +322,17 @@ def inference_onnx_runtime(session_or_pipeline, task_type, model_name, output_na
     return result, time_infer, num_tokens
 
 
+def inference_onnx_runtime_open_loop(session, args, get_slice):
+    if args.task in ['text-to-image', 'batch-text-generation', 'named-entity-recognition']:
+        raise ValueError(f'Open-loop inference is not supported for the task {args.task}')
+    # session is shared by workers, its run method is thread-safe
+    worker_args = (synchronized(get_slice), args.model_name, args.output_names, session, args.task, args.device)
+    trace = read_arrival_trace(args.arrival_trace) if args.arrival_trace else None
+    return run_open_loop_inference(inference_iteration, [worker_args] * args.load_workers, args.number_iter,
+                                   args.time, args.arrival_rate, args.arrival_distribution, trace,
+                                   args.latency_sla, args.sla_percentile)
+
+
 def inference_iteration(get_slice, model_name, output_names, session, task_type, device, tokenizer=None):
     iter_tokens = None
     inputs = get_slice()
@@ -309,7 +370,7 @@ def infer_slice(output_names, model_name, session_or_pipeline, task_type, device
 
         res = (model_output, num_tokens)
     else:
-        res = session_or_pipeline.run(output_names, slice_input)
+        res = run_session(session_or_pipeline, output_names, slice_input)
 
     return res
 
@@ -346,6 +407,8 @@ def prepare_output(result, output_names, model_name, task_type, args):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='OnnxRuntime', version=onnx_rt.__version__)
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -358,9 +421,23 @@ def main():
         log.info('Setting inference session options')
         sess_options = set_session_options(args.number_threads, args.execution_mode, args.num_inter_threads)
 
-        log.info(f'Creating inference session:\n\t {args.model}')
-        inference_session = create_inference_session(args.model, args.task, args.execution_providers,
-                                                     args.device, args.precision, sess_options)
+        model_path, optimized_model_path, compiled_model_cache_hit = args.model, None, None
+        compiled_model_cache = CompiledModelCache.get_cache(args.compiled_model_cache_dir, 'onnxruntime')
+        if compiled_model_cache and args.task not in ['text-to-image']:
+            model_path, optimized_model_path = use_optimized_model_cache(args.model, compiled_model_cache,
+                                                                         args.execution_providers, args.device,
+                                                                         args.precision, sess_options)
+            compiled_model_cache_hit = optimized_model_path is None
+
+        log.info(f'Creating inference session:\n\t {model_path}')
+        inference_session, compile_time = get_exec_time()(create_inference_session)(
+            model_path, args.task, args.execution_providers, args.device, args.precision, sess_options)
+        if optimized_model_path:
+            save_optimized_model(compiled_model_cache, optimized_model_path)
+        log.info(f'Inference session is created in {compile_time:.3f} s')
+        # session creation reads and optimizes the model in one call
+        report_writer.update_execution_results(compile_time=round(compile_time, 5),
+                                               compiled_model_cache_hit=compiled_model_cache_hit)
 
         if args.task not in ['text-to-image']:
             args.input_names = model_wrapper.get_input_layer_names(inference_session)
@@ -377,9 +454,12 @@ def main():
         io = IOAdapter.get_io_adapter(args, model_wrapper, data_transformer)
 
         if args.task not in ['text-to-image', 'batch-text-generation']:
+            input_shapes = {}
             for layer_name in args.input_names:
                 layer_shape = model_wrapper.get_input_layer_shape(inference_session, layer_name)
                 log.info(f'Shape for input layer {layer_name}: {layer_shape}')
+                input_shapes[layer_name] = layer_shape
+            report_writer.update_input_shapes(input_shapes)
 
         if args.input:
             log.info('Preparing input data')
@@ -388,33 +468,48 @@ def main():
             io.fill_unset_inputs(inference_session, log)
         except Exception:
             log.warning('Could not fill unset inputs')
+        io.set_input_binder(bind_ort_value)
 
         if args.task not in ['text-to-image']:
             if args.output_names is None:
                 outputs = inference_session.get_outputs()
                 args.output_names = [output.name for output in outputs]
 
-        log.info(f'Starting inference ({args.number_iter} iterations)')
-        result, inference_time, num_tokens = inference_onnx_runtime(
-            session_or_pipeline=inference_session,
-            task_type=args.task,
-            model_name=args.model_name,
-            output_names=args.output_names,
-            number_iter=args.number_iter,
-            get_slice=io.get_slice_input,
-            test_duration=args.time,
-            device=args.device)
-
+        if args.arrival_rate or args.arrival_trace:
+            log.info(f'Starting open-loop inference ({args.load_workers} workers)')
+            open_loop_results, max_rate_under_sla = inference_onnx_runtime_open_loop(inference_session, args,
+                                                                                     io.get_slice_input)
+            result, inference_time = None, open_loop_results['time_infer']
+        else:
+            log.info(f'Starting inference ({args.number_iter} iterations)')
+            result, inference_time, num_tokens = inference_onnx_runtime(
+                session_or_pipeline=inference_session,
+                task_type=args.task,
+                model_name=args.model_name,
+                output_names=args.output_names,
+                number_iter=args.number_iter,
+                get_slice=io.get_slice_input,
+                test_duration=args.time,
+                device=args.device)
+
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
         log.info('Computing performance metrics')
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
-                                                                      num_tokens=num_tokens)
+        if args.arrival_rate or args.arrival_trace:
+            inference_result = pp.calculate_performance_metrics_open_loop(args.batch_size, open_loop_results,
+                                                                          max_rate_under_sla, **get_warmup_results())
+        else:
+            inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                          num_tokens=num_tokens,
+                                                                          **get_loop_results())
 
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
         report_writer.write_report(args.report_path)
 
         if not args.raw_output:
-            if args.number_iter == 1:
+            if result is not None and args.number_iter == 1:
                 try:
                     log.info('Converting output tensor to print results')
                     result = prepare_output(result, args.output_names, args.model_name, args.task, args)
@@ -6,10 +6,12 @@ import cv2
 import numpy as np
 
 from pathlib import Path
-from time import time
+from time import perf_counter
 
 import postprocessing_data as pp
-from inference_tools.loop_tools import get_exec_time, loop_inference
+from inference_tools.argument_tools import add_input_data_arguments, add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import OpenCVIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -45,6 +47,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-d', '--device',
                         help='Specify the target device to infer on (CPU by default)',
                         default='CPU',
@@ -139,6 +142,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'opencv_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
     parser.add_argument('--time', required=False, default=0, type=int,
                         dest='time',
                         help='Optional. Time in seconds to execute topology.')
@@ -191,13 +195,13 @@ def inference_opencv(net, input_name, output_names, number_iter, get_slice, test
         slice_input = get_slice()
         load_images_to_network(net, slice_input[input_name])
         if output_names:
-            t0 = time()
+            t0 = perf_counter()
             result = net.forward(output_names)
-            t1 = time()
+            t1 = perf_counter()
         else:
-            t0 = time()
+            t0 = perf_counter()
             result = net.forward()
-            t1 = time()
+            t1 = perf_counter()
         time_infer.append(t1 - t0)
     else:
         loop_results = loop_inference(number_iter, test_duration)(inference_iteration)(get_slice, input_name, net,
@@ -262,6 +266,8 @@ def create_dict_for_wrapper(args):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='OpenCV', version=cv2.__version__)
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -276,13 +282,13 @@ def main():
         log.info('Loading network files:\n\t {0}\n\t {1}'.format(args.model, args.weights))
         if args.weights == '' or args.weights == 'none' or args.weights == 'None':
             args.weights = None
-        net = load_network(args.model, args.weights)
+        net, read_network_time = get_exec_time()(load_network)(args.model, args.weights)
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
 
         layer_name = model_wrapper.get_input_layer_names(net)
-        log.info('Shape for input layer {0}: {1}'.format(
-            layer_name,
-            model_wrapper.get_input_layer_shape(net, layer_name),
-        ))
+        input_shape = model_wrapper.get_input_layer_shape(net, layer_name)
+        log.info('Shape for input layer {0}: {1}'.format(layer_name, input_shape))
+        report_writer.update_input_shapes({layer_name: input_shape})
 
         log.info('The assign of the backend to infer')
         set_backend_to_infer(net, args.backend)
@@ -309,8 +315,12 @@ def main():
         result, inference_time = inference_opencv(
             net, args.input_name, args.output_names, args.number_iter, io.get_slice_input, args.time)
 
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
         log.info('Computing performance metrics')
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                      **get_loop_results())
 
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
@@ -5,15 +5,23 @@ import traceback
 import numpy as np
 
 from pathlib import Path
-from time import time
+from time import perf_counter_ns
 
 from openvino.runtime import AsyncInferQueue
 
 import postprocessing_data as pp
 from utils import (set_input_to_blobs, get_request_result, create_core, create_model,
-                   configure_model, get_input_shape, reshape_input, compile_model)
+                   configure_model, get_input_shape, reshape_input, compile_model, create_shared_tensor,
+                   is_loaded_from_cache)
 
+from compiled_model_cache import CompiledModelCache
 from io_adapter import IOAdapter
+from inference_tools.argument_tools import (add_compiled_model_cache_argument, add_input_data_arguments,
+                                            add_raw_timings_argument)
+from inference_tools.heartbeat_tools import heartbeat
+from inference_tools.loop_tools import NANOSECONDS_IN_SECOND, get_exec_time
+from inference_tools.memory_tools import record_memory
+from inference_tools.startup_tools import record_first_inference
 from io_model_wrapper import OpenVINOIOModelWrapper
 from reporter.report_writer import ReportWriter
 from transformer import OpenVINOTransformer
@@ -45,6 +53,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-r', '--requests',
                         help='A positive integer value of infer requests to be created.'
                              'Number of infer requests may be limited by device capabilities',
@@ -109,6 +118,12 @@ def cli_argument_parser():
                         default=1,
                         type=int,
                         dest='number_iter')
+    parser.add_argument('--time',
+                        help='Optional. Time in seconds to execute topology, '
+                             'requests are started until both number_iter and time are reached',
+                        default=0,
+                        type=int,
+                        dest='time')
     parser.add_argument('-nthreads', '--number_threads',
                         help='Number of threads to use for inference on the CPU. (Max by default)',
                         type=int,
@@ -160,26 +175,39 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'openvino_async_inference_report.json',
                         dest='report_path')
+    add_raw_timings_argument(parser, 'Optional. Path to .npy file to save raw latency of each request.')
+    add_compiled_model_cache_argument(parser)
     args = parser.parse_args()
 
     return args
 
 
-def infer_async(compiled_model, number_iter, num_request, get_slice):
+def infer_async(compiled_model, number_iter, num_request, get_slice, time_limit=0):
     result = None
+    latencies = []
     infer_queue = AsyncInferQueue(compiled_model, num_request)
+
+    def completion_callback(request, start_time):
+        # called from OpenVINO threads, list.append is atomic
+        latency = (perf_counter_ns() - start_time) / NANOSECONDS_IN_SECOND
+        latencies.append(latency)
+        record_first_inference(latency)
+        heartbeat('inference', len(latencies))
+
+    infer_queue.set_callback(completion_callback)
     iteration = 0
-    inference_time = time()
-    while iteration < max(number_iter, num_request):
+    time_limit_ns = time_limit * NANOSECONDS_IN_SECOND
+    inference_start = perf_counter_ns()
+    while iteration < max(number_iter, num_request) or perf_counter_ns() - inference_start < time_limit_ns:
         idle_id = infer_queue.get_idle_request_id()
         if idle_id < 0:
             infer_queue.wait(num_requests=1)
             idle_id = infer_queue.get_idle_request_id()
         set_input_to_blobs(infer_queue[idle_id], get_slice())
-        infer_queue.start_async()
+        infer_queue.start_async(userdata=perf_counter_ns())
         iteration += 1
     infer_queue.wait_all()
-    inference_time = time() - inference_time
+    inference_time = (perf_counter_ns() - inference_start) / NANOSECONDS_IN_SECOND
     if number_iter == 1:
         request_results = [get_request_result(request) for request in infer_queue]
         output_names = request_results[0].keys()
@@ -187,7 +215,7 @@ def infer_async(compiled_model, number_iter, num_request, get_slice):
         for key in result:
             result[key] = np.concatenate([result[key] for result in request_results], axis=0)
 
-    return result, inference_time
+    return result, inference_time, latencies
 
 
 def main():
@@ -212,11 +240,13 @@ def main():
             'async',
             log,
         )
-        model = create_model(core, args.model_xml, args.model_bin, log)
+        compiled_model_cache = CompiledModelCache.get_cache(args.compiled_model_cache_dir, 'openvino')
+        model, read_network_time = get_exec_time()(create_model)(core, args.model_xml, args.model_bin, log)
         configure_model(core, model, args.device, args.default_device, args.affinity)
         input_shapes = get_input_shape(model_wrapper, model)
         for layer in input_shapes:
             log.info('Shape for input layer {0}: {1}'.format(layer, input_shapes[layer]))
+        report_writer.update_input_shapes(input_shapes)
 
         reshape_input(model, args.batch_size)
 
@@ -225,9 +255,18 @@ def main():
             io.prepare_input(model, args.input)
         else:
             io.fill_unset_inputs(model, log)
+        io.set_input_binder(create_shared_tensor)
 
         log.info('Create executable network')
-        compiled_model = compile_model(core, model, args.device, args.priority)
+        compiled_model, compile_time = get_exec_time()(compile_model)(
+            core, model, args.device, args.priority,
+            compiled_model_cache.framework_dir if compiled_model_cache else None)
+        if compiled_model_cache:
+            compiled_model_cache.evict()
+        log.info(f'Model is read in {read_network_time:.3f} s, compiled in {compile_time:.3f} s')
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5),
+                                               compile_time=round(compile_time, 5),
+                                               compiled_model_cache_hit=is_loaded_from_cache(compiled_model))
 
         log.info('Runtime parameters')
         keys = core.get_property(args.device, 'SUPPORTED_PROPERTIES')
@@ -239,14 +278,21 @@ def main():
                 except BaseException:
                     pass
 
-        log.info(f'Starting inference ({args.number_iter} iterations) with {args.requests} requests on {args.device}')
-        result, time = infer_async(compiled_model, args.number_iter, args.requests, io.get_slice_input)
+        record_memory('model_load')
+        log.info(f'Starting inference ({args.number_iter} iterations or {args.time} seconds) '
+                 f'with {args.requests} requests on {args.device}')
+        result, time, latencies = infer_async(compiled_model, args.number_iter, args.requests, io.get_slice_input,
+                                              args.time)
 
+        if args.raw_timings_path:
+            log.info(f'Write raw request latencies to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, latencies)
         log.info('Computing performance metrics')
         inference_result = pp.calculate_performance_metrics_async_mode(time,
                                                                        args.batch_size,
-                                                                       args.number_iter)
-        report_writer.update_execution_results(**inference_result, iterations_num=args.number_iter)
+                                                                       len(latencies),
+                                                                       latencies)
+        report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
         report_writer.write_report(args.report_path)
 
@@ -8,8 +8,14 @@ from pathlib import Path
 import postprocessing_data as pp
 
 from utils import (set_input_to_blobs, get_request_result, create_core, create_model,
-                   configure_model, get_input_shape, reshape_input, compile_model)
-from inference_tools.loop_tools import loop_inference
+                   configure_model, get_input_shape, reshape_input, compile_model, create_shared_tensor,
+                   is_loaded_from_cache)
+from compiled_model_cache import CompiledModelCache
+from inference_tools.argument_tools import (add_compiled_model_cache_argument, add_input_data_arguments,
+                                            add_load_generator_arguments, add_measurement_arguments)
+from inference_tools.load_generator import read_arrival_trace, run_open_loop_inference, synchronized
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, get_warmup_results, loop_inference,
+                                        set_loop_parameters, set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import OpenVINOIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -42,6 +48,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-b', '--batch_size',
                         help='Size of the processed pack',
                         default=1,
@@ -150,6 +157,9 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'openvino_sync_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
+    add_compiled_model_cache_argument(parser)
+    add_load_generator_arguments(parser)
     parser.add_argument('--time', required=False, default=0, type=int,
                         dest='time',
                         help='Optional. Time in seconds to execute topology.')
@@ -169,6 +179,16 @@ def infer_sync(compiled_model, number_iter, get_slice, test_duration):
     return result, time_infer
 
 
+def infer_open_loop(compiled_model, args, get_slice):
+    # every worker has its own infer request
+    get_slice = synchronized(get_slice)
+    workers_args = [(get_slice, compiled_model.create_infer_request()) for _ in range(args.load_workers)]
+    trace = read_arrival_trace(args.arrival_trace) if args.arrival_trace else None
+    return run_open_loop_inference(inference_iteration, workers_args, args.number_iter, args.time,
+                                   args.arrival_rate, args.arrival_distribution, trace, args.latency_sla,
+                                   args.sla_percentile)
+
+
 def inference_iteration(get_slice, request):
     set_input_to_blobs(request, get_slice())
     exec_time = infer_slice(request)
@@ -183,6 +203,8 @@ def infer_slice(request):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='OpenVINO')
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -202,12 +224,14 @@ def main():
             'sync',
             log,
         )
-        model = create_model(core, args.model_xml, args.model_bin, log)
+        compiled_model_cache = CompiledModelCache.get_cache(args.compiled_model_cache_dir, 'openvino')
+        model, read_network_time = get_exec_time()(create_model)(core, args.model_xml, args.model_bin, log)
         configure_model(core, model, args.device, args.default_device, args.affinity)
         input_shapes = get_input_shape(model_wrapper, model)
 
         for layer in input_shapes:
             log.info('Shape for input layer {0}: {1}'.format(layer, input_shapes[layer]))
+        report_writer.update_input_shapes(input_shapes)
 
         reshape_input(model, args.batch_size)
 
@@ -216,22 +240,44 @@ def main():
             io.prepare_input(model, args.input)
         else:
             io.fill_unset_inputs(model, log)
+        io.set_input_binder(create_shared_tensor)
 
         log.info('Create executable network')
-        compiled_model = compile_model(core, model, args.device, args.priority)
+        compiled_model, compile_time = get_exec_time()(compile_model)(
+            core, model, args.device, args.priority,
+            compiled_model_cache.framework_dir if compiled_model_cache else None)
+        if compiled_model_cache:
+            compiled_model_cache.evict()
+        log.info(f'Model is read in {read_network_time:.3f} s, compiled in {compile_time:.3f} s')
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5),
+                                               compile_time=round(compile_time, 5),
+                                               compiled_model_cache_hit=is_loaded_from_cache(compiled_model))
 
-        log.info(f'Starting inference ({args.number_iter} iterations) on {args.device}')
-        result, inference_time = infer_sync(compiled_model, args.number_iter, io.get_slice_input, args.time)
+        if args.arrival_rate or args.arrival_trace:
+            log.info(f'Starting open-loop inference ({args.load_workers} workers) on {args.device}')
+            open_loop_results, max_rate_under_sla = infer_open_loop(compiled_model, args, io.get_slice_input)
+            result, inference_time = None, open_loop_results['time_infer']
+        else:
+            log.info(f'Starting inference ({args.number_iter} iterations) on {args.device}')
+            result, inference_time = infer_sync(compiled_model, args.number_iter, io.get_slice_input, args.time)
 
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
         log.info('Computing performance metrics')
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time, args.mininfer)
+        if args.arrival_rate or args.arrival_trace:
+            inference_result = pp.calculate_performance_metrics_open_loop(args.batch_size, open_loop_results,
+                                                                          max_rate_under_sla, **get_warmup_results())
+        else:
+            inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                          args.mininfer, **get_loop_results())
 
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
         report_writer.write_report(args.report_path)
 
         if not args.raw_output:
-            if args.number_iter == 1:
+            if result is not None and args.number_iter == 1:
                 try:
                     log.info('Inference results')
                     io.process_output(result, log)
@@ -7,8 +7,9 @@ import traceback
 
 import postprocessing_data as pp
 import preprocessing_data as prep
-from inference_tools.loop_tools import get_exec_time
-from inference_tools.loop_tools import loop_inference
+from inference_tools.argument_tools import add_input_data_arguments, add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import PaddlePaddleIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -38,6 +39,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-b', '--batch_size',
                         help='Size of the processed pack',
                         default=1,
@@ -110,6 +112,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'paddle_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
     parser.add_argument('--time', required=False, default=0, type=int,
                         dest='time',
                         help='Optional. Time in seconds to execute topology')
@@ -126,8 +129,9 @@ def inference_paddlepaddle(predictor, number_iter, get_slice, test_duration):
     input_info = predictor.get_input_names()
     outputs = predictor.get_output_names()
     if number_iter > 1:
-        time_infer, _ = loop_inference(number_iter, test_duration)(inference_iteration)(get_slice,
-                                                                                        input_info, predictor)
+        loop_results = loop_inference(number_iter, test_duration)(inference_iteration)(get_slice, input_info,
+                                                                                       predictor)
+        time_infer = loop_results['time_infer']
     else:
         exec_time = inference_iteration(get_slice, input_info, predictor)
         result = {}
@@ -164,6 +168,8 @@ def prepare_output(result, output_names, task):
 def main():
     try:
         args = cli_argument_parser()
+        set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+        set_loop_parameters(args.quiet, args.collect_rusage)
 
         report_writer = ReportWriter()
         report_writer.update_framework_info(name='PaddlePaddle', version=paddle_infer.get_version())
@@ -178,7 +184,9 @@ def main():
             config.enable_use_gpu(args.memory_pool_init_size_mb, 0)
         else:
             config.set_cpu_math_library_num_threads(args.number_threads)
-        predictor = paddle_infer.create_predictor(config)
+        # predictor creation reads and optimizes the model in one call
+        predictor, compile_time = get_exec_time()(paddle_infer.create_predictor)(config)
+        report_writer.update_execution_results(compile_time=round(compile_time, 5))
         args.input_shapes = prep.parse_input_arg(args.input_shapes, args.input_names)
         for name in predictor.get_input_names():
             predictor.get_input_handle(name).reshape(args.input_shapes[name])
@@ -200,7 +208,11 @@ def main():
         log.info(f'Starting inference ({args.number_iter} iterations)')
         result, inference_time = inference_paddlepaddle(predictor, args.number_iter, io.get_slice_input, args.time)
 
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
+        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                      **get_loop_results())
 
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
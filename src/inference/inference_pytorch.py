@@ -1,19 +1,24 @@
 import argparse
 import importlib
 import json
+import os
 import re
 import sys
 import traceback
 
 from functools import partial
 from pathlib import Path
-from time import time
+from time import perf_counter
 
 import torch
 
 import postprocessing_data as pp
 import preprocessing_data as prep
-from inference_tools.loop_tools import loop_inference, get_exec_time
+from compiled_model_cache import CompiledModelCache
+from inference_tools.argument_tools import (add_compiled_model_cache_argument, add_input_data_arguments,
+                                            add_measurement_arguments)
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import PyTorchIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -66,6 +71,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-in', '--input_names',
                         help='Names of the input tensors',
                         required=False,
@@ -183,6 +189,8 @@ def cli_argument_parser():
                         default=Path(__file__).parent / 'pytorch_inference_report.json',
                         dest='report_path',
                         help='Path to json benchmark report path, default: ./pytorch_inference_report.json')
+    add_measurement_arguments(parser)
+    add_compiled_model_cache_argument(parser)
     parser.add_argument('--time', required=False, default=0, type=int,
                         dest='time',
                         help='Optional. Time in seconds to execute topology.')
@@ -279,6 +287,18 @@ def load_model_from_config(model_name, model_config, module, weights, device='cp
         return model, custom_compile_func, custom_trace_func
 
 
+def set_compiled_model_cache(compiled_model_cache):
+    # torch.compile compiles lazily at the first inference, inductor reuses compiled graphs and kernels of the
+    # previous runs from its cache directories. They are keyed by graph, inputs, torch version and device by torch
+    os.environ['TORCHINDUCTOR_CACHE_DIR'] = str(compiled_model_cache.framework_dir / 'inductor')
+    os.environ['TRITON_CACHE_DIR'] = str(compiled_model_cache.framework_dir / 'triton')
+    try:
+        import torch._inductor.config as inductor_config
+        inductor_config.fx_graph_cache = True
+    except (ImportError, AttributeError):
+        log.warning(f'FX graph cache is not supported by PyTorch {get_torch_version()}')
+
+
 def compile_model(model, device, model_type, shapes, input_type, tensor_rt_dtype, precision, compile_backend,
                   custom_compile_func, custom_trace_func):
     if model_type == 'baseline':
@@ -402,7 +422,7 @@ def inference_pytorch(model, num_iterations, task_type, get_slice, input_names,
             if task_type in ['classification', 'feedforward', 'yolo_v7']:
                 inputs = [torch.tensor(get_slice()[input_name], device=device) for input_name in input_names]
 
-            t0 = time()
+            t0 = perf_counter()
 
             if task_type in ['classification', 'feedforward']:
                 output = torch.nn.functional.softmax(model(*inputs), dim=1).to('cpu')
@@ -444,7 +464,7 @@ def inference_pytorch(model, num_iterations, task_type, get_slice, input_names,
                 num_tokens.extend(get_meaning_tokens_from_batch(generated_output, input_size, dot_token=2))
                 log.info(f'Generated tokens num: {num_tokens}')
 
-            t1 = time()
+            t1 = perf_counter()
             time_infer.append(t1 - t0)
         else:
             # several decorator calls in order to use variables as decorator parameters
@@ -568,6 +588,8 @@ def prepare_output(result, output_names, task_type):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='PyTorch', version=get_torch_version())
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -610,8 +632,12 @@ def main():
         set_thread_num(args.num_inter_threads, args.num_intra_threads)
 
         device = get_device_to_infer(args.device)
+        compiled_model_cache = CompiledModelCache.get_cache(args.compiled_model_cache_dir, 'pytorch')
+        if compiled_model_cache:
+            set_compiled_model_cache(compiled_model_cache)
         custom_compile_func = None
         custom_trace_func = None
+        t0 = perf_counter()
         if args.model is not None:
             model_type = 'scripted'
             model = load_model_from_file(args.model)
@@ -640,7 +666,9 @@ def main():
             else:
                 model = load_model_from_module(model_name=args.model_name, module=args.module,
                                                weights=args.weights, device=args.device)
+        read_network_time = perf_counter() - t0
 
+        t0 = perf_counter()
         if args.task not in ['text-translation'] and (args.num_gpu_devices is None or args.num_gpu_devices == 1):
             compiled_model = compile_model(model=model, device=device, model_type=model_type,
                                            shapes=args.input_shapes, input_type=args.input_type,
@@ -651,11 +679,20 @@ def main():
                                            custom_trace_func=custom_trace_func)
         else:
             compiled_model = model
+        compile_time = perf_counter() - t0
+        if compiled_model_cache:
+            compiled_model_cache.evict()
+        log.info(f'Model is loaded in {read_network_time:.3f} s, compiled in {compile_time:.3f} s')
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5),
+                                               compile_time=round(compile_time, 5))
 
         if args.task in ['classification', 'feedforward']:
+            input_shapes = {}
             for layer_name in args.input_names:
                 layer_shape = model_wrapper.get_input_layer_shape(args.model, layer_name)
                 log.info(f'Shape for input layer {layer_name}: {layer_shape}')
+                input_shapes[layer_name] = layer_shape
+            report_writer.update_input_shapes(input_shapes)
 
         if args.input:
             log.info(f'Preparing input data: {args.input}')
@@ -674,11 +711,15 @@ def main():
             task_type=args.task,
         )
 
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
         log.info('Computing performance metrics')
         inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
                                                                       num_tokens=num_tokens,
                                                                       audios_lengths=audios_lengths,
-                                                                      audio_sampling_rate=audio_sampling_rate)
+                                                                      audio_sampling_rate=audio_sampling_rate,
+                                                                      **get_loop_results())
         report_writer.update_execution_results(**inference_result)
 
         log.info(f'Write report to {args.report_path}')
@@ -7,7 +7,9 @@ import spektral
 import tensorflow as tf
 
 import postprocessing_data as pp
-from inference_tools.loop_tools import loop_inference, get_exec_time
+from inference_tools.argument_tools import add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from reporter.report_writer import ReportWriter
 import spektral_auxiliary
 
@@ -48,6 +50,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'sp_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
     parser.add_argument('--raw_output',
                         help='Raw output without logs',
                         default=False,
@@ -127,6 +130,8 @@ def infer_slice(model, slice_input):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='Spektral', version=spektral.__version__)
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -146,13 +151,18 @@ def main():
                     f' tensorflow will use NVIDIA_GPU by default')
 
     io = spektral_auxiliary.SpektralIO.get_io_adapter(args, None, None)
-    model = model_load(Path(args.model_path))
+    model, read_network_time = get_exec_time()(model_load)(Path(args.model_path))
+    report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
     io.prepare_input(model, args.input)
 
     result, inference_time = inference_spektral(model, args.number_iter, io.get_slice_input, args.time)
 
+    if args.raw_timings_path:
+        log.info(f'Write raw inference times to {args.raw_timings_path}')
+        pp.save_raw_timings(args.raw_timings_path, inference_time)
     log.info('Computing performance metrics')
-    inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+    inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                  **get_loop_results())
 
     report_writer.update_execution_results(**inference_result)
     log.info(f'Writing report to {args.report_path}')
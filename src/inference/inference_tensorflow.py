@@ -8,7 +8,9 @@ import tensorflow as tf
 from tensorflow.python.saved_model import signature_constants
 
 import postprocessing_data as pp
-from inference_tools.loop_tools import loop_inference, get_exec_time
+from inference_tools.argument_tools import add_input_data_arguments, add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import TensorFlowIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -38,6 +40,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-b', '--batch_size',
                         help='Size of the processed pack',
                         default=1,
@@ -135,6 +138,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'tf_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
     parser.add_argument('--time',
                         required=False,
                         default=0,
@@ -249,6 +253,8 @@ def create_dict_for_transformer(args):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='TensorFlow', version=tf.__version__)
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -282,11 +288,12 @@ def main():
     log.info(f'Loading network files:\n\t {args.model_path}')
     model_path = model_path.parent if model_path.name == 'saved_model.pb' else model_path
 
-    model, _ = load_model(model_path,
-                          input_names=input_op_name,
-                          output_names=output_names,
-                          const_inputs=[],
-                          log=log)
+    (model, _), read_network_time = get_exec_time()(load_model)(model_path,
+                                                                input_names=input_op_name,
+                                                                output_names=output_names,
+                                                                const_inputs=[],
+                                                                log=log)
+    report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
 
     signature_key = signature_constants.DEFAULT_SERVING_SIGNATURE_DEF_KEY
     func = model._backref_to_saved_model.signatures[signature_key]
@@ -296,6 +303,7 @@ def main():
 
     for layer in input_shapes:
         log.info('Shape for input layer {0}: {1}'.format(layer, input_shapes[layer]))
+    report_writer.update_input_shapes(input_shapes)
 
     if args.input:
         log.info(f'Preparing input data: {args.input}')
@@ -310,8 +318,12 @@ def main():
     result, inference_time = inference_tensorflow(model, args.number_iter,
                                                   io.get_slice_input, args.time)
 
+    if args.raw_timings_path:
+        log.info(f'Write raw inference times to {args.raw_timings_path}')
+        pp.save_raw_timings(args.raw_timings_path, inference_time)
     log.info('Computing performance metrics')
-    inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+    inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                  **get_loop_results())
 
     report_writer.update_execution_results(**inference_result)
     log.info(f'Write report to {args.report_path}')
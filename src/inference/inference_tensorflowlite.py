@@ -6,8 +6,9 @@ from pathlib import Path
 
 import postprocessing_data as pp
 import preprocessing_data as prep
-from inference_tools.loop_tools import get_exec_time
-from inference_tools.loop_tools import loop_inference
+from inference_tools.argument_tools import add_input_data_arguments, add_measurement_arguments
+from inference_tools.loop_tools import (get_exec_time, get_loop_results, loop_inference, set_loop_parameters,
+                                        set_warmup_parameters)
 from io_adapter import IOAdapter
 from io_model_wrapper import TensorFlowLiteIOModelWrapper
 from reporter.report_writer import ReportWriter
@@ -41,6 +42,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('-b', '--batch_size',
                         help='Size of the processed pack',
                         default=1,
@@ -140,6 +142,7 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'tflite_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
     parser.add_argument('--time', required=False, default=0, type=int,
                         dest='time',
                         help='Optional. Time in seconds to execute topology.')
@@ -244,6 +247,8 @@ def prepare_output(result, output_names, task):
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_framework_info(name='TF-Lite')
     report_writer.update_configuration_setup(batch_size=args.batch_size,
@@ -259,7 +264,9 @@ def main():
             delegate = load_delegates(args.delegate_ext, args.delegate_options)
 
         log.info(f'Loading network files:\n\t {args.model_path}')
-        interpreter = load_network(tflite, args.model_path, args.number_threads, delegate)
+        interpreter, read_network_time = get_exec_time()(load_network)(tflite, args.model_path, args.number_threads,
+                                                                       delegate)
+        report_writer.update_execution_results(read_network_time=round(read_network_time, 5))
 
         args.input_names = model_wrapper.get_input_layer_names(interpreter)
 
@@ -274,6 +281,7 @@ def main():
         input_shapes = get_input_shape(model_wrapper, interpreter)
         for layer in input_shapes:
             log.info(f'Shape for input layer {layer}: {input_shapes[layer]}')
+        report_writer.update_input_shapes(input_shapes)
 
         if args.input and args.input != ['None']:
             log.info(f'Preparing input data: {args.input}')
@@ -285,7 +293,11 @@ def main():
         log.info(f'Starting inference ({args.number_iter} iterations)')
         result, inference_time = inference_tflite(interpreter, args.number_iter, io.get_slice_input, args.time)
 
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time)
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, inference_time)
+        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, inference_time,
+                                                                      **get_loop_results())
 
         report_writer.update_execution_results(**inference_result)
         log.info(f'Write report to {args.report_path}')
@@ -0,0 +1,122 @@
+"""
+Command line arguments shared by inference launchers, the benchmark passes them to every launcher in the same way.
+"""
+from pathlib import Path
+
+from .load_generator import ARRIVAL_DISTRIBUTIONS
+
+RAW_TIMINGS_HELP = 'Optional. Path to .npy file to save raw inference time of each iteration.'
+
+
+def add_input_data_arguments(parser):
+    """Input data preparation of io_adapter.py"""
+    parser.add_argument('--max_input_images',
+                        help='Optional. Maximum number of images taken from the input directory. '
+                             'Images are sampled deterministically.',
+                        type=int,
+                        default=None,
+                        dest='max_input_images')
+    parser.add_argument('--input_cache_dir',
+                        help='Optional. Directory to cache decoded and preprocessed input data '
+                             'shared between launches.',
+                        type=Path,
+                        default=None,
+                        dest='input_cache_dir')
+
+
+def add_raw_timings_argument(parser, help_message=RAW_TIMINGS_HELP):
+    parser.add_argument('--raw_timings_path',
+                        type=Path,
+                        default=None,
+                        dest='raw_timings_path',
+                        help=help_message)
+
+
+def add_warmup_arguments(parser):
+    """Warm-up of loop_inference, launchers pass the values to set_warmup_parameters"""
+    parser.add_argument('--warmup_iters',
+                        type=int,
+                        default=0,
+                        dest='warmup_iters',
+                        help='Optional. Minimal number of warm-up iterations, excluded from performance metrics.')
+    parser.add_argument('--warmup_time',
+                        type=float,
+                        default=0,
+                        dest='warmup_time',
+                        help='Optional. Minimal warm-up time in seconds.')
+    parser.add_argument('--steady_state_cv',
+                        type=float,
+                        default=None,
+                        dest='steady_state_cv',
+                        help='Optional. Continue warm-up until the coefficient of variation of the last '
+                             'iterations times is less than this value.')
+    parser.add_argument('--steady_state_max_time',
+                        type=float,
+                        default=60,
+                        dest='steady_state_max_time',
+                        help='Optional. Maximal warm-up time in seconds when --steady_state_cv is set.')
+
+
+def add_loop_arguments(parser):
+    """Output and counters of loop_inference, launchers pass the values to set_loop_parameters"""
+    parser.add_argument('--quiet',
+                        action='store_true',
+                        dest='quiet',
+                        help='Optional. Do not print the progress of inference.')
+    parser.add_argument('--collect_rusage',
+                        action='store_true',
+                        dest='collect_rusage',
+                        help='Optional. Collect CPU time and context switches of every measured iteration.')
+
+
+def add_measurement_arguments(parser):
+    """Measurements of synchronous launchers using loop_inference"""
+    add_raw_timings_argument(parser)
+    add_warmup_arguments(parser)
+    add_loop_arguments(parser)
+
+
+def add_compiled_model_cache_argument(parser):
+    parser.add_argument('--compiled_model_cache_dir',
+                        type=Path,
+                        default=None,
+                        dest='compiled_model_cache_dir',
+                        help='Optional. Directory of compiled models shared by tests and runs.')
+
+
+def add_load_generator_arguments(parser):
+    """Open-loop inference of load_generator.py"""
+    parser.add_argument('--arrival_rate',
+                        type=float,
+                        default=None,
+                        dest='arrival_rate',
+                        help='Optional. Requests per second of the open-loop inference. Requests arrive '
+                             'independently of the completion of previous ones and wait for a free worker.')
+    parser.add_argument('--arrival_distribution',
+                        type=str,
+                        choices=ARRIVAL_DISTRIBUTIONS,
+                        default='poisson',
+                        dest='arrival_distribution',
+                        help='Optional. Distribution of inter-arrival times of the open-loop inference.')
+    parser.add_argument('--arrival_trace',
+                        type=Path,
+                        default=None,
+                        dest='arrival_trace',
+                        help='Optional. Text file with inter-arrival times in seconds, one per line, replacing '
+                             'the distribution. Times are scaled to --arrival_rate if it is set.')
+    parser.add_argument('--load_workers',
+                        type=int,
+                        default=1,
+                        dest='load_workers',
+                        help='Optional. Number of requests served concurrently in the open-loop inference.')
+    parser.add_argument('--latency_sla',
+                        type=float,
+                        default=None,
+                        dest='latency_sla',
+                        help='Optional. Search the maximal arrival rate at which the latency percentile '
+                             '(seconds) is not greater than this value.')
+    parser.add_argument('--sla_percentile',
+                        type=float,
+                        default=99,
+                        dest='sla_percentile',
+                        help='Optional. Latency percentile of --latency_sla.')
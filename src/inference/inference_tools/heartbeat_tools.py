@@ -0,0 +1,41 @@
+"""
+Heartbeats of the launcher: the current phase and the number of completed iterations are written to the file set
+by the benchmark, the benchmark kills the launcher that makes no progress within the stall timeout of the phase.
+"""
+import os
+import threading
+from time import time
+
+# the benchmark sets the path of the heartbeat file in this environment variable
+HEARTBEAT_PATH_ENV = 'DLI_HEARTBEAT_PATH'
+# heartbeats of the same phase are written at most once per period in seconds, the file is not rewritten
+# on every iteration of short inferences
+HEARTBEAT_PERIOD = 1.0
+
+# completion callbacks of asynchronous launchers beat from inference threads
+_heartbeat_lock = threading.Lock()
+_last_heartbeat = {'phase': None, 'time': 0.0}
+
+
+def heartbeat(phase, iteration=0):
+    """
+    Report the progress of the launcher
+    :param phase: 'load' after import of the framework, 'warmup', 'inference' or 'report'
+    :param iteration: number of completed iterations of the phase
+    """
+    now = time()
+    if phase == _last_heartbeat['phase'] and now - _last_heartbeat['time'] < HEARTBEAT_PERIOD:
+        return
+    heartbeat_path = os.environ.get(HEARTBEAT_PATH_ENV)
+    if not heartbeat_path:
+        return
+    with _heartbeat_lock:
+        _last_heartbeat.update(phase=phase, time=now)
+        temporary_path = f'{heartbeat_path}.{os.getpid()}'
+        try:
+            with open(temporary_path, 'w') as heartbeat_file:
+                heartbeat_file.write(f'{phase} {iteration}')
+            # the benchmark never reads a partially written heartbeat
+            os.replace(temporary_path, heartbeat_path)
+        except OSError:
+            pass
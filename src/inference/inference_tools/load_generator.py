@@ -0,0 +1,216 @@
+"""
+Open-loop load generator. Requests arrive at the target rate independently of the completion of previous ones
+and wait in the queue of the worker pool, so latency of a request includes its queueing time.
+"""
+import math
+import queue
+import threading
+from functools import wraps
+from time import perf_counter, sleep
+
+import numpy as np
+
+from .loop_tools import get_loop_parameters, get_result_exec_time, run_configured_warmup, wait_start_barrier
+from .heartbeat_tools import heartbeat
+from .memory_tools import start_allocation_tracing, stop_allocation_tracing
+
+# inter-arrival times of the trace are used instead of the distribution if the trace is set
+ARRIVAL_DISTRIBUTIONS = ('poisson', 'uniform')
+# maximal number of open-loop runs of the maximal rate search
+MAX_RATE_SEARCH_RUNS = 12
+# relative width of the rate interval at which the maximal rate search stops
+MAX_RATE_SEARCH_PRECISION = 0.05
+
+
+def read_arrival_trace(path):
+    """
+    Inter-arrival times in seconds, one value per line
+    """
+    with open(path) as trace_file:
+        intervals = [float(line) for line in trace_file if line.strip()]
+    if not intervals or min(intervals) < 0 or sum(intervals) <= 0:
+        raise ValueError(f'Arrival trace {path} must contain non-negative inter-arrival times')
+    return intervals
+
+
+def get_arrival_times(requests_count, arrival_rate=None, distribution='poisson', trace=None, seed=0):
+    """
+    Arrival times of requests in seconds from the start of the run
+    :param arrival_rate: requests per second, trace intervals are scaled to this mean rate if it is set
+    :param trace: inter-arrival times of the trace distribution, repeated if the trace is shorter than the run
+    """
+    if distribution == 'trace':
+        intervals = np.resize(np.asarray(trace, dtype=np.float64), requests_count)
+        if arrival_rate:
+            intervals *= len(trace) / sum(trace) / arrival_rate
+    elif distribution == 'poisson':
+        intervals = np.random.default_rng(seed).exponential(1 / arrival_rate, requests_count)
+    elif distribution == 'uniform':
+        intervals = np.full(requests_count, 1 / arrival_rate)
+    else:
+        raise ValueError(f'Unknown arrival distribution {distribution}')
+    return np.cumsum(intervals) - intervals[0]
+
+
+def synchronized(func):
+    """
+    Serialize calls of the function shared by workers, ex. input slicing of IO adapter
+    """
+    lock = threading.Lock()
+
+    @wraps(func)
+    def f_synchronized(*args, **kwargs):
+        with lock:
+            return func(*args, **kwargs)
+
+    return f_synchronized
+
+
+def open_loop_inference(arrival_times, workers_args, warmup=True, quiet=None):
+    """
+    Run inference_func on requests arriving at arrival_times by the pool of workers
+    :param arrival_times: arrival times in seconds from the start of the run
+    :param workers_args: arguments of inference_func for every worker, ex. its own infer request,
+                         the first ones are used for warm-up set by set_warmup_parameters
+    :param warmup: run warm-up before the requests, repeated runs of the rate search are warmed up once
+    :param quiet: do not print the progress. Value set by set_loop_parameters is used if None
+    """
+    if quiet is None:
+        quiet = get_loop_parameters()['quiet']
+
+    def deco_open_loop_inference(inference_func):
+        @wraps(inference_func)
+        def f_open_loop_inference():
+            requests = queue.Queue()
+            latencies = [[] for _ in workers_args]
+            service_times = [[] for _ in workers_args]
+            errors = []
+
+            warmup_time_infer, steady_state_reached = [], None
+            if warmup:
+                warmup_time_infer, steady_state_reached = run_configured_warmup(inference_func, workers_args[0], {})
+            wait_start_barrier()
+            allocation_tracing = start_allocation_tracing()
+            if not quiet:
+                print(f'start open-loop inference of {len(arrival_times)} requests by {len(workers_args)} workers')
+
+            def serve(worker_index):
+                while True:
+                    arrival_time = requests.get()
+                    if arrival_time is None:
+                        return
+                    try:
+                        exec_time = get_result_exec_time(inference_func(*workers_args[worker_index]))
+                    except Exception as ex:
+                        errors.append(ex)
+                        return
+                    if exec_time > 0:
+                        latencies[worker_index].append(perf_counter() - arrival_time)
+                        service_times[worker_index].append(exec_time)
+                    heartbeat('inference', len(latencies[worker_index]))
+
+            workers = [threading.Thread(target=serve, args=(index,), daemon=True)
+                       for index in range(len(workers_args))]
+            for worker in workers:
+                worker.start()
+            start_time = perf_counter()
+            for arrival_offset in arrival_times:
+                delay = start_time + arrival_offset - perf_counter()
+                if delay > 0:
+                    sleep(delay)
+                # latency is counted from the scheduled arrival, a late dispatch is not hidden
+                requests.put(start_time + arrival_offset)
+                if errors:
+                    break
+            for _ in workers:
+                requests.put(None)
+            for worker in workers:
+                worker.join()
+            duration = perf_counter() - start_time
+            if allocation_tracing:
+                stop_allocation_tracing(len(arrival_times))
+            if errors:
+                raise errors[0]
+
+            return {'time_infer': [latency for worker_latencies in latencies for latency in worker_latencies],
+                    'service_time_infer': [time for worker_times in service_times for time in worker_times],
+                    'warmup_time_infer': warmup_time_infer,
+                    'steady_state_reached': steady_state_reached,
+                    'duration': duration,
+                    'arrival_rate': (len(arrival_times) - 1) / arrival_times[-1] if arrival_times[-1] > 0 else None}
+
+        return f_open_loop_inference
+
+    return deco_open_loop_inference
+
+
+def meets_latency_sla(results, latency_sla, sla_percentile):
+    return bool(results['time_infer']) and np.percentile(results['time_infer'], sla_percentile) <= latency_sla
+
+
+def find_max_arrival_rate(run_at_rate, initial_rate, latency_sla, sla_percentile=99,
+                          max_runs=MAX_RATE_SEARCH_RUNS, precision=MAX_RATE_SEARCH_PRECISION):
+    """
+    Maximal arrival rate at which the latency percentile meets SLA. The rate is doubled or halved from
+    initial_rate until SLA bounds are found, then the interval is bisected
+    :param run_at_rate: function running open-loop inference at the rate and returning its results
+    :return: maximal rate and results of its run, None and results of the last run if SLA is never met
+    """
+    low, high = None, None
+    best_results, last_results = None, None
+    rate = initial_rate
+    for _ in range(max_runs):
+        last_results = run_at_rate(rate)
+        if meets_latency_sla(last_results, latency_sla, sla_percentile):
+            low, best_results = rate, last_results
+        else:
+            high = rate
+        if low is not None and high is not None and (high - low) / high <= precision:
+            break
+        if high is None:
+            rate *= 2
+        elif low is None:
+            rate /= 2
+        else:
+            rate = (low + high) / 2
+    return (low, best_results) if low is not None else (None, last_results)
+
+
+def get_requests_count(iter_count, test_duration, arrival_rate):
+    return max(iter_count, math.ceil(arrival_rate * test_duration), 2)
+
+
+def run_open_loop_inference(inference_func, workers_args, iter_count, test_duration, arrival_rate=None,
+                            distribution='poisson', trace=None, latency_sla=None, sla_percentile=99, quiet=None):
+    """
+    Open-loop inference at the arrival rate or, if latency_sla is set, at the maximal rate meeting SLA
+    :param iter_count: minimal number of requests of every run
+    :param test_duration: minimal duration of every run in seconds at the target arrival rate
+    :param arrival_rate: requests per second, the mean rate of the trace is used if None
+    :param trace: inter-arrival times replacing the distribution
+    :param latency_sla: maximal latency percentile in seconds
+    :param quiet: do not print the progress. Value set by set_loop_parameters is used if None
+    :return: results of the reported run and the maximal rate under SLA (None if SLA is not set or never met)
+    """
+    if quiet is None:
+        quiet = get_loop_parameters()['quiet']
+    if not arrival_rate and not trace:
+        raise ValueError('Arrival rate is required for the open-loop inference without arrival trace')
+    initial_rate = arrival_rate or len(trace) / sum(trace)
+    distribution = 'trace' if trace else distribution
+    runs_count = 0
+
+    def run_at_rate(rate):
+        nonlocal runs_count
+        requests_count = get_requests_count(iter_count, test_duration, rate)
+        arrival_times = get_arrival_times(requests_count, rate, distribution, trace, seed=runs_count)
+        runs_count += 1
+        if not quiet and latency_sla is not None:
+            print(f'open-loop run at {rate:.3f} requests per second')
+        return open_loop_inference(arrival_times, workers_args, warmup=(runs_count == 1), quiet=quiet)(
+            inference_func)()
+
+    if latency_sla is None:
+        return run_at_rate(initial_rate), None
+    max_rate, results = find_max_arrival_rate(run_at_rate, initial_rate, latency_sla, sla_percentile)
+    return results, max_rate
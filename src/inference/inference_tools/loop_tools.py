@@ -1,26 +1,229 @@
+import os
 from functools import wraps
-from time import time
+from pathlib import Path
+from statistics import mean, pstdev
+from time import perf_counter_ns, sleep
 
+from .heartbeat_tools import heartbeat
+from .memory_tools import record_memory, start_allocation_tracing, stop_allocation_tracing
+from .startup_tools import record_first_inference
+
+try:
+    import resource
+except ImportError:
+    # resource module is unavailable on Windows
+    resource = None
+
+NANOSECONDS_IN_SECOND = 1e9
+PROGRESS_PERIOD_NS = 10 ** 9
+# number of last warm-up iterations used to compute the coefficient of variation in the steady-state mode
+STEADY_STATE_WINDOW = 10
+DEFAULT_STEADY_STATE_MAX_TIME = 60
+# instances of multi-instance test start measurements together, the benchmark sets the barrier folder
+# and the number of instances in these environment variables
+START_BARRIER_ENV = 'DLI_START_BARRIER'
+START_BARRIER_PARTIES_ENV = 'DLI_START_BARRIER_PARTIES'
+START_BARRIER_TIMEOUT = 600
+START_BARRIER_POLL_PERIOD = 0.001
+
+# launchers set warm-up once from the command line, loop_inference calls get it without passing through every
+# inference function
+_warmup_parameters = {
+    'warmup_iters': 0,
+    'warmup_time': 0,
+    'steady_state_cv': None,
+    'steady_state_max_time': DEFAULT_STEADY_STATE_MAX_TIME,
+}
+_warmup_results = {
+    'warmup_time_infer': [],
+    'steady_state_reached': None,
+}
+_loop_parameters = {
+    'quiet': False,
+    'collect_rusage': False,
+}
+_rusage_results = {
+    'cpu_time': [],
+    'context_switches': [],
+}
+
+
+def get_rusage_counters():
+    """
+    CPU time in seconds and number of context switches of the whole process, None if unsupported by the OS
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime, usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def set_warmup_parameters(warmup_iters=0, warmup_time=0, steady_state_cv=None,
+                          steady_state_max_time=DEFAULT_STEADY_STATE_MAX_TIME):
+    """
+    Set warm-up of the following loop_inference calls
+    :param warmup_iters: minimal number of warm-up iterations
+    :param warmup_time: minimal sum of warm-up execution times in seconds
+    :param steady_state_cv: continue warm-up until the coefficient of variation of the last STEADY_STATE_WINDOW
+                            execution times is less than this value
+    :param steady_state_max_time: maximal sum of warm-up execution times in seconds for the steady-state mode
+    """
+    _warmup_parameters.update(warmup_iters=warmup_iters or 0, warmup_time=warmup_time or 0,
+                              steady_state_cv=steady_state_cv,
+                              steady_state_max_time=steady_state_max_time or DEFAULT_STEADY_STATE_MAX_TIME)
+
+
+def get_warmup_results():
+    """
+    Warm-up execution times of the last loop_inference call and whether the steady state was reached
+    (None if the steady-state mode is off)
+    """
+    return dict(_warmup_results)
+
+
+def set_loop_parameters(quiet=False, collect_rusage=False):
+    """
+    Set output and counters of the following loop_inference calls
+    :param quiet: do not print the progress
+    :param collect_rusage: collect CPU time and context switches of every measured iteration
+    """
+    _loop_parameters.update(quiet=bool(quiet), collect_rusage=bool(collect_rusage))
+
+
+def get_loop_parameters():
+    """
+    Output and counters set by set_loop_parameters
+    """
+    return dict(_loop_parameters)
+
+
+def get_loop_results():
+    """
+    Warm-up results and CPU time and context switches of measured iterations of the last loop_inference call,
+    keyword arguments of calculate_performance_metrics_sync_mode
+    """
+    return {**_warmup_results, **_rusage_results}
+
+
+def is_steady_state(time_infer, steady_state_cv, window=STEADY_STATE_WINDOW):
+    if len(time_infer) < window:
+        return False
+    last_times = time_infer[-window:]
+    return pstdev(last_times) < steady_state_cv * mean(last_times)
+
+
+def warmup_inference(inference_func, args, kwargs, warmup_iters, warmup_time, steady_state_cv, steady_state_max_time):
+    warmup_time_infer = []
+    warmup_duration = 0
+    iteration = 0
+    steady_state_reached = None
+    while iteration < warmup_iters or warmup_duration < warmup_time:
+        exec_time = get_result_exec_time(inference_func(*args, **kwargs))
+        if iteration == 0:
+            record_first_inference(exec_time)
+        if exec_time > 0:
+            warmup_time_infer.append(exec_time)
+            warmup_duration += exec_time
+        iteration += 1
+        heartbeat('warmup', iteration)
+    if steady_state_cv is not None:
+        steady_state_reached = is_steady_state(warmup_time_infer, steady_state_cv)
+        while not steady_state_reached and warmup_duration < steady_state_max_time:
+            exec_time = get_result_exec_time(inference_func(*args, **kwargs))
+            if exec_time > 0:
+                warmup_time_infer.append(exec_time)
+                warmup_duration += exec_time
+            steady_state_reached = is_steady_state(warmup_time_infer, steady_state_cv)
+            heartbeat('warmup', len(warmup_time_infer))
+    return warmup_time_infer, steady_state_reached
+
+
+def wait_start_barrier(timeout=START_BARRIER_TIMEOUT):
+    """
+    Wait until all instances of multi-instance test arrive at the start of measurements. Every instance
+    creates its file in the barrier folder, repeated calls of the process return immediately
+    """
+    barrier_folder = os.environ.get(START_BARRIER_ENV)
+    if not barrier_folder:
+        return
+    parties = int(os.environ.get(START_BARRIER_PARTIES_ENV, 1))
+    barrier_folder = Path(barrier_folder)
+    barrier_folder.mkdir(parents=True, exist_ok=True)
+    (barrier_folder / str(os.getpid())).touch()
+    deadline = perf_counter_ns() + timeout * NANOSECONDS_IN_SECOND
+    while len(list(barrier_folder.iterdir())) < parties:
+        if perf_counter_ns() > deadline:
+            raise TimeoutError(f'Instances have not arrived at the start barrier in {timeout} seconds')
+        heartbeat('barrier')
+        sleep(START_BARRIER_POLL_PERIOD)
+
+
+def run_configured_warmup(inference_func, args, kwargs, warmup_iters=None):
+    """
+    Warm-up set by set_warmup_parameters, its results are returned by get_warmup_results
+    :param warmup_iters: minimal number of warm-up iterations replacing the configured one if not None
+    """
+    warmup_parameters = dict(_warmup_parameters)
+    if warmup_iters is not None:
+        warmup_parameters['warmup_iters'] = warmup_iters
+    record_memory('model_load')
+    warmup_time_infer, steady_state_reached = warmup_inference(inference_func, args, kwargs, **warmup_parameters)
+    _warmup_results.update(warmup_time_infer=warmup_time_infer, steady_state_reached=steady_state_reached)
+    record_memory('warmup')
+    return warmup_time_infer, steady_state_reached
+
+
+def loop_inference(iter_count, test_duration, warmup_iters=None, quiet=None, collect_rusage=None):
+    """
+    Run inference_func iter_count times or while the sum of execution times is less than test_duration seconds
+    :param warmup_iters: minimal number of iterations before the measured ones, their times are excluded
+                         from time_infer. Warm-up set by set_warmup_parameters is used if None
+    :param quiet: do not print the progress. Value set by set_loop_parameters is used if None
+    :param collect_rusage: collect CPU time and context switches of every measured iteration. Value set
+                           by set_loop_parameters is used if None
+    """
+    if quiet is None:
+        quiet = _loop_parameters['quiet']
+    if collect_rusage is None:
+        collect_rusage = _loop_parameters['collect_rusage']
+    collect_rusage = collect_rusage and resource is not None
 
-def loop_inference(iter_count, test_duration):
     def deco_loop_inference(inference_func):
         @wraps(inference_func)
         def f_loop_inference(*args, **kwargs):
             infer_duration = 0
             iteration = 1
             time_infer = []
+            cpu_time = []
+            context_switches = []
             num_tokens = []
             audios_lengths = []
             audio_sampling_rate = None
 
-            print(f'start inference max {iter_count} iterations or {test_duration} seconds')
+            if not quiet:
+                print(f'start inference max {iter_count} iterations or {test_duration} seconds')
 
+            warmup_time_infer, steady_state_reached = run_configured_warmup(inference_func, args, kwargs,
+                                                                            warmup_iters)
+            if not quiet and warmup_time_infer:
+                print(f'warm-up completed in {len(warmup_time_infer)} iterations')
+            wait_start_barrier()
+            allocation_tracing = start_allocation_tracing()
+
+            last_progress_time = perf_counter_ns()
             while (iteration <= iter_count) or (infer_duration < test_duration and test_duration > 0):
-                print('.', end='')
+                if collect_rusage:
+                    counters = get_rusage_counters()
                 infer_res = inference_func(*args, **kwargs)
+                if collect_rusage:
+                    cpu_time_after, context_switches_after = get_rusage_counters()
+                    cpu_time.append(cpu_time_after - counters[0])
+                    context_switches.append(context_switches_after - counters[1])
+                exec_time = get_result_exec_time(infer_res)
+                if iteration == 1:
+                    # the first inference of the test if there is no warm-up
+                    record_first_inference(exec_time)
                 if isinstance(infer_res, dict):
-                    audio_length = None
-                    exec_time = infer_res.get('exec_time')
                     iter_tokens = infer_res.get('iter_tokens')
                     audio_length = infer_res.get('audio_length')
                     audio_sampling_rate = infer_res.get('audio_sampling_rate')
@@ -35,15 +238,26 @@ def loop_inference(iter_count, test_duration):
                                 num_tokens.append(iter_tokens)
                         if audio_length is not None:
                             audios_lengths.append(audio_length)
-                else:
-                    exec_time = infer_res
                 if exec_time > 0:
                     time_infer.append(exec_time)
-                infer_duration = sum(time_infer)
+                    infer_duration += exec_time
+                heartbeat('inference', iteration)
                 iteration += 1
-            print('')
+                if not quiet and perf_counter_ns() - last_progress_time >= PROGRESS_PERIOD_NS:
+                    # progress is printed once a period, printing every iteration perturbs short inferences
+                    print('.', end='', flush=True)
+                    last_progress_time = perf_counter_ns()
+            if allocation_tracing:
+                stop_allocation_tracing(iteration - 1)
+            if not quiet:
+                print('')
+            _rusage_results.update(cpu_time=cpu_time, context_switches=context_switches)
 
             return {'time_infer': time_infer,
+                    'warmup_time_infer': warmup_time_infer,
+                    'steady_state_reached': steady_state_reached,
+                    'cpu_time': cpu_time,
+                    'context_switches': context_switches,
                     'num_tokens': num_tokens,
                     'audios_lengths': audios_lengths,
                     'audio_sampling_rate': audio_sampling_rate}
@@ -53,14 +267,23 @@ def loop_inference(iter_count, test_duration):
     return deco_loop_inference
 
 
+def get_result_exec_time(infer_res):
+    """
+    Execution time of inference_func result, the time itself or the exec_time item of the dictionary
+    """
+    if isinstance(infer_res, dict):
+        return infer_res.get('exec_time')
+    return infer_res
+
+
 def get_exec_time():
     def deco_get_exec_time(func):
         @wraps(func)
         def f_get_exec_time(*args, **kwargs):
-            t0 = time()
+            t0 = perf_counter_ns()
             res = func(*args, **kwargs)
-            t1 = time()
-            exec_time = t1 - t0
+            t1 = perf_counter_ns()
+            exec_time = (t1 - t0) / NANOSECONDS_IN_SECOND
             return res, exec_time
 
         return f_get_exec_time
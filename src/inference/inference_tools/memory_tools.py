@@ -0,0 +1,116 @@
+"""
+Memory footprint of the launcher process: RSS after stages of the test and peak RSS read from /proc, Python
+allocations of measured iterations traced by tracemalloc if the benchmark enables allocation tracing.
+"""
+import os
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    # resource module is unavailable on Windows
+    resource = None
+
+# the benchmark sets this environment variable to trace allocations, tracing slows down Python code of iterations
+TRACE_ALLOCATIONS_ENV = 'DLI_TRACE_ALLOCATIONS'
+PROC_STATUS_PATH = '/proc/self/status'
+PROC_CLEAR_REFS_PATH = '/proc/self/clear_refs'
+BYTES_IN_KILOBYTE = 1024
+BYTES_IN_MEGABYTE = 1024 ** 2
+# stages after which RSS is recorded: framework import, model load and compilation, warm-up
+MEMORY_STAGES = ('import', 'model_load', 'warmup')
+
+# RSS of stages and traced allocations in bytes, launchers record them once per test
+_memory_results = {}
+
+
+def read_proc_status_value(name):
+    """
+    Value of /proc/self/status field in bytes, None if /proc is unavailable
+    """
+    try:
+        with open(PROC_STATUS_PATH) as status:
+            for line in status:
+                if line.startswith(f'{name}:'):
+                    return int(line.split()[1]) * BYTES_IN_KILOBYTE
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def get_rss():
+    return read_proc_status_value('VmRSS')
+
+
+def get_peak_rss():
+    peak_rss = read_proc_status_value('VmHWM')
+    if peak_rss is None and resource is not None:
+        # ru_maxrss is measured in kilobytes on Linux, it can not be reset
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * BYTES_IN_KILOBYTE
+    return peak_rss
+
+
+def reset_peak_rss():
+    """
+    Reset peak RSS of the process to its current RSS, ex. before the next test of the resident worker
+    """
+    try:
+        with open(PROC_CLEAR_REFS_PATH, 'w') as clear_refs:
+            clear_refs.write('5')
+    except OSError:
+        pass
+
+
+def reset_memory_results():
+    _memory_results.clear()
+
+
+def record_memory(stage):
+    """
+    Record RSS after the stage of MEMORY_STAGES, repeated records of the stage are ignored
+    """
+    _memory_results.setdefault(stage, get_rss())
+
+
+def start_allocation_tracing():
+    """
+    Start tracemalloc if the benchmark enables allocation tracing
+    :return: True if tracing is started
+    """
+    if not os.environ.get(TRACE_ALLOCATIONS_ENV) or tracemalloc.is_tracing():
+        return False
+    tracemalloc.start()
+    return True
+
+
+def stop_allocation_tracing(iterations_num):
+    """
+    Stop tracemalloc started by start_allocation_tracing and record memory retained per iteration
+    and the peak of traced memory
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _memory_results.setdefault('allocated_per_iteration', current / max(iterations_num, 1))
+    _memory_results.setdefault('traced_memory_peak', peak)
+
+
+def get_memory_results():
+    """
+    Memory footprint of the test in the format of JSON report, megabytes except allocations per iteration in bytes
+    """
+    def to_megabytes(value):
+        return round(value / BYTES_IN_MEGABYTE, 3) if value is not None else None
+
+    rss_after_import = _memory_results.get('import')
+    rss_after_load = _memory_results.get('model_load')
+    load_rss_delta = (rss_after_load - rss_after_import
+                      if rss_after_import is not None and rss_after_load is not None else None)
+    allocated_per_iteration = _memory_results.get('allocated_per_iteration')
+    return {'rss_after_import_mb': to_megabytes(rss_after_import),
+            'rss_after_load_mb': to_megabytes(rss_after_load),
+            'rss_after_warmup_mb': to_megabytes(_memory_results.get('warmup')),
+            'peak_rss_mb': to_megabytes(get_peak_rss()),
+            'load_rss_delta_mb': to_megabytes(load_rss_delta),
+            'allocated_per_iteration': (round(allocated_per_iteration, 1)
+                                        if allocated_per_iteration is not None else None),
+            'traced_memory_peak_mb': to_megabytes(_memory_results.get('traced_memory_peak'))}
@@ -0,0 +1,80 @@
+"""
+Startup phases of the launcher: framework import, model reading, compilation and the first inference.
+Cold start is the wall-clock time from the start of the process to the result of the first inference.
+"""
+import os
+from time import time
+
+PROC_STAT_PATH = '/proc/self/stat'
+PROC_UPTIME_PATH = '/proc/uptime'
+# position of the process start time (in clock ticks after boot) in /proc/self/stat after the process name
+STAT_START_TIME_INDEX = 19
+
+# the resident worker sets the start time of its job, the start of the process is used otherwise
+_start_time = {'time': None}
+# durations of import and the first inference in seconds and the wall-clock time of the first inference result
+_startup_results = {}
+
+
+def get_process_start_time():
+    """
+    Wall-clock start time of the process in seconds since the epoch, None if /proc is unavailable
+    """
+    try:
+        with open(PROC_STAT_PATH) as stat_file:
+            # the process name may contain spaces, fields are counted after it
+            start_ticks = int(stat_file.read().rsplit(')', 1)[1].split()[STAT_START_TIME_INDEX])
+        with open(PROC_UPTIME_PATH) as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+        return time() - uptime + start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def set_start_time(start_time):
+    _start_time['time'] = start_time
+
+
+def get_start_time():
+    if _start_time['time'] is None:
+        # computed once, uptime and clock are read at slightly different moments
+        _start_time['time'] = get_process_start_time()
+    return _start_time['time']
+
+
+def reset_startup_results():
+    _startup_results.clear()
+
+
+def record_import():
+    start_time = get_start_time()
+    if start_time is not None:
+        _startup_results.setdefault('import', time() - start_time)
+
+
+def record_first_inference(exec_time):
+    """
+    Record the first inference of the test, next calls are ignored
+    """
+    if 'first_inference_end' not in _startup_results:
+        _startup_results['first_inference_end'] = time()
+        _startup_results['first_inference'] = exec_time
+
+
+def get_startup_results(read_time=None, compile_time=None):
+    """
+    Startup phases in the format of JSON report
+    :param read_time: model reading time measured by the launcher
+    :param compile_time: model compilation time measured by the launcher
+    """
+    def to_report(value):
+        return round(value, 5) if value is not None else None
+
+    start_time = get_start_time()
+    first_inference_end = _startup_results.get('first_inference_end')
+    cold_start_time = first_inference_end - start_time if start_time and first_inference_end else None
+    return {'import_time': to_report(_startup_results.get('import')),
+            'read_time': to_report(read_time),
+            'compile_time': to_report(compile_time),
+            'first_inference_time': to_report(_startup_results.get('first_inference')),
+            'cold_start_time': to_report(cold_start_time)}
@@ -0,0 +1,83 @@
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from transformer import LAYER_LAYOUT_TO_IMAGE, transform_batch  # noqa: E402
+
+CHANNEL_SWAP = [2, 1, 0]
+MEAN = [123.675, 116.28, 103.53]
+INPUT_SCALE = [58.395, 57.12, 57.375]
+
+
+def cli_argument_parser():
+    parser = argparse.ArgumentParser(description='Compare per-image and batched image preprocessing throughput')
+    parser.add_argument('-b', '--batch_sizes',
+                        help='Batch sizes to measure',
+                        default=[1, 32, 256],
+                        type=int,
+                        nargs='+',
+                        dest='batch_sizes')
+    parser.add_argument('--image_size',
+                        help='Height and width of images',
+                        default=[224, 224],
+                        type=int,
+                        nargs=2,
+                        dest='image_size')
+    parser.add_argument('-ni', '--number_iter',
+                        help='Number of measurements for each batch size',
+                        default=5,
+                        type=int,
+                        dest='number_iter')
+    return parser.parse_args()
+
+
+def legacy_transform_images(images, element_type):
+    # per-image float64 loop of transformers before batched preprocessing with the channel swap applied,
+    # equivalence with the original transformers is checked in src/benchmark/tests/test_transformer.py
+    transformed_images = np.zeros(shape=[images.shape[0], images.shape[3], images.shape[1], images.shape[2]],
+                                  dtype=element_type)
+    for i in range(images.shape[0]):
+        image = np.copy(images[i]).astype(np.float64)
+        image = image[:, :, CHANNEL_SWAP]
+        for channel in range(3):
+            image[:, :, channel] -= MEAN[channel]
+            image[:, :, channel] /= INPUT_SCALE[channel]
+        transformed_images[i] = image.transpose(2, 0, 1)
+    return transformed_images
+
+
+def batched_transform_images(images, element_type):
+    return transform_batch(images, element_type, channel_swap=CHANNEL_SWAP, mean=MEAN, input_scale=INPUT_SCALE,
+                           layout=LAYER_LAYOUT_TO_IMAGE['NCHW'])
+
+
+def measure_throughput(transform, images, number_iter):
+    times = []
+    for _ in range(number_iter):
+        t0 = perf_counter()
+        transform(images, np.float32)
+        times.append(perf_counter() - t0)
+    return images.shape[0] / np.median(times)
+
+
+def main():
+    args = cli_argument_parser()
+    height, width = args.image_size
+    rng = np.random.default_rng(0)
+    print(f'{"Batch":>6} {"Legacy, img/s":>15} {"Batched, img/s":>15} {"Speedup":>8}')
+    for batch_size in args.batch_sizes:
+        images = rng.integers(0, 256, size=(batch_size, height, width, 3), dtype=np.uint8)
+        if not np.allclose(legacy_transform_images(images, np.float32), batched_transform_images(images, np.float32),
+                           atol=1e-4):
+            raise ValueError('Batched preprocessing result differs from the per-image one')
+        legacy = measure_throughput(legacy_transform_images, images, args.number_iter)
+        batched = measure_throughput(batched_transform_images, images, args.number_iter)
+        print(f'{batch_size:>6} {legacy:>15.1f} {batched:>15.1f} {batched / legacy:>7.1f}x')
+
+
+if __name__ == '__main__':
+    sys.exit(main() or 0)
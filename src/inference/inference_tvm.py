@@ -6,6 +6,10 @@ import traceback
 from pathlib import Path
 
 import postprocessing_data as pp
+from compiled_model_cache import CompiledModelCache
+from inference_tools.argument_tools import (add_compiled_model_cache_argument, add_input_data_arguments,
+                                            add_measurement_arguments)
+from inference_tools.loop_tools import get_loop_results, set_loop_parameters, set_warmup_parameters
 from io_adapter import IOAdapter
 from io_model_wrapper import TVMIOModelWrapper
 from transformer import TVMTransformer
@@ -81,6 +85,7 @@ def cli_argument_parser():
                         type=str,
                         nargs='+',
                         dest='input')
+    add_input_data_arguments(parser)
     parser.add_argument('--color_map',
                         help='Classes color map',
                         type=str,
@@ -179,6 +184,8 @@ def cli_argument_parser():
                         type=Path,
                         default=Path(__file__).parent / 'tvm_inference_report.json',
                         dest='report_path')
+    add_measurement_arguments(parser)
+    add_compiled_model_cache_argument(parser)
     args = parser.parse_args()
 
     return args
@@ -186,6 +193,8 @@ def cli_argument_parser():
 
 def main():
     args = cli_argument_parser()
+    set_warmup_parameters(args.warmup_iters, args.warmup_time, args.steady_state_cv, args.steady_state_max_time)
+    set_loop_parameters(args.quiet, args.collect_rusage)
     report_writer = ReportWriter()
     report_writer.update_configuration_setup(batch_size=args.batch_size,
                                              iterations_num=args.number_iter,
@@ -196,9 +205,15 @@ def main():
         io = IOAdapter.get_io_adapter(args, wrapper, transformer)
 
         log.info(f'Shape for input layer {args.input_name}: {args.input_shape}')
+        report_writer.update_input_shapes({args.input_name: args.input_shape})
         converter = TVMConverter.get_converter(create_dict_for_converter(args))
         report_writer.update_framework_info(name='TVM', version=converter.tvm.__version__)
-        graph_module = converter.get_graph_module()
+        compiled_model_cache = CompiledModelCache.get_cache(args.compiled_model_cache_dir, 'tvm')
+        graph_module = converter.get_graph_module(compiled_model_cache)
+        log.info(f'Model is loaded in {converter.load_time:.3f} s, compiled in {converter.compile_time:.3f} s')
+        report_writer.update_execution_results(read_network_time=round(converter.load_time, 5),
+                                               compile_time=round(converter.compile_time, 5),
+                                               compiled_model_cache_hit=converter.cache_hit)
 
         log.info(f'Preparing input data: {args.input}')
         io.prepare_input(graph_module, args.input)
@@ -226,8 +241,12 @@ def main():
                 except Exception as ex:
                     log.warning('Error when printing inference results. {0}'.format(str(ex)))
 
+        if args.raw_timings_path:
+            log.info(f'Write raw inference times to {args.raw_timings_path}')
+            pp.save_raw_timings(args.raw_timings_path, infer_time)
         log.info('Computing performance metrics')
-        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, infer_time)
+        inference_result = pp.calculate_performance_metrics_sync_mode(args.batch_size, infer_time,
+                                                                      **get_loop_results())
         report_writer.update_execution_results(**inference_result)
         report_writer.write_report(args.report_path)
         log.info(f'Performance results:\n{json.dumps(inference_result, indent=4)}')
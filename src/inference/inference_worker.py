@@ -0,0 +1,291 @@
+"""
+Resident worker keeping inference frameworks imported between tests.
+
+Client mode (default) sends the launcher script and its arguments to the worker listening on --socket, starting
+the worker if it is not running, prints the launcher output and exits with the launcher return code. The worker
+runs main() of the launcher in its own process, so framework imports are paid once per worker. The worker exits
+after --max_jobs jobs or --idle_timeout seconds without jobs, the next client starts a new one.
+"""
+import argparse
+import fcntl
+import importlib.util
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+from inference_tools.memory_tools import reset_peak_rss
+from inference_tools.startup_tools import set_start_time
+
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath('utils')))
+from logger_conf import configure_logger  # noqa: E402
+
+log = configure_logger()
+
+WORKER_START_TIMEOUT = 60
+DEFAULT_IDLE_TIMEOUT = 600
+MESSAGE_ENCODING = 'utf-8'
+# environment variables of the benchmark passed from the client to the job, ex. allocation tracing
+JOB_ENV_PREFIX = 'DLI_'
+
+
+def cli_argument_parser():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--socket',
+                        help='Path to the Unix socket of the worker',
+                        type=Path,
+                        required=True,
+                        dest='socket')
+    parser.add_argument('--max_jobs',
+                        help='Number of jobs after which the worker exits and is restarted by the next client. '
+                             '0 means no limit',
+                        default=0,
+                        type=int,
+                        dest='max_jobs')
+    parser.add_argument('--idle_timeout',
+                        help='Time in seconds without jobs after which the worker exits',
+                        default=DEFAULT_IDLE_TIMEOUT,
+                        type=float,
+                        dest='idle_timeout')
+    parser.add_argument('--serve',
+                        help='Run the worker instead of the client',
+                        action='store_true',
+                        dest='serve')
+    parser.add_argument('--stop',
+                        help='Stop the worker if it is running',
+                        action='store_true',
+                        dest='stop')
+    parser.add_argument('script',
+                        help='Launcher script executed by the worker',
+                        nargs='?',
+                        default=None)
+    parser.add_argument('script_args',
+                        help='Arguments of the launcher script',
+                        nargs=argparse.REMAINDER)
+
+    return parser.parse_args()
+
+
+def send_message(connection, message):
+    connection.sendall((json.dumps(message) + '\n').encode(MESSAGE_ENCODING))
+
+
+def receive_messages(connection):
+    buffer = b''
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return
+        buffer += chunk
+        while b'\n' in buffer:
+            line, buffer = buffer.split(b'\n', 1)
+            yield json.loads(line.decode(MESSAGE_ENCODING))
+
+
+def load_launcher(script):
+    script = Path(script).resolve()
+    module_name = script.stem
+    module = sys.modules.get(module_name)
+    if module is None or Path(module.__file__).resolve() != script:
+        spec = importlib.util.spec_from_file_location(module_name, script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def get_exit_code(exit_code):
+    if exit_code is None:
+        return 0
+    return exit_code if isinstance(exit_code, int) else 1
+
+
+def run_job(job):
+    """
+    Run main() of the launcher with job arguments, output of the launcher and native libraries is captured
+    :return: launcher return code and output
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = os.dup(1), os.dup(2)
+    saved_env = dict(os.environ)
+    with tempfile.TemporaryFile() as output_file:
+        os.dup2(output_file.fileno(), 1)
+        os.dup2(output_file.fileno(), 2)
+        try:
+            os.chdir(job['cwd'])
+            if job.get('affinity') and hasattr(os, 'sched_setaffinity'):
+                os.sched_setaffinity(0, job['affinity'])
+            # the worker inherits environment of the client starting it, the job gets environment of its client
+            for name in [name for name in os.environ if name.startswith(JOB_ENV_PREFIX)]:
+                del os.environ[name]
+            os.environ.update(job.get('env', {}))
+            # peak RSS of the launcher is reported per test, not per worker lifetime
+            reset_peak_rss()
+            # startup of the job is counted from its start, imports of the worker are already done
+            set_start_time(job.get('start_time') or time.time())
+            sys.argv = [job['script']] + job['args']
+            return_code = get_exit_code(load_launcher(job['script']).main())
+        except SystemExit as ex:
+            return_code = get_exit_code(ex.code)
+        except BaseException:
+            traceback.print_exc()
+            return_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            for fd in saved_fds:
+                os.close(fd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+        output_file.seek(0)
+        output = output_file.read().decode(MESSAGE_ENCODING, errors='replace')
+    return return_code, output
+
+
+def serve(socket_path, max_jobs, idle_timeout):
+    if socket_path.exists():
+        socket_path.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    server.settimeout(idle_timeout)
+    jobs_count = 0
+    try:
+        while not max_jobs or jobs_count < max_jobs:
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                break
+            with connection:
+                connection.settimeout(None)
+                job = next(receive_messages(connection), None)
+                if job is None:
+                    continue
+                if job.get('stop'):
+                    send_message(connection, {'pid': os.getpid()})
+                    break
+                # clients waiting in the queue of the stopped worker retry with a new one, if the job is not accepted
+                send_message(connection, {'pid': os.getpid()})
+                return_code, output = run_job(job)
+                jobs_count += 1
+                send_message(connection, {'return_code': return_code, 'output': output})
+    finally:
+        # the path is removed before closing, so clients do not remove the socket of the next worker as stale
+        if socket_path.exists():
+            socket_path.unlink()
+        server.close()
+
+
+def start_worker(socket_path, max_jobs, idle_timeout):
+    log.info(f'Starting resident worker {socket_path}')
+    subprocess.Popen([sys.executable, str(Path(__file__).resolve()), '--serve', '--socket', str(socket_path),
+                      '--max_jobs', str(max_jobs), '--idle_timeout', str(idle_timeout)],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+
+
+def try_connect(socket_path):
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(str(socket_path))
+        return connection
+    except (FileNotFoundError, ConnectionRefusedError):
+        connection.close()
+        return None
+
+
+def connect(socket_path, max_jobs, idle_timeout):
+    connection = try_connect(socket_path)
+    if connection is not None:
+        return connection
+    # concurrent clients start one worker
+    with open(f'{socket_path}.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        connection = try_connect(socket_path)
+        if connection is not None:
+            return connection
+        if socket_path.exists():
+            # socket of the crashed worker
+            socket_path.unlink()
+        start_worker(socket_path, max_jobs, idle_timeout)
+        deadline = time.monotonic() + WORKER_START_TIMEOUT
+        while connection is None:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'Resident worker {socket_path} is not started in {WORKER_START_TIMEOUT} seconds')
+            time.sleep(0.05)
+            connection = try_connect(socket_path)
+        return connection
+
+
+def get_worker_killer(socket_path, worker_pid):
+    def kill_worker(signum, frame):
+        # the job is interrupted by timeout, the worker may hang, so it is killed to let the next jobs run
+        log.error(f'Job is interrupted, killing resident worker {socket_path}')
+        os.kill(worker_pid, signal.SIGKILL)
+        sys.exit(1)
+
+    return kill_worker
+
+
+def submit_job(socket_path, max_jobs, idle_timeout, script, script_args):
+    job = {
+        'script': str(Path(script).resolve()),
+        'args': script_args,
+        'cwd': os.getcwd(),
+        'start_time': time.time(),
+        'affinity': sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None,
+        'env': {name: value for name, value in os.environ.items() if name.startswith(JOB_ENV_PREFIX)},
+    }
+    while True:
+        with connect(socket_path, max_jobs, idle_timeout) as connection:
+            messages = receive_messages(connection)
+            try:
+                send_message(connection, job)
+                accepted = next(messages, None)
+            except (BrokenPipeError, ConnectionResetError):
+                accepted = None
+            if accepted is None:
+                # worker has finished its last job and stopped, the job goes to the new one
+                continue
+
+            signal.signal(signal.SIGTERM, get_worker_killer(socket_path, accepted['pid']))
+            result = next(messages, None)
+            if result is None:
+                log.error(f'Resident worker {socket_path} crashed while running the job')
+                return 1
+            sys.stdout.write(result['output'])
+            sys.stdout.flush()
+            return result['return_code']
+
+
+def stop(socket_path):
+    connection = try_connect(socket_path)
+    if connection is None:
+        return 0
+    with connection:
+        send_message(connection, {'stop': True})
+        next(receive_messages(connection), None)
+    return 0
+
+
+def main():
+    args = cli_argument_parser()
+    if args.serve:
+        return serve(args.socket, args.max_jobs, args.idle_timeout)
+    if args.stop:
+        return stop(args.socket)
+    return submit_job(args.socket, args.max_jobs, args.idle_timeout, args.script, args.script_args)
+
+
+if __name__ == '__main__':
+    sys.exit(main() or 0)
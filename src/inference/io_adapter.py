@@ -1,20 +1,50 @@
 import abc
 import copy
+import hashlib
 import itertools
 import json
+import math
 import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import cv2
 import numpy as np
 
+from detection_postprocessing import (non_max_suppression, soft_non_max_suppression, xywh_to_xyxy,
+                                      yolo_non_max_suppression)
+
 
 class IOAdapter(metaclass=abc.ABCMeta):
+    # upper bound of memory for materialized batches, bigger datasets are assembled on every iteration
+    BATCH_CACHE_MAX_BYTES = 2 ** 30
+    BATCH_CACHE_ALIGNMENT = 64
+    DECODE_THREADS = min(8, os.cpu_count() or 1)
+    DECODE_PREFETCH_SIZE = 64
+    # least recently used cache files are removed when the cache directory exceeds this size
+    INPUT_CACHE_MAX_BYTES = 10 * 2 ** 30
+    # temporary cache files of crashed launchers are removed after this time in seconds
+    INPUT_CACHE_TMP_MAX_AGE = 3600
+
     def __init__(self, args, io_model_wrapper, transformer):
         self._input = None
         self._transformed_input = {}
+        self._input_samples = {}
+        self._batch_cache = None
+        self._batch_buffers = []
+        self._batch_index = 0
+        self._input_binder = None
         self._original_shapes = None
         self._batch_size = args.batch_size
+        self._max_input_images = getattr(args, 'max_input_images', None)
+        # decoded images and ready-to-feed tensors are cached on disk only in the explicit cache directory
+        input_cache_dir = getattr(args, 'input_cache_dir', None)
+        self._persistent_input_cache = input_cache_dir is not None
+        self._input_cache_dir = Path(input_cache_dir) if input_cache_dir else None
         self._prompts = []
         self._labels = getattr(args, 'labels', None)
         self._number_top = getattr(args, 'number_top', None)
@@ -26,24 +56,129 @@ class IOAdapter(metaclass=abc.ABCMeta):
         self._io_model_wrapper = io_model_wrapper
         self._transformer = transformer
 
-    def __convert_images(self, shape, data, dtype, input_name):
+    def __convert_images(self, shape, data, dtype, input_name, use_cache=False):
         chw = self._transformer.get_shape_in_chw_order(shape, input_name)
-        images = []
-        image_shapes = []
-        for image in data:
-            image = self.__read_data(image, shape, dtype, chw)
-            image_shapes.append(chw[1:])
-            images.append(image)
-        return np.array(images), image_shapes
+        image_shapes = [chw[1:]] * len(data)
+        cache_path = None
+        if use_cache:
+            cache_key = self.__get_cache_key(data, list(shape), np.dtype(dtype).str, list(chw))
+            cache_path = self._input_cache_dir / f'decoded_{cache_key}.npy'
+            images = self.__load_cached_array(cache_path)
+            if images is not None:
+                return images, image_shapes
+
+        images = None
+        tmp_path = None
+        for idx, image in self.__decode_images(data, shape, dtype, chw):
+            if images is None:
+                images_shape = (len(data), *image.shape)
+                if cache_path is not None:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+                    images = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=image.dtype, shape=images_shape)
+                else:
+                    images = np.empty(images_shape, dtype=image.dtype)
+            images[idx] = image
+        if tmp_path is not None:
+            images.flush()
+            del images
+            images = self.__commit_cached_array(tmp_path, cache_path)
+        return images, image_shapes
+
+    def __decode_images(self, files, shape, dtype, chw):
+        # decode in background threads, at most DECODE_PREFETCH_SIZE decoded images are kept in flight
+        with ThreadPoolExecutor(max_workers=self.DECODE_THREADS) as pool:
+            prefetch_queue = deque()
+            for idx, filename in enumerate(files):
+                prefetch_queue.append((idx, pool.submit(self.__read_data, filename, shape, dtype, chw)))
+                if len(prefetch_queue) >= self.DECODE_PREFETCH_SIZE:
+                    idx, future = prefetch_queue.popleft()
+                    yield idx, future.result()
+            while prefetch_queue:
+                idx, future = prefetch_queue.popleft()
+                yield idx, future.result()
+
+    @staticmethod
+    def __get_cache_key(files, *settings):
+        key = hashlib.sha256()
+        for filename in files:
+            file_stat = os.stat(filename)
+            key.update(f'{filename}:{file_stat.st_size}:{file_stat.st_mtime_ns};'.encode())
+        key.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        return key.hexdigest()
+
+    @staticmethod
+    def __load_cached_array(cache_path):
+        if not cache_path.is_file():
+            return None
+        # modification time is used as the last access time for LRU eviction
+        os.utime(cache_path)
+        return np.load(cache_path, mmap_mode='r')
+
+    def __save_cached_array(self, cache_path, array):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as file:
+            np.save(file, array)
+        return self.__commit_cached_array(tmp_path, cache_path)
+
+    def __commit_cached_array(self, tmp_path, cache_path):
+        # concurrent tests may prepare the same input, rename keeps the cache file consistent
+        os.replace(tmp_path, cache_path)
+        self.__evict_input_cache(keep=cache_path)
+        return np.load(cache_path, mmap_mode='r')
 
     @staticmethod
-    def __create_list_images(input_):
-        # TODO should we limit number of images? what if we have 50K images?
+    def __is_process_alive(pid):
+        if sys.platform == 'win32':
+            # signal 0 is CTRL_C_EVENT on Windows, stale files are detected by the age only
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            # the process of another user
+            return True
+        return True
+
+    def __remove_stale_tmp_files(self):
+        # <name>.<pid>.tmp files of launchers crashed before the rename are never committed
+        for tmp_file in self._input_cache_dir.glob('*.tmp'):
+            try:
+                pid = int(tmp_file.suffixes[-2][1:])
+                is_stale = time.time() - tmp_file.stat().st_mtime > self.INPUT_CACHE_TMP_MAX_AGE
+                if is_stale and pid != os.getpid() and not self.__is_process_alive(pid):
+                    tmp_file.unlink()
+            except (IndexError, ValueError, FileNotFoundError):
+                continue
+
+    def __evict_input_cache(self, keep):
+        self.__remove_stale_tmp_files()
+        cache_files = []
+        for cache_file in self._input_cache_dir.glob('*.npy'):
+            try:
+                cache_files.append((cache_file.stat().st_mtime, cache_file.stat().st_size, cache_file))
+            except FileNotFoundError:
+                continue
+        cache_size = sum(size for _, size, _ in cache_files)
+        for _, size, cache_file in sorted(cache_files):
+            if cache_size <= self.INPUT_CACHE_MAX_BYTES:
+                break
+            if cache_file == keep:
+                continue
+            try:
+                cache_file.unlink()
+            except FileNotFoundError:
+                pass
+            cache_size -= size
+
+    def __create_list_images(self, input_):
         images = []
         if os.path.exists(input_[0]):
             if os.path.isdir(input_[0]):
                 path = os.path.abspath(input_[0])
-                images = [os.path.join(path, file) for file in os.listdir(path)]
+                images = [os.path.join(path, file) for file in sorted(os.listdir(path))]
             elif os.path.isfile(input_[0]):
                 for image in input_:
                     if not os.path.isfile(image):
@@ -51,6 +186,10 @@ class IOAdapter(metaclass=abc.ABCMeta):
                     images.append(os.path.abspath(image))
         else:
             raise ValueError(f'Path to image or to directory with images does not exist: {input_[0]}')
+        if self._max_input_images and len(images) > self._max_input_images:
+            # fixed seed keeps the same working set for all tests using this directory
+            indices = random.Random(0).sample(range(len(images)), self._max_input_images)
+            images = [images[idx] for idx in sorted(indices)]
         return images
 
     @staticmethod
@@ -119,6 +258,8 @@ class IOAdapter(metaclass=abc.ABCMeta):
                 input_value = self.__fill_random(input_shape, element_type)
 
             self._transformed_input.update({input_name: itertools.cycle(input_value)})
+            self._input_samples.update({input_name: input_value})
+        self._batch_cache = None
 
     @staticmethod
     def __fill_input_info(input_shape, image_sizes, element_type):
@@ -154,18 +295,32 @@ class IOAdapter(metaclass=abc.ABCMeta):
             transformed_value = value
         else:
             input_files = input_file.split(',')
-            value = self.__create_list_images(input_files)
+            files = self.__create_list_images(input_files)
             shape = self._io_model_wrapper.get_input_layer_shape(model, input_blob)
             element_type = self._io_model_wrapper.get_input_layer_dtype(model, input_blob)
-            value, shapes = self.__convert_images(shape, value, element_type, input_blob)
-            transformed_value = self._transformer.transform_images(value, shape, element_type, input_blob)
+            value, shapes = self.__convert_images(shape, files, element_type, input_blob,
+                                                  use_cache=self._persistent_input_cache)
+
+            transformed_value = None
+            if self._persistent_input_cache:
+                cache_key = self.__get_cache_key(files, list(shape), np.dtype(element_type).str, input_blob,
+                                                 self._transformer.get_cache_key())
+                cache_path = self._input_cache_dir / f'transformed_{cache_key}.npy'
+                transformed_value = self.__load_cached_array(cache_path)
+            if transformed_value is None:
+                transformed_value = self._transformer.transform_images(value, shape, element_type, input_blob)
+                if self._persistent_input_cache and isinstance(transformed_value, np.ndarray):
+                    transformed_value = self.__save_cached_array(cache_path, transformed_value)
         self._input.update({input_blob: value})
         self._original_shapes.update({input_blob: shapes})
         self._transformed_input.update({input_blob: itertools.cycle(transformed_value)})
+        self._input_samples.update({input_blob: transformed_value})
 
     def prepare_input(self, model, input_):
         self._input = {}
         self._transformed_input = {}
+        self._input_samples = {}
+        self._batch_cache = None
         self._original_shapes = {}
 
         if ':' in input_[0]:
@@ -177,7 +332,67 @@ class IOAdapter(metaclass=abc.ABCMeta):
             input_blob = self._io_model_wrapper.get_input_layer_names(model)[0]
             self.__parse_input_instance(input_[0], input_blob, model)
 
+    def set_input_binder(self, binder):
+        """
+        Set framework specific conversion of cached batches, ex. to OrtValue or ov.Tensor sharing batch memory.
+        :param binder: callable binder(input_name, batch) called once for every distinct batch
+        """
+        self._input_binder = binder
+        self._batch_cache = None
+
+    @staticmethod
+    def _aligned_empty(shape, dtype, alignment):
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        buffer = np.empty(nbytes + alignment, dtype=np.uint8)
+        offset = -buffer.ctypes.data % alignment
+        return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
+    def _get_batch_cache_period(self):
+        # data cycle is periodic: input with n samples repeats after n / gcd(n, batch_size) batches
+        period = 1
+        for samples in self._input_samples.values():
+            input_period = len(samples) // math.gcd(len(samples), self._batch_size)
+            period = period * input_period // math.gcd(period, input_period)
+        return period
+
+    def _create_batch_cache(self):
+        if not self._input_samples or self._input_samples.keys() != self._transformed_input.keys():
+            return None
+        samples = {key: np.asarray(value) for key, value in self._input_samples.items()}
+        if any(value.dtype == object or len(value) == 0 for value in samples.values()):
+            return None
+        period = self._get_batch_cache_period()
+        batch_nbytes = sum(value[0].nbytes for value in samples.values()) * self._batch_size
+        if period * batch_nbytes > self.BATCH_CACHE_MAX_BYTES:
+            return None
+
+        batch_cache = []
+        self._batch_buffers = []
+        for batch_index in range(period):
+            batch = {}
+            for key, value in samples.items():
+                indices = np.arange(batch_index * self._batch_size, (batch_index + 1) * self._batch_size) % len(value)
+                data = self._aligned_empty((self._batch_size, *value.shape[1:]), value.dtype,
+                                           self.BATCH_CACHE_ALIGNMENT)
+                np.take(value, indices, axis=0, out=data)
+                # bound objects may share memory with the buffer, keep it alive
+                self._batch_buffers.append(data)
+                batch[key] = self._input_binder(key, data) if self._input_binder else data
+                data.flags.writeable = False
+            batch_cache.append(batch)
+        self._batch_index = 0
+        return batch_cache
+
     def get_slice_input(self, *args, **kwargs):
+        if self._batch_cache is None:
+            self._batch_cache = self._create_batch_cache() or []
+        if self._batch_cache:
+            # distinct batches are materialized once, read-only views are handed out without copying
+            slice_input = self._batch_cache[self._batch_index % len(self._batch_cache)]
+            self._batch_index += 1
+            return dict(slice_input)
+
         slice_input = dict.fromkeys(self._transformed_input.keys(), None)
         for key in self._transformed_input:
             data_gen = self._transformed_input[key]
@@ -1109,31 +1324,11 @@ class DetectionSSD(IOAdapter):
     @staticmethod
     def _non_max_supression(detections, det_threshold):
         detections.sort(key=lambda detection: detection[0], reverse=True)
-        valid_detections = []
-        for _ in range(len(detections)):
-            max_detection = max(detections, key=lambda detection: detection[0])
-            if max_detection[0] < det_threshold:
-                break
-            valid_detections.append(max_detection)
-            max_detection[0] = 0
-            for detection in detections:
-                if detection[0] < det_threshold:
-                    continue
-                current_rect_area = ((detection[1][2] - detection[1][0]) * (detection[1][3] - detection[1][1]))
-                max_rect_area = ((max_detection[1][2] - max_detection[1][0])
-                                 * (max_detection[1][3] - max_detection[1][1]))
-                intersection_area = 0
-                if not (detection[1][0] >= max_detection[1][2]
-                        or detection[1][1] >= max_detection[1][3]
-                        or max_detection[1][0] >= detection[1][2]
-                        or max_detection[1][1] >= detection[1][3]):
-                    intersection_area = ((min(detection[1][2], max_detection[1][2])
-                                          - max(detection[1][0], max_detection[1][0]))
-                                         * (min(detection[1][3], max_detection[1][3])
-                                            - max(detection[1][1], max_detection[1][1])))
-                overlap = intersection_area / (current_rect_area + max_rect_area - intersection_area)
-                detection[0] *= np.exp(-overlap * overlap / 0.6)
-        return valid_detections
+        if not detections:
+            return []
+        keep = soft_non_max_suppression([detection[1] for detection in detections],
+                                        [detection[0] for detection in detections], det_threshold)
+        return [detections[i] for i in keep]
 
     @staticmethod
     def _draw_detections(images, batch, valid_detections, action_map, h, w):
@@ -1779,13 +1974,9 @@ class yolo(IOAdapter):
     def __init__(self, args, io_model_wrapper, transformer):
         super().__init__(args, io_model_wrapper, transformer)
 
-    def _sigmoid(self, x) -> float:
+    def _sigmoid(self, x):
         return 1 / (1 + np.exp(-x))
 
-    def _softmax(self, x):
-        e_x = np.exp(x)
-        return e_x / e_x.sum(axis=0)
-
     @abc.abstractmethod
     def _get_anchors(self):
         pass
@@ -1794,40 +1985,6 @@ class yolo(IOAdapter):
     def _get_shapes(self):
         pass
 
-    def __non_max_supression(self, predictions, score_threshold, nms_threshold):
-        predictions.sort(key=lambda prediction: prediction[0], reverse=True)
-        valid_detections = []
-        while len(predictions) > 0:
-            max_detection = predictions[0]
-            if max_detection[0] < score_threshold:
-                break
-            valid_detections.append(max_detection)
-            predictions.remove(max_detection)
-            remove_detections = []
-            for detection in predictions:
-                if detection[0] < score_threshold:
-                    remove_detections.append(detection)
-                    continue
-                if not (max_detection[1] == detection[1]):
-                    continue
-                current_rect_area = detection[2][2] * detection[2][3]
-                max_rect_area = max_detection[2][2] * max_detection[2][3]
-                intersection_area = 0
-                if not (detection[2][2] <= 0 or detection[2][3] <= 0
-                        or max_detection[2][2] <= 0 or max_detection[2][3] <= 0):
-                    intersection_area = float(
-                        (min(detection[2][0] + detection[2][2], max_detection[2][0] + max_detection[2][2])
-                         - max(detection[2][0], max_detection[2][0]))
-                        * (min(detection[2][1] + detection[2][3], max_detection[2][1] + max_detection[2][3])
-                           - max(detection[2][1], max_detection[2][1])),
-                    )
-                overlap = intersection_area / (current_rect_area + max_rect_area - intersection_area)
-                if overlap > nms_threshold:
-                    remove_detections.append(detection)
-            for detection in remove_detections:
-                predictions.remove(detection)
-        return valid_detections
-
     @staticmethod
     def __print_detections(detections, labels_map, image, scales, orig_shape, batch, log):
         image = cv2.resize(image, orig_shape)
@@ -1851,28 +2008,32 @@ class yolo(IOAdapter):
                                 cv2.FONT_HERSHEY_SIMPLEX, 0.75, (255, 255, 255), 1)
         return image
 
-    def _get_cell_predictions(self, cx, cy, dx, dy, detection, anchor_box_number, image_height, image_weight, anchors):
-        tx, ty, tw, th, to = detection[0:5]
-        bbox_center_x = (float(cx) + self._sigmoid(tx)) * (float(image_weight) / dx)
-        bbox_center_y = (float(cy) + self._sigmoid(ty)) * (float(image_height) / dy)
-        prior_width, prior_height = anchors[anchor_box_number]
-        bbox_width = (np.exp(tw) * prior_width) * (float(image_weight) / dx)
-        bbox_height = (np.exp(th) * prior_height) * (float(image_height) / dy)
-        confidence = self._sigmoid(to)
-        scores = detection[5:]
-        class_id = np.argmax(self._softmax(scores))
-        best_class_score = scores[class_id]
-        confidence_in_class = confidence * best_class_score
-        if confidence_in_class > self._threshold:
-            bbox = [
-                float(bbox_center_x - bbox_width / 2),
-                float(bbox_center_y - bbox_height / 2),
-                float(bbox_width),
-                float(bbox_height),
-            ]
-            prediction = [[best_class_score, class_id, bbox]]
-            return prediction
-        return None
+    def _get_cell_detections(self, cells):
+        # detections of all cells and anchors in the order of (cx, cy, anchor) with objectness above the threshold
+        detections = cells.transpose(3, 2, 0, 1)
+        cx, cy, anchor_box_number = np.indices(detections.shape[:3]).reshape(3, -1)
+        detections = detections.reshape(-1, cells.shape[1]).astype(np.float64)
+        mask = detections[:, 4] >= self._threshold
+        return detections[mask], cx[mask], cy[mask], anchor_box_number[mask]
+
+    def _get_predictions(self, detections, cx, cy, dx, dy, priors, image_height, image_weight):
+        """
+        Decode detections of one output
+        :param priors: anchor box sizes of every detection
+        :return: scores, class ids and boxes in [x_min, y_min, width, height] format
+        """
+        tx, ty, tw, th, to = detections[:, :5].T
+        bbox_center_x = (cx + self._sigmoid(tx)) * (image_weight / dx)
+        bbox_center_y = (cy + self._sigmoid(ty)) * (image_height / dy)
+        bbox_width = (np.exp(tw) * priors[:, 0]) * (image_weight / dx)
+        bbox_height = (np.exp(th) * priors[:, 1]) * (image_height / dy)
+        scores = detections[:, 5:]
+        class_ids = np.argmax(scores, axis=1)
+        best_class_scores = scores[np.arange(len(scores)), class_ids]
+        mask = self._sigmoid(to) * best_class_scores > self._threshold
+        boxes = np.stack([bbox_center_x - bbox_width / 2, bbox_center_y - bbox_height / 2, bbox_width, bbox_height],
+                         axis=1)
+        return best_class_scores[mask], class_ids[mask], boxes[mask]
 
     def process_output(self, result, log):
         if self._is_result_invalid(result):
@@ -1891,24 +2052,21 @@ class yolo(IOAdapter):
             images[i] = input_[i % ib]
         for batch in range(ib):
             image = images[batch]
-            predictions = []
+            scores, class_ids, boxes = [], [], []
             orig_h, orig_w = self._original_shapes[next(iter(self._original_shapes))][batch]
             scales = {'W': orig_w / w, 'H': orig_h / h}
             for i, array_of_detections in enumerate(result):
-                anchors_boxes = anchors[i]
-                data = array_of_detections[batch]
                 data_shape = shapes[i]
                 dx, dy = data_shape[-2:]
-                cells = data.reshape(data_shape)
-                for cx in range(dy):
-                    for cy in range(dx):
-                        for anchor_box_number, detection in enumerate(cells[:, :, cy, cx]):
-                            if detection[4] >= self._threshold:
-                                prediction = self._get_cell_predictions(cx, cy, dx, dy, detection, anchor_box_number,
-                                                                        h, w, anchors_boxes)
-                                if prediction is not None:
-                                    predictions += prediction
-            valid_detections = self.__non_max_supression(predictions, self._threshold, 0.4)
+                cells = array_of_detections[batch].reshape(data_shape)
+                detections, cx, cy, anchor_box_number = self._get_cell_detections(cells)
+                priors = np.asarray(anchors[i], dtype=np.float64)[anchor_box_number]
+                output_predictions = self._get_predictions(detections, cx, cy, dx, dy, priors, h, w)
+                for predictions, output in zip((scores, class_ids, boxes), output_predictions):
+                    predictions.append(output)
+            scores, class_ids, boxes = np.concatenate(scores), np.concatenate(class_ids), np.concatenate(boxes)
+            keep = non_max_suppression(xywh_to_xyxy(boxes), scores, 0.4, self._threshold, class_ids)
+            valid_detections = [[scores[i], class_ids[i], boxes[i].tolist()] for i in keep]
             image = self.__print_detections(valid_detections, self._labels_map, cv2.UMat(image),
                                             scales, (orig_w, orig_h), batch, log)
             out_img = os.path.join(os.path.dirname(__file__), f'out_yolo_detection_{batch + 1}.bmp')
@@ -1987,26 +2145,24 @@ class YoloV3IO(yolo):
         super().__init__(args, io_model_wrapper, transformer)
         self.load_labels_map('mscoco_names.txt')
 
-    def _get_cell_predictions(self, cx, cy, dx, dy, detection, anchor_box_number, image_height, image_weight, anchors):
-        predictions = []
-        tx, ty, tw, th = detection[0:4]
-        prior_width, prior_height = anchors[anchor_box_number]
-        bbox_center_x = (float(cx) + tx) * (float(image_height) / dx)
-        bbox_center_y = (float(cy) + ty) * (float(image_weight) / dy)
-        bbox_width = np.exp(tw) * prior_width
-        bbox_height = np.exp(th) * prior_height
-        for class_id in range(80):
-            confidence = detection[5 + class_id]
-            if confidence >= self._threshold:
-                bbox = [
-                    float(bbox_center_x - bbox_width / 2),
-                    float(bbox_center_y - bbox_height / 2),
-                    float(bbox_width),
-                    float(bbox_height),
-                ]
-                prediction = [confidence, class_id, bbox]
-                predictions.append(prediction)
-        return predictions
+    def _activate_offsets(self, x):
+        return x
+
+    def _activate_scores(self, x):
+        return x
+
+    def _get_predictions(self, detections, cx, cy, dx, dy, priors, image_height, image_weight):
+        tx, ty, tw, th = detections[:, :4].T
+        bbox_center_x = (cx + self._activate_offsets(tx)) * (image_height / dx)
+        bbox_center_y = (cy + self._activate_offsets(ty)) * (image_weight / dy)
+        bbox_width = np.exp(tw) * priors[:, 0]
+        bbox_height = np.exp(th) * priors[:, 1]
+        boxes = np.stack([bbox_center_x - bbox_width / 2, bbox_center_y - bbox_height / 2, bbox_width, bbox_height],
+                         axis=1)
+        # every class with enough confidence gives a separate prediction of the cell
+        confidences = self._activate_scores(detections[:, 5:85])
+        cell_ids, class_ids = np.nonzero(confidences >= self._threshold)
+        return confidences[cell_ids, class_ids], class_ids, boxes[cell_ids]
 
     def _get_shapes(self):
         shapes = [
@@ -2030,37 +2186,26 @@ class YoloV3TFIO(YoloV3IO):
         super().__init__(args, io_model_wrapper, transformer)
         self.load_labels_map('mscoco_names.txt')
 
-    def _get_cell_predictions(self, cx, cy, dx, dy, detection, anchor_box_number, image_height, image_weight, anchors):
-        predictions = []
-        tx, ty, tw, th = detection[0:4]
-        prior_width, prior_height = anchors[anchor_box_number]
-        bbox_center_x = (float(cx) + self._sigmoid(tx)) * (float(image_height) / dx)
-        bbox_center_y = (float(cy) + self._sigmoid(ty)) * (float(image_weight) / dy)
-        bbox_width = np.exp(tw) * prior_width
-        bbox_height = np.exp(th) * prior_height
-        for class_id in range(80):
-            confidence = self._sigmoid(detection[5 + class_id])
-            if confidence >= self._threshold:
-                bbox = [
-                    float(bbox_center_x - bbox_width / 2),
-                    float(bbox_center_y - bbox_height / 2),
-                    float(bbox_width),
-                    float(bbox_height),
-                ]
-                prediction = [confidence, class_id, bbox]
-                predictions.append(prediction)
-
-        return predictions
+    def _activate_offsets(self, x):
+        return self._sigmoid(x)
+
+    def _activate_scores(self, x):
+        return self._sigmoid(x)
 
 
 class YoloV7(IOAdapter):
     def process_output(self, result, log, threshold=0.5):
-        from configs.pytorch_configs.yolo_v7 import non_max_suppression, plot_one_box
+        from configs.pytorch_configs.yolo_v7 import plot_one_box
 
         self.load_color_map('mscoco_color_map.txt')
         self.load_labels_map('mscoco_names.txt')
 
-        result = non_max_suppression(result)
+        if isinstance(result, (list, tuple)):
+            # model in the evaluation mode returns detections together with the raw feature maps
+            result = result[0]
+        if hasattr(result, 'detach'):
+            result = result.detach().cpu().numpy()
+        result = yolo_non_max_suppression(result)
         input_layer_name = next(iter(self._input))
         input_ = self._input[input_layer_name]
         image = input_[0]
@@ -2096,11 +2241,14 @@ class YoloV7ONNX(IOAdapter):
             orig_h, orig_w = shapes[i % ib]
             image = input_[i % ib]
             images.append(cv2.resize(image, (orig_w, orig_h)))
+        # the exported model already contains non-maximum suppression, rows are [batch, x_min, y_min, x_max, y_max,
+        # class, score]
         for batch_detections in result:
-            for det in batch_detections:
-                batch, x_min, y_min, x_max, y_max, cls, _ = det.astype(int)
+            batch_detections = np.asarray(batch_detections).reshape(-1, 7)
+            boxes = batch_detections[:, :6].astype(int)
+            for (batch, x_min, y_min, x_max, y_max, cls), score in zip(boxes, batch_detections[:, 6]):
                 color = self._classes_color_map[cls]
-                label = f'{self._labels_map[cls]} {det[-1]:.2f}'
+                label = f'{self._labels_map[cls]} {score:.2f}'
                 cv2.rectangle(images[batch], (x_min, y_min), (x_max, y_max), color, 1)
                 cv2.putText(images[batch], label, (x_min, y_min - 2), 0, 0.3, [225, 255, 255],
                             thickness=1, lineType=cv2.LINE_AA)
@@ -1,5 +1,14 @@
 import numpy as np
 
+LATENCY_PERCENTILES = {
+    'latency_p50': 50,
+    'latency_p90': 90,
+    'latency_p95': 95,
+    'latency_p99': 99,
+    'latency_p99_9': 99.9,
+}
+HISTOGRAM_BUCKETS_PER_DECADE = 20
+
 
 def delete_incorrect_time(time, num_tokens, min_correct_time):
     valid_time = []
@@ -40,6 +49,41 @@ def calculate_latency(time):
     return latency, latency_std
 
 
+def calculate_latency_percentiles(time):
+    """
+    Calculate latency percentiles on the raw times, without three sigma filtering to keep the tail
+    :param time: list of times taken for each inference operation
+    """
+    values = np.percentile(time, list(LATENCY_PERCENTILES.values()))
+    return {key: round(float(value), 5) for key, value in zip(LATENCY_PERCENTILES.keys(), values)}
+
+
+def calculate_latency_histogram(time, buckets_per_decade=HISTOGRAM_BUCKETS_PER_DECADE):
+    """
+    Calculate log-bucketed (HDR-style) histogram of times: bucket width is proportional to its lower bound,
+    so short and tail times are counted with the same relative precision
+    :param time: list of times taken for each inference operation
+    :param buckets_per_decade: number of buckets between powers of ten
+    :return: list of [lower bound, upper bound, count] for non-empty buckets
+    """
+    time = np.asarray(time, dtype=np.float64)
+    time = time[time > 0]
+    if time.size == 0:
+        return []
+    bucket_ids, counts = np.unique(np.floor(np.log10(time) * buckets_per_decade).astype(np.int64),
+                                   return_counts=True)
+    return [[float(f'{10 ** (bucket_id / buckets_per_decade):.6g}'),
+             float(f'{10 ** ((bucket_id + 1) / buckets_per_decade):.6g}'),
+             int(count)] for bucket_id, count in zip(bucket_ids, counts)]
+
+
+def save_raw_timings(path, time):
+    """
+    Save raw times taken for each inference operation (seconds) as float32 .npy file
+    """
+    np.save(path, np.asarray(time, dtype=np.float32))
+
+
 def calculate_batch_fps(batch_size, time):
     if time == 0:
         return -1
@@ -64,8 +108,11 @@ def calculate_latency_per_value(inference_time, values):
 
 
 def calculate_performance_metrics_sync_mode(batch_size, inference_time, min_infer_time=0.0,
-                                            num_tokens=None, audios_lengths=None, audio_sampling_rate=None):
-    first_inference_time = inference_time[0]
+                                            num_tokens=None, audios_lengths=None, audio_sampling_rate=None,
+                                            warmup_time_infer=None, steady_state_reached=None, cpu_time=None,
+                                            context_switches=None):
+    # the very first inference is the first warm-up iteration, if there is warm-up
+    first_inference_time = warmup_time_infer[0] if warmup_time_infer else inference_time[0]
     iterations_num = len(inference_time)
     execution_time = sum(inference_time)
     latency_per_token_median = None
@@ -73,6 +120,8 @@ def calculate_performance_metrics_sync_mode(batch_size, inference_time, min_infe
     average_audio_length = None
 
     inference_time, num_tokens = delete_incorrect_time(inference_time, num_tokens, min_infer_time)
+    latency_percentiles = calculate_latency_percentiles(inference_time)
+    latency_histogram = calculate_latency_histogram(inference_time)
     if num_tokens:
         latencies_per_token = calculate_latency_per_value(inference_time, num_tokens)
         latencies_per_token = three_sigma_rule(latencies_per_token)
@@ -93,11 +142,19 @@ def calculate_performance_metrics_sync_mode(batch_size, inference_time, min_infe
         'iterations_num': iterations_num,
         'execution_time': round(execution_time, 3),
         'first_inference_time': round(first_inference_time, 5),
+        'warmup_iterations_num': len(warmup_time_infer) if warmup_time_infer else 0,
+        'warmup_time': round(sum(warmup_time_infer), 5) if warmup_time_infer else 0,
+        'steady_state_reached': steady_state_reached,
+        # CPU time of all threads of the process can exceed the execution time
+        'cpu_time_per_iteration': round(float(np.mean(cpu_time)), 6) if cpu_time else None,
+        'context_switches_per_iteration': round(float(np.mean(context_switches)), 3) if context_switches else None,
         'latency_avg': round(average_time, 5),
         'latency_median': round(latency, 5),
         'latency_std': round(latency_std, 5),
         'latency_max': round(max(inference_time), 5),
         'latency_min': round(min(inference_time), 5),
+        **latency_percentiles,
+        'latency_histogram': latency_histogram,
         'latency_per_token': round(latency_per_token_median, 5) if latency_per_token_median is not None else None,
         'num_tokens': np.median(num_tokens) if num_tokens else None,
         'min_num_tokens': min(num_tokens) if num_tokens else None,
@@ -112,6 +169,27 @@ def calculate_performance_metrics_sync_mode(batch_size, inference_time, min_infe
     return inference_result
 
 
+def calculate_performance_metrics_open_loop(batch_size, open_loop_results, max_rate_under_sla=None,
+                                            warmup_time_infer=None, steady_state_reached=None):
+    """
+    Latency statistics of requests including their queueing time, throughput of the whole run
+    :param open_loop_results: results of the reported open-loop run
+    :param max_rate_under_sla: maximal arrival rate meeting latency SLA, None if SLA is not set
+    """
+    latencies = open_loop_results['time_infer']
+    duration = open_loop_results['duration']
+    inference_result = calculate_performance_metrics_sync_mode(batch_size, latencies,
+                                                               warmup_time_infer=warmup_time_infer,
+                                                               steady_state_reached=steady_state_reached)
+    inference_result.update({
+        'execution_time': round(duration, 3),
+        'throughput': round(calculate_average_fps(len(latencies), batch_size, duration), 3),
+        'arrival_rate': round(open_loop_results['arrival_rate'], 3) if open_loop_results['arrival_rate'] else None,
+        'max_rate_under_sla': round(max_rate_under_sla, 3) if max_rate_under_sla else None,
+    })
+    return inference_result
+
+
 def log_performance_metrics_sync_mode(log, average_time, fps, latency):
     log.info(f'Average time of single pass : {average_time:.3f}')
     log.info(f'FPS : {fps:.3f}')
@@ -122,14 +200,31 @@ def print_performance_metrics_sync_mode(log, average_time, fps, latency):
     log.info(f'{average_time:.3f},{fps:.3f},{latency:.3f}')
 
 
-def calculate_performance_metrics_async_mode(inference_time, batch_size, iteration_count):
+def calculate_performance_metrics_async_mode(inference_time, batch_size, iteration_count, latencies=None):
+    """
+    :param inference_time: time of the whole asynchronous run in seconds
+    :param iteration_count: number of completed requests
+    :param latencies: list of times from start to completion of each request, latency statistics are skipped if None
+    """
     average_time = inference_time / iteration_count
     fps = calculate_average_fps(iteration_count, batch_size, inference_time)
     inference_result = {
+        'iterations_num': iteration_count,
         'execution_time': round(inference_time, 3),
         'latency_avg': round(average_time, 5),
         'throughput': round(fps, 3),
     }
+    if latencies:
+        latency, latency_std = calculate_latency(latencies)
+        inference_result.update({
+            'latency_median': round(latency, 5),
+            'latency_std': round(latency_std, 5),
+            'latency_max': round(max(latencies), 5),
+            'latency_min': round(min(latencies), 5),
+            **calculate_latency_percentiles(latencies),
+            'latency_histogram': calculate_latency_histogram(latencies),
+            'batch_throughput': round(calculate_batch_fps(batch_size, latency), 3),
+        })
     return inference_result
 
 
@@ -1,12 +1,22 @@
 import json
 from pathlib import Path
 
+from inference_tools.heartbeat_tools import heartbeat
+from inference_tools.memory_tools import get_memory_results, record_memory, reset_memory_results
+from inference_tools.startup_tools import get_startup_results, record_import, reset_startup_results
+
 JSON_REPORT_TEMPLATE_PATH = Path(__file__).parent / 'report_template.json'
 
 
 class ReportWriter:
     def __init__(self):
         self.report = self.load_report_template()
+        # launchers create the writer after imports of frameworks
+        reset_memory_results()
+        record_memory('import')
+        reset_startup_results()
+        record_import()
+        heartbeat('load')
 
     def load_report_template(self):
         with open(JSON_REPORT_TEMPLATE_PATH) as f:
@@ -16,12 +26,21 @@ class ReportWriter:
     def update_configuration_setup(self, **kwargs):
         self._update_report('configurations_setup', **kwargs)
 
+    def update_input_shapes(self, input_shapes):
+        """
+        Input shapes by layer names, the benchmark reads them from the report instead of the launcher output
+        """
+        self.update_configuration_setup(input_shapes={str(layer): str(shape) for layer, shape in input_shapes.items()})
+
     def update_execution_results(self, **kwargs):
         self._update_report('execution_results', **kwargs)
 
     def update_framework_info(self, **kwargs):
         self._update_report('framework_info', **kwargs)
 
+    def update_startup(self, **kwargs):
+        self._update_report('startup', **kwargs)
+
     def update_cmd_options(self, **kwargs):
         self._update_report('cmd_options', **kwargs)
 
@@ -32,6 +51,11 @@ class ReportWriter:
             self.report[section][key] = value
 
     def write_report(self, target_file_path: Path):
+        heartbeat('report')
+        self.update_execution_results(**get_memory_results())
+        execution_results = self.report['execution_results']
+        self.update_startup(**get_startup_results(execution_results['read_network_time'],
+                                                  execution_results['compile_time']))
         if target_file_path.exists():
             target_file_path.unlink()
         with open(target_file_path, 'w', encoding='utf-8') as fp:
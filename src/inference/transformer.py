@@ -1,3 +1,5 @@
+import json
+
 import cv2
 import numpy as np
 
@@ -19,10 +21,44 @@ LAYER_LAYOUT_TO_IMAGE = {
 }
 
 
+def transform_batch(images, element_type, channel_swap=None, mean=None, input_scale=None, norm=False, layout=None):
+    """
+    Preprocess the whole batch of images with channels in the last axis in one pass.
+    :param images: array of images in NHWC order
+    :param element_type: type of the result, computations are done in float32 (float64 for float64 result)
+    :param channel_swap: order of channels, ex. [2, 1, 0] converts BGR to RGB
+    :param norm: divide values by 255 before mean subtraction
+    :param layout: order of axes passed to transpose, ex. LAYER_LAYOUT_TO_IMAGE['NCHW']
+    :return: contiguous array of element_type
+    """
+    images = np.asarray(images)
+    compute_type = np.float64 if np.dtype(element_type) == np.float64 else np.float32
+    channel_axis = images.ndim - 1
+    if channel_swap is not None:
+        images = images[..., list(channel_swap)]
+    if layout is not None:
+        # transpose source data, it is smaller than the float copy, and keep channels out of the inner loop
+        images = images.transpose(layout)
+        channel_axis = list(layout).index(channel_axis)
+    channel_shape = [1] * images.ndim
+    channel_shape[channel_axis] = -1
+
+    transformed_images = np.empty(images.shape, dtype=compute_type)
+    transformed_images[...] = images
+    if norm:
+        transformed_images *= compute_type(1 / 255)
+    if mean is not None:
+        transformed_images -= np.asarray(mean, dtype=compute_type).reshape(channel_shape)
+    if input_scale is not None:
+        transformed_images /= np.asarray(input_scale, dtype=compute_type).reshape(channel_shape)
+    return transformed_images.astype(element_type, copy=False)
+
+
 class Transformer:
-    @staticmethod
-    def _transform(image):
-        return image
+    def get_cache_key(self):
+        # transformed images depend on the transformer type and its settings from create_dict_for_transformer
+        settings = {name: value for name, value in vars(self).items() if name != '_model'}
+        return json.dumps({'transformer': type(self).__name__, 'settings': settings}, sort_keys=True, default=str)
 
     @staticmethod
     def get_shape_in_chw_order(shape, *args):
@@ -30,19 +66,13 @@ class Transformer:
 
     def transform_images(self, images, shape, element_type, *args):
         dataset_size = images.shape[0]
-        new_shape = [dataset_size] + shape[1:]
-        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
-        for i in range(dataset_size):
-            transformed_images[i] = self._transform(images[i])
+        new_shape = [dataset_size] + list(shape[1:])
+        transformed_images = np.empty(shape=new_shape, dtype=element_type)
+        transformed_images[:] = images
         return transformed_images
 
 
 class OpenVINOTransformer(Transformer):
-    def _transform(self, image, shape):
-        if self.__is_nhwc(shape):
-            return image
-        return image.transpose(2, 0, 1)
-
     def __is_nhwc(self, shape):
         return (len(shape) in [3, 4]) and (shape[len(shape) - 1] in [1, 3])
 
@@ -54,12 +84,8 @@ class OpenVINOTransformer(Transformer):
     def transform_images(self, images, shape, element_type, *args):
         dataset_size = images.shape[0]
         new_shape = [dataset_size, shape[1], shape[2], shape[3]]
-        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
-        image_index = 0
-        for i in range(dataset_size):
-            image_index %= images.shape[0]
-            transformed_images[i] = self._transform(images[image_index], shape)
-            image_index += 1
+        transformed_images = np.empty(shape=new_shape, dtype=element_type)
+        transformed_images[:] = images if self.__is_nhwc(shape) else images.transpose(0, 3, 1, 2)
         return transformed_images
 
 
@@ -67,37 +93,12 @@ class IntelCaffeTransformer(Transformer):
     def __init__(self, converting):
         self._converting = converting
 
-    def __set_channel_swap(self, image):
-        if 'channel_swap' in self._converting:
-            image = image[self._converting['channel_swap'], :, :]
-
-    def __set_mean(self, image):
-        if 'mean' in self._converting:
-            image[:, :, 0] -= self._converting['mean'][0]
-            image[:, :, 1] -= self._converting['mean'][1]
-            image[:, :, 2] -= self._converting['mean'][2]
-
-    def __set_input_scale(self, image):
-        if 'input_scale' in self._converting:
-            image[:, :, 0] /= self._converting['input_scale'][0]
-            image[:, :, 1] /= self._converting['input_scale'][1]
-            image[:, :, 2] /= self._converting['input_scale'][2]
-
-    def _transform(self, image):
-        transformed_image = np.copy(image).astype(np.float32)
-        transformed_image = transformed_image.transpose(2, 0, 1)
-        self.__set_channel_swap(transformed_image)
-        self.__set_mean(transformed_image)
-        self.__set_input_scale(transformed_image)
-        return transformed_image
-
     def transform_images(self, images, shape, element_type, *args):
-        dataset_size = images.shape[0]
-        new_shape = [dataset_size] + list(shape[1:])
-        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
-        for i in range(dataset_size):
-            transformed_images[i] = self._transform(images[i])
-        return transformed_images
+        return transform_batch(images, element_type,
+                               channel_swap=self._converting.get('channel_swap'),
+                               mean=self._converting.get('mean'),
+                               input_scale=self._converting.get('input_scale'),
+                               layout=LAYER_LAYOUT_TO_IMAGE['NCHW'])
 
 
 class TensorFlowTransformer(Transformer):
@@ -108,36 +109,11 @@ class TensorFlowTransformer(Transformer):
         h, w, c = shape[1:]
         return c, h, w
 
-    def __set_channel_swap(self, image):
-        if 'channel_swap' in self._converting:
-            image = image[:, :, self._converting['channel_swap']]
-
-    def __set_mean(self, image):
-        if 'mean' in self._converting:
-            image[:, :, 0] -= self._converting['mean'][0]
-            image[:, :, 1] -= self._converting['mean'][1]
-            image[:, :, 2] -= self._converting['mean'][2]
-
-    def __set_input_scale(self, image):
-        if 'input_scale' in self._converting:
-            image[:, :, 0] /= self._converting['input_scale'][0]
-            image[:, :, 1] /= self._converting['input_scale'][1]
-            image[:, :, 2] /= self._converting['input_scale'][2]
-
-    def _transform(self, image):
-        transformed_image = np.copy(image).astype(np.float64)
-        self.__set_channel_swap(transformed_image)
-        self.__set_mean(transformed_image)
-        self.__set_input_scale(transformed_image)
-        return transformed_image
-
     def transform_images(self, images, shape, element_type, *args):
-        dataset_size = images.shape[0]
-        new_shape = [dataset_size] + shape[1:]
-        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
-        for i in range(dataset_size):
-            transformed_images[i] = self._transform(images[i])
-        return transformed_images
+        return transform_batch(images, element_type,
+                               channel_swap=self._converting.get('channel_swap'),
+                               mean=self._converting.get('mean'),
+                               input_scale=self._converting.get('input_scale'))
 
 
 class TensorFlowLiteTransformer(TensorFlowTransformer):
@@ -153,83 +129,41 @@ class TensorFlowLiteTransformer(TensorFlowTransformer):
             chw = shape[-1], shape[-3], shape[-2]
         return chw
 
-    def __set_channel_swap(self, image, input_name):
-        channel_swap = self._converting[input_name]['channel_swap']
-        if channel_swap is not None:
-            image = image[:, :, :, channel_swap]
-
-    def __set_mean(self, image, input_name):
-        mean = self._converting[input_name]['mean']
-        if mean is not None:
-            image -= mean
-
-    def __set_input_scale(self, image, input_name):
-        input_scale = self._converting[input_name]['input_scale']
-        if input_scale is not None:
-            image /= input_scale
-
-    def __set_layout_order(self, image, input_name):
-        layout = self._converting[input_name]['layout']
-        if layout is not None:
-            layout = LAYER_LAYOUT_TO_IMAGE[layout]
-            image = image.transpose(layout)
-        return image
-
-    def _transform(self, image, input_name):
-        transformed_image = np.copy(image).astype(np.float64)
-        self.__set_channel_swap(transformed_image, input_name)
-        self.__set_mean(transformed_image, input_name)
-        self.__set_input_scale(transformed_image, input_name)
-        transformed_image = self.__set_layout_order(transformed_image, input_name)
-        return transformed_image
-
     def transform_images(self, images, shape, element_type, input_name):
-        transformed_images = np.zeros(shape=shape)
-        transformed_images = self._transform(images, input_name)
-        return transformed_images.astype(element_type)
+        converting = self._converting[input_name]
+        layout = converting['layout']
+        return transform_batch(images, element_type,
+                               channel_swap=converting['channel_swap'],
+                               mean=converting['mean'],
+                               input_scale=converting['input_scale'],
+                               layout=LAYER_LAYOUT_TO_IMAGE[layout] if layout is not None else None)
 
 
 class MXNetTransformer(Transformer):
     def __init__(self, converting):
         self._converting = converting
 
-    def __set_norm(self, image):
+    def __set_norm(self, images):
         import mxnet
         if self._converting['norm'] is True:
-            mean = mxnet.nd.array([self._converting['mean'][0],
-                                   self._converting['mean'][1],
-                                   self._converting['mean'][2]])
-            std = mxnet.nd.array([self._converting['std'][0],
-                                  self._converting['std'][1],
-                                  self._converting['std'][2]])
-            normalized_image = mxnet.image.color_normalize(
-                mxnet.nd.array(image).astype(np.float32) / 255, mean=mean, std=std)
-            return normalized_image
-        return image
-
-    def __set_channel_swap(self, image):
+            mean = mxnet.nd.array(self._converting['mean'][:3])
+            std = mxnet.nd.array(self._converting['std'][:3])
+            normalized_images = mxnet.image.color_normalize(
+                mxnet.nd.array(images).astype(np.float32) / 255, mean=mean, std=std)
+            return normalized_images
+        return mxnet.nd.array(images)
+
+    def __set_channel_swap(self, images):
         if self._converting['channel_swap'] is not None:
-            transposing_form = (self._converting['channel_swap'][0],
-                                self._converting['channel_swap'][1],
-                                self._converting['channel_swap'][2])
-            transposed_image = image.transpose(transposing_form)
-            return transposed_image
-        return image
-
-    def _transform(self, image):
-        normalized_image = self.__set_norm(image)
-        transposed_image = self.__set_channel_swap(normalized_image)
-        return transposed_image
+            # channel_swap is the transposing form of a single image, batch axis is kept first
+            transposing_form = [0] + [axis + 1 for axis in self._converting['channel_swap'][:3]]
+            return images.transpose(transposing_form)
+        return images
 
     def transform_images(self, images, shape, element_type, *args):
-        import mxnet
-
-        dataset_size = images.shape[0]
-        new_shape = [dataset_size] + shape[1:]
-        transformed_images = mxnet.nd.zeros(shape=new_shape, dtype=element_type)
-        for i in range(dataset_size):
-            transformed_images[i] = self._transform(images[i])
-        return transformed_images
+        normalized_images = self.__set_norm(images)
+        transposed_images = self.__set_channel_swap(normalized_images)
+        return transposed_images.astype(element_type)
 
 
 class OpenCVTransformer(Transformer):
@@ -247,19 +181,13 @@ class OpenCVTransformer(Transformer):
 
     def __set_layout_order(self, image):
         if self._layout is not None:
-            self._layout = LAYER_LAYOUT_TO_IMAGE[self._layout]
-            image = image.transpose(self._layout)
+            image = image.transpose(LAYER_LAYOUT_TO_IMAGE[self._layout])
         return image
 
-    def _transform(self, image):
-        blob = cv2.dnn.blobFromImage(image, **self._converting)
-        transformed_blob = self.__set_layout_order(blob / self._std)
-        return transformed_blob
-
     def transform_images(self, images, shape, element_type, *args):
         blob = cv2.dnn.blobFromImages(images, **self._converting)
-        transformed_blob = self.__set_layout_order(blob / self._std)
-        return transformed_blob
+        blob /= self._std
+        return self.__set_layout_order(blob)
 
 
 class PyTorchTransformer(TensorFlowLiteTransformer):
@@ -287,44 +215,14 @@ class TVMTransformer(Transformer):
             chw = shape[-1], shape[-3], shape[-2]
         return chw
 
-    def __set_channel_swap(self, image, input_name):
-        channel_swap = self._converting['channel_swap']
-        if channel_swap is not None:
-            image = image[:, :, :, channel_swap]
-
-    def __set_norm(self, image, input_name):
-        image /= [np.float32(255), np.float32(255), np.float32(255)]
-
-    def __set_mean(self, image, input_name):
-        mean = self._converting['mean']
-        if mean is not None:
-            image -= mean
-
-    def __set_input_scale(self, image, input_name):
-        input_scale = self._converting['std']
-        if input_scale is not None:
-            image /= input_scale
-
-    def __set_layout_order(self, image, input_name):
-        layout = self._converting['layout']
-        if layout is not None:
-            layout = LAYER_LAYOUT_TO_IMAGE[layout]
-            image = image.transpose(layout)
-        return image
-
-    def _transform(self, image, input_name):
-        transformed_image = np.copy(image).astype(np.float64)
-        self.__set_channel_swap(transformed_image, input_name)
-        if self._converting['norm']:
-            self.__set_norm(transformed_image, input_name)
-        self.__set_mean(transformed_image, input_name)
-        self.__set_input_scale(transformed_image, input_name)
-        transformed_image = self.__set_layout_order(transformed_image, input_name)
-        return transformed_image
-
     def transform_images(self, images, shape, element_type, input_name):
-        transformed_images = self._transform(images, input_name)
-        return transformed_images.astype(element_type)
+        layout = self._converting['layout']
+        return transform_batch(images, element_type,
+                               channel_swap=self._converting['channel_swap'],
+                               mean=self._converting['mean'],
+                               input_scale=self._converting['std'],
+                               norm=self._converting['norm'],
+                               layout=LAYER_LAYOUT_TO_IMAGE[layout] if layout is not None else None)
 
 
 class ONNXRuntimeTransformerCpp(Transformer):
@@ -351,16 +249,12 @@ class PyTorchTransformerCpp(Transformer):
 
 
 class NcnnTransformer(Transformer):
-    def _transform(self, image, shape):
-        return image
-
     def get_shape_in_chw_order(self, shape, *args):
         return shape[3], shape[1], shape[2]
 
     def transform_images(self, images, shape, element_type, *args):
         dataset_size = images.shape[0]
         new_shape = [dataset_size, shape[1], shape[2], shape[3]]
-        transformed_images = np.zeros(shape=new_shape, dtype=element_type)
-        for i in range(dataset_size):
-            transformed_images[i] = self._transform(images[i], shape)
+        transformed_images = np.empty(shape=new_shape, dtype=element_type)
+        transformed_images[:] = images
         return transformed_images
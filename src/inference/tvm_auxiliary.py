@@ -3,7 +3,7 @@ import importlib
 import abc
 
 from pathlib import Path
-from time import time
+from time import perf_counter
 
 from inference_tools.loop_tools import loop_inference, get_exec_time
 
@@ -47,9 +47,9 @@ class InferenceHelper:
         time_infer = []
         if num_of_iterations == 1:
             slice_input = get_slice()
-            t0 = time()
+            t0 = perf_counter()
             result = self._inference_tvm(module, input_name, slice_input)
-            t1 = time()
+            t1 = perf_counter()
             time_infer.append(t1 - t0)
         else:
             loop_results = loop_inference(num_of_iterations, test_duration)(self.inference_iteration)(get_slice,
@@ -124,14 +124,25 @@ def create_core(path_to_extension, path_to_intel_gpu_config, device, nthreads, n
         raise Exception('Inference Engine is unavailable!')
 
 
-def compile_model(core, model, device, multi_priority):
+def compile_model(core, model, device, multi_priority, cache_dir=None):
     properties = {}
     if 'MULTI' in device and multi_priority:
         properties.update({'MULTI_DEVICE_PRIORITIES': multi_priority})
+    if cache_dir:
+        # OpenVINO keys compiled blobs by model, device, properties and runtime version itself
+        properties.update({'CACHE_DIR': str(cache_dir)})
     compiled_model = core.compile_model(model, device, properties)
     return compiled_model
 
 
+def is_loaded_from_cache(compiled_model):
+    try:
+        return bool(compiled_model.get_property('LOADED_FROM_CACHE'))
+    except Exception:
+        # property is not supported by the device or the OpenVINO version
+        return None
+
+
 def get_input_shape(io_model_wrapper, model):
     layer_shapes = {}
     layer_names = io_model_wrapper.get_input_layer_names(model)
@@ -153,6 +164,11 @@ def reshape_input(model, batch_size):
     model.reshape(new_shapes)
 
 
+def create_shared_tensor(input_name, data):
+    # tensor shares memory with the cached batch, setting it to request does not copy input data
+    return Tensor(data, shared_memory=True)
+
+
 def set_input_to_blobs(request, input_):
     model_inputs = request.model_inputs
     for layer_name, data in input_.items():
@@ -165,7 +181,7 @@ def set_input_to_blobs(request, input_):
                         raise ValueError('Input data and input layer with name {0} has different shapes: '
                                          '{1} and {2}'.format(layer_name, PartialShape(data.shape),
                                                               model_input.get_partial_shape()))
-                    new_tensor = Tensor(data)
+                    new_tensor = data if isinstance(data, Tensor) else Tensor(data)
                     request.set_tensor(model_input.get_any_name(), new_tensor)
                     found_tensor = True
         else:
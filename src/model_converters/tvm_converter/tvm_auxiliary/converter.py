@@ -3,6 +3,7 @@ import abc
 import sys
 import os
 from pathlib import Path
+from time import perf_counter
 
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent.joinpath('utils')))
 from logger_conf import configure_logger  # noqa: E402
@@ -32,6 +33,9 @@ class TVMConverter(metaclass=abc.ABCMeta):
         self.graph = None
         self.mod = None
         self.params = None
+        self.load_time = None
+        self.compile_time = None
+        self.cache_hit = None
         self.log = log
         self.tvm = importlib.import_module('tvm')
         self.tvm.relay = importlib.import_module('tvm.relay')
@@ -146,7 +150,7 @@ class TVMConverter(metaclass=abc.ABCMeta):
             with open(f'{self.output_dir}/{lib_name}.ro', 'wb') as fo:
                 fo.write(lib[0])
 
-    def get_graph_module_from_vm(self, mod, params, target, dev):
+    def get_graph_module_from_vm(self, mod, params, target, dev, cache_entry=None):
         rly_vm = self.tvm.relay.vm
         vm = self.tvm.runtime.vm
         if self.mod_type == 'so' and self.params_type == 'ro':
@@ -154,25 +158,80 @@ class TVMConverter(metaclass=abc.ABCMeta):
         else:
             with self.tvm.transform.PassContext(opt_level=self.opt_level):
                 executable = rly_vm.compile(mod, target=target, params=params)
+            if cache_entry is not None:
+                code, lib = executable.save()
+                self._save_cached_file(cache_entry / 'model.ro', lambda path: Path(path).write_bytes(code))
+                self._save_cached_file(cache_entry / 'model.so', lib.export_library)
         des_vm = vm.VirtualMachine(executable, dev)
         return des_vm
 
-    def get_graph_module_from_relay(self, mod, params, target, dev):
+    def get_graph_module_from_relay(self, mod, params, target, dev, cache_entry=None):
         with self.tvm.transform.PassContext(opt_level=self.opt_level):
             lib = self.tvm.relay.build(mod, target=target, params=params)
+        if cache_entry is not None:
+            self._save_cached_file(cache_entry / 'model.so', lib.export_library)
         self.graph = self.graph_executor.GraphModule(lib['default'](dev))
         return self.graph
 
-    def get_graph_module(self):
+    def get_cache_key(self, compiled_model_cache):
+        return compiled_model_cache.get_key([self.model_path, self.model_params], tvm_version=self.tvm.__version__,
+                                            source_framework=self.source_framework, model_name=self.model_name,
+                                            module=self.module, input_name=self.input_name,
+                                            input_shape=self.input_shape, device=self.device, target=self.target_str,
+                                            opt_level=self.opt_level, vm=self.vm)
+
+    def _save_cached_file(self, path, save_func):
+        # concurrent tests may compile the same model, the complete file is renamed to the cache entry
+        tmp_path = path.with_name(f'{os.getpid()}.{path.name}')
+        save_func(str(tmp_path))
+        os.replace(tmp_path, path)
+
+    def _load_cached_graph_module(self, cache_entry, dev):
+        lib_path = cache_entry / 'model.so'
+        code_path = cache_entry / 'model.ro'
+        if not lib_path.is_file() or (self.vm and not code_path.is_file()):
+            return None
+        self.log.info(f'Loading compiled model from cache: {cache_entry}')
+        lib = self.tvm.runtime.load_module(str(lib_path))
+        if self.vm:
+            vm = self.tvm.runtime.vm
+            executable = vm.Executable.load_exec(code_path.read_bytes(), lib)
+            return vm.VirtualMachine(executable, dev)
+        self.graph = self.graph_executor.GraphModule(lib['default'](dev))
+        return self.graph
+
+    def get_graph_module(self, compiled_model_cache=None):
+        """
+        :param compiled_model_cache: CompiledModelCache to load the compiled model from or to save it to,
+                                     models already compiled to libraries are not cached
+        """
         target, dev = self._get_target_device()
+        cache_entry = None
+        if compiled_model_cache is not None and self.mod_type not in ['so', 'tar']:
+            cache_entry = compiled_model_cache.get_entry(self.get_cache_key(compiled_model_cache))
+            t0 = perf_counter()
+            graph_module = self._load_cached_graph_module(cache_entry, dev)
+            if graph_module is not None:
+                self.load_time, self.compile_time, self.cache_hit = perf_counter() - t0, 0.0, True
+                compiled_model_cache.touch(cache_entry)
+                return graph_module
+            self.cache_hit = False
+
         self.log.info(f'Get TVM model from {self.source_framework} model')
+        t0 = perf_counter()
         model = self._convert_model_from_framework()
+        self.load_time = perf_counter() - t0
 
         self.log.info(f'Creating graph module from {self.source_framework} model')
+        t0 = perf_counter()
         if len(model) == 2:
             if self.vm:
-                return self.get_graph_module_from_vm(model[0], model[1], target, dev)
+                graph_module = self.get_graph_module_from_vm(model[0], model[1], target, dev, cache_entry)
             else:
-                return self.get_graph_module_from_relay(model[0], model[1], target, dev)
+                graph_module = self.get_graph_module_from_relay(model[0], model[1], target, dev, cache_entry)
         else:
-            return self.get_graph_module_from_lib(model[0])
+            graph_module = self.get_graph_module_from_lib(model[0])
+        self.compile_time = perf_counter() - t0
+        if cache_entry is not None:
+            compiled_model_cache.evict(keep=cache_entry)
+        return graph_module
@@ -1,6 +1,17 @@
+import argparse
+import json
+import os
 import platform
 import subprocess
 from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:
+    # python 3.7
+    importlib_metadata = None
 
 try:
     from openvino.runtime import Core
@@ -8,29 +19,33 @@ try:
 except ImportError:
     _ov_core_supported = False
 
+CPU_SYSFS_PATH = Path('/sys/devices/system/cpu')
+NUMA_SYSFS_PATH = Path('/sys/devices/system/node')
+ISA_FLAGS = ['sse4_2', 'avx', 'avx2', 'fma', 'avx512f', 'avx512bw', 'avx512vl', 'avx512_vnni', 'avx512_bf16',
+             'avx512_fp16', 'avx_vnni', 'amx_tile', 'amx_int8', 'amx_bf16', 'neon', 'asimd', 'sve']
+FRAMEWORK_PACKAGES = ['openvino', 'torch', 'tensorflow', 'tflite-runtime', 'onnxruntime', 'mxnet', 'paddlepaddle',
+                      'apache-tvm', 'ncnn', 'dgl', 'spektral', 'opencv-python', 'numpy']
 
-def get_cpu_name():
-    cpuname = 'Undefined'
-
-    if _ov_core_supported:
-        core = Core()
-        if 'CPU' in core.available_devices:
-            cpuname = core.get_property('CPU', 'FULL_DEVICE_NAME')
-        del core
 
-    return cpuname.strip()
+@lru_cache(maxsize=None)
+def get_openvino_device_names():
+    """
+    Full names of devices available for OpenVINO, one Core is created for all devices
+    """
+    if not _ov_core_supported:
+        return {}
+    core = Core()
+    device_names = {device: core.get_property(device, 'FULL_DEVICE_NAME') for device in core.available_devices}
+    del core
+    return device_names
 
 
-def get_gpu_name():
-    gpuname = 'Undefined'
+def get_cpu_name():
+    return get_openvino_device_names().get('CPU', 'Undefined').strip()
 
-    if _ov_core_supported:
-        core = Core()
-        if 'GPU' in core.available_devices:
-            gpuname = core.get_property('GPU', 'FULL_DEVICE_NAME')
-        del core
 
-    return gpuname
+def get_gpu_name():
+    return get_openvino_device_names().get('GPU', 'Undefined')
 
 
 def get_ram_size(ostype):
@@ -44,11 +59,10 @@ def get_ram_size(ostype):
         text = text.split('=')
         ramsize = text[1].strip() + ' KB'
     elif ostype == 'Linux':
-        command = ['cat', '/proc/meminfo']
-        all_info = subprocess.check_output(command).strip().decode()
-        for line in all_info.split('\n'):
-            if 'MemTotal' in line:
-                return line.split(':')[1].strip()
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if 'MemTotal' in line:
+                    return line.split(':')[1].strip()
     return ramsize
 
 
@@ -66,7 +80,126 @@ def get_system_characteristics():
     return characteristics
 
 
+def _read_sysfs(path):
+    try:
+        return Path(path).read_text().strip()
+    except OSError:
+        return None
+
+
+def get_cpu_topology():
+    """
+    CPU model, topology and supported ISA extensions from /proc/cpuinfo, empty on systems without it
+    """
+    try:
+        with open('/proc/cpuinfo') as cpuinfo:
+            blocks = cpuinfo.read().strip().split('\n\n')
+    except OSError:
+        return {}
+    processors = []
+    for block in blocks:
+        processor = {}
+        for line in block.split('\n'):
+            key, _, value = line.partition(':')
+            processor[key.strip()] = value.strip()
+        processors.append(processor)
+    flags = set(processors[0].get('flags', processors[0].get('Features', '')).split())
+    cores = {(processor.get('physical id'), processor.get('core id')) for processor in processors}
+    numa_nodes = list(NUMA_SYSFS_PATH.glob('node[0-9]*')) if NUMA_SYSFS_PATH.exists() else []
+    return {
+        'cpu_model': processors[0].get('model name', processors[0].get('Model')),
+        'sockets': len({processor.get('physical id') for processor in processors}),
+        # physical and core ids are absent on some architectures, every logical cpu is a core then
+        'cores': len(cores) if len(cores) > 1 else len(processors),
+        'threads': len(processors),
+        'numa_nodes': max(len(numa_nodes), 1),
+        'isa_flags': [flag for flag in ISA_FLAGS if flag in flags],
+        'microcode': processors[0].get('microcode'),
+    }
+
+
+def get_cpu_caches():
+    """
+    Cache sizes of the first CPU, ex. {'L1d': '48K', 'L2': '2048K'}
+    """
+    caches = {}
+    for index in sorted(CPU_SYSFS_PATH.glob('cpu0/cache/index[0-9]*')):
+        level, cache_type, size = (_read_sysfs(index / name) for name in ['level', 'type', 'size'])
+        if level is None or size is None:
+            continue
+        suffix = {'Data': 'd', 'Instruction': 'i'}.get(cache_type, '')
+        caches[f'L{level}{suffix}'] = size
+    return caches
+
+
+def get_cpu_frequency():
+    """
+    Frequency governor and limits (kHz) of the first CPU
+    """
+    cpufreq = CPU_SYSFS_PATH / 'cpu0' / 'cpufreq'
+    return {
+        'governor': _read_sysfs(cpufreq / 'scaling_governor'),
+        'min_frequency': _read_sysfs(cpufreq / 'cpuinfo_min_freq'),
+        'max_frequency': _read_sysfs(cpufreq / 'cpuinfo_max_freq'),
+        'scaling_max_frequency': _read_sysfs(cpufreq / 'scaling_max_freq'),
+        'boost': _read_sysfs(CPU_SYSFS_PATH / 'cpufreq' / 'boost'),
+    }
+
+
+def get_framework_versions():
+    """
+    Versions of installed inference frameworks
+    """
+    versions = {}
+    if importlib_metadata is None:
+        return versions
+    for package in FRAMEWORK_PACKAGES:
+        try:
+            versions[package] = importlib_metadata.version(package)
+        except importlib_metadata.PackageNotFoundError:
+            pass
+    return versions
+
+
+def get_system_fingerprint():
+    """
+    Structured description of the machine affecting performance results
+    """
+    ostype = platform.system()
+    fingerprint = {
+        'cpu_model': get_cpu_name(),
+        'cpu_family': platform.processor(),
+        'gpu': get_gpu_name(),
+        'ram_size': get_ram_size(ostype),
+        'threads': os.cpu_count(),
+    }
+    fingerprint.update(get_cpu_topology())
+    fingerprint.update({
+        'caches': get_cpu_caches(),
+        **get_cpu_frequency(),
+        'os': ostype,
+        'os_version': platform.platform(),
+        'kernel': platform.release(),
+        'python_version': platform.python_version(),
+        'frameworks': get_framework_versions(),
+    })
+    return fingerprint
+
+
+def cli_argument_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fingerprint',
+                        help='Print structured machine fingerprint as JSON',
+                        action='store_true',
+                        dest='fingerprint')
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
-    hardware_dict = get_system_characteristics()
-    for key in hardware_dict:
-        print('{0}: {1}'.format(key, hardware_dict[key]))
+    args = cli_argument_parser()
+    if args.fingerprint:
+        print(json.dumps(get_system_fingerprint(), sort_keys=True))
+    else:
+        hardware_dict = get_system_characteristics()
+        for key in hardware_dict:
+            print('{0}: {1}'.format(key, hardware_dict[key]))
@@ -6,6 +6,8 @@ import platform
 import subprocess
 import sys
 
+from table_format import get_host_table_name
+
 
 class Launcher(metaclass=abc.ABCMeta):
     def __init__(self, target, path_to_ftp_client, params_config, executor, os_type, result, logs):
@@ -26,9 +28,10 @@ class Launcher(metaclass=abc.ABCMeta):
         with open(self.local_config, 'wb') as config_file:
             ftp_connection.retrbinary('RETR {0}'.format(self.source_config), config_file.write)
 
-    def download_result(self, ftp_connection):
-        result_table = open(self.result, 'rb')
-        ftp_connection.storbinary('STOR {0}_{1}_result_table.csv'.format(platform.node(), self.target), result_table)
+    def download_result(self, ftp_connection, host_name=None):
+        host_name = host_name or platform.node()
+        with open(self.result, 'rb') as result_table:
+            ftp_connection.storbinary(f'STOR {get_host_table_name(host_name, self.target)}', result_table)
 
     def launch(self):
         command_line = self._get_command_line()
@@ -143,6 +146,10 @@ def cli_argument_parser():
                         help='Path to the global datasets configuration file',
                         type=str,
                         required=False)
+    parser.add_argument('--host_name',
+                        help='Name of the machine in names of result tables on the FTP, network name by default',
+                        type=str,
+                        required=False)
 
     args = parser.parse_args()
 
@@ -166,7 +173,7 @@ def main():
 
         ftp_connection = ftplib.FTP(param_list.server_ip, param_list.login, param_list.password)
         ftp_connection.cwd(param_list.ftp_dir)
-        benchmark.download_result(ftp_connection)
+        benchmark.download_result(ftp_connection, param_list.host_name)
         ftp_connection.close()
 
     # accuracy checker
@@ -186,7 +193,7 @@ def main():
 
         ftp_connection = ftplib.FTP(param_list.server_ip, param_list.login, param_list.password)
         ftp_connection.cwd(param_list.ftp_dir)
-        accuracy_checker.download_result(ftp_connection)
+        accuracy_checker.download_result(ftp_connection, param_list.host_name)
         ftp_connection.close()
 
 
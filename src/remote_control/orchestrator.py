@@ -0,0 +1,202 @@
+import asyncio
+import ftplib
+import os
+import threading
+from collections import Counter
+from time import time
+
+import table_format
+
+# delay in seconds before the second attempt to connect or launch, it is doubled after every failed attempt
+INITIAL_BACKOFF = 2.0
+MAX_BACKOFF = 60.0
+FINISHED_STATES = ('done', 'failed')
+
+
+def run_in_thread(function, *args):
+    """Run the blocking call of SSH, WMI or FTP client in a daemon thread. The thread of the timed out call
+    is abandoned, it does not delay the exit of the script.
+    """
+    loop = asyncio.get_event_loop()
+    future = loop.create_future()
+
+    def set_result(result, exception):
+        # the future is cancelled by the timeout of the caller
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    def run():
+        result, exception = None, None
+        try:
+            result = function(*args)
+        except Exception as error:
+            exception = error
+        try:
+            loop.call_soon_threadsafe(set_result, result, exception)
+        except RuntimeError:
+            # the event loop is closed after the timeout of the host
+            pass
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+class HostStatus:
+    def __init__(self, host):
+        self.host = host
+        self.state = 'waiting'
+        self.message = ''
+        self.start_time = time()
+        self.state_time = self.start_time
+
+
+class ResultsMerger:
+    """Merge result tables of hosts into common tables on the FTP as soon as each host finishes"""
+
+    def __init__(self, server_ip, login, password, ftp_dir, result_tables, log):
+        """ResultsMerger constructor
+
+        :param result_tables: Names of common tables by targets of ftp_client.py ('benchmark', 'accuracy_checker')
+        """
+        self._server_ip = server_ip
+        self._login = login
+        self._password = password
+        self._ftp_dir = ftp_dir
+        self._result_tables = result_tables
+        self._log = log
+        # hosts finish concurrently, tables are merged one host at a time
+        self._lock = threading.Lock()
+        for table_name in self._result_tables.values():
+            if os.path.isfile(table_name):
+                os.remove(table_name)
+
+    def merge_host(self, host_name):
+        """Append tables of the finished host to the common tables and upload them to the FTP"""
+        with self._lock:
+            ftp_connection = ftplib.FTP(self._server_ip, self._login, self._password)
+            try:
+                ftp_connection.cwd(self._ftp_dir)
+                for target, table_name in self._result_tables.items():
+                    host_table = table_format.get_host_table_name(host_name, target)
+                    try:
+                        table_format.append_table(ftp_connection, host_table, table_name)
+                    except ftplib.error_perm as error:
+                        self._log.warning(f'{host_name}: no {target} results on the FTP ({error})')
+                        continue
+                    table_format.upload_table(ftp_connection, table_name)
+            finally:
+                ftp_connection.close()
+
+
+class RemoteOrchestrator:
+    """Connect to all machines, launch experiments and merge their results concurrently. One unreachable
+    or hung machine fails after its timeouts without delaying the others.
+    """
+
+    def __init__(self, machine_list, log, create_executor, get_command_line, merger=None,
+                 attempts=5, attempt_timeout=60, host_timeout=None, status_period=30):
+        """RemoteOrchestrator constructor
+
+        :param create_executor: Callable returning RemoteExecutor for the machine
+        :param get_command_line: Callable returning the command line of ftp_client.py for the machine
+        :param merger: ResultsMerger, results are not merged if it is None
+        :param attempts: Number of attempts to connect to the machine and to launch the experiment
+        :param attempt_timeout: Maximal time in seconds of one attempt
+        :param host_timeout: Maximal time in seconds of the whole experiment on the machine, None is unlimited
+        :param status_period: Period in seconds of the status of all machines in the log
+        """
+        self._machine_list = machine_list
+        self._log = log
+        self._create_executor = create_executor
+        self._get_command_line = get_command_line
+        self._merger = merger
+        self._attempts = attempts
+        self._attempt_timeout = attempt_timeout
+        self._host_timeout = host_timeout
+        self._status_period = status_period
+        self._statuses = {machine.ip: HostStatus(machine.ip) for machine in machine_list}
+
+    async def run(self):
+        """Run experiments on all machines, returns hosts with failed experiments"""
+        status_task = asyncio.ensure_future(self._report_status())
+        try:
+            await asyncio.gather(*(self._run_host(machine) for machine in self._machine_list))
+        finally:
+            status_task.cancel()
+        self._log_status()
+        return [host for host, status in self._statuses.items() if status.state == 'failed']
+
+    async def _run_host(self, machine):
+        try:
+            await asyncio.wait_for(self._execute_host(machine), self._host_timeout)
+        except asyncio.TimeoutError:
+            self._set_state(machine.ip, 'failed', f'timed out after {self._host_timeout} s')
+        except Exception as error:
+            self._set_state(machine.ip, 'failed', str(error))
+
+    async def _execute_host(self, machine):
+        executor = self._create_executor(machine)
+        await self._retry(machine.ip, 'connecting', True, executor.try_connection,
+                          machine.ip, machine.login, machine.password)
+        # the timed out launch may have started ftp_client.py, the second one would run experiments twice
+        await self._retry(machine.ip, 'launching', False, executor.try_python, self._get_command_line(machine))
+        self._set_state(machine.ip, 'running')
+        await run_in_thread(executor.wait_all)
+        if self._merger is not None:
+            self._set_state(machine.ip, 'merging')
+            await run_in_thread(self._merger.merge_host, machine.ip)
+        self._set_state(machine.ip, 'done')
+
+    async def _retry(self, host, state, retry_on_timeout, function, *args):
+        """Call the function until it returns True, attempts are repeated after False or an exception
+
+        :param retry_on_timeout: Repeat the timed out attempt, False for calls whose timed out attempt may
+                                 still succeed
+        """
+        backoff = INITIAL_BACKOFF
+        for attempt in range(1, self._attempts + 1):
+            self._set_state(host, state, f'attempt {attempt} of {self._attempts}')
+            try:
+                if await asyncio.wait_for(run_in_thread(function, *args), self._attempt_timeout):
+                    return
+                error = 'process is not created'
+            except asyncio.TimeoutError:
+                error = f'no response in {self._attempt_timeout} s'
+                if not retry_on_timeout:
+                    raise RuntimeError(f'{state} failed ({error}), it is not repeated')
+            except Exception as exception:
+                error = str(exception) or type(exception).__name__
+            if attempt < self._attempts:
+                self._log.warning(f'{host}: {state} failed ({error}), next attempt in {backoff:.0f} s')
+                await asyncio.sleep(backoff)
+                backoff = min(2 * backoff, MAX_BACKOFF)
+        raise RuntimeError(f'{state} failed after {self._attempts} attempts ({error})')
+
+    def _set_state(self, host, state, message=''):
+        status = self._statuses[host]
+        if status.state != state:
+            status.state_time = time()
+        status.state, status.message = state, message
+        details = f' ({message})' if message else ''
+        if state == 'failed':
+            self._log.error(f'{host}: {state}{details}')
+        else:
+            self._log.info(f'{host}: {state}{details}')
+
+    async def _report_status(self):
+        while True:
+            await asyncio.sleep(self._status_period)
+            self._log_status()
+
+    def _log_status(self):
+        states = Counter(status.state for status in self._statuses.values())
+        self._log.info('Hosts: ' + ', '.join(f'{count} {state}' for state, count in sorted(states.items())))
+        now = time()
+        for status in self._statuses.values():
+            if status.state not in FINISHED_STATES:
+                self._log.info(f'    {status.host}: {status.state} for {now - status.state_time:.0f} s, '
+                               f'{now - status.start_time:.0f} s in total')
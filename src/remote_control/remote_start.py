@@ -1,11 +1,12 @@
 import argparse
-import ftplib
+import asyncio
 import logging as log
 import os
 import sys
+from functools import partial
 
 import config_parser
-import table_format
+from orchestrator import RemoteOrchestrator, ResultsMerger
 
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'deployment'))
 from remote_executor import RemoteExecutor  # noqa: E402 pylint: disable=E0401
@@ -42,6 +43,24 @@ def cli_argument_parser():
                         type=str,
                         help='Path to the directory with results on the FTP.',
                         required=True)
+    parser.add_argument('--attempts',
+                        type=int,
+                        help='Number of attempts to connect to the machine and to launch experiments, '
+                             'the delay between attempts is doubled from 2 to 60 seconds. Timed out launches '
+                             'are not repeated',
+                        default=5)
+    parser.add_argument('--attempt_timeout',
+                        type=float,
+                        help='Maximal time in seconds of one attempt to connect or to launch',
+                        default=60)
+    parser.add_argument('--host_timeout',
+                        type=float,
+                        help='Maximal time in seconds of experiments on one machine, unlimited by default',
+                        default=None)
+    parser.add_argument('--status_period',
+                        type=float,
+                        help='Period in seconds of the status of all machines in the log',
+                        default=30)
 
     args = parser.parse_args()
 
@@ -51,20 +70,18 @@ def cli_argument_parser():
     return args
 
 
-def client_execution(machine, server_ip, server_login, server_psw, ftp_dir, log):
-    executor = RemoteExecutor(machine.os_type, log)
-    executor.create_connection(machine.ip, machine.login, machine.password)
+def get_client_command_line(machine, server_ip, server_login, server_psw, ftp_dir):
     command_line = (f'{machine.path_to_ftp_client} '
                     f'-ip {server_ip} '
                     f'-l {server_login} '
                     f'-p {server_psw} '
                     f'-os {machine.os_type} '
-                    f'--ftp_dir {ftp_dir}')
+                    f'--ftp_dir {ftp_dir} '
+                    f'--host_name {machine.ip}')
     command_line = add_benchmark_arguments(command_line, machine)
     command_line = add_accuracy_checker_arguments(command_line, machine)
-    executor.execute_python(command_line)
 
-    return executor
+    return command_line
 
 
 def add_benchmark_arguments(command_line, machine):
@@ -103,32 +120,29 @@ def main():
 
     machine_list = config_parser.parse_config(args.config)
 
-    client_list = []
-    log.info('Clients start executing')
-
-    for machine in machine_list:
-        client_list.append(client_execution(
-            machine,
-            args.server_ip,
-            args.server_login,
-            args.server_psw,
-            args.ftp_dir,
-            log,
-        ))
-
-    log.info('Executor script is waiting for all experiments')
-    for client in client_list:
-        client.wait_all()
-
-    ftp_connection = ftplib.FTP(
-        args.server_ip,
-        args.server_login,
-        args.server_psw,
+    result_tables = {target: table_name for target, table_name in (
+        ('benchmark', args.benchmark_result_table),
+        ('accuracy_checker', args.accuracy_checker_result_table),
+    ) if table_name}
+    merger = ResultsMerger(args.server_ip, args.server_login, args.server_psw, args.ftp_dir, result_tables, log)
+    orchestrator = RemoteOrchestrator(
+        machine_list,
+        log,
+        lambda machine: RemoteExecutor(machine.os_type, log),
+        partial(get_client_command_line, server_ip=args.server_ip, server_login=args.server_login,
+                server_psw=args.server_psw, ftp_dir=args.ftp_dir),
+        merger,
+        args.attempts,
+        args.attempt_timeout,
+        args.host_timeout,
+        args.status_period,
     )
-    ftp_connection.cwd(args.ftp_dir)
-    table_format.join_tables(ftp_connection, 'benchmark', args.benchmark_result_table)
-    table_format.join_tables(ftp_connection, 'accuracy_checker', args.accuracy_checker_result_table)
-    ftp_connection.close()
+
+    log.info('Clients start executing')
+    failed_hosts = asyncio.run(orchestrator.run())
+    if failed_hosts:
+        log.error(f'Experiments failed on machines: {", ".join(failed_hosts)}')
+        return 1
 
 
 if __name__ == '__main__':
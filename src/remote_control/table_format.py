@@ -1,3 +1,6 @@
+import os
+
+
 class TableHandler:
     def __init__(self):
         self.__my_lines = []
@@ -18,27 +21,25 @@ class TableHandler:
         self.__my_current_line += 1
 
 
-def join_tables(ftp_server, target, table_name):
-    result_tables = []
-    tables = []
-    ftp_server.retrlines('NLST', tables.append)
-    for idx in range(len(tables)):
-        if target in tables[idx]:
-            result_table = TableHandler()
-            ftp_server.retrlines('RETR ' + tables[idx], result_table.set_line)
-            result_tables.append(result_table)
+def get_host_table_name(host_name, target):
+    """Name of the result table uploaded to the FTP by ftp_client.py of the host"""
+    return f'{host_name}_{target}_result_table.csv'
 
-    result_table = open(table_name, 'w')
-    for idx in range(len(result_tables)):
-        if idx:
-            result_tables[idx].skip_line()
 
-        line = result_tables[idx].get_line()
-        while (line):
+def append_table(ftp_server, source_table, table_name):
+    """Append rows of the table from the FTP to the local table, the header is written once"""
+    source = TableHandler()
+    ftp_server.retrlines('RETR ' + source_table, source.set_line)
+    if os.path.isfile(table_name) and os.path.getsize(table_name) > 0:
+        source.skip_line()
+
+    with open(table_name, 'a') as result_table:
+        line = source.get_line()
+        while line:
             result_table.write(line + '\n')
-            line = result_tables[idx].get_line()
-    result_table.close()
+            line = source.get_line()
+
 
-    result_table = open(table_name, 'rb')
-    ftp_server.storbinary('STOR ' + table_name, result_table)
-    result_table.close()
+def upload_table(ftp_server, table_name):
+    with open(table_name, 'rb') as result_table:
+        ftp_server.storbinary('STOR ' + table_name, result_table)
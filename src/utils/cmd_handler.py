@@ -1,20 +1,39 @@
 import abc
 import os
+import shutil
+import signal
 import subprocess
 import threading
 import sys
+import time
+from collections import deque
 
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[0]))
 from constants import Status  # noqa: E402, PLC0411
+from memory_sampler import ProcessTreeMemorySampler, get_process_tree, get_start_time  # noqa: E402, PLC0411
+
+# the last lines of the process output are kept for logs of failed tests, results are read from JSON reports
+OUTPUT_TAIL_LINES = 2000
+# period of stall checks in seconds
+STALL_CHECK_PERIOD = 1.0
+# time in seconds for processes to exit after SIGTERM before they are killed
+KILL_GRACE_PERIOD = 10
+# period in seconds of checks of terminated processes during the grace period
+KILL_POLL_PERIOD = 0.1
 
 
 class CMDHandler(metaclass=abc.ABCMeta):
-    def __init__(self, command_line, log, env=None):
+    def __init__(self, command_line, log, env=None, cpu_set=None, memory_sampler=None, stall_monitor=None,
+                 output_tail_lines=OUTPUT_TAIL_LINES):
         self.command_line = command_line
         self.log = log
         self.env = env
+        self.cpu_set = cpu_set
+        self.memory_sampler = memory_sampler
+        self.stall_monitor = stall_monitor
+        self.output_tail_lines = output_tail_lines
         self.output = []
         self.process = None
         self.return_code = Status.EXIT_SUCCESS.value
@@ -22,30 +41,39 @@ class CMDHandler(metaclass=abc.ABCMeta):
     def run(self, timeout):
 
         def target(stdout, stderr):
-            self.process = subprocess.Popen(self.command_line, stdout=stdout, stderr=stderr, env=self.env,
-                                            shell=isinstance(self.command_line, str))
+            self.process = subprocess.Popen(self._get_pinned_command_line(), stdout=stdout, stderr=stderr,
+                                            env=self.env, shell=isinstance(self.command_line, str))
+            if self.memory_sampler is not None:
+                self.memory_sampler.start(self.process.pid)
 
             if stdout != subprocess.DEVNULL:
-                self.output = []
+                output = deque(maxlen=self.output_tail_lines)
                 for line in self.process.stdout:
-                    line = line.decode('utf-8')
-                    self.output.append(line)
+                    line = line.decode('utf-8', errors='replace')
+                    output.append(line)
 
                     sys.stdout.write(line)
+                self.output = list(output)
 
                 sys.stdout.flush()
                 self.process.stdout.close()
 
             self.process.wait()
+            if self.memory_sampler is not None:
+                self.memory_sampler.stop()
 
         thread = threading.Thread(target=target, args=(subprocess.PIPE, subprocess.STDOUT))
         thread.start()
 
-        thread.join(timeout)
+        stall = self._wait(thread, timeout)
         if thread.is_alive():
             try:
-                self.log.error(f'Timeout {timeout} is reached, terminating')
-                self.return_code = Status.PROCESS_TIMEOUT.value
+                if stall is not None:
+                    self.log.error(f'Process is stalled: {stall}, terminating')
+                    self.return_code = Status.PROCESS_STALLED.value
+                else:
+                    self.log.error(f'Timeout {timeout} is reached, terminating')
+                    self.return_code = Status.PROCESS_TIMEOUT.value
                 self.kill_process_by_pid(self.process.pid)
                 thread.join()
             except OSError as e:
@@ -61,11 +89,86 @@ class CMDHandler(metaclass=abc.ABCMeta):
                                     else Status.PROCESS_CMD_ERROR.value)
         self.log.info(f'Process returncode = {process_return_code}')
 
+    def _wait(self, thread, timeout):
+        """
+        Wait for the end of the process until the timeout or the stall detected by the stall monitor
+        :return: description of the stall or None
+        """
+        if self.stall_monitor is None:
+            thread.join(timeout)
+            return None
+        deadline = time.monotonic() + timeout if timeout else None
+        while thread.is_alive():
+            wait_time = STALL_CHECK_PERIOD if deadline is None else min(STALL_CHECK_PERIOD, deadline - time.monotonic())
+            if wait_time <= 0:
+                return None
+            thread.join(wait_time)
+            stall = self.stall_monitor.get_stall()
+            if stall is not None and thread.is_alive():
+                return stall
+        return None
+
+    def _get_pinned_command_line(self):
+        """
+        Prefix the command line with taskset, processes are started from threads of the parallel scheduler
+        where preexec_fn of Popen is unsafe
+        """
+        if not self.cpu_set:
+            return self.command_line
+        if shutil.which('taskset') is None:
+            self.log.warning(f'taskset is not found on {sys.platform}, process will not be pinned')
+            return self.command_line
+        self.log.info(f'Process will be pinned to CPUs: {self.cpu_set}')
+        cpu_list = ','.join(str(cpu) for cpu in self.cpu_set)
+        if isinstance(self.command_line, str):
+            return f'taskset -c {cpu_list} {self.command_line}'
+        return ['taskset', '-c', cpu_list, *self.command_line]
+
     def kill_process_by_pid(self, pid):
+        """
+        Terminate the process tree, processes alive after the grace period are killed
+        """
         try:
             if sys.platform == 'win32':
                 subprocess.call(['taskkill', '/F', '/T', '/PID', str(pid)])
-            else:
+            elif not ProcessTreeMemorySampler.is_supported():
                 os.system(f'pkill -TERM -P {pid}')
+            else:
+                # children are listed before termination, they are not found in the tree after the exit of the parent
+                process_tree = {tree_pid: get_start_time(tree_pid) for tree_pid in get_process_tree(pid)}
+                self._send_signal(process_tree, signal.SIGTERM)
+                alive_pids = self._wait_process_tree(pid, process_tree, KILL_GRACE_PERIOD)
+                if alive_pids:
+                    self.log.warning(f'Processes {alive_pids} are alive {KILL_GRACE_PERIOD} s after SIGTERM, killing')
+                    self._send_signal(alive_pids, signal.SIGKILL)
         except OSError as err:
             self.log.error(err)
+
+    def _wait_process_tree(self, pid, process_tree, timeout):
+        """
+        Wait for the exit of the process tree
+        :param process_tree: start times of processes by pids, a pid with another start time belongs
+                             to a new process after the exit of the listed one
+        :return: pids of processes alive after the timeout
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            # the parent is not reaped, so its pid is not reused and children started after SIGTERM are its children
+            process_tree.update((child_pid, get_start_time(child_pid)) for child_pid in get_process_tree(pid)
+                                if child_pid not in process_tree)
+        while True:
+            alive_pids = [tree_pid for tree_pid, start_time in process_tree.items()
+                          if start_time is not None and get_start_time(tree_pid) == start_time]
+            if not alive_pids or time.monotonic() >= deadline:
+                return alive_pids
+            time.sleep(KILL_POLL_PERIOD)
+
+    @staticmethod
+    def _send_signal(pids, signal_number):
+        for pid in pids:
+            try:
+                os.kill(pid, signal_number)
+            except (ProcessLookupError, PermissionError):
+                pass
@@ -13,6 +13,7 @@ class Status(Enum):
     PROCESS_CREATE_ERROR = 127
     INFERENCE_SEGMENTATION_FAULT = 139
     PROCESS_CMD_ERROR = 400
+    PROCESS_STALLED = 408
     EXECUTOR_NOT_FOUND = 438
 
     @classmethod
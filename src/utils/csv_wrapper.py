@@ -1,4 +1,6 @@
 import csv
+import io
+import os
 
 
 class CsvReport:
@@ -33,12 +35,31 @@ class CsvReport:
                                           delimiter=self._delimiter, quoting=csv.QUOTE_ALL)
             self._writer.writeheader()
 
+    def rewrite(self, rows):
+        """Replace the CSV file with headers and rows. The new file is written aside and replaces
+        the old one atomically
+
+        :param rows: List of rows as dict with column name and cell value, missing columns are left empty
+        """
+        temporary_path = f'{self._path}.tmp'
+        with open(temporary_path, 'w') as csv_file:
+            self._writer = csv.DictWriter(csv_file, fieldnames=self._headers, dialect=csv.excel,
+                                          delimiter=self._delimiter, quoting=csv.QUOTE_ALL, extrasaction='ignore')
+            self._writer.writeheader()
+            self._writer.writerows(rows)
+        os.replace(temporary_path, self._path)
+
     def append_row(self, row_dict):
-        """Append row to the CSV file
+        """Append row to the CSV file. The row is written at once and flushed to the disk,
+        so an interrupted run can leave incomplete only the last row
 
         :param row_dict: Dict with column name and cell value
         """
+        row = io.StringIO()
+        self._writer = csv.DictWriter(row, fieldnames=self._headers, dialect=csv.excel,
+                                      delimiter=self._delimiter, quoting=csv.QUOTE_ALL)
+        self._writer.writerow(row_dict)
         with open(self._path, 'a') as csv_file:
-            self._writer = csv.DictWriter(csv_file, fieldnames=self._headers, dialect=csv.excel,
-                                          delimiter=self._delimiter, quoting=csv.QUOTE_ALL)
-            self._writer.writerow(row_dict)
+            csv_file.write(row.getvalue())
+            csv_file.flush()
+            os.fsync(csv_file.fileno())
@@ -1,6 +1,8 @@
 import abc
 import sys
+from collections import deque
 
+from cmd_handler import OUTPUT_TAIL_LINES
 from constants import Status
 
 
@@ -18,7 +20,7 @@ class DockerHandler(metaclass=abc.ABCMeta):
         exec_instance = self.docker_client.api.exec_create(self.container_id, self.command_line,
                                                            privileged=True, tty=False)
         exec_output = self.docker_client.api.exec_start(exec_instance['Id'], tty=False, stream=True)
-        self.output = []
+        output = deque(maxlen=OUTPUT_TAIL_LINES)
         try:
             for stdout_out in exec_output:
                 if stdout_out is not None:
@@ -26,9 +28,10 @@ class DockerHandler(metaclass=abc.ABCMeta):
                     if self.print_output:
                         sys.stdout.write(line)
                         sys.stdout.flush()
-                    self.output.extend(line.splitlines())
+                    output.extend(line.splitlines())
         except Exception as err:
             self.log.error(err)
+        self.output = list(output)
 
         exit_metadata = self.docker_client.api.exec_inspect(exec_instance['Id'])
         exit_code = exit_metadata['ExitCode']
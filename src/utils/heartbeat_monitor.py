@@ -0,0 +1,50 @@
+import os
+from time import time
+
+# phases of launchers before the first inference: model reading, compilation and input data preparation
+LOAD_PHASES = ('load',)
+
+
+class HeartbeatMonitor:
+    """Detect the stall of the launcher by its heartbeat file. The launcher rewrites the file with its phase
+    and the number of completed iterations while it makes progress, launchers without heartbeats are never stalled.
+    """
+
+    def __init__(self, heartbeat_path, stall_timeout=None, load_stall_timeout=None):
+        """HeartbeatMonitor constructor
+
+        :param heartbeat_path: Path of the heartbeat file written by the launcher
+        :param stall_timeout: Maximal time in seconds without heartbeats during warm-up and inference
+        :param load_stall_timeout: Maximal time in seconds without heartbeats during model loading and compilation
+        """
+        self.heartbeat_path = heartbeat_path
+        self.stall_timeout = stall_timeout
+        self.load_stall_timeout = load_stall_timeout
+        self.remove_heartbeat()
+
+    def remove_heartbeat(self):
+        try:
+            os.remove(self.heartbeat_path)
+        except OSError:
+            pass
+
+    def get_heartbeat(self):
+        """Phase and completed iterations of the last heartbeat and its age in seconds, None before the first one"""
+        try:
+            modification_time = os.path.getmtime(self.heartbeat_path)
+            with open(self.heartbeat_path) as heartbeat_file:
+                phase, iteration = heartbeat_file.read().split()
+        except (OSError, ValueError):
+            return None
+        return phase, int(iteration), time() - modification_time
+
+    def get_stall(self):
+        """Description of the stall if the launcher has made no progress within the stall timeout of its phase"""
+        heartbeat = self.get_heartbeat()
+        if heartbeat is None:
+            return None
+        phase, iteration, age = heartbeat
+        stall_timeout = self.load_stall_timeout if phase in LOAD_PHASES else self.stall_timeout
+        if not stall_timeout or age <= stall_timeout:
+            return None
+        return f'no progress for {age:.0f} s in phase {phase} after {iteration} iterations'
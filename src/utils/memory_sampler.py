@@ -0,0 +1,110 @@
+import os
+import threading
+from pathlib import Path
+
+PROC_PATH = Path('/proc')
+BYTES_IN_KILOBYTE = 1024
+DEFAULT_SAMPLING_INTERVAL = 0.5
+
+
+def get_children(pid):
+    children_path = PROC_PATH / str(pid) / 'task' / str(pid) / 'children'
+    try:
+        return [int(child) for child in children_path.read_text().split()]
+    except (OSError, ValueError):
+        return []
+
+
+def get_process_tree(pid):
+    """Process and all its descendants"""
+    tree = []
+    pids = [pid]
+    while pids:
+        current_pid = pids.pop()
+        tree.append(current_pid)
+        pids.extend(get_children(current_pid))
+    return tree
+
+
+def get_start_time(pid):
+    """Start time of the process in clock ticks after boot, None if the process does not exist or is a zombie.
+    The pid and the start time identify the process, the pid alone may be reused after its exit
+    """
+    try:
+        # the command name in parentheses may contain spaces, fields after it are split
+        fields = (PROC_PATH / str(pid) / 'stat').read_text().rpartition(')')[2].split()
+        return None if fields[0] == 'Z' else int(fields[19])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_rss(pid):
+    """Resident set size in bytes, None if the process does not exist"""
+    try:
+        with open(PROC_PATH / str(pid) / 'statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_uss(pid):
+    """Unique set size in bytes (private pages), None if it is unavailable"""
+    try:
+        with open(PROC_PATH / str(pid) / 'smaps_rollup') as smaps:
+            fields = dict(line.split(':', 1) for line in smaps if ':' in line)
+        return sum(int(fields[field].split()[0]) for field in ('Private_Clean', 'Private_Dirty')) * BYTES_IN_KILOBYTE
+    except (OSError, ValueError, KeyError, IndexError):
+        return None
+
+
+class ProcessTreeMemorySampler:
+    """Sample RSS and USS of the process tree from /proc in the background thread and keep their peaks.
+    RSS of processes sharing pages is summed, so tree RSS overestimates memory of multi-process launchers,
+    USS counts private pages only.
+    """
+
+    def __init__(self, interval=DEFAULT_SAMPLING_INTERVAL):
+        """ProcessTreeMemorySampler constructor
+
+        :param interval: Sampling interval in seconds
+        """
+        self.interval = interval
+        self.peak_rss = None
+        self.peak_uss = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def is_supported():
+        return PROC_PATH.joinpath('self', 'statm').exists()
+
+    def sample(self, pid):
+        rss_values, uss_values = [], []
+        for tree_pid in get_process_tree(pid):
+            rss_values.append(get_rss(tree_pid))
+            uss_values.append(get_uss(tree_pid))
+        rss = sum(value for value in rss_values if value is not None)
+        uss = sum(value for value in uss_values if value is not None)
+        if rss:
+            self.peak_rss = max(self.peak_rss or 0, rss)
+        if uss:
+            self.peak_uss = max(self.peak_uss or 0, uss)
+
+    def start(self, pid):
+        if not self.is_supported():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(pid,), daemon=True)
+        self._thread.start()
+
+    def _run(self, pid):
+        while True:
+            self.sample(pid)
+            if self._stop_event.wait(self.interval):
+                return
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,179 @@
+import argparse
+import csv
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[0]))
+from csv_wrapper import CsvReport  # noqa: E402, PLC0411
+
+
+class ResultStore:
+    """SQLite store of result tables. Every result kind is a table with a column per CSV column
+    and the raw JSON report of the test, key columns used by the report generators are indexed.
+    Values are stored as text the same way as in CSV tables.
+    """
+    KEY_COLUMNS = {
+        'benchmark': ('Topology name', 'Infrastructure', 'Inference Framework', 'Precision', 'Batch size', 'Mode'),
+        'accuracy_checker': ('Topology name', 'Infrastructure', 'Inference Framework', 'Device', 'Precision',
+                             'Accuracy type'),
+    }
+    REPORT_COLUMN = 'JSON report'
+
+    def __init__(self, path):
+        """ResultStore constructor
+
+        :param path: Path to SQLite database, it is created if it does not exist
+        """
+        self._path = path
+        # OutputHandler adds rows from the threads of concurrent tests
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._connection.close()
+
+    @staticmethod
+    def _quote(name):
+        escaped_name = name.replace('"', '""')
+        return f'"{escaped_name}"'
+
+    def _check_kind(self, kind):
+        if kind not in self.KEY_COLUMNS:
+            raise ValueError(f'Unknown result kind {kind}')
+
+    def _get_columns(self, kind):
+        return [row[1] for row in self._connection.execute(f'PRAGMA table_info({self._quote(kind)})')]
+
+    def create_table(self, kind, columns):
+        """Create table of the result kind with indexes on key columns. Columns missing
+        in the existing table are added, so tables with different column sets can be merged
+
+        :param kind: Result kind, 'benchmark' or 'accuracy_checker'
+        :param columns: List of column names in CSV order
+        """
+        self._check_kind(kind)
+        with self._lock, self._connection:
+            table = self._quote(kind)
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                                     f'{self._quote(self.REPORT_COLUMN)} TEXT)')
+            existing_columns = self._get_columns(kind)
+            for column in columns:
+                if column not in existing_columns:
+                    self._connection.execute(f'ALTER TABLE {table} ADD COLUMN {self._quote(column)} TEXT')
+            existing_columns = self._get_columns(kind)
+            key_columns = [column for column in self.KEY_COLUMNS[kind] if column in existing_columns]
+            if key_columns:
+                index = self._quote(f'{kind}_key_columns')
+                self._connection.execute(f'CREATE INDEX IF NOT EXISTS {index} ON {table} '
+                                         f'({", ".join(self._quote(column) for column in key_columns)})')
+
+    def add_rows(self, kind, rows, reports=None):
+        """Add rows in one transaction
+
+        :param kind: Result kind
+        :param rows: List of dicts with column name and cell value, columns must exist in the table
+        :param reports: List of raw JSON reports of the rows, None if the reports are unavailable
+        """
+        self._check_kind(kind)
+        reports = reports or [None] * len(rows)
+        with self._lock, self._connection:
+            for row, report in zip(rows, reports):
+                columns = [self.REPORT_COLUMN, *row.keys()]
+                values = [report, *('' if value is None else str(value) for value in row.values())]
+                self._connection.execute(f'INSERT INTO {self._quote(kind)} '
+                                         f'({", ".join(self._quote(column) for column in columns)}) '
+                                         f'VALUES ({", ".join("?" * len(values))})', values)
+
+    def add_row(self, kind, row, report=None):
+        self.add_rows(kind, [row], [report])
+
+    def import_csv(self, kind, paths):
+        """Import existing CSV tables
+
+        :param kind: Result kind
+        :param paths: List of paths to CSV tables
+        :return: Number of imported rows
+        """
+        rows_count = 0
+        for path in paths:
+            rows = CsvReport(path).read()
+            if not rows:
+                continue
+            self.create_table(kind, list(rows[0].keys()))
+            self.add_rows(kind, rows)
+            rows_count += len(rows)
+        return rows_count
+
+    def _select(self, kind, columns, conditions):
+        query = f'SELECT {", ".join(self._quote(column) for column in columns)} FROM {self._quote(kind)}'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(f'{self._quote(column)} = ?' for column in conditions)
+        return self._connection.execute(f'{query} ORDER BY id', list(conditions.values())).fetchall()
+
+    def read_table(self, kind, conditions=None):
+        """Read rows in the order they are added
+
+        :param kind: Result kind
+        :param conditions: Dict with column name and required value, indexed key columns make the lookup fast
+        :return: List of CSV column names and list of rows as lists of values
+        """
+        self._check_kind(kind)
+        with self._lock:
+            columns = [column for column in self._get_columns(kind) if column not in ('id', self.REPORT_COLUMN)]
+            if not columns:
+                raise ValueError(f'No {kind} results in {self._path}')
+            rows = self._select(kind, columns, conditions or {})
+        return columns, [['' if value is None else value for value in row] for row in rows]
+
+    def get_reports(self, kind, conditions=None):
+        """Raw JSON reports of the rows matching conditions, None for rows without reports"""
+        self._check_kind(kind)
+        with self._lock:
+            return [row[0] for row in self._select(kind, [self.REPORT_COLUMN], conditions or {})]
+
+    def write_csv(self, kind, file, delimiter=';'):
+        """Write table of the result kind in CSV format
+
+        :param file: File object opened for writing
+        """
+        columns, rows = self.read_table(kind)
+        writer = csv.writer(file, dialect=csv.excel, delimiter=delimiter, quoting=csv.QUOTE_ALL)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def cli_argument_parser():
+    parser = argparse.ArgumentParser(description='Import CSV result tables to the SQLite result store')
+
+    parser.add_argument('-s', '--result_store',
+                        type=str,
+                        help='Path to the result store',
+                        required=True)
+    parser.add_argument('-t', '--tables',
+                        type=str,
+                        help='Paths to the result tables in csv format',
+                        nargs='+',
+                        required=True)
+    parser.add_argument('-k', '--table_kind',
+                        type=str,
+                        help='Kind of tables',
+                        choices=list(ResultStore.KEY_COLUMNS),
+                        default='benchmark')
+
+    return parser.parse_args()
+
+
+def main():
+    args = cli_argument_parser()
+    store = ResultStore(args.result_store)
+    try:
+        rows_count = store.import_csv(args.table_kind, args.tables)
+    finally:
+        store.close()
+    print(f'{rows_count} rows are imported to {args.result_store}')
+
+
+if __name__ == '__main__':
+    sys.exit(main() or 0)